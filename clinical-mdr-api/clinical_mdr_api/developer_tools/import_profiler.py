@@ -0,0 +1,118 @@
+"""
+Import profiler: reports the modules whose import takes the most time when a module is imported in a fresh interpreter,
+e.g. the application on startup, from the output of Python's `-X importtime` option.
+
+    python -m clinical_mdr_api.developer_tools.import_profiler clinical_mdr_api.main
+
+The modules are listed by cumulative time (the module and the modules it imported first)
+and by self time, and the self times are summed by package.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+_IMPORTTIME_RE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)(?P<module>\S+)"
+)
+
+
+@dataclass(frozen=True)
+class ModuleImport:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ModuleImport]:
+    """Parses the `import time:` lines written to stderr by `python -X importtime`"""
+
+    imports = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            imports.append(
+                ModuleImport(
+                    module=match["module"],
+                    self_us=int(match["self"]),
+                    cumulative_us=int(match["cumulative"]),
+                    depth=(len(match["indent"]) - 1) // 2,
+                )
+            )
+    return imports
+
+
+def profile_import(module: str) -> list[ModuleImport]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def package_totals(imports: list[ModuleImport], depth: int) -> dict[str, int]:
+    """Sums the self times of the modules by their package, the first `depth` components of their name"""
+
+    totals: dict[str, int] = defaultdict(int)
+    for module_import in imports:
+        totals[
+            ".".join(module_import.module.split(".")[:depth])
+        ] += module_import.self_us
+    return dict(totals)
+
+
+def format_report(imports: list[ModuleImport], top: int, depth: int) -> str:
+    total_us = sum(module_import.self_us for module_import in imports)
+    lines = [f"{len(imports)} modules imported in {total_us / 1e6:.2f}s", ""]
+
+    lines.append(f"# Top {top} modules by cumulative time")
+    for module_import in sorted(imports, key=lambda i: -i.cumulative_us)[:top]:
+        lines.append(
+            f"{module_import.cumulative_us / 1e3:10.1f} ms  {module_import.module}"
+        )
+    lines.append("")
+
+    lines.append(f"# Top {top} modules by self time")
+    for module_import in sorted(imports, key=lambda i: -i.self_us)[:top]:
+        lines.append(f"{module_import.self_us / 1e3:10.1f} ms  {module_import.module}")
+    lines.append("")
+
+    lines.append(f"# Top {top} packages by self time")
+    totals = package_totals(imports, depth)
+    for package, self_us in sorted(totals.items(), key=lambda t: -t[1])[:top]:
+        lines.append(f"{self_us / 1e3:10.1f} ms  {package}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "module",
+        nargs="?",
+        default="clinical_mdr_api.main",
+        help="Module to import",
+    )
+    parser.add_argument(
+        "--top", type=int, default=30, help="Number of modules listed per section"
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=3,
+        help="Number of module name components the self times are summed by",
+    )
+    args = parser.parse_args()
+
+    print(format_report(profile_import(args.module), args.top, args.depth))
+
+
+if __name__ == "__main__":
+    main()
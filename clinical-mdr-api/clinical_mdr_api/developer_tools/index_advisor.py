@@ -0,0 +1,269 @@
+"""
+Index advisor: finds label/property and relationship-type/property predicates of captured Cypher queries
+that are not backed by an index or constraint defined in `neo4j-mdr-db/db_schema.py`,
+and proposes the missing entries for its `INDEXES`, `TEXT_INDEXES`, `REL_INDEXES` and `CONSTRAINTS` lists.
+
+Capture the queries executed by a test or benchmark run with the `--capture-cypher` pytest option, e.g.
+
+    pytest --capture-cypher=reports/cypher_queries.json clinical_mdr_api/tests/performance/
+
+then run the advisor on the captured queries:
+
+    python -m clinical_mdr_api.developer_tools.index_advisor reports/cypher_queries.json
+"""
+
+import argparse
+import importlib.util
+import json
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+
+DEFAULT_SCHEMA_PATH = Path(__file__).parents[3] / "neo4j-mdr-db" / "db_schema.py"
+
+# Operators that can be served by a range index (or node key/unique constraint)
+RANGE_OPERATORS = {
+    "=",
+    "<",
+    ">",
+    "<=",
+    ">=",
+    "IN",
+    "STARTS WITH",
+    "IS NOT NULL",
+    "ORDER BY",
+}
+# Operators that can only be served by a text index
+TEXT_OPERATORS = {"CONTAINS", "ENDS WITH"}
+
+_COMMENT_RE = re.compile(r"//[^\n]*")
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NODE_RE = re.compile(
+    r"\(\s*(?P<var>\w+)?\s*:(?P<labels>[\w:|&`\s]+?)\s*(?P<props>\{[^{}]*\})?\s*\)"
+)
+_REL_RE = re.compile(
+    r"\[\s*(?P<var>\w+)?\s*:(?P<types>[\w|:`\s]+?)\s*(?:\*[\d.]*)?\s*(?P<props>\{[^{}]*\})?\s*\]"
+)
+_MAP_KEY_RE = re.compile(r"(\w+)\s*:")
+# SET clauses assign properties, they are removed before looking for predicates
+_SET_CLAUSE_RE = re.compile(
+    r"\bSET\b.*?(?=\b(?:MATCH|OPTIONAL|WITH|RETURN|MERGE|CREATE|DELETE|DETACH|REMOVE|CALL|UNWIND|FOREACH|ON)\b|\}|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_PREDICATE_RE = re.compile(
+    r"\b(?P<var>\w+)\.(?P<prop>\w+)\s*"
+    r"(?P<op><=|>=|<>|=~|=|<|>|\bIN\b|\bSTARTS\s+WITH\b|\bENDS\s+WITH\b|\bCONTAINS\b|\bIS\s+NOT\s+NULL\b)",
+    re.IGNORECASE,
+)
+_REVERSED_PREDICATE_RE = re.compile(
+    r"(?P<op><=|>=|=|<|>)\s*(?P<var>\w+)\.(?P<prop>\w+)\b(?!\s*\()"
+)
+_ORDER_BY_RE = re.compile(
+    r"\bORDER\s+BY\s+(?P<items>.+?)(?=\bSKIP\b|\bLIMIT\b|\bRETURN\b|\bWITH\b|\bUNION\b|\}|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_ORDER_ITEM_RE = re.compile(r"\b(?P<var>\w+)\.(?P<prop>\w+)\b")
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """A property lookup on a node label (`is_relationship=False`) or a relationship type"""
+
+    label: str
+    prop: str
+    operator: str
+    is_relationship: bool = False
+
+
+@dataclass
+class Proposal:
+    label: str
+    prop: str
+    is_relationship: bool
+    is_text: bool
+    query_count: int = 0
+    operators: set[str] = field(default_factory=set)
+    example: str = ""
+
+    @property
+    def schema_list(self) -> str:
+        if self.is_relationship:
+            return "REL_INDEXES"
+        if self.is_text:
+            return "TEXT_INDEXES"
+        if self.prop == "uid" and self.label.endswith("Root"):
+            return "CONSTRAINTS"
+        return "INDEXES"
+
+    @property
+    def schema_entry(self) -> str:
+        if self.schema_list == "CONSTRAINTS":
+            return f'("{self.label}", "{self.prop}", CONSTRAINT_TYPE_NODE_KEY),'
+        return f'("{self.label}", "{self.prop}"),'
+
+
+def _normalize_operator(operator: str) -> str:
+    return " ".join(operator.upper().split())
+
+
+def _split_labels(labels: str) -> list[str]:
+    return [
+        label.strip("` ") for label in re.split(r"[:|&]", labels) if label.strip("` ")
+    ]
+
+
+def extract_predicates(query: str) -> set[Predicate]:
+    """Extracts the property predicates of a Cypher query whose variable is bound to a label or relationship type.
+
+    Inline property maps, WHERE predicates and ORDER BY items are considered.
+    The extraction is regex based and best-effort, complex expressions may be missed.
+    """
+
+    query = _STRING_RE.sub("''", _COMMENT_RE.sub("", query))
+
+    node_vars: dict[str, set[str]] = defaultdict(set)
+    rel_vars: dict[str, set[str]] = defaultdict(set)
+    predicates: set[Predicate] = set()
+
+    for match in _NODE_RE.finditer(query):
+        labels = _split_labels(match["labels"])
+        if match["var"]:
+            node_vars[match["var"]].update(labels)
+        for prop in _MAP_KEY_RE.findall(match["props"] or ""):
+            predicates.update(Predicate(label, prop, "=") for label in labels)
+
+    for match in _REL_RE.finditer(query):
+        types = _split_labels(match["types"])
+        if match["var"]:
+            rel_vars[match["var"]].update(types)
+        for prop in _MAP_KEY_RE.findall(match["props"] or ""):
+            predicates.update(
+                Predicate(rel_type, prop, "=", True) for rel_type in types
+            )
+
+    query = _SET_CLAUSE_RE.sub(" ", query)
+    usages = [
+        (m["var"], m["prop"], _normalize_operator(m["op"]))
+        for regex in (_PREDICATE_RE, _REVERSED_PREDICATE_RE)
+        for m in regex.finditer(query)
+    ]
+    for order_by in _ORDER_BY_RE.finditer(query):
+        usages.extend(
+            (m["var"], m["prop"], "ORDER BY")
+            for m in _ORDER_ITEM_RE.finditer(order_by["items"])
+        )
+
+    for var, prop, operator in usages:
+        if operator not in RANGE_OPERATORS | TEXT_OPERATORS:
+            continue
+        predicates.update(Predicate(label, prop, operator) for label in node_vars[var])
+        predicates.update(
+            Predicate(rel_type, prop, operator, True) for rel_type in rel_vars[var]
+        )
+
+    return predicates
+
+
+def load_schema(path: Path = DEFAULT_SCHEMA_PATH) -> ModuleType:
+    spec = importlib.util.spec_from_file_location("db_schema", path)
+    schema = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(schema)
+    return schema
+
+
+def is_covered(predicate: Predicate, schema: ModuleType) -> bool:
+    key = (predicate.label, predicate.prop)
+    if predicate.is_relationship:
+        return key in schema.REL_INDEXES
+    text_indexed = key in schema.TEXT_INDEXES
+    range_indexed = key in schema.INDEXES or any(
+        (label, prop) == key and constraint_type != schema.CONSTRAINT_TYPE_NOT_NULL
+        for label, prop, constraint_type in schema.CONSTRAINTS
+    )
+    if predicate.operator in TEXT_OPERATORS:
+        return text_indexed
+    return range_indexed or (text_indexed and predicate.operator != "ORDER BY")
+
+
+def advise(queries: dict[str, int], schema: ModuleType) -> list[Proposal]:
+    """Returns proposed schema additions for the unindexed predicates of `queries` (query text -> number of executions),
+    ordered by the number of executed queries that would use them"""
+
+    proposals: dict[tuple, Proposal] = {}
+    for query, count in queries.items():
+        used_by_query = set()
+        for predicate in extract_predicates(query):
+            if is_covered(predicate, schema):
+                continue
+            is_text = predicate.operator in TEXT_OPERATORS
+            key = (predicate.label, predicate.prop, predicate.is_relationship, is_text)
+            proposal = proposals.setdefault(
+                key,
+                Proposal(
+                    label=predicate.label,
+                    prop=predicate.prop,
+                    is_relationship=predicate.is_relationship,
+                    is_text=is_text,
+                    example=" ".join(query.split())[:200],
+                ),
+            )
+            proposal.operators.add(predicate.operator)
+            used_by_query.add(key)
+        for key in used_by_query:
+            proposals[key].query_count += count
+
+    return sorted(
+        proposals.values(),
+        key=lambda p: (-p.query_count, p.schema_list, p.label, p.prop),
+    )
+
+
+def format_report(proposals: list[Proposal]) -> str:
+    if not proposals:
+        return "All captured label/property predicates are backed by an index or constraint.\n"
+
+    lines = []
+    by_list: dict[str, list[Proposal]] = defaultdict(list)
+    for proposal in proposals:
+        by_list[proposal.schema_list].append(proposal)
+    for schema_list in ("CONSTRAINTS", "INDEXES", "TEXT_INDEXES", "REL_INDEXES"):
+        if not by_list[schema_list]:
+            continue
+        lines.append(f"# Proposed additions to {schema_list}")
+        for proposal in by_list[schema_list]:
+            lines.append(
+                f"    {proposal.schema_entry}  # {proposal.query_count} queries, "
+                f"{', '.join(sorted(proposal.operators))}"
+            )
+            lines.append(f"    # e.g. {proposal.example}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def load_queries(path: Path) -> dict[str, int]:
+    with open(path, encoding="utf-8") as file:
+        return Counter(json.load(file))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "queries",
+        type=Path,
+        help="JSON file of captured queries (query text -> number of executions)",
+    )
+    parser.add_argument(
+        "--schema",
+        type=Path,
+        default=DEFAULT_SCHEMA_PATH,
+        help="Path to db_schema.py",
+    )
+    args = parser.parse_args()
+
+    print(format_report(advise(load_queries(args.queries), load_schema(args.schema))))
+
+
+if __name__ == "__main__":
+    main()
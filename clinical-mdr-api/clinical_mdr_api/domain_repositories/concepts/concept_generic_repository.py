@@ -32,6 +32,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     sb_clear_cache,
     validate_filters_and_add_search_string,
 )
@@ -344,6 +345,7 @@ class ConceptGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType]
 
         return concept_ars
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         field_name: str,
@@ -24,6 +24,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     validate_filters_and_add_search_string,
 )
 from common.exceptions import ValidationException
@@ -227,6 +228,7 @@ class CTCodelistAggregatedRepository:
 
         return GenericFilteringReturn.create(items=codelists_ars, total=total)
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         field_name: str,
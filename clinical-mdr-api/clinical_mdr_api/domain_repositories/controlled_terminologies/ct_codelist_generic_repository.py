@@ -12,6 +12,9 @@ from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_get_all_qu
     create_codelist_filter_statement,
     format_codelist_filter_sort_keys,
 )
+from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_term_registry import (
+    CT_TERM_REGISTRY,
+)
 from clinical_mdr_api.domain_repositories.library_item_repository import (
     LibraryItemRepositoryImplBase,
 )
@@ -43,6 +46,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     sb_clear_cache,
     validate_filters_and_add_search_string,
 )
@@ -52,6 +56,8 @@ from common import exceptions
 class CTCodelistGenericRepository(
     LibraryItemRepositoryImplBase[_AggregateRootType], ABC
 ):
+    cache_store_ct_terms_by_codelists = CT_TERM_REGISTRY
+
     root_class = type
     value_class = type
     relationship_from_root = type
@@ -218,6 +224,7 @@ class CTCodelistGenericRepository(
 
         return GenericFilteringReturn.create(items=extracted_items, total=total)
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         field_name: str,
@@ -386,7 +393,9 @@ class CTCodelistGenericRepository(
             return versions
         return None
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid", "cache_store_ct_terms_by_codelists"]
+    )
     def save(self, item: _AggregateRootType) -> None:
         if item.uid is not None and item.repository_closure_data is None:
             self._create(item)
@@ -407,7 +416,9 @@ class CTCodelistGenericRepository(
             return True
         return False
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid", "cache_store_ct_terms_by_codelists"]
+    )
     def add_term(
         self, codelist_uid: str, term_uid: str, author_id: str, order: int
     ) -> None:
@@ -469,7 +480,9 @@ class CTCodelistGenericRepository(
         db.cypher_query(query, {"codelist_uid": codelist_uid, "term_uid": term_uid})
         TemplateParameterTermRoot.generate_node_uids_if_not_present()
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid", "cache_store_ct_terms_by_codelists"]
+    )
     def remove_term(self, codelist_uid: str, term_uid: str, author_id: str) -> None:
         """
         Method removes term identified by term_uid from the codelist identified by codelist_uid.
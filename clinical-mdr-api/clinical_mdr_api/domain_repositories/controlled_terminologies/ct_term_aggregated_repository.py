@@ -22,6 +22,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     validate_filters_and_add_search_string,
 )
 from common.exceptions import ValidationException
@@ -228,6 +229,7 @@ class CTTermAggregatedRepository:
 
         return GenericFilteringReturn.create(items=terms_ars, total=total)
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         field_name: str,
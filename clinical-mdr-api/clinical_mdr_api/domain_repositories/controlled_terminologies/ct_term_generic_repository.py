@@ -13,6 +13,9 @@ from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_get_all_qu
     create_term_filter_statement,
     format_term_filter_sort_keys,
 )
+from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_term_registry import (
+    CT_TERM_REGISTRY,
+)
 from clinical_mdr_api.domain_repositories.library_item_repository import (
     LibraryItemRepositoryImplBase,
 )
@@ -40,6 +43,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     sb_clear_cache,
     validate_filters_and_add_search_string,
 )
@@ -51,6 +55,8 @@ from common.exceptions import (
 
 
 class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType], ABC):
+    cache_store_ct_terms_by_codelists = CT_TERM_REGISTRY
+
     root_class = type
     value_class = type
     relationship_from_root = type
@@ -271,6 +277,7 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
 
         return GenericFilteringReturn.create(items=extracted_items, total=total)
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         field_name: str,
@@ -450,6 +457,7 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
         status: LibraryItemStatus | None = None,
         at_specific_date: datetime | None = None,
         include_retired_versions: bool = False,
+        codelist_name: str | None = None,
     ) -> list[_AggregateRootType] | None:
         if not term_uids:
             return []
@@ -457,10 +465,22 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
         cypher_query = """
             MATCH (n:CTTermRoot)
             WHERE n.uid in $term_uids
+        """
+        if codelist_name:
+            params["codelist_name"] = codelist_name
+            cypher_query += """
+            AND EXISTS {
+                MATCH (n)<-[:HAS_TERM]-(:CTCodelistRoot)-[:HAS_NAME_ROOT]->(:CTCodelistNameRoot)
+                -[:LATEST]->(:CTCodelistNameValue {name: $codelist_name})
+            }
+            """
+        cypher_query += """
             MATCH (n)--(ctnr:CTTermNameRoot)
             RETURN COLLECT( DISTINCT elementID(ctnr)) as ctterm_name_element_ids
         """
         ctterm_name_element_ids = db.cypher_query(cypher_query, params=params)[0][0][0]
+        if not ctterm_name_element_ids:
+            return []
 
         # !TODO rename parameter uid to element_ids to be consistent
         element_id_filter = {"uid": {"v": ctterm_name_element_ids, "op": "eq"}}
@@ -485,7 +505,9 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
             return versions
         return None
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid", "cache_store_ct_terms_by_codelists"]
+    )
     def save(self, item: _AggregateRootType) -> None:
         if item.uid is not None and item.repository_closure_data is None:
             self._create(item)
@@ -498,7 +520,9 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
     def _is_repository_related_to_ct(self) -> bool:
         return True
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid", "cache_store_ct_terms_by_codelists"]
+    )
     def add_parent(
         self, term_uid: str, parent_uid: str, relationship_type: TermParentType
     ) -> None:
@@ -531,7 +555,9 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
         else:
             ct_term_root_node.has_parent_subtype.connect(ct_term_root_parent_node)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid", "cache_store_ct_terms_by_codelists"]
+    )
     def remove_parent(
         self, term_uid: str, parent_uid: str, relationship_type: TermParentType
     ) -> None:
@@ -0,0 +1,61 @@
+import datetime
+import threading
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping
+
+from cachetools import TTLCache
+
+from clinical_mdr_api.models.controlled_terminologies.ct_term import (
+    SimpleCTTermNameWithConflictFlag,
+)
+from common import config
+
+CodelistTerms = Mapping[str, Mapping[str, SimpleCTTermNameWithConflictFlag]]
+
+
+class CTTermRegistry(TTLCache):
+    """
+    Process-wide store of the terms of a set of codelists (codelist name -> term uid -> term)
+    valid at a given effective date, shared by all requests.
+
+    The stored mappings are read-only. Clearing the registry bumps its version,
+    so that a load that started before the clear is not stored afterwards.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.RLock()
+        self._version = 0
+
+    def get_or_load(
+        self,
+        codelist_names: Iterable[str],
+        effective_date: datetime.datetime | None,
+        load: Callable[[], CodelistTerms],
+    ) -> CodelistTerms:
+        key = (frozenset(codelist_names), effective_date)
+        with self._lock:
+            terms = self.get(key)
+            version = self._version
+        if terms is not None:
+            return terms
+
+        # loading is done outside the lock, concurrent loads of the same key are harmless
+        terms = MappingProxyType(
+            {
+                codelist_name: MappingProxyType(dict(codelist_terms))
+                for codelist_name, codelist_terms in load().items()
+            }
+        )
+        with self._lock:
+            if version == self._version:
+                self[key] = terms
+        return terms
+
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            super().clear()
+
+
+CT_TERM_REGISTRY = CTTermRegistry(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL)
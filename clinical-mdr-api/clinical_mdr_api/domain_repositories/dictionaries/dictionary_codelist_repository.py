@@ -43,6 +43,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     sb_clear_cache,
     validate_filters_and_add_search_string,
 )
@@ -277,6 +278,7 @@ class DictionaryCodelistGenericRepository(
 
         return codelist_ars
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         library: DictionaryType,
@@ -46,6 +46,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     sb_clear_cache,
     validate_filters_and_add_search_string,
 )
@@ -280,6 +281,7 @@ class DictionaryTermGenericRepository(
 
         return term_ars
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         codelist_uid: str,
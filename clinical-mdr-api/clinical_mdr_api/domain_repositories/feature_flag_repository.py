@@ -4,6 +4,7 @@ from neomodel import db
 from clinical_mdr_api.domain_repositories.models.feature_flag import (
     FeatureFlag as FeatureFlagNode,
 )
+from clinical_mdr_api.domain_repositories.snapshot import Snapshot
 from clinical_mdr_api.models.feature_flag import FeatureFlag
 from common.exceptions import NotFoundException
 
@@ -27,6 +28,7 @@ class FeatureFlagRepository:
             """
             MATCH (n:FeatureFlag)
             RETURN n
+            ORDER BY n.sn
             """,
             resolve_objects=True,
         )
@@ -121,3 +123,9 @@ class FeatureFlagRepository:
             """,
             params={"sn": sn},
         )
+
+
+# The feature flags are polled by the UI of every user
+feature_flags = Snapshot(
+    "feature-flags", lambda: FeatureFlagRepository().retrieve_all_feature_flags()
+)
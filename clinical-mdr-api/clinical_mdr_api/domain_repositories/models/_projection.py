@@ -0,0 +1,354 @@
+"""
+Read projections of neomodel nodes into response models.
+
+A `Projection` declares the relation paths of a neomodel class that a response model is built from,
+using the same notation as `fetch_relations`. The properties to return are taken from the `source`
+of the response model fields. Both are compiled into a single Cypher query returning one map
+projection per node, which replaces `ListDistinct(Model.nodes.fetch_relations(...).resolve_subgraph()).distinct()`:
+no OGM object is built per fetched path and no deduplication is needed.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from inspect import isclass
+from typing import Any, Iterator, Sequence
+
+from neomodel import INCOMING, OUTGOING, StructuredNode, db
+from pydantic import BaseModel
+
+from clinical_mdr_api.services.user_info import UserInfoService
+from common.utils import get_field_type
+
+FILTER_OPERATORS = {
+    "in": "IN",
+    "ne": "<>",
+    "lt": "<",
+    "lte": "<=",
+    "gt": ">",
+    "gte": ">=",
+}
+
+
+class ProjectedNode:
+    """
+    Stand-in for a node returned by `resolve_subgraph`:
+    holds the projected properties as attributes and the projected relations in `_relations`.
+    """
+
+    def __init__(self, properties: dict[str, Any], relations: dict[str, Any]):
+        self.__dict__.update(properties)
+        self._relations = relations
+
+
+@dataclass
+class _ProjectionNode:
+    node_class: type[StructuredNode]
+    variable: str
+    relationship_variable: str | None = None
+    relationship_definition: dict | None = None
+    properties: set[str] = field(default_factory=set)
+    relationship_properties: set[str] = field(default_factory=set)
+    children: dict[str, "_ProjectionNode"] = field(default_factory=dict)
+
+    @property
+    def relationship_class(self) -> type:
+        return self.relationship_definition["model"]
+
+
+def _relationship_definition(node_class: type[StructuredNode], name: str) -> dict:
+    relationships = node_class.defined_properties(aliases=False, properties=False)
+    if name not in relationships:
+        raise ValueError(f"{node_class.__name__} has no relationship '{name}'.")
+    relationships[name].lookup_node_class()
+    return relationships[name].definition
+
+
+def _hop(
+    definition: dict, relationship_variable: str = "", node_variable: str = ""
+) -> str:
+    relationship = f"[{relationship_variable}:{definition['relation_type']}]"
+    node = f"({node_variable}:{definition['node_class'].__label__})"
+    if definition["direction"] == OUTGOING:
+        return f"-{relationship}->{node}"
+    if definition["direction"] == INCOMING:
+        return f"<-{relationship}-{node}"
+    return f"-{relationship}-{node}"
+
+
+def _inflate(entity_class: type, values: dict, names: set[str]) -> dict[str, Any]:
+    definitions = entity_class.defined_properties(aliases=False, rels=False)
+    return {
+        name: (
+            definitions[name].inflate(values[name])
+            if values.get(name) is not None
+            else None
+        )
+        for name in names
+    }
+
+
+def model_sources(model: type[BaseModel], _parents: tuple = ()) -> Iterator[str]:
+    """Yields the `source` of the fields of `model` and of its nested models without a source"""
+
+    for model_field in model.model_fields.values():
+        jse = model_field.json_schema_extra
+        jse = jse if isinstance(jse, dict) else {}
+        if jse.get("exclude_from_model_validate"):
+            continue
+        if source := jse.get("source"):
+            yield source
+            continue
+        field_type = get_field_type(model_field.annotation)
+        if (
+            isclass(field_type)
+            and issubclass(field_type, BaseModel)
+            and field_type is not model
+            and field_type not in _parents
+        ):
+            yield from model_sources(field_type, _parents + (model,))
+
+
+class Projection:
+    """
+    Projection of the nodes of `node_class` into `model`, traversing the given `relations`.
+
+    As with `fetch_relations`, only the nodes having all the given relation paths are returned.
+    Each relation is expected to lead to a single node: the first one found having the rest of the relation paths
+    and matching the filters is projected.
+    """
+
+    def __init__(
+        self,
+        node_class: type[StructuredNode],
+        model: type[BaseModel],
+        relations: Sequence[str] = (),
+    ):
+        self.node_class = node_class
+        self.model = model
+        self.relations = tuple(relations)
+
+    @cached_property
+    def _root(self) -> _ProjectionNode:
+        root = _ProjectionNode(node_class=self.node_class, variable="n0")
+        count = 0
+        for relation in self.relations:
+            node = root
+            for name in relation.split("__"):
+                if name not in node.children:
+                    count += 1
+                    definition = _relationship_definition(node.node_class, name)
+                    node.children[name] = _ProjectionNode(
+                        node_class=definition["node_class"],
+                        variable=f"n{count}",
+                        relationship_variable=f"r{count}",
+                        relationship_definition=definition,
+                    )
+                node = node.children[name]
+
+        for source in model_sources(self.model):
+            *path, prop = re.split(r"[.|]", source)
+            node = root
+            for name in path:
+                node = node.children.get(name)
+                if node is None:
+                    # not fetched, `model_validate` treats it like a missing relation
+                    break
+            else:
+                if "|" in source:
+                    entity_class = node.relationship_class
+                    node.relationship_properties.add(prop)
+                else:
+                    entity_class = node.node_class
+                    node.properties.add(prop)
+                if prop not in entity_class.defined_properties(
+                    aliases=False, rels=False
+                ):
+                    raise ValueError(
+                        f"'{source}' of {self.model.__name__} is not a property of {entity_class.__name__}."
+                    )
+        return root
+
+    def _conditions(
+        self, filter_keys: tuple[str, ...]
+    ) -> dict[tuple[str, ...], list[str]]:
+        """
+        Compiles `filter` keyword arguments into conditions on the deepest projected node of their path,
+        keyed by the relation path of that node.
+        The filters continuing on the same path beyond the projected nodes are matched together, as `filter` does.
+        """
+
+        conditions: dict[tuple[str, ...], list[str]] = {}
+        predicates: dict[tuple[tuple[str, ...], tuple[str, ...]], list[str]] = {}
+        for i, key in enumerate(filter_keys):
+            key, _, relationship_property = key.partition("|")
+            parts = key.split("__")
+            operator = "="
+            prop = relationship_property
+            if not relationship_property:
+                if len(parts) > 1 and parts[-1] in FILTER_OPERATORS:
+                    operator = FILTER_OPERATORS[parts.pop()]
+                *parts, prop = parts
+
+            node = self._root
+            path: list[str] = []
+            for name in parts:
+                if name not in node.children:
+                    break
+                node = node.children[name]
+                path.append(name)
+            remaining = tuple(parts[len(path) :])
+
+            if remaining:
+                variable = "filtered_rel" if relationship_property else "filtered"
+            else:
+                variable = (
+                    node.relationship_variable
+                    if relationship_property
+                    else node.variable
+                )
+            predicates.setdefault((tuple(path), remaining), []).append(
+                f"{variable}.{prop} {operator} $p{i}"
+            )
+
+        for (path, remaining), path_predicates in predicates.items():
+            if not remaining:
+                conditions.setdefault(path, []).extend(path_predicates)
+                continue
+            node = self._root
+            for name in path:
+                node = node.children[name]
+            hops = []
+            node_class = node.node_class
+            for i, name in enumerate(remaining):
+                definition = _relationship_definition(node_class, name)
+                is_last = i == len(remaining) - 1
+                hops.append(
+                    _hop(
+                        definition,
+                        relationship_variable="filtered_rel" if is_last else "",
+                        node_variable="filtered" if is_last else "",
+                    )
+                )
+                node_class = definition["node_class"]
+            conditions.setdefault(path, []).append(
+                f"EXISTS {{ MATCH ({node.variable}){''.join(hops)} WHERE {' AND '.join(path_predicates)} }}"
+            )
+        return conditions
+
+    def _node_conditions(
+        self,
+        node: _ProjectionNode,
+        conditions: dict[tuple[str, ...], list[str]],
+        path: tuple[str, ...] = (),
+    ) -> list[str]:
+        """
+        Returns the conditions of the node at `path` and the patterns of the relation paths below it,
+        with the conditions of their nodes, that the node must have.
+        """
+
+        node_conditions = list(conditions.get(path, []))
+        for name, child in node.children.items():
+            child_conditions = self._node_conditions(child, conditions, path + (name,))
+            node_conditions.append(
+                f"EXISTS {{ MATCH ({node.variable}){_hop(child.relationship_definition, child.relationship_variable, child.variable)}"
+                f"{' WHERE ' + ' AND '.join(child_conditions) if child_conditions else ''} }}"
+            )
+        return node_conditions
+
+    def _map_projection(
+        self,
+        node: _ProjectionNode,
+        conditions: dict[tuple[str, ...], list[str]],
+        path: tuple[str, ...] = (),
+    ) -> str:
+        entries = [f".{prop}" for prop in sorted(node.properties)]
+        for name, child in node.children.items():
+            child_path = path + (name,)
+            item = f"node: {self._map_projection(child, conditions, child_path)}"
+            if child.relationship_properties:
+                relationship_entries = ", ".join(
+                    f".{prop}" for prop in sorted(child.relationship_properties)
+                )
+                item += f", relationship: {child.relationship_variable} {{{relationship_entries}}}"
+            # the node is picked among the ones having the rest of the relation paths and matching the filters
+            where = " AND ".join(self._node_conditions(child, conditions, child_path))
+            entries.append(
+                f"{name}: head([({node.variable}){_hop(child.relationship_definition, child.relationship_variable, child.variable)}"
+                f"{' WHERE ' + where if where else ''} | {{{item}}}])"
+            )
+        if not node.properties:
+            return f"{{{', '.join(entries)}}}"
+        return f"{node.variable} {{{', '.join(entries)}}}"
+
+    @lru_cache(maxsize=64)
+    def _query(self, filter_keys: tuple[str, ...], order_by: str | None) -> str:
+        conditions = self._conditions(filter_keys)
+
+        query = f"MATCH (n0:{self.node_class.__label__})"
+        if root_conditions := self._node_conditions(self._root, conditions):
+            query += f" WHERE {' AND '.join(root_conditions)}"
+        query += (
+            f" WITH n0, {self._map_projection(self._root, conditions)} AS projection"
+        )
+        query += " RETURN projection"
+        if order_by:
+            descending = order_by.startswith("-")
+            query += (
+                f" ORDER BY n0.{order_by.lstrip('-')}{' DESC' if descending else ''}"
+            )
+        return query
+
+    def _to_projected_node(self, values: dict, node: _ProjectionNode) -> ProjectedNode:
+        relations = {}
+        for name, child in node.children.items():
+            item = values.get(name)
+            if item is None:
+                continue
+            relations[name] = self._to_projected_node(item["node"], child)
+            if child.relationship_properties:
+                relations[f"{name}_relationship"] = ProjectedNode(
+                    _inflate(
+                        child.relationship_class,
+                        item["relationship"],
+                        child.relationship_properties,
+                    ),
+                    {},
+                )
+        return ProjectedNode(
+            _inflate(node.node_class, values, node.properties), relations
+        )
+
+    def _author_ids(self, values: dict, node: _ProjectionNode) -> Iterator[str]:
+        if "author_id" in node.properties and values.get("author_id"):
+            yield values["author_id"]
+        for name, child in node.children.items():
+            item = values.get(name)
+            if item is not None:
+                yield from self._author_ids(item["node"], child)
+                if "author_id" in child.relationship_properties and item[
+                    "relationship"
+                ].get("author_id"):
+                    yield item["relationship"]["author_id"]
+
+    def fetch(self, order_by: str | None = None, **filters) -> list[BaseModel]:
+        """
+        Returns the projected nodes matching the `filters`, given in the notation of `NodeSet.filter`
+        (`relation__property=value`, `relation__property__in=values`, `relation|relationship_property=value`).
+        """
+
+        filter_keys = tuple(filters)
+        rows, _ = db.cypher_query(
+            self._query(filter_keys, order_by),
+            {f"p{i}": filters[key] for i, key in enumerate(filter_keys)},
+        )
+        # resolves the usernames of all authors at once, mapping `author_username` fields is then a lookup
+        UserInfoService.get_author_usernames_from_ids(
+            author_id
+            for row in rows
+            for author_id in self._author_ids(row[0], self._root)
+        )
+        return [
+            self.model.model_validate(self._to_projected_node(row[0], self._root))
+            for row in rows
+        ]
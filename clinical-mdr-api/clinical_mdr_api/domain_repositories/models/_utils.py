@@ -36,8 +36,12 @@ def format_generic_header_values(values: list[Any]):
 
 class ListDistinct(list):
     def distinct(self):
-        uniques = []
+        """
+        Returns the items without duplicates, keeping the first occurrence.
+        Saved nodes are compared by their element_id, as `StructuredNode.__eq__` does.
+        """
+        uniques = {}
         for ith in self:
-            if ith not in uniques:
-                uniques.extend([ith])
-        return uniques
+            key = getattr(ith, "element_id", None) or id(ith)
+            uniques.setdefault(key, ith)
+        return list(uniques.values())
@@ -1,10 +1,17 @@
-from neomodel import RelationshipFrom, RelationshipTo, StringProperty, ZeroOrMore
+from neomodel import (
+    BooleanProperty,
+    RelationshipFrom,
+    RelationshipTo,
+    StringProperty,
+    ZeroOrMore,
+)
 
 from clinical_mdr_api.domain_repositories.models.generic import (
     ClinicalMdrNode,
     ClinicalMdrNodeWithUID,
     ClinicalMdrRel,
     VersionRelationship,
+    ZonedDateTimeProperty,
 )
 from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyAction
 from clinical_mdr_api.domain_repositories.models.study_field import (
@@ -178,6 +185,56 @@ class StudyValue(ClinicalMdrNode, AuditTrailMixin):
     )
 
 
+class StudyHeader(ClinicalMdrNode):
+    """
+    Read model holding the identification of a study and its current version,
+    denormalized from the latest `StudyValue` and its `HAS_VERSION` relationship.
+    Maintained by `StudyDefinitionRepositoryImpl` whenever a study is created, saved or deleted.
+    """
+
+    uid = StringProperty()
+    study_id = StringProperty()
+    acronym = StringProperty()
+    id_prefix = StringProperty()
+    number = StringProperty()
+    version_status = StringProperty()
+    version_number = StringProperty()
+    version_started_at = ZonedDateTimeProperty()
+    version_ended_at = ZonedDateTimeProperty()
+    version_author_id = StringProperty()
+    version_description = StringProperty()
+    is_deleted = BooleanProperty()
+
+    study_root = RelationshipFrom("StudyRoot", "HAS_HEADER", model=ClinicalMdrRel)
+
+
+class StudySummary(ClinicalMdrNode):
+    """
+    Read model holding the current metadata of a study that the studies list filters and sorts on,
+    denormalized from the latest `StudyValue`, its study fields and version relationships.
+    Maintained by `StudyDefinitionRepositoryImpl` whenever a study is created or saved.
+    """
+
+    uid = StringProperty()
+    study_number = StringProperty()
+    subpart_id = StringProperty()
+    study_acronym = StringProperty()
+    study_subpart_acronym = StringProperty()
+    study_id_prefix = StringProperty()
+    description = StringProperty()
+    project_number = StringProperty()
+    study_title = StringProperty()
+    study_short_title = StringProperty()
+    study_status = StringProperty()
+    version_number = StringProperty()
+    version_timestamp = ZonedDateTimeProperty()
+    version_author_id = StringProperty()
+    has_latest_locked = BooleanProperty()
+    is_deleted = BooleanProperty()
+
+    study_root = RelationshipFrom("StudyRoot", "HAS_SUMMARY", model=ClinicalMdrRel)
+
+
 class StudyRoot(ClinicalMdrNodeWithUID):
     """
     Represents the root object for a given compound in the graph.
@@ -194,3 +251,5 @@ class StudyRoot(ClinicalMdrNodeWithUID):
         StudyValue, "LATEST_RELEASED", model=VersionRelationship
     )
     audit_trail = RelationshipTo(StudyAction, "AUDIT_TRAIL", model=ClinicalMdrRel)
+    has_header = RelationshipTo(StudyHeader, "HAS_HEADER", model=ClinicalMdrRel)
+    has_summary = RelationshipTo(StudySummary, "HAS_SUMMARY", model=ClinicalMdrRel)
@@ -4,6 +4,7 @@ from neomodel import db
 from clinical_mdr_api.domain_repositories.models.notification import (
     Notification as NotificationNode,
 )
+from clinical_mdr_api.domain_repositories.snapshot import Snapshot
 from clinical_mdr_api.models.notification import Notification
 from common.exceptions import NotFoundException
 
@@ -36,17 +37,13 @@ class NotificationRepository:
 
         return self._transform_to_models(rs[0])
 
-    def retrieve_all_active_notifications(self) -> list[Notification]:
+    def retrieve_all_published_notifications(self) -> list[Notification]:
         rs = db.cypher_query(
             """
             MATCH (n:Notification)
             WHERE n.published_at IS NOT NULL
-            AND (
-                (datetime(n.started_at) IS NULL OR datetime(n.started_at) <= datetime())
-                AND 
-                (datetime(n.ended_at) IS NULL OR datetime(n.ended_at) >= datetime())
-            )
             RETURN n
+            ORDER BY n.sn
             """,
             resolve_objects=True,
         )
@@ -158,3 +155,10 @@ class NotificationRepository:
             """,
             params={"sn": sn},
         )
+
+
+# The active notifications are polled by the UI of every user, they are filtered from this snapshot
+published_notifications = Snapshot(
+    "notifications",
+    lambda: NotificationRepository().retrieve_all_published_notifications(),
+)
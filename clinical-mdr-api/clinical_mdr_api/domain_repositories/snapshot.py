@@ -0,0 +1,161 @@
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Callable, Generic, NamedTuple, TypeVar
+
+from common import config
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class InvalidationChannel:
+    """
+    Signals the changes of a snapshot to the other worker processes of the host.
+
+    A change replaces the file `<name>.version` in `SNAPSHOT_CHANNEL_DIR`, so that its stamp (inode and modification time)
+    changes, and the workers compare the stamp with the one read before their latest load, which costs a `stat` call.
+    """
+
+    def __init__(self, name: str, directory: str = config.SNAPSHOT_CHANNEL_DIR):
+        self.path = os.path.join(directory, f"{name}.version")
+
+    def stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def publish(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary_path = f"{self.path}.{uuid.uuid4().hex}"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                file.write(temporary_path)
+            os.replace(temporary_path, self.path)
+        except OSError as error:
+            # the other workers see the change once the snapshot reaches its maximum age
+            log.warning("Publishing a change to %s failed: %s", self.path, error)
+
+
+@dataclass(frozen=True)
+class SnapshotDocument:
+    """Serialized representation of the data of a snapshot, with its entity tag"""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def of(cls, body: bytes) -> "SnapshotDocument":
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+class _State(NamedTuple):
+    version: int
+    data: object
+    stamp: tuple[int, int] | None
+    generation: int
+    loaded_at: float
+
+
+class Snapshot(Generic[T]):
+    """
+    Process-wide copy of a small data set read by many requests, e.g. the feature flags, with a version counter.
+
+    The data is loaded on first use, by one request while the concurrent ones wait for it, and reloaded when:
+    - a write of this process invalidated it (see `invalidates`), which is also published to the other workers
+      through the invalidation channel;
+    - another worker published a change through the invalidation channel;
+    - `max_age` seconds have passed, for the writes of the API instances running on other hosts (0 disables it).
+
+    The version counter is incremented whenever the reloaded data differs from the previous data.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[], T],
+        max_age: float = config.SNAPSHOT_MAX_AGE_SECONDS,
+        channel: InvalidationChannel | None = None,
+    ):
+        self.name = name
+        self._load = load
+        self.max_age = max_age
+        self.channel = channel or InvalidationChannel(name)
+        self._lock = threading.Lock()
+        self._state: _State | None = None
+        self._generation = 0
+        self._documents: dict[Hashable, SnapshotDocument] = {}
+
+    def _is_current(self, state: _State | None, stamp: tuple[int, int] | None):
+        return (
+            state is not None
+            and state.generation == self._generation
+            and state.stamp == stamp
+            and (not self.max_age or time.monotonic() - state.loaded_at < self.max_age)
+        )
+
+    def current(self) -> tuple[int, T]:
+        """Returns the version and the data of the snapshot, reloaded if it is not current"""
+
+        stamp = self.channel.stamp()
+        state = self._state
+        if self._is_current(state, stamp):
+            return state.version, state.data
+
+        with self._lock:
+            state = self._state
+            if self._is_current(state, stamp):
+                return state.version, state.data
+            generation = self._generation
+            data = self._load()
+            version = 1 if state is None else state.version
+            if state is not None and data != state.data:
+                version += 1
+                self._documents = {}
+            # a write during the load changed the generation or the stamp, the next read reloads the data
+            self._state = _State(version, data, stamp, generation, time.monotonic())
+        log.debug("Snapshot %s loaded, version %s", self.name, version)
+        return version, data
+
+    def get(self) -> T:
+        return self.current()[1]
+
+    def document(
+        self, version: int, key: Hashable, render: Callable[[], bytes]
+    ) -> SnapshotDocument:
+        """Returns the document rendered from the data of `version` identified by `key`, rendered once per version"""
+
+        documents = self._documents
+        document = documents.get((version, key))
+        if document is None:
+            document = SnapshotDocument.of(render())
+            documents[(version, key)] = document
+        return document
+
+    def invalidate(self):
+        """Reloads the data of this process and of the other workers on their next read"""
+
+        with self._lock:
+            self._generation += 1
+        self.channel.publish()
+
+    def invalidates(self, func):
+        """Decorates a function writing the data, to invalidate the snapshot once it has returned (after its transaction)"""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.invalidate()
+
+        return wrapper
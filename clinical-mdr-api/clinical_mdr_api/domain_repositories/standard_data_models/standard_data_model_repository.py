@@ -14,6 +14,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    cached_header_values,
     validate_filters_and_add_search_string,
 )
 from common.exceptions import NotFoundException, ValidationException
@@ -219,6 +220,7 @@ class StandardDataModelRepository(ABC):
 
         return extracted_items, total_amount
 
+    @cached_header_values
     def get_distinct_headers(
         self,
         field_name: str,
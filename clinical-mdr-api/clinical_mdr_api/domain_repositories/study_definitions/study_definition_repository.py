@@ -569,6 +569,7 @@ return *
         filter_operator: FilterOperator | None = FilterOperator.AND,
         total_count: bool = False,
         deleted: bool = False,
+        uids: list[str] | None = None,
     ) -> GenericFilteringReturn[StudyDefinitionAR]:
         """
         Public method which is to retrieve (a part of) whole Study repository content in the form of Study aggregate
@@ -595,6 +596,7 @@ return *
         page_size : int, number of results per page
         filter_by : dict, keys are field names for filter_variable and values are objects describing the filtering to execute
         total_count : boolean, indicates if total count of results should be returned
+        uids : list of study uids to restrict the results to, all studies are retrieved if None
         :return: Dictionary of 'items' and 'total_count'. 'items' contains the results in the form of StudyDefinitionAR instances.
         Not more than page_size items. Can be less than than that in case of the last page.
         Empty sequence in case page_number and page_size parameters pass out of the whole repository content.
@@ -620,6 +622,7 @@ return *
                 filter_by=filter_by,
                 filter_operator=filter_operator,
                 deleted=deleted,
+                uids=uids,
             )
         )
         # projecting results to StudyDefinitionAR instances
@@ -847,6 +850,7 @@ return *
         study_selection_object_node_id: int | None = None,
         study_selection_object_node_type: NodeMeta | None = None,
         deleted: bool = False,
+        uids: list[str] | None = None,
     ) -> GenericFilteringReturn[StudyDefinitionSnapshot]:
         """
         Abstract method which is expected to retrieve (a part of) whole Study
@@ -866,6 +870,8 @@ return *
 
         total_count : boolean, indicates if total count of results should be returned
 
+        uids : list of study uids to restrict the results to, all studies are retrieved if None
+
         :return: Dictionary of 'items' and 'total_count'. 'items' contains the
         results in the form of StudyDefinitionSnapshot instances. Not more than
         page_size items. Can
@@ -1006,6 +1012,13 @@ return *
         :return: bool
         """
 
+    @abstractmethod
+    def get_current_locked_version(self, study_uid: str) -> str | None:
+        """
+        A method that returns the version number of a Study with specified study_uid if its current version is locked
+        :return: str | None
+        """
+
     @abstractmethod
     def check_if_study_is_deleted(self, study_uid: str) -> bool:
         """
@@ -83,6 +83,27 @@ from common.config import (
 )
 from common.utils import convert_to_datetime
 
+# Properties of the (:StudySummary) read model, projected from the study root `sr`, its latest value `sv`
+# and its LATEST_LOCKED `llr` and LATEST_DRAFT `ldr` relationships
+STUDY_SUMMARY_PROJECTION = """{
+    uid: sr.uid,
+    study_number: sv.study_number,
+    subpart_id: sv.subpart_id,
+    study_acronym: sv.study_acronym,
+    study_subpart_acronym: sv.study_subpart_acronym,
+    study_id_prefix: sv.study_id_prefix,
+    description: sv.description,
+    project_number: head([(sv)-[:HAS_PROJECT]->(:StudyProjectField)<-[:HAS_FIELD]-(p:Project) | p.project_number]),
+    study_title: head([(sv)-[:HAS_TEXT_FIELD]->(t:StudyTextField) WHERE t.field_name = "study_title" | t.value]),
+    study_short_title: head([(sv)-[:HAS_TEXT_FIELD]->(st:StudyTextField) WHERE st.field_name = "study_short_title" | st.value]),
+    study_status: CASE WHEN ldr.end_date IS NULL THEN 'DRAFT' ELSE 'LOCKED' END,
+    version_timestamp: CASE WHEN ldr.end_date IS NULL THEN ldr.start_date ELSE llr.start_date END,
+    version_number: CASE WHEN ldr.end_date IS NULL THEN ldr.version ELSE llr.version END,
+    version_author_id: CASE WHEN ldr.end_date IS NULL THEN ldr.author_id ELSE llr.author_id END,
+    has_latest_locked: llr IS NOT NULL,
+    is_deleted: EXISTS((sv)<-[:BEFORE]-(:Delete))
+}"""
+
 MAINTAIN_RELATIONSHIPS_FOR_NEW_STUDY_VALUE = {
     "belongs_to_study_parent_part",
     "has_study_activity",
@@ -549,6 +570,8 @@ class StudyDefinitionRepositoryImpl(StudyDefinitionRepository, RepositoryImpl):
                 author_id=self.audit_info.author_id,
                 date=date,
             )
+            self._maintain_study_header(current_snapshot.uid)
+            self._maintain_study_summary(current_snapshot.uid)
             return
 
         # some assertions about what and how can things be or change (current implementation is built on those
@@ -672,6 +695,138 @@ class StudyDefinitionRepositoryImpl(StudyDefinitionRepository, RepositoryImpl):
         self._maintain_study_soa_preferences_relationship_on_save(
             expected_latest_value=expected_latest_value, previous_value=previous_value
         )
+        self._maintain_study_header(current_snapshot.uid)
+        self._maintain_study_summary(current_snapshot.uid)
+
+    @staticmethod
+    def _maintain_study_header(uid: str) -> None:
+        """
+        Refreshes the (:StudyHeader) read model of the study from its latest value
+        and the HAS_VERSION relationship of that value that ended last (or is still open),
+        so that readers don't have to resolve the current version of the study themselves.
+        Also called when the study is deleted, to flag the header as deleted.
+        """
+        db.cypher_query(
+            """
+            MATCH (study_root:StudyRoot {uid: $uid})-[:LATEST]->(study_value:StudyValue)
+            OPTIONAL MATCH (study_root)-[hv:HAS_VERSION]->(study_value)
+            WITH study_root, study_value, hv ORDER BY hv.end_date DESC LIMIT 1
+            MERGE (study_root)-[:HAS_HEADER]->(header:StudyHeader)
+            SET header.uid = study_root.uid,
+                header.acronym = study_value.study_acronym,
+                header.id_prefix = study_value.study_id_prefix,
+                header.number = study_value.study_number,
+                header.study_id = CASE study_value.subpart_id
+                    WHEN IS NULL THEN toUpper(COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, ''))
+                    ELSE toUpper(COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, '')) + "-" + study_value.subpart_id
+                END,
+                header.version_status = hv.status,
+                header.version_number = hv.version,
+                header.version_started_at = hv.start_date,
+                header.version_ended_at = hv.end_date,
+                header.version_author_id = hv.author_id,
+                header.version_description = hv.change_description,
+                header.is_deleted = EXISTS((study_value)<-[:BEFORE]-(:Delete))
+            """,
+            {"uid": uid},
+        )
+
+    @staticmethod
+    def _maintain_study_summary(uid: str) -> None:
+        """
+        Refreshes the (:StudySummary) read model of the study, holding the current metadata
+        the studies list filters and sorts on, see `_build_snapshot_alias_clause` for the full snapshot.
+        """
+        db.cypher_query(
+            f"""
+            MATCH (sr:StudyRoot {{uid: $uid}})-[:LATEST]->(sv:StudyValue)
+            WITH sr, sv,
+                head([(sr)-[ll:LATEST_LOCKED]->() | ll]) AS llr,
+                head([(sr)-[ld:LATEST_DRAFT]->() | ld]) AS ldr
+            MERGE (sr)-[:HAS_SUMMARY]->(summary:StudySummary)
+            SET summary = {STUDY_SUMMARY_PROJECTION}
+            """,
+            {"uid": uid},
+        )
+
+    def find_all_summaries(
+        self,
+        has_study_footnote: bool | None = None,
+        has_study_objective: bool | None = None,
+        has_study_endpoint: bool | None = None,
+        has_study_criteria: bool | None = None,
+        has_study_activity: bool | None = None,
+        has_study_activity_instruction: bool | None = None,
+        deleted: bool = False,
+    ) -> list[dict]:
+        """
+        Returns the (:StudySummary) read models of all studies, completed with the names of the project
+        and clinical programme, the author username and the study parent part and subparts.
+        Much cheaper than `find_all`, which builds the full snapshot of every study.
+        The summary of a study that doesn't have one stored yet is projected on the fly.
+        """
+        has_filters = {
+            "HAS_STUDY_FOOTNOTE": has_study_footnote,
+            "HAS_STUDY_OBJECTIVE": has_study_objective,
+            "HAS_STUDY_ENDPOINT": has_study_endpoint,
+            "HAS_STUDY_CRITERIA": has_study_criteria,
+            "HAS_STUDY_ACTIVITY": has_study_activity,
+            "HAS_STUDY_ACTIVITY_INSTRUCTION": has_study_activity_instruction,
+        }
+        has_filters_clause = "".join(
+            f" AND {'' if value else 'NOT '}EXISTS((sv)-[:{rel_type}]->())"
+            for rel_type, value in has_filters.items()
+            if value is not None
+        )
+        rs, columns = db.cypher_query(
+            f"""
+            MATCH (sr:StudyRoot)-[:LATEST]->(sv:StudyValue)
+            WHERE {'' if deleted else 'NOT'} EXISTS((sv)<-[:BEFORE]-(:Delete)){has_filters_clause}
+            OPTIONAL MATCH (sr)-[:HAS_SUMMARY]->(stored:StudySummary)
+            WITH sr, sv, stored,
+                CASE WHEN stored IS NULL THEN head([(sr)-[ll:LATEST_LOCKED]->() | ll]) END AS llr,
+                CASE WHEN stored IS NULL THEN head([(sr)-[ld:LATEST_DRAFT]->() | ld]) END AS ldr
+            WITH sr, sv,
+                CASE WHEN stored IS NULL THEN {STUDY_SUMMARY_PROJECTION} ELSE stored {{.*}} END AS summary
+            OPTIONAL MATCH (p:Project {{project_number: summary.project_number}})
+            OPTIONAL MATCH (p)<-[:HOLDS_PROJECT]-(cp:ClinicalProgramme)
+            OPTIONAL MATCH (author:User {{user_id: summary.version_author_id}})
+            RETURN summary,
+                p.name AS project_name,
+                cp.name AS clinical_programme_name,
+                coalesce(author.username, summary.version_author_id) AS version_author,
+                head([(sv)<-[:HAS_STUDY_SUBPART]-(psv:StudyValue)<-[:LATEST]-(parent:StudyRoot) | {{
+                    uid: parent.uid,
+                    study_number: psv.study_number,
+                    study_acronym: psv.study_acronym,
+                    study_id_prefix: psv.study_id_prefix,
+                    description: psv.description,
+                    project_number: head([(psv)-[:HAS_PROJECT]->(:StudyProjectField)<-[:HAS_FIELD]-(pp:Project) | pp.project_number]),
+                    study_title: head([(psv)-[:HAS_TEXT_FIELD]->(pt:StudyTextField) WHERE pt.field_name = "study_title" | pt.value]),
+                    registry_identifiers: [(psv)-[:HAS_TEXT_FIELD]->(rf:StudyTextField) WHERE rf.field_name IN $registry_identifier_fields | {{
+                        field_name: rf.field_name,
+                        value: rf.value,
+                        null_value_code: head([(rf)-[:HAS_REASON_FOR_NULL_VALUE]->(nvr:CTTermRoot)-[:HAS_NAME_ROOT]->(:CTTermNameRoot)-[:LATEST]->(nvv:CTTermNameValue) | {{
+                            term_uid: nvr.uid,
+                            sponsor_preferred_name: nvv.name,
+                            date_conflict: false
+                        }}])
+                    }}]
+                }}]) AS study_parent_part,
+                [(sv)-[:HAS_STUDY_SUBPART]->(:StudyValue)<-[:LATEST]-(sub:StudyRoot) | sub.uid] AS study_subpart_uids
+            """,
+            {
+                "registry_identifier_fields": [
+                    field.name for field in fields(RegistryIdentifiersVO)
+                ]
+            },
+        )
+        summaries = [dict(zip(columns, row)) for row in rs]
+        for summary in summaries:
+            summary["summary"]["version_timestamp"] = convert_to_datetime(
+                value=summary["summary"]["version_timestamp"]
+            )
+        return summaries
 
     def _maintain_study_relationship_on_save(
         self,
@@ -1958,6 +2113,8 @@ class StudyDefinitionRepositoryImpl(StudyDefinitionRepository, RepositoryImpl):
             author_id=self.audit_info.author_id,
             date=date,
         )
+        self._maintain_study_header(snapshot.uid)
+        self._maintain_study_summary(snapshot.uid)
 
     @staticmethod
     def _generate_study_value_audit_node(
@@ -2164,6 +2321,7 @@ class StudyDefinitionRepositoryImpl(StudyDefinitionRepository, RepositoryImpl):
         study_selection_object_node_type,
         filter_query_parameters: dict,
         deleted: bool,
+        uids: list[str] | None = None,
     ) -> str:
         if study_selection_object_node_id:
             match_clause = f"""
@@ -2178,6 +2336,9 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
         match_clause += (
             f"WHERE {'' if deleted else 'NOT'} EXISTS((sv)<-[:BEFORE]-(:Delete))"
         )
+        if uids is not None:
+            match_clause += " AND sr.uid IN $uids"
+            filter_query_parameters["uids"] = uids
         return match_clause
 
     def _build_snapshot_alias_clause(self) -> str:
@@ -2345,6 +2506,7 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
         study_selection_object_node_id: int | None = None,
         study_selection_object_node_type: NodeMeta | None = None,
         deleted: bool = False,
+        uids: list[str] | None = None,
     ) -> GenericFilteringReturn[StudyDefinitionSnapshot]:
         # To build StudyDefinitionSnapshot (domain object) we need 5 main members:
         # * uid
@@ -2370,6 +2532,7 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
             study_selection_object_node_type,
             filter_query_parameters,
             deleted,
+            uids,
         )
         alias_clause = self._build_snapshot_alias_clause()
         filter_by = self._update_snapshot_filter_by(
@@ -2756,6 +2919,19 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
         )
         return is_study_locked
 
+    def get_current_locked_version(self, study_uid: str) -> str | None:
+        result, _ = db.cypher_query(
+            """
+            MATCH (root:StudyRoot {uid: $uid})-[:LATEST_LOCKED]->(value:StudyValue)<-[:LATEST]-(root)
+            MATCH (root)-[hv:HAS_VERSION {status: 'LOCKED'}]->(value)
+            RETURN hv.version
+            ORDER BY hv.start_date DESC
+            LIMIT 1
+            """,
+            {"uid": study_uid},
+        )
+        return result[0][0] if result else None
+
     @classmethod
     def check_if_study_is_deleted(cls, study_uid: str) -> bool:
         root = StudyRoot.nodes.get_or_none(uid=study_uid)
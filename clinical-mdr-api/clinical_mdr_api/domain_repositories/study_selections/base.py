@@ -1,12 +1,19 @@
 import datetime
 from dataclasses import dataclass
 
+from neomodel import db
+
 from clinical_mdr_api.domain_repositories.models.study import StudyRoot, StudyValue
 from clinical_mdr_api.domain_repositories.models.study_audit_trail import (
     Create,
     Delete,
     Edit,
 )
+from clinical_mdr_api.repositories._utils import (
+    CypherQueryBuilder,
+    FilterDict,
+    FilterOperator,
+)
 from common.exceptions import NotFoundException
 
 
@@ -22,6 +29,62 @@ class SelectionHistory:
     end_date: datetime.datetime | None
 
 
+def study_value_match_clause(study_value_version: str | None = None) -> str:
+    """Matches the StudyValue `sv` of the study `$study_uid`, at the given released version or the latest one"""
+    if study_value_version:
+        return """
+            MATCH (sr:StudyRoot {uid: $study_uid})-[:HAS_VERSION {status: 'RELEASED', version: $study_value_version}]->(sv:StudyValue)
+            """
+    return "MATCH (sr:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)"
+
+
+def find_selection_page(
+    match_clause: str,
+    alias_clause: str,
+    field_aliases: dict[str, str],
+    parameters: dict,
+    filter_by: dict | None = None,
+    filter_operator: FilterOperator | None = FilterOperator.AND,
+    sort_by: dict | None = None,
+    page_number: int = 1,
+    page_size: int = 0,
+    total_count: bool = False,
+) -> tuple[list[str], int]:
+    """
+    Filters, sorts, paginates and counts the selections of a study in the database.
+
+    The alias clause defines the selection `uid`, its `position` in the selection aggregate
+    and one alias per response model field that can be filtered or sorted on, as mapped by `field_aliases`.
+    The selections are sorted by position after the requested `sort_by` keys, or by position only
+    when no `sort_by` is given, so that the pages don't overlap.
+
+    Returns the uids of the selections in the page and the total number of selections matching the filters.
+    """
+    query = CypherQueryBuilder(
+        match_clause=match_clause,
+        alias_clause=alias_clause,
+        filter_by=FilterDict(elements=filter_by or {}),
+        filter_operator=filter_operator or FilterOperator.AND,
+        sort_by=sort_by or {"order": True},
+        implicit_sort_by="order",
+        page_number=page_number,
+        page_size=page_size,
+        total_count=total_count,
+        format_filter_sort_keys=lambda key: field_aliases.get(key, key),
+    )
+    query.parameters.update(parameters)
+
+    result, columns = query.execute()
+    uid_index = columns.index("uid")
+    uids = [row[uid_index] for row in result]
+
+    count = 0
+    if total_count:
+        count_result, _ = db.cypher_query(query.count_query, query.parameters)
+        count = count_result[0][0] if count_result else 0
+    return uids, count
+
+
 class StudySelectionRepository:
     """
     Base class for study selection.
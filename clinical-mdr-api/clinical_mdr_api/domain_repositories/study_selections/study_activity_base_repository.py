@@ -1,18 +1,17 @@
 import abc
+import bisect
 import datetime
 from typing import Generic, TypeVar
 
 from neomodel import db
 
 from clinical_mdr_api import utils
-from clinical_mdr_api.domain_repositories.models.study import StudyRoot, StudyValue
 from clinical_mdr_api.domain_repositories.models.study_audit_trail import (
     Create,
     Delete,
     Edit,
     StudyAction,
 )
-from clinical_mdr_api.domain_repositories.models.study_selections import StudySelection
 from clinical_mdr_api.domains.study_selections.study_selection_base import (
     StudySelectionBaseAR,
     StudySelectionBaseVO,
@@ -22,8 +21,52 @@ from common.utils import convert_to_datetime, validate_max_skip_clause
 _AggregateRootType = TypeVar("_AggregateRootType")
 
 
+def get_shifted_selection_uids(
+    previous_selections: dict[str, tuple[int, StudySelectionBaseVO]],
+    current_selections: dict[str, tuple[int, StudySelectionBaseVO]],
+) -> set[str]:
+    """
+    Returns the uids of the unchanged selections whose order only changed because other selections
+    were added, removed or moved, i.e. the unchanged selections that kept their relative order.
+    The selections are mappings of uid to (order, selection).
+    """
+    unchanged = sorted(
+        (order, previous_selections[uid][0], uid)
+        for uid, (order, selection) in current_selections.items()
+        if uid in previous_selections and previous_selections[uid][1] is selection
+    )
+    # longest increasing subsequence of the previous orders, in the current order
+    tails: list[int] = []
+    tail_orders: list[int] = []
+    # index of the previous selection of the subsequence ending at each selection, -1 for none
+    predecessors: list[int] = []
+    for index, (_, previous_order, _) in enumerate(unchanged):
+        position = bisect.bisect_left(tail_orders, previous_order)
+        predecessors.append(tails[position - 1] if position else -1)
+        if position == len(tails):
+            tails.append(index)
+            tail_orders.append(previous_order)
+        else:
+            tails[position] = index
+            tail_orders[position] = previous_order
+    kept = set()
+    index: int = tails[-1] if tails else -1
+    while index >= 0:
+        order, previous_order, uid = unchanged[index]
+        if order != previous_order:
+            kept.add(uid)
+        index = predecessors[index]
+    return kept
+
+
 class StudySelectionActivityBaseRepository(Generic[_AggregateRootType], abc.ABC):
     _aggregate_root_type: StudySelectionBaseAR
+    # label of the selection nodes and type of their relationship from the StudyValue
+    _selection_label: str
+    _study_value_relationship: str
+    # labels of selections linked by uid in `_link_selection_query`,
+    # their relationships aren't copied from the previous version of a selection
+    _maintained_selection_labels: tuple[str, ...] = ()
 
     @staticmethod
     def _acquire_write_lock_study_value(uid: str) -> None:
@@ -71,21 +114,19 @@ class StudySelectionActivityBaseRepository(Generic[_AggregateRootType], abc.ABC)
         raise NotImplementedError
 
     @abc.abstractmethod
-    def get_study_selection_node_from_latest_study_value(
-        self, study_value: StudyValue, study_selection: StudySelection
-    ):
+    def _selection_parameters(self, selection: StudySelectionBaseVO) -> dict:
+        """
+        Returns the write parameters of a selection, its node `properties`
+        and the uids and versions used by `_link_selection_query`
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
-    def _add_new_selection(
-        self,
-        latest_study_value_node: StudyValue,
-        order: int,
-        selection: StudySelectionBaseVO,
-        audit_node: StudyAction,
-        last_study_selection_node: StudySelection,
-        for_deletion: bool = False,
-    ):
+    def _link_selection_query(self) -> str:
+        """
+        Returns the Cypher linking each `new` selection node to the library and study nodes
+        it references, using the `selection` parameters returned by `_selection_parameters`
+        """
         raise NotImplementedError
 
     def _versioning_query(self):
@@ -222,190 +263,184 @@ class StudySelectionActivityBaseRepository(Generic[_AggregateRootType], abc.ABC)
             selection_aggregate.repository_closure_data = all_selections
         return selection_aggregate
 
-    def _get_audit_node(
-        self, study_selection: _AggregateRootType, study_selection_uid: str
-    ):
-        if not any(
-            item.study_selection_uid == study_selection_uid
-            for item in study_selection.study_objects_selection
-        ):
-            return Delete()
-
-        if any(
-            item.study_selection_uid == study_selection_uid
-            for item in study_selection.repository_closure_data
-        ) or (
-            study_selection.closure_from_other_ar
-            and study_selection_uid
-            == study_selection.closure_from_other_ar.study_selection_uid
-        ):
-            return Edit()
-        return Create()
-
     def is_repository_based_on_ordered_selection(self):
         return True
 
-    def _get_audit_trail_nodes_to_reference(
-        self,
-        study_root_node: StudyRoot,
-        latest_study_value_node: StudyValue,
-        author_id: str,
-        study_activity: StudySelectionBaseVO,
-        study_selection: StudySelectionBaseAR,
-    ):
-        last_study_selection_node = (
-            self.get_study_selection_node_from_latest_study_value(
-                study_value=latest_study_value_node, study_selection=study_activity
-            )
-        )
-
-        audit_node = self._get_audit_node(
-            study_selection, study_activity.study_selection_uid
-        )
-        audit_node = self._set_before_audit_info(
-            last_study_selection_node, audit_node, study_root_node, author_id
-        )
-        return audit_node, last_study_selection_node
-
     def save(
         self,
         study_selection: StudySelectionBaseAR,
         author_id: str,
         make_order_check=True,
     ) -> None:
+        """
+        Persists the changes of the selections of the aggregate compared to its `repository_closure_data`.
+
+        Created, edited and deleted selections are written by a single UNWIND query.
+        Selections that only moved because another selection was added, removed or reordered
+        get their order updated in place, unless the node is shared with a locked or released study version.
+        """
         assert study_selection.repository_closure_data is not None
-        # get the closure_data
-        closure_data = study_selection.repository_closure_data
-        closure_data_length = len(closure_data)
-
-        # getting the latest study value node
-        study_root_node: StudyRoot = StudyRoot.nodes.get(uid=study_selection.study_uid)
-        latest_study_value_node: StudyValue = study_root_node.latest_value.get_or_none()
-
-        # process new/changed/deleted elements for each activity
-        selections_to_remove = []
-        selections_to_add = []
-
-        # check if object is removed from the selection list - delete has been called
-        if closure_data_length > len(study_selection.study_objects_selection):
-            # remove the last item from old list, as there will no longer be any study activity with that high order
-            if self.is_repository_based_on_ordered_selection():
-                selections_to_remove.append((len(closure_data), closure_data[-1]))
-            else:
-                for order, closure_item in enumerate(closure_data, start=1):
-                    if closure_item not in study_selection.study_objects_selection:
-                        selections_to_remove.append((order, closure_item))
-
-        # loop through new data - start=1 as order starts at 1 not at 0 and find what needs to be removed and added
-        for order, selection in enumerate(
-            study_selection.study_objects_selection, start=1
-        ):
-            # check whether something new is added
-            if closure_data_length > order - 1:
-                # check if anything has changed
-                if selection is not closure_data[order - 1]:
-                    # don't modify the item if the change is the order change,
-                    # if the item is actually changed (the uid is the same) we should modify it
-                    if (
-                        self.is_repository_based_on_ordered_selection()
-                        or selection.study_selection_uid
-                        == closure_data[order - 1].study_selection_uid
-                    ):
-                        # update the selection by removing the old if the old exists, and adding new selection
-                        selections_to_remove.append((order, closure_data[order - 1]))
-                        selections_to_add.append((order, selection))
-            else:
-                # else something new have been added
-                selections_to_add.append((order, selection))
-
-        # audit trail nodes dictionary, holds the new nodes created for the audit trail
-        audit_trail_nodes = {}
-
-        # loop through and remove selections
-        for order, study_activity in selections_to_remove:
-
-            if not (
-                study_selection.closure_from_other_ar
-                and study_selection.closure_from_other_ar.study_selection_uid
-                == study_activity.study_selection_uid
-            ):
-                audit_node, last_study_selection_node = (
-                    self._get_audit_trail_nodes_to_reference(
-                        study_root_node=study_root_node,
-                        latest_study_value_node=latest_study_value_node,
-                        author_id=author_id,
-                        study_activity=study_activity,
-                        study_selection=study_selection,
-                    )
+        closure_from_other_ar_uid = (
+            study_selection.closure_from_other_ar.study_selection_uid
+            if study_selection.closure_from_other_ar
+            else None
+        )
+        previous_selections = {
+            selection.study_selection_uid: (order, selection)
+            for order, selection in enumerate(
+                study_selection.repository_closure_data, start=1
+            )
+        }
+        current_selections = {
+            selection.study_selection_uid: (order, selection)
+            for order, selection in enumerate(
+                study_selection.study_objects_selection, start=1
+            )
+        }
+        shifted_uids = set()
+        if make_order_check and self.is_repository_based_on_ordered_selection():
+            shifted_uids = get_shifted_selection_uids(
+                previous_selections, current_selections
+            )
+        shifted_uids = self._update_order_in_place(
+            study_selection.study_uid,
+            [{"uid": uid, "order": current_selections[uid][0]} for uid in shifted_uids],
+        )
+        date = datetime.datetime.now(datetime.timezone.utc)
+
+        writes = []
+        for uid, (order, selection) in current_selections.items():
+            new_order = order if make_order_check else selection.order
+            if uid in previous_selections:
+                previous_order, previous_selection = previous_selections[uid]
+                if uid in shifted_uids:
+                    continue
+                if selection is previous_selection and (
+                    previous_order == order
+                    or not self.is_repository_based_on_ordered_selection()
+                ):
+                    continue
+                writes.append(
+                    self._selection_write(selection, new_order, Edit, author_id, date)
                 )
-                audit_trail_nodes[study_activity.study_selection_uid] = (
-                    audit_node,
-                    last_study_selection_node,
+            elif uid == closure_from_other_ar_uid:
+                writes.append(
+                    self._selection_write(selection, new_order, Edit, author_id, date)
                 )
-
-                if isinstance(audit_node, Delete):
-                    self._add_new_selection(
-                        latest_study_value_node,
-                        order,
-                        study_activity,
-                        audit_node,
-                        last_study_selection_node,
-                        True,
+            else:
+                writes.append(
+                    self._selection_write(
+                        selection,
+                        new_order,
+                        Create,
+                        selection.author_id,
+                        selection.start_date,
                     )
-
-        # loop through and add selections
-        for order, selection in selections_to_add:
-            last_study_selection_node = None
-            if selection.study_selection_uid in audit_trail_nodes:
-                audit_node, last_study_selection_node = audit_trail_nodes[
-                    selection.study_selection_uid
-                ]
-            elif (
-                study_selection.closure_from_other_ar
-                and selection.study_selection_uid
-                == study_selection.closure_from_other_ar.study_selection_uid
-            ):
-                audit_node, last_study_selection_node = (
-                    self._get_audit_trail_nodes_to_reference(
-                        study_root_node=study_root_node,
-                        latest_study_value_node=latest_study_value_node,
-                        author_id=author_id,
-                        study_activity=selection,
-                        study_selection=study_selection,
+                )
+        for uid, (order, selection) in previous_selections.items():
+            if uid not in current_selections and uid != closure_from_other_ar_uid:
+                writes.append(
+                    self._selection_write(
+                        selection, order, Delete, author_id, date, for_deletion=True
                     )
                 )
-            else:
-                audit_node = Create()
-                audit_node.author_id = selection.author_id
-                audit_node.date = selection.start_date
-                audit_node.save()
-                study_root_node.audit_trail.connect(audit_node)
-            new_order = order
-            if not make_order_check:
-                new_order = selection.order
-            self._add_new_selection(
-                latest_study_value_node,
-                new_order,
-                selection,
-                audit_node,
-                last_study_selection_node,
-                False,
-            )
 
-    @staticmethod
-    def _set_before_audit_info(
-        study_activity_selection_node: StudySelection,
-        audit_node: StudyAction,
-        study_root_node: StudyRoot,
+        if writes:
+            self._write_selections(study_selection.study_uid, writes)
+
+    def _selection_write(
+        self,
+        selection: StudySelectionBaseVO,
+        order: int,
+        action: type[StudyAction],
         author_id: str,
-    ) -> StudyAction:
-        audit_node.author_id = author_id
-        audit_node.date = datetime.datetime.now(datetime.timezone.utc)
-        audit_node.save()
-
-        audit_node.has_before.connect(study_activity_selection_node)
-        study_root_node.audit_trail.connect(audit_node)
-        return audit_node
+        date: datetime.datetime,
+        for_deletion: bool = False,
+    ) -> dict:
+        parameters = self._selection_parameters(selection)
+        parameters["properties"] |= {
+            "uid": selection.study_selection_uid,
+            "accepted_version": selection.accepted_version,
+        }
+        if self.is_repository_based_on_ordered_selection():
+            parameters["properties"]["order"] = order
+        return parameters | {
+            "uid": selection.study_selection_uid,
+            "action": action.__label__,
+            "author_id": author_id,
+            "date": date,
+            "for_deletion": for_deletion,
+        }
+
+    def _update_order_in_place(
+        self, study_uid: str, order_updates: list[dict]
+    ) -> set[str]:
+        """
+        Sets the new order of selections that were only shifted by other changes,
+        returns the uids of the updated selections.
+        Nodes that are also part of another version of the study are not updated.
+        """
+        if not order_updates:
+            return set()
+        rs, _ = db.cypher_query(
+            f"""
+            MATCH (:StudyRoot {{uid: $study_uid}})-[:LATEST]->(sv:StudyValue)
+            UNWIND $order_updates AS order_update
+            MATCH (sv)-[:{self._study_value_relationship}]->(selection:{self._selection_label} {{uid: order_update.uid}})
+            WHERE NOT EXISTS {{
+                (selection)<-[:{self._study_value_relationship}]-(other_study_value:StudyValue)
+                WHERE other_study_value <> sv
+            }}
+            SET selection.order = order_update.order
+            RETURN selection.uid
+            """,
+            {"study_uid": study_uid, "order_updates": order_updates},
+        )
+        return {row[0] for row in rs}
+
+    def _write_selections(self, study_uid: str, writes: list[dict]) -> None:
+        """
+        Creates the new versions of the selections with their audit trail in a single query.
+        The relationships of the previous version to other selections of the study value
+        are copied to the new version, except for the `_maintained_selection_labels`
+        that are linked by `_link_selection_query`.
+        """
+        excluded_labels = "".join(
+            f" AND NOT other:{label}" for label in self._maintained_selection_labels
+        )
+        db.cypher_query(
+            f"""
+            MATCH (sr:StudyRoot {{uid: $study_uid}})-[:LATEST]->(sv:StudyValue)
+            UNWIND $writes AS selection
+            OPTIONAL MATCH (sv)-[previous_rel:{self._study_value_relationship}]->(previous:{self._selection_label} {{uid: selection.uid}})
+            CALL apoc.create.node(["StudyAction", selection.action], {{author_id: selection.author_id, date: selection.date}})
+            YIELD node AS audit
+            CREATE (sr)-[:AUDIT_TRAIL]->(audit)
+            CREATE (audit)-[:AFTER]->(new:StudySelection:{self._selection_label})
+            SET new = selection.properties
+            FOREACH (_ IN CASE WHEN previous IS NULL THEN [] ELSE [1] END | CREATE (audit)-[:BEFORE]->(previous))
+            FOREACH (_ IN CASE WHEN selection.for_deletion THEN [] ELSE [1] END
+                | CREATE (sv)-[:{self._study_value_relationship}]->(new))
+            WITH sv, selection, previous, previous_rel, new
+            CALL {{
+                WITH sv, previous, new
+                MATCH (previous)-[rel]-(other)
+                WHERE (other:StudySelection OR other:StudyField){excluded_labels}
+                    AND EXISTS {{ (sv)-->(other) }}
+                CALL apoc.create.relationship(
+                    CASE WHEN startNode(rel) = previous THEN new ELSE other END,
+                    type(rel),
+                    properties(rel),
+                    CASE WHEN startNode(rel) = previous THEN other ELSE new END
+                ) YIELD rel AS copied_rel
+                RETURN count(copied_rel) AS copied_rels
+            }}
+            DELETE previous_rel
+            WITH selection, new
+            {self._link_selection_query()}
+            """,
+            {"study_uid": study_uid, "writes": writes},
+        )
 
     def _get_selection_with_history(
         self, study_uid: str, study_selection_uid: str = None
@@ -3,18 +3,8 @@ from dataclasses import dataclass
 
 from neomodel import db
 
-from clinical_mdr_api.domain_repositories.generic_repository import (
-    manage_previous_connected_study_selection_relationships,
-)
-from clinical_mdr_api.domain_repositories.models.activities import (
-    ActivityGroupRoot,
-    ActivityGroupValue,
-)
-from clinical_mdr_api.domain_repositories.models.study import StudyValue
-from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyAction
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivityGroup,
-    StudySelection,
 )
 from clinical_mdr_api.domain_repositories.study_selections.study_activity_base_repository import (
     StudySelectionActivityBaseRepository,
@@ -49,6 +39,8 @@ class StudySelectionActivityGroupRepository(
     StudySelectionActivityBaseRepository[StudySelectionActivityGroupAR]
 ):
     _aggregate_root_type = StudySelectionActivityGroupAR
+    _selection_label = "StudyActivityGroup"
+    _study_value_relationship = "HAS_STUDY_ACTIVITY_GROUP"
 
     def _create_value_object_from_repository(
         self, selection: dict, acv: bool
@@ -191,60 +183,25 @@ class StudySelectionActivityGroupRepository(
                     """
         return audit_trail_cypher
 
-    def get_study_selection_node_from_latest_study_value(
-        self, study_value: StudyValue, study_selection: StudySelection
-    ):
-        return StudyActivityGroup.nodes.has(has_before=False).get(
-            uid=study_selection.study_selection_uid
-        )
-
-    def _add_new_selection(
-        self,
-        latest_study_value_node: StudyValue,
-        order: int,
-        selection: StudySelectionActivityGroupVO,
-        audit_node: StudyAction,
-        last_study_selection_node: StudyActivityGroup,
-        for_deletion: bool = False,
-    ):
-        # find the activity group value
-        activity_group_root_node: ActivityGroupRoot = ActivityGroupRoot.nodes.get(
-            uid=selection.activity_group_uid
-        )
-        latest_activity_group_value_node: ActivityGroupValue = (
-            activity_group_root_node.get_value_for_version(
-                selection.activity_group_version
-            )
-        )
-        # Create new activity group selection
-        study_activity_group_selection_node = StudyActivityGroup(
-            show_activity_group_in_protocol_flowchart=selection.show_activity_group_in_protocol_flowchart,
-            order=order,
-        )
-        study_activity_group_selection_node.uid = selection.study_selection_uid
-        study_activity_group_selection_node.accepted_version = (
-            selection.accepted_version
-        )
-        study_activity_group_selection_node.save()
-
-        if not for_deletion:
-            # Connect new node with study value
-            latest_study_value_node.has_study_activity_group.connect(
-                study_activity_group_selection_node
-            )
+    def _selection_parameters(self, selection: StudySelectionActivityGroupVO) -> dict:
+        return {
+            "properties": {
+                "show_activity_group_in_protocol_flowchart": selection.show_activity_group_in_protocol_flowchart,
+            },
+            "activity_group_uid": selection.activity_group_uid,
+            "activity_group_version": selection.activity_group_version,
+        }
 
-        # Connect new node with audit trail
-        audit_node.has_after.connect(study_activity_group_selection_node)
-        # Connect new node with Activity subgroup value
-        study_activity_group_selection_node.has_selected_activity_group.connect(
-            latest_activity_group_value_node
-        )
-        if last_study_selection_node:
-            manage_previous_connected_study_selection_relationships(
-                previous_item=last_study_selection_node,
-                study_value_node=latest_study_value_node,
-                new_item=study_activity_group_selection_node,
-            )
+    def _link_selection_query(self) -> str:
+        return """
+            CALL {
+                WITH selection, new
+                MATCH (:ActivityGroupRoot {uid: selection.activity_group_uid})
+                    -[:HAS_VERSION {version: selection.activity_group_version}]->(activity_group_value:ActivityGroupValue)
+                WITH new, activity_group_value LIMIT 1
+                CREATE (new)-[:HAS_SELECTED_ACTIVITY_GROUP]->(activity_group_value)
+            }
+            """
 
     def generate_uid(self) -> str:
         return StudyActivityGroup.get_next_free_uid_and_increment_counter()
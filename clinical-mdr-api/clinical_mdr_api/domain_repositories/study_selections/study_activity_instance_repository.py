@@ -1,20 +1,9 @@
 import datetime
 from dataclasses import dataclass
 
-from clinical_mdr_api.domain_repositories.generic_repository import (
-    manage_previous_connected_study_selection_relationships,
-)
 from clinical_mdr_api.domain_repositories.models._utils import ListDistinct
-from clinical_mdr_api.domain_repositories.models.activities import (
-    ActivityInstanceRoot,
-    ActivityInstanceValue,
-)
-from clinical_mdr_api.domain_repositories.models.study import StudyValue
-from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyAction
 from clinical_mdr_api.domain_repositories.models.study_selections import (
-    StudyActivity,
     StudyActivityInstance,
-    StudySelection,
 )
 from clinical_mdr_api.domain_repositories.study_selections.study_activity_base_repository import (
     StudySelectionActivityBaseRepository,
@@ -48,6 +37,9 @@ class StudySelectionActivityInstanceRepository(
     StudySelectionActivityBaseRepository[StudySelectionActivityInstanceAR]
 ):
     _aggregate_root_type = StudySelectionActivityInstanceAR
+    _selection_label = "StudyActivityInstance"
+    _study_value_relationship = "HAS_STUDY_ACTIVITY_INSTANCE"
+    _maintained_selection_labels = ("StudyActivity",)
 
     def is_repository_based_on_ordered_selection(self):
         return False
@@ -285,75 +277,38 @@ class StudySelectionActivityInstanceRepository(
                     """
         return audit_trail_cypher
 
-    def get_study_selection_node_from_latest_study_value(
-        self, study_value: StudyValue, study_selection: StudySelection
-    ):
-        return study_value.has_study_activity_instance.get(
-            uid=study_selection.study_selection_uid
-        )
+    def _selection_parameters(
+        self, selection: StudySelectionActivityInstanceVO
+    ) -> dict:
+        return {
+            "properties": {
+                "show_activity_instance_in_protocol_flowchart": selection.show_activity_instance_in_protocol_flowchart,
+            },
+            "activity_instance_uid": selection.activity_instance_uid,
+            "activity_instance_version": selection.activity_instance_version,
+            "study_activity_uid": selection.study_activity_uid,
+        }
 
-    def _add_new_selection(
-        self,
-        latest_study_value_node: StudyValue,
-        order: int,
-        selection: StudySelectionActivityInstanceVO,
-        audit_node: StudyAction,
-        last_study_selection_node: StudyActivityInstance,
-        for_deletion: bool = False,
-    ):
-        # Create new activity selection
-        study_activity_instance_selection_node = StudyActivityInstance(
-            show_activity_instance_in_protocol_flowchart=selection.show_activity_instance_in_protocol_flowchart,
-        )
-        study_activity_instance_selection_node.uid = selection.study_selection_uid
-        study_activity_instance_selection_node.accepted_version = (
-            selection.accepted_version
-        )
-        study_activity_instance_selection_node.save()
-        if not for_deletion:
-            # Connect new node with study value
-            latest_study_value_node.has_study_activity_instance.connect(
-                study_activity_instance_selection_node
-            )
-        # Connect new node with audit trail
-        audit_node.has_after.connect(study_activity_instance_selection_node)
-        if selection.activity_instance_uid:
-            # find the activity instance value
-            activity_instance_root_node: ActivityInstanceRoot = (
-                ActivityInstanceRoot.nodes.get(uid=selection.activity_instance_uid)
-            )
-            if selection.activity_instance_version:
-                latest_activity_instance_value_node: ActivityInstanceValue = (
-                    activity_instance_root_node.get_value_for_version(
-                        selection.activity_instance_version
-                    )
-                )
-            else:
-                latest_activity_instance_value_node: ActivityInstanceValue = (
-                    activity_instance_root_node.has_latest_value.get()
-                )
-            # Connect new node with Activity value
-            study_activity_instance_selection_node.has_selected_activity_instance.connect(
-                latest_activity_instance_value_node
-            )
-
-        # Connect StudyActivityInstance with StudyActivity node
-        study_activity_node = StudyActivity.nodes.has(has_before=False).get(
-            uid=selection.study_activity_uid
-        )
-        study_activity_instance_selection_node.study_activity_has_study_activity_instance.connect(
-            study_activity_node
-        )
-
-        if last_study_selection_node:
-            manage_previous_connected_study_selection_relationships(
-                previous_item=last_study_selection_node,
-                study_value_node=latest_study_value_node,
-                new_item=study_activity_instance_selection_node,
-                exclude_study_selection_relationships=[
-                    StudyActivity,
-                ],
-            )
+    def _link_selection_query(self) -> str:
+        return """
+            CALL {
+                WITH selection, new
+                MATCH (activity_instance_root:ActivityInstanceRoot {uid: selection.activity_instance_uid})
+                    -[has_version:HAS_VERSION|LATEST]->(activity_instance_value:ActivityInstanceValue)
+                WHERE CASE
+                    WHEN selection.activity_instance_version IS NULL THEN type(has_version) = "LATEST"
+                    ELSE type(has_version) = "HAS_VERSION" AND has_version.version = selection.activity_instance_version
+                END
+                WITH new, activity_instance_value LIMIT 1
+                CREATE (new)-[:HAS_SELECTED_ACTIVITY_INSTANCE]->(activity_instance_value)
+            }
+            CALL {
+                WITH selection, new
+                MATCH (study_activity:StudyActivity {uid: selection.study_activity_uid})
+                WHERE NOT EXISTS { (study_activity)<-[:BEFORE]-(:StudyAction) }
+                CREATE (study_activity)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_INSTANCE]->(new)
+            }
+            """
 
     def generate_uid(self) -> str:
         return StudyActivityInstance.get_next_free_uid_and_increment_counter()
@@ -1,22 +1,7 @@
 import datetime
 from dataclasses import dataclass
 
-from clinical_mdr_api.domain_repositories.generic_repository import (
-    manage_previous_connected_study_selection_relationships,
-)
-from clinical_mdr_api.domain_repositories.models.activities import (
-    ActivityRoot,
-    ActivityValue,
-)
-from clinical_mdr_api.domain_repositories.models.study import StudyValue
-from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyAction
-from clinical_mdr_api.domain_repositories.models.study_selections import (
-    StudyActivity,
-    StudyActivityGroup,
-    StudyActivitySubGroup,
-    StudySelection,
-    StudySoAGroup,
-)
+from clinical_mdr_api.domain_repositories.models.study_selections import StudyActivity
 from clinical_mdr_api.domain_repositories.study_selections.study_activity_base_repository import (
     StudySelectionActivityBaseRepository,
 )
@@ -58,6 +43,13 @@ class StudySelectionActivityRepository(
     StudySelectionActivityBaseRepository[StudySelectionActivityAR]
 ):
     _aggregate_root_type = StudySelectionActivityAR
+    _selection_label = "StudyActivity"
+    _study_value_relationship = "HAS_STUDY_ACTIVITY"
+    _maintained_selection_labels = (
+        "StudySoAGroup",
+        "StudyActivitySubGroup",
+        "StudyActivityGroup",
+    )
 
     def _create_value_object_from_repository(
         self, selection: dict, acv: bool
@@ -350,84 +342,45 @@ class StudySelectionActivityRepository(
                     """
         return audit_trail_cypher
 
-    def get_study_selection_node_from_latest_study_value(
-        self, study_value: StudyValue, study_selection: StudySelection
-    ):
-        return study_value.has_study_activity.get(
-            uid=study_selection.study_selection_uid
-        )
-
-    def _add_new_selection(
-        self,
-        latest_study_value_node: StudyValue,
-        order: int,
-        selection: StudySelectionActivityVO,
-        audit_node: StudyAction,
-        last_study_selection_node: StudyActivity,
-        for_deletion: bool = False,
-    ):
-        # find the activity value
-        activity_root_node: ActivityRoot = ActivityRoot.nodes.get(
-            uid=selection.activity_uid
-        )
-        latest_activity_value_node: ActivityValue = (
-            activity_root_node.get_value_for_version(selection.activity_version)
-        )
-        # Create new activity selection
-        study_activity_selection_node = StudyActivity(
-            order=order,
-            show_activity_in_protocol_flowchart=selection.show_activity_in_protocol_flowchart,
-        )
-        study_activity_selection_node.uid = selection.study_selection_uid
-        study_activity_selection_node.accepted_version = selection.accepted_version
-        study_activity_selection_node.save()
-        if not for_deletion:
-            # Connect new node with study value
-            latest_study_value_node.has_study_activity.connect(
-                study_activity_selection_node
-            )
-        # Connect new node with audit trail
-        audit_node.has_after.connect(study_activity_selection_node)
-        # Connect new node with Activity value
-        study_activity_selection_node.has_selected_activity.connect(
-            latest_activity_value_node
-        )
-        # Connect StudyActivity with StudySoAGroup node
-        study_soa_group_node = StudySoAGroup.nodes.has(has_before=False).get(
-            uid=selection.study_soa_group_uid
-        )
-        study_activity_selection_node.has_soa_group_selection.connect(
-            study_soa_group_node
-        )
-
-        if selection.study_activity_subgroup_uid:
-            # Connect StudyActivity with StudyActivitySubGroup node
-            study_activity_subgroup = StudyActivitySubGroup.nodes.has(
-                has_before=False
-            ).get(uid=selection.study_activity_subgroup_uid)
-            study_activity_selection_node.study_activity_has_study_activity_subgroup.connect(
-                study_activity_subgroup
-            )
+    def _selection_parameters(self, selection: StudySelectionActivityVO) -> dict:
+        return {
+            "properties": {
+                "show_activity_in_protocol_flowchart": selection.show_activity_in_protocol_flowchart,
+            },
+            "activity_uid": selection.activity_uid,
+            "activity_version": selection.activity_version,
+            "study_soa_group_uid": selection.study_soa_group_uid,
+            "study_activity_subgroup_uid": selection.study_activity_subgroup_uid,
+            "study_activity_group_uid": selection.study_activity_group_uid,
+        }
 
-        if selection.study_activity_group_uid:
-            # Connect StudyActivity with StudyActivityGroup node
-            study_activity_group = StudyActivityGroup.nodes.has(has_before=False).get(
-                uid=selection.study_activity_group_uid
-            )
-            study_activity_selection_node.study_activity_has_study_activity_group.connect(
-                study_activity_group
-            )
-        if last_study_selection_node:
-            manage_previous_connected_study_selection_relationships(
-                previous_item=last_study_selection_node,
-                study_value_node=latest_study_value_node,
-                new_item=study_activity_selection_node,
-                exclude_study_selection_relationships=[
-                    StudySoAGroup,
-                    StudyActivitySubGroup,
-                    StudyActivityGroup,
-                ],
-            )
+    def _link_selection_query(self) -> str:
+        return """
+            CALL {
+                WITH selection, new
+                MATCH (:ActivityRoot {uid: selection.activity_uid})-[:HAS_VERSION {version: selection.activity_version}]->(activity_value:ActivityValue)
+                WITH new, activity_value LIMIT 1
+                CREATE (new)-[:HAS_SELECTED_ACTIVITY]->(activity_value)
+            }
+            CALL {
+                WITH selection, new
+                MATCH (study_soa_group:StudySoAGroup {uid: selection.study_soa_group_uid})
+                WHERE NOT EXISTS { (study_soa_group)<-[:BEFORE]-(:StudyAction) }
+                CREATE (new)-[:STUDY_ACTIVITY_HAS_STUDY_SOA_GROUP]->(study_soa_group)
+            }
+            CALL {
+                WITH selection, new
+                MATCH (study_activity_subgroup:StudyActivitySubGroup {uid: selection.study_activity_subgroup_uid})
+                WHERE NOT EXISTS { (study_activity_subgroup)<-[:BEFORE]-(:StudyAction) }
+                CREATE (new)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_SUBGROUP]->(study_activity_subgroup)
+            }
+            CALL {
+                WITH selection, new
+                MATCH (study_activity_group:StudyActivityGroup {uid: selection.study_activity_group_uid})
+                WHERE NOT EXISTS { (study_activity_group)<-[:BEFORE]-(:StudyAction) }
+                CREATE (new)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_GROUP]->(study_activity_group)
+            }
+            """
 
     def generate_uid(self) -> str:
         return StudyActivity.get_next_free_uid_and_increment_counter()
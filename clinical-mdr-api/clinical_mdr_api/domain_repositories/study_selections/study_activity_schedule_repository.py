@@ -1,3 +1,4 @@
+import datetime
 from dataclasses import dataclass
 
 from neomodel import db
@@ -5,6 +6,7 @@ from neomodel import db
 from clinical_mdr_api import utils
 from clinical_mdr_api.domain_repositories.models._utils import ListDistinct
 from clinical_mdr_api.domain_repositories.models.study import StudyValue
+from clinical_mdr_api.domain_repositories.models.study_audit_trail import Create, Delete
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivity,
     StudyActivitySchedule,
@@ -14,6 +16,7 @@ from clinical_mdr_api.domains.study_selections.study_activity_schedule import (
     StudyActivityScheduleVO,
 )
 from common import config
+from common.config import NUMBER_OF_UID_DIGITS
 from common.exceptions import BusinessLogicException, NotFoundException
 from common.utils import convert_to_datetime
 
@@ -27,6 +30,19 @@ class SelectionHistory(base.SelectionHistory):
     study_activity_instance_uid: str | None
 
 
+@dataclass
+class StudyScheduleGrid:
+    """Study activities, visits and activity schedules of the latest version of a study."""
+
+    # study activity uid -> uid of its study activity instance
+    study_activity_instance_uids: dict[str, str | None]
+    study_visit_uids: set[str]
+    # study activity schedule uid -> (study activity uid, study visit uid)
+    schedules: dict[str, tuple[str, str]]
+    # (study activity uid, study visit uid) of all schedules
+    scheduled_pairs: set[tuple[str, str]]
+
+
 class StudyActivityScheduleRepository(base.StudySelectionRepository):
     @staticmethod
     def _acquire_write_lock_study_value(uid: str) -> None:
@@ -156,6 +172,119 @@ class StudyActivityScheduleRepository(base.StudySelectionRepository):
     def generate_uid(self) -> str:
         return StudyActivity.get_next_free_uid_and_increment_counter()
 
+    def _generate_uids(self, count: int) -> list[str]:
+        """Reserves `count` uids from the counter used when a schedule node is saved without uid."""
+        if not count:
+            return []
+        last_uid_number = db.cypher_query(
+            """
+            MERGE (m:Counter {counterId: 'StudyActivityScheduleCounter'})
+            ON CREATE SET m:StudyActivityScheduleCounter, m.count = 0
+            SET m.count = m.count + $count
+            RETURN m.count
+            """,
+            {"count": count},
+        )[0][0][0]
+        return [
+            f"StudyActivitySchedule_{str(uid_number).zfill(NUMBER_OF_UID_DIGITS)}"
+            for uid_number in range(last_uid_number - count + 1, last_uid_number + 1)
+        ]
+
+    def get_schedule_grid(self, study_uid: str) -> StudyScheduleGrid:
+        rs, _ = db.cypher_query(
+            """
+            MATCH (:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)
+            RETURN
+                [(sv)-[:HAS_STUDY_ACTIVITY]->(sa:StudyActivity) | [
+                    sa.uid,
+                    head([(sa)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_INSTANCE]->(sai:StudyActivityInstance) | sai.uid])
+                ]] AS study_activities,
+                [(sv)-[:HAS_STUDY_VISIT]->(svi:StudyVisit) | svi.uid] AS study_visit_uids,
+                [(sv)-[:HAS_STUDY_ACTIVITY_SCHEDULE]->(sas:StudyActivitySchedule) | [
+                    head([(sas)<-[:STUDY_ACTIVITY_HAS_SCHEDULE]-(sa:StudyActivity) | sa.uid]),
+                    head([(sas)<-[:STUDY_VISIT_HAS_SCHEDULE]-(svi:StudyVisit) | svi.uid]),
+                    sas.uid
+                ]] AS schedules
+            """,
+            {"study_uid": study_uid},
+        )
+        NotFoundException.raise_if(not rs, "Study", study_uid)
+        study_activities, study_visit_uids, schedules = rs[0]
+        schedules = {
+            uid: (study_activity_uid, study_visit_uid)
+            for study_activity_uid, study_visit_uid, uid in schedules
+        }
+        return StudyScheduleGrid(
+            study_activity_instance_uids=dict(study_activities),
+            study_visit_uids=set(study_visit_uids),
+            schedules=schedules,
+            scheduled_pairs=set(schedules.values()),
+        )
+
+    def save_all(
+        self,
+        study_uid: str,
+        created_schedules: list[StudyActivityScheduleVO],
+        deleted_schedules: list[StudyActivityScheduleVO],
+        author_id: str,
+    ) -> None:
+        """
+        Creates and deletes the given schedules of the latest version of the study with their audit trail
+        in a single query, as `save` and `delete` do for a single schedule.
+        The uids of the created schedules are assigned.
+        """
+        for schedule, uid in zip(
+            created_schedules, self._generate_uids(len(created_schedules))
+        ):
+            schedule.uid = uid
+        date = datetime.datetime.now(datetime.timezone.utc)
+        writes = [
+            {
+                "uid": schedule.uid,
+                "study_activity_uid": schedule.study_activity_uid,
+                "study_visit_uid": schedule.study_visit_uid,
+                "action": Create.__label__,
+                "author_id": schedule.author_id,
+                "date": schedule.start_date,
+                "for_deletion": False,
+            }
+            for schedule in created_schedules
+        ] + [
+            {
+                "uid": schedule.uid,
+                "study_activity_uid": schedule.study_activity_uid,
+                "study_visit_uid": schedule.study_visit_uid,
+                "action": Delete.__label__,
+                "author_id": author_id,
+                "date": date,
+                "for_deletion": True,
+            }
+            for schedule in deleted_schedules
+        ]
+        if not writes:
+            return
+        db.cypher_query(
+            """
+            MATCH (sr:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)
+            UNWIND $writes AS schedule
+            OPTIONAL MATCH (sv)-[previous_rel:HAS_STUDY_ACTIVITY_SCHEDULE]->(previous:StudyActivitySchedule {uid: schedule.uid})
+            CALL apoc.create.node(["StudyAction", schedule.action], {author_id: schedule.author_id, date: schedule.date})
+            YIELD node AS audit
+            CREATE (sr)-[:AUDIT_TRAIL]->(audit)
+            CREATE (audit)-[:AFTER]->(new:StudySelection:StudyActivitySchedule {uid: schedule.uid})
+            FOREACH (_ IN CASE WHEN previous IS NULL THEN [] ELSE [1] END | CREATE (audit)-[:BEFORE]->(previous))
+            FOREACH (_ IN CASE WHEN schedule.for_deletion THEN [] ELSE [1] END
+                | CREATE (sv)-[:HAS_STUDY_ACTIVITY_SCHEDULE]->(new))
+            DELETE previous_rel
+            WITH sv, schedule, new
+            MATCH (sv)-[:HAS_STUDY_ACTIVITY]->(sa:StudyActivity {uid: schedule.study_activity_uid})
+            MATCH (sv)-[:HAS_STUDY_VISIT]->(svi:StudyVisit {uid: schedule.study_visit_uid})
+            CREATE (sa)-[:STUDY_ACTIVITY_HAS_SCHEDULE]->(new)
+            CREATE (svi)-[:STUDY_VISIT_HAS_SCHEDULE]->(new)
+            """,
+            {"study_uid": study_uid, "writes": writes},
+        )
+
     def _get_selection_with_history(
         self, study_uid: str, selection_uid: str | None = None
     ):
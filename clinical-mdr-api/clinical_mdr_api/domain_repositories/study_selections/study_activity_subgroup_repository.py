@@ -3,15 +3,6 @@ from dataclasses import dataclass
 
 from neomodel import db
 
-from clinical_mdr_api.domain_repositories.generic_repository import (
-    manage_previous_connected_study_selection_relationships,
-)
-from clinical_mdr_api.domain_repositories.models.activities import (
-    ActivitySubGroupRoot,
-    ActivitySubGroupValue,
-)
-from clinical_mdr_api.domain_repositories.models.study import StudyValue
-from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyAction
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivitySubGroup,
 )
@@ -48,6 +39,8 @@ class StudySelectionActivitySubGroupRepository(
     StudySelectionActivityBaseRepository[StudySelectionActivitySubGroupAR]
 ):
     _aggregate_root_type = StudySelectionActivitySubGroupAR
+    _selection_label = "StudyActivitySubGroup"
+    _study_value_relationship = "HAS_STUDY_ACTIVITY_SUBGROUP"
 
     def _create_value_object_from_repository(
         self, selection: dict, acv: bool
@@ -181,60 +174,27 @@ class StudySelectionActivitySubGroupRepository(
                     """
         return audit_trail_cypher
 
-    def get_study_selection_node_from_latest_study_value(
-        self, study_value: StudyValue, study_selection: StudyActivitySubGroup
-    ):
-        return StudyActivitySubGroup.nodes.has(has_before=False).get(
-            uid=study_selection.study_selection_uid
-        )
-
-    def _add_new_selection(
-        self,
-        latest_study_value_node: StudyValue,
-        order: int,
-        selection: StudySelectionActivitySubGroupVO,
-        audit_node: StudyAction,
-        last_study_selection_node: StudyActivitySubGroup,
-        for_deletion: bool = False,
-    ):
-        # find the activity subgroup value
-        activity_subgroup_root_node: ActivitySubGroupRoot = (
-            ActivitySubGroupRoot.nodes.get(uid=selection.activity_subgroup_uid)
-        )
-        latest_activity_subgroup_value_node: ActivitySubGroupValue = (
-            activity_subgroup_root_node.get_value_for_version(
-                selection.activity_subgroup_version
-            )
-        )
-        # Create new activity subgroup selection
-        study_activity_subgroup_selection_node = StudyActivitySubGroup(
-            show_activity_subgroup_in_protocol_flowchart=selection.show_activity_subgroup_in_protocol_flowchart,
-            order=order,
-        )
-        study_activity_subgroup_selection_node.uid = selection.study_selection_uid
-        study_activity_subgroup_selection_node.accepted_version = (
-            selection.accepted_version
-        )
-        study_activity_subgroup_selection_node.save()
-
-        if not for_deletion:
-            # Connect new node with study value
-            latest_study_value_node.has_study_activity_subgroup.connect(
-                study_activity_subgroup_selection_node
-            )
+    def _selection_parameters(
+        self, selection: StudySelectionActivitySubGroupVO
+    ) -> dict:
+        return {
+            "properties": {
+                "show_activity_subgroup_in_protocol_flowchart": selection.show_activity_subgroup_in_protocol_flowchart,
+            },
+            "activity_subgroup_uid": selection.activity_subgroup_uid,
+            "activity_subgroup_version": selection.activity_subgroup_version,
+        }
 
-        # Connect new node with audit trail
-        audit_node.has_after.connect(study_activity_subgroup_selection_node)
-        # Connect new node with Activity subgroup value
-        study_activity_subgroup_selection_node.has_selected_activity_subgroup.connect(
-            latest_activity_subgroup_value_node
-        )
-        if last_study_selection_node:
-            manage_previous_connected_study_selection_relationships(
-                previous_item=last_study_selection_node,
-                study_value_node=latest_study_value_node,
-                new_item=study_activity_subgroup_selection_node,
-            )
+    def _link_selection_query(self) -> str:
+        return """
+            CALL {
+                WITH selection, new
+                MATCH (:ActivitySubGroupRoot {uid: selection.activity_subgroup_uid})
+                    -[:HAS_VERSION {version: selection.activity_subgroup_version}]->(activity_subgroup_value:ActivitySubGroupValue)
+                WITH new, activity_subgroup_value LIMIT 1
+                CREATE (new)-[:HAS_SELECTED_ACTIVITY_SUBGROUP]->(activity_subgroup_value)
+            }
+            """
 
     def generate_uid(self) -> str:
         return StudyActivitySubGroup.get_next_free_uid_and_increment_counter()
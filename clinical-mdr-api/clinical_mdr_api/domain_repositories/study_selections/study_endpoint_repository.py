@@ -24,17 +24,37 @@ from clinical_mdr_api.domain_repositories.models.syntax import (
 from clinical_mdr_api.domain_repositories.models.template_parameter import (
     TemplateParameter,
 )
+from clinical_mdr_api.domain_repositories.study_selections.base import (
+    find_selection_page,
+    study_value_match_clause,
+)
 from clinical_mdr_api.domains.study_selections.study_selection_endpoint import (
     StudyEndpointSelectionHistory,
     StudySelectionEndpointsAR,
     StudySelectionEndpointVO,
 )
+from clinical_mdr_api.repositories._utils import FilterOperator
 from common.config import STUDY_ENDPOINT_TP_NAME
 from common.exceptions import BusinessLogicException
 from common.utils import convert_to_datetime
 
 
 class StudySelectionEndpointRepository:
+    # StudySelectionEndpoint fields that can be filtered and sorted on in the database, with their alias in `find_page_by_study`
+    page_fields = {
+        "study_endpoint_uid": "uid",
+        "order": "position",
+        "accepted_version": "accepted_version",
+        "start_date": "start_date",
+        "study_objective.study_objective_uid": "study_objective_uid",
+        "endpoint_level.term_uid": "endpoint_level_uid",
+        "endpoint_sublevel.term_uid": "endpoint_sublevel_uid",
+        "endpoint.uid": "endpoint_uid",
+        "endpoint.name": "endpoint_name",
+        "template.uid": "template_uid",
+        "template.name": "template_name",
+    }
+
     @staticmethod
     def _acquire_write_lock_study_value(uid: str) -> None:
         db.cypher_query(
@@ -269,6 +289,70 @@ class StudySelectionEndpointRepository:
             selection_aggregate.repository_closure_data = all_selections
         return selection_aggregate
 
+    def find_page_by_study(
+        self,
+        study_uid: str,
+        study_value_version: str | None = None,
+        filter_by: dict | None = None,
+        filter_operator: FilterOperator | None = FilterOperator.AND,
+        sort_by: dict | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        total_count: bool = False,
+    ) -> tuple[list[str], int]:
+        """
+        Filters, sorts and paginates the selected study endpoints of a study in the database,
+        on the fields listed in `page_fields`.
+        The selections are those of the aggregate returned by `find_by_study`, in the same order.
+        :return: The uids of the selections in the page, and the total number of matching selections
+        """
+        match_clause = (
+            study_value_match_clause(study_value_version)
+            + """
+            MATCH (sv)-[:HAS_STUDY_ENDPOINT]->(se:StudyEndpoint)<-[:AFTER]-(:StudyAction)
+            WHERE EXISTS {
+                MATCH (se)-[:HAS_SELECTED_ENDPOINT]->(:EndpointValue)<-[ver]-(:EndpointRoot)
+                WHERE ver.status = "Final"
+            } OR EXISTS {
+                MATCH (se)-[:HAS_SELECTED_ENDPOINT_TEMPLATE]->(:EndpointTemplateValue)<-[ver]-(:EndpointTemplateRoot)
+                WHERE ver.status = "Final"
+            }
+            WITH DISTINCT sv, se ORDER BY se.order
+            WITH sv, collect(se) AS selections
+            UNWIND range(0, size(selections) - 1) AS index
+            WITH sv, selections[index] AS se, index + 1 AS position
+            """
+        )
+        alias_clause = """
+            se.uid AS uid,
+            position,
+            coalesce(se.accepted_version, false) AS accepted_version,
+            head([(se)<-[:AFTER]-(sa:StudyAction) | sa.date]) AS start_date,
+            head([(se)-[:STUDY_ENDPOINT_HAS_STUDY_OBJECTIVE]->(so:StudyObjective)<-[:HAS_STUDY_OBJECTIVE]-(sv) | so.uid]) AS study_objective_uid,
+            head([(se)-[:HAS_ENDPOINT_LEVEL]->(elr:CTTermRoot)<-[:HAS_TERM]-(:CTCodelistRoot)
+                -[:HAS_NAME_ROOT]->(:CTCodelistNameRoot)-[:LATEST_FINAL]->(:CTCodelistNameValue {name: "Endpoint Level"}) | elr.uid]) AS endpoint_level_uid,
+            head([(se)-[:HAS_ENDPOINT_SUB_LEVEL]->(eslr:CTTermRoot) | eslr.uid]) AS endpoint_sublevel_uid,
+            head([(se)-[:HAS_SELECTED_ENDPOINT]->(:EndpointValue)<-[:HAS_VERSION]-(er:EndpointRoot) | er.uid]) AS endpoint_uid,
+            head([(se)-[:HAS_SELECTED_ENDPOINT]->(ev:EndpointValue) | ev.name]) AS endpoint_name,
+            head([(se)-[:HAS_SELECTED_ENDPOINT_TEMPLATE]->(:EndpointTemplateValue)<-[:HAS_VERSION]-(etr:EndpointTemplateRoot) | etr.uid]) AS template_uid,
+            head([(se)-[:HAS_SELECTED_ENDPOINT_TEMPLATE]->(etv:EndpointTemplateValue) | etv.name]) AS template_name
+            """
+        parameters = {"study_uid": study_uid}
+        if study_value_version:
+            parameters["study_value_version"] = study_value_version
+        return find_selection_page(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            field_aliases=self.page_fields,
+            parameters=parameters,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            total_count=total_count,
+        )
+
     def _get_audit_node(
         self, study_selection: StudySelectionEndpointsAR, study_selection_uid: str
     ):
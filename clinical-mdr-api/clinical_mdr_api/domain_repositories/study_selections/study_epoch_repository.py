@@ -2,6 +2,13 @@ import datetime
 
 from neomodel import db
 
+from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_term_name_repository import (
+    CTTermNameRepository,
+)
+from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_term_registry import (
+    CT_TERM_REGISTRY,
+    CodelistTerms,
+)
 from clinical_mdr_api.domain_repositories.generic_repository import (
     manage_previous_connected_study_selection_relationships,
 )
@@ -25,6 +32,10 @@ from clinical_mdr_api.domains.study_selections.study_epoch import (
     StudyEpochType,
     StudyEpochVO,
 )
+from clinical_mdr_api.domains.versioned_object_aggregate import LibraryItemStatus
+from clinical_mdr_api.models.controlled_terminologies.ct_term import (
+    SimpleCTTermNameWithConflictFlag,
+)
 from common import config as settings
 from common.exceptions import ValidationException
 
@@ -36,8 +47,9 @@ def get_ctlist_terms_by_name(
         ctterm_name_match = "(:CTTermNameRoot)-[:LATEST_FINAL]->(ctnv:CTTermNameValue) WHERE codelist_name_value.name IN $codelist_names"
     else:
         ctterm_name_match = """(ctnr:CTTermNameRoot)-[hv:HAS_VERSION]->(ctnv:CTTermNameValue)
-            WHERE codelist_name_value.name IN $codelist_names AND 
+            WHERE codelist_name_value.name IN $codelist_names AND (
                 (hv.start_date<= datetime($effective_date) < datetime(hv.end_date)) OR (hv.end_date IS NULL AND (hv.start_date <= datetime($effective_date)))
+            )
         """
     cypher_query = f"""
         MATCH (codelist_name_value:CTCodelistNameValue)<-[:LATEST_FINAL]-(:CTCodelistNameRoot)<-[:HAS_NAME_ROOT]-
@@ -61,7 +73,37 @@ def get_ctlist_terms_by_name(
     return {a[0]: a[1] for a in items}
 
 
+def get_ct_terms_by_codelist(
+    codelist_names: list[str], effective_date: datetime.datetime | None = None
+) -> CodelistTerms:
+    """
+    Returns the final terms of the given codelists valid at `effective_date` (codelist name -> term uid -> term).
+    The terms are loaded once and then shared by all requests through the CT term registry.
+    """
+
+    def load_terms() -> CodelistTerms:
+        codelist_names_by_term_uid = get_ctlist_terms_by_name(
+            codelist_names, effective_date=effective_date
+        )
+        terms = CTTermNameRepository().find_by_uids(
+            term_uids=list(codelist_names_by_term_uid),
+            status=LibraryItemStatus.FINAL,
+            at_specific_date=effective_date,
+        )
+        terms_by_codelist = {codelist_name: {} for codelist_name in codelist_names}
+        for term in terms:
+            simple_term = SimpleCTTermNameWithConflictFlag.from_ct_term_ar(term)
+            for codelist_name in codelist_names_by_term_uid[simple_term.term_uid]:
+                if codelist_name in terms_by_codelist:
+                    terms_by_codelist[codelist_name][simple_term.term_uid] = simple_term
+        return terms_by_codelist
+
+    return CT_TERM_REGISTRY.get_or_load(codelist_names, effective_date, load_terms)
+
+
 class StudyEpochRepository:
+    cache_store_ct_terms_by_codelists = CT_TERM_REGISTRY
+
     def __init__(self, author_id: str):
         self.author_id = author_id
 
@@ -70,6 +112,13 @@ class StudyEpochRepository:
     ):
         return get_ctlist_terms_by_name(codelist_names, effective_date=effective_date)
 
+    def fetch_ct_terms(
+        self,
+        codelist_names: list[str],
+        effective_date: datetime.datetime | None = None,
+    ) -> CodelistTerms:
+        return get_ct_terms_by_codelist(codelist_names, effective_date=effective_date)
+
     def get_allowed_configs(self, effective_date: datetime.datetime | None = None):
         if effective_date:
             subtype_name_value_match = """MATCH (term_subtype_name_root)-[hv:HAS_VERSION]->(term_subtype_name_value:CTTermNameValue)
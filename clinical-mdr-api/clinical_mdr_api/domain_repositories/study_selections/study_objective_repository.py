@@ -22,10 +22,15 @@ from clinical_mdr_api.domain_repositories.models.syntax import (
     ObjectiveRoot,
     ObjectiveTemplateRoot,
 )
+from clinical_mdr_api.domain_repositories.study_selections.base import (
+    find_selection_page,
+    study_value_match_clause,
+)
 from clinical_mdr_api.domains.study_selections.study_selection_objective import (
     StudySelectionObjectivesAR,
     StudySelectionObjectiveVO,
 )
+from clinical_mdr_api.repositories._utils import FilterOperator
 from common.exceptions import BusinessLogicException
 from common.utils import convert_to_datetime
 
@@ -49,6 +54,19 @@ class SelectionHistory:
 
 
 class StudySelectionObjectiveRepository:
+    # StudySelectionObjective fields that can be filtered and sorted on in the database, with their alias in `find_page_by_study`
+    page_fields = {
+        "study_objective_uid": "uid",
+        "order": "position",
+        "accepted_version": "accepted_version",
+        "start_date": "start_date",
+        "objective_level.term_uid": "objective_level_uid",
+        "objective.uid": "objective_uid",
+        "objective.name": "objective_name",
+        "template.uid": "template_uid",
+        "template.name": "template_name",
+    }
+
     @staticmethod
     def _acquire_write_lock_study_value(uid: str) -> None:
         db.cypher_query(
@@ -218,6 +236,70 @@ class StudySelectionObjectiveRepository:
             selection_aggregate.repository_closure_data = all_selections
         return selection_aggregate
 
+    def find_page_by_study(
+        self,
+        study_uid: str,
+        study_value_version: str | None = None,
+        filter_by: dict | None = None,
+        filter_operator: FilterOperator | None = FilterOperator.AND,
+        sort_by: dict | None = None,
+        page_number: int = 1,
+        page_size: int = 0,
+        total_count: bool = False,
+    ) -> tuple[list[str], int]:
+        """
+        Filters, sorts and paginates the selected study objectives of a study in the database,
+        on the fields listed in `page_fields`.
+        The selections are those of the aggregate returned by `find_by_study`, in the same order.
+        :return: The uids of the selections in the page, and the total number of matching selections
+        """
+        match_clause = (
+            study_value_match_clause(study_value_version)
+            + """
+            MATCH (sv)-[:HAS_STUDY_OBJECTIVE]->(so:StudyObjective)<-[:AFTER]-(:StudyAction)
+            WHERE EXISTS {
+                MATCH (so)-[:HAS_SELECTED_OBJECTIVE]->(:ObjectiveValue)<-[ver]-(:ObjectiveRoot)
+                WHERE ver.status = "Final"
+            } OR EXISTS {
+                MATCH (so)-[:HAS_SELECTED_OBJECTIVE_TEMPLATE]->(:ObjectiveTemplateValue)<-[ver]-(:ObjectiveTemplateRoot)
+                WHERE ver.status = "Final"
+            }
+            WITH DISTINCT so
+            OPTIONAL MATCH (so)-[:HAS_OBJECTIVE_LEVEL]->(olr:CTTermRoot)<-[has_term:HAS_TERM]-(:CTCodelistRoot)
+            -[:HAS_NAME_ROOT]->(:CTCodelistNameRoot)-[:LATEST_FINAL]->(:CTCodelistNameValue {name: "Objective Level"})
+            WITH so, olr, has_term.order AS level_order ORDER BY level_order, so.order
+            WITH collect([so, olr]) AS selections
+            UNWIND range(0, size(selections) - 1) AS index
+            WITH selections[index][0] AS so, selections[index][1] AS olr, index + 1 AS position
+            """
+        )
+        alias_clause = """
+            so.uid AS uid,
+            position,
+            coalesce(so.accepted_version, false) AS accepted_version,
+            head([(so)<-[:AFTER]-(sa:StudyAction) | sa.date]) AS start_date,
+            CASE WHEN EXISTS { MATCH (so)-[:HAS_SELECTED_OBJECTIVE]->(:ObjectiveValue) } THEN olr.uid END AS objective_level_uid,
+            head([(so)-[:HAS_SELECTED_OBJECTIVE]->(:ObjectiveValue)<-[:HAS_VERSION]-(obr:ObjectiveRoot) | obr.uid]) AS objective_uid,
+            head([(so)-[:HAS_SELECTED_OBJECTIVE]->(ov:ObjectiveValue) | ov.name]) AS objective_name,
+            head([(so)-[:HAS_SELECTED_OBJECTIVE_TEMPLATE]->(:ObjectiveTemplateValue)<-[:HAS_VERSION]-(otr:ObjectiveTemplateRoot) | otr.uid]) AS template_uid,
+            head([(so)-[:HAS_SELECTED_OBJECTIVE_TEMPLATE]->(otv:ObjectiveTemplateValue) | otv.name]) AS template_name
+            """
+        parameters = {"study_uid": study_uid}
+        if study_value_version:
+            parameters["study_value_version"] = study_value_version
+        return find_selection_page(
+            match_clause=match_clause,
+            alias_clause=alias_clause,
+            field_aliases=self.page_fields,
+            parameters=parameters,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            sort_by=sort_by,
+            page_number=page_number,
+            page_size=page_size,
+            total_count=total_count,
+        )
+
     def _get_audit_node(
         self, study_selection: StudySelectionObjectivesAR, study_selection_uid: str
     ):
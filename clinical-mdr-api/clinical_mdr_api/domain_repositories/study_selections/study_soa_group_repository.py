@@ -3,18 +3,7 @@ from dataclasses import dataclass
 
 from neomodel import db
 
-from clinical_mdr_api.domain_repositories.generic_repository import (
-    manage_previous_connected_study_selection_relationships,
-)
-from clinical_mdr_api.domain_repositories.models.controlled_terminology import (
-    CTTermRoot,
-)
-from clinical_mdr_api.domain_repositories.models.study import StudyValue
-from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyAction
-from clinical_mdr_api.domain_repositories.models.study_selections import (
-    StudySelection,
-    StudySoAGroup,
-)
+from clinical_mdr_api.domain_repositories.models.study_selections import StudySoAGroup
 from clinical_mdr_api.domain_repositories.study_selections.study_activity_base_repository import (
     StudySelectionActivityBaseRepository,
 )
@@ -44,6 +33,8 @@ class SelectionHistory:
 
 class StudySoAGroupRepository(StudySelectionActivityBaseRepository[StudySoAGroupAR]):
     _aggregate_root_type = StudySoAGroupAR
+    _selection_label = "StudySoAGroup"
+    _study_value_relationship = "HAS_STUDY_SOA_GROUP"
 
     def _create_value_object_from_repository(
         self, selection: dict, acv: bool
@@ -164,46 +155,22 @@ class StudySoAGroupRepository(StudySelectionActivityBaseRepository[StudySoAGroup
                     """
         return audit_trail_cypher
 
-    def get_study_selection_node_from_latest_study_value(
-        self, study_value: StudyValue, study_selection: StudySelection
-    ):
-        return StudySoAGroup.nodes.has(has_before=False).get(
-            uid=study_selection.study_selection_uid
-        )
+    def _selection_parameters(self, selection: StudySoAGroupVO) -> dict:
+        return {
+            "properties": {
+                "show_soa_group_in_protocol_flowchart": selection.show_soa_group_in_protocol_flowchart,
+            },
+            "soa_group_term_uid": selection.soa_group_term_uid,
+        }
 
-    def _add_new_selection(
-        self,
-        latest_study_value_node: StudyValue,
-        order: int,
-        selection: StudySoAGroupVO,
-        audit_node: StudyAction,
-        last_study_selection_node: StudySoAGroup,
-        for_deletion: bool = False,
-    ):
-        # Create new activity selection
-        study_soa_group_node = StudySoAGroup(
-            show_soa_group_in_protocol_flowchart=selection.show_soa_group_in_protocol_flowchart,
-            order=order,
-        )
-        study_soa_group_node.uid = selection.study_selection_uid
-        study_soa_group_node.accepted_version = selection.accepted_version
-        study_soa_group_node.save()
-
-        if not for_deletion:
-            # Connect new node with study value
-            latest_study_value_node.has_study_soa_group.connect(study_soa_group_node)
-
-        # Connect new node with audit trail
-        audit_node.has_after.connect(study_soa_group_node)
-        # Set flowchart group
-        ct_term_root = CTTermRoot.nodes.get(uid=selection.soa_group_term_uid)
-        study_soa_group_node.has_flowchart_group.connect(ct_term_root)
-        if last_study_selection_node:
-            manage_previous_connected_study_selection_relationships(
-                previous_item=last_study_selection_node,
-                study_value_node=latest_study_value_node,
-                new_item=study_soa_group_node,
-            )
+    def _link_selection_query(self) -> str:
+        return """
+            CALL {
+                WITH selection, new
+                MATCH (soa_group_term:CTTermRoot {uid: selection.soa_group_term_uid})
+                CREATE (new)-[:HAS_FLOWCHART_GROUP]->(soa_group_term)
+            }
+            """
 
     def generate_uid(self) -> str:
         return StudySoAGroup.get_next_free_uid_and_increment_counter()
@@ -1,10 +1,15 @@
 import datetime
+from typing import Collection
 
 from neomodel import db
 
 from clinical_mdr_api.domain_repositories.concepts.unit_definitions.unit_definition_repository import (
     UnitDefinitionRepository,
 )
+from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_term_registry import (
+    CT_TERM_REGISTRY,
+    CodelistTerms,
+)
 from clinical_mdr_api.domain_repositories.generic_repository import (
     manage_previous_connected_study_selection_relationships,
 )
@@ -30,6 +35,7 @@ from clinical_mdr_api.domain_repositories.models.study_audit_trail import (
 from clinical_mdr_api.domain_repositories.models.study_epoch import StudyEpoch
 from clinical_mdr_api.domain_repositories.models.study_visit import StudyVisit
 from clinical_mdr_api.domain_repositories.study_selections.study_epoch_repository import (
+    get_ct_terms_by_codelist,
     get_ctlist_terms_by_name,
 )
 from clinical_mdr_api.domains.concepts.unit_definitions.unit_definition import (
@@ -117,18 +123,11 @@ def get_valid_time_references_for_study(
 
 
 class StudyVisitRepository:
+    cache_store_ct_terms_by_codelists = CT_TERM_REGISTRY
+
     def __init__(self, author_id: str):
         self.author_id = author_id
-        unit_repository = UnitDefinitionRepository(self.author_id)
-        units, _ = unit_repository.get_all_optimized()
-        unit: UnitDefinitionAR
-        self._day_unit = None
-        self._week_unit = None
-        for unit in units:
-            if unit.concept_vo.name == "day":
-                self._day_unit = unit
-            if unit.concept_vo.name == "week":
-                self._week_unit = unit
+        self._day_week_units: tuple[UnitDefinitionAR, UnitDefinitionAR] | None = None
 
     def generate_uid(self) -> str:
         return StudyVisit.get_next_free_uid_and_increment_counter()
@@ -136,12 +135,45 @@ class StudyVisitRepository:
     def fetch_ctlist(self, codelist_names: str, effective_date=None):
         return get_ctlist_terms_by_name(codelist_names, effective_date=effective_date)
 
-    def get_day_week_units(self):
-        return (self._day_unit, self._week_unit)
+    def fetch_ct_terms(
+        self,
+        codelist_names: list[str],
+        effective_date: datetime.datetime | None = None,
+    ) -> CodelistTerms:
+        return get_ct_terms_by_codelist(codelist_names, effective_date=effective_date)
+
+    def get_day_week_units(self) -> tuple[UnitDefinitionAR, UnitDefinitionAR]:
+        if self._day_week_units is None:
+            units, _ = UnitDefinitionRepository(self.author_id).get_all_optimized()
+            unit: UnitDefinitionAR
+            day_unit = None
+            week_unit = None
+            for unit in units:
+                if unit.concept_vo.name == "day":
+                    day_unit = unit
+                if unit.concept_vo.name == "week":
+                    week_unit = unit
+            self._day_week_units = (day_unit, week_unit)
+        return self._day_week_units
 
     def save(self, visit: StudyVisitVO, create: bool = False):
         return self._update(visit, create)
 
+    def save_all(self, visits: list[StudyVisitVO], created_visit_uids: Collection[str]):
+        """
+        Saves the given visits of a study, the study nodes are loaded once for all of them.
+        """
+        if not visits:
+            return
+        study_root, study_value = self._get_study_nodes(visits[0].study_uid)
+        for visit in visits:
+            self._update(
+                visit,
+                create=visit.uid in created_visit_uids,
+                study_root=study_root,
+                study_value=study_value,
+            )
+
     def count_activities(
         self, visit_uid: str, study_value_version: str | None = None
     ) -> int:
@@ -600,12 +632,23 @@ class StudyVisitRepository:
         action.has_after.connect(new_item)
         study_root.audit_trail.connect(action)
 
-    def _update(self, study_visit: StudyVisitVO, create: bool = False):
-        study_root: StudyRoot = StudyRoot.nodes.get(uid=study_visit.study_uid)
+    def _get_study_nodes(self, study_uid: str) -> tuple[StudyRoot, StudyValue]:
+        study_root: StudyRoot = StudyRoot.nodes.get(uid=study_uid)
         study_value: StudyValue = study_root.latest_value.get_or_none()
         ValidationException.raise_if(
             study_value is None, msg="Study doesn't have draft version."
         )
+        return study_root, study_value
+
+    def _update(
+        self,
+        study_visit: StudyVisitVO,
+        create: bool = False,
+        study_root: StudyRoot | None = None,
+        study_value: StudyValue | None = None,
+    ):
+        if study_root is None or study_value is None:
+            study_root, study_value = self._get_study_nodes(study_visit.study_uid)
         if not create:
             previous_item = study_value.has_study_visit.get(uid=study_visit.uid)
 
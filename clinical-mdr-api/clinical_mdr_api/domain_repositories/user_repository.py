@@ -1,12 +1,19 @@
 # pylint: disable=invalid-name
 import json
-from datetime import datetime
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Iterable
 
 from cachetools import TTLCache, cached
 from neomodel import db
 
 from clinical_mdr_api.domain_repositories.models.user import User as UserNode
 from clinical_mdr_api.models.user import UserInfo, UserInfoPatchInput
+from common import config
+
+log = logging.getLogger(__name__)
 
 cache_get_user = TTLCache(maxsize=1000, ttl=10)
 
@@ -55,6 +62,19 @@ class UserRepository:
 
         return [self._transform_to_model(item[0]) for item in rs[0]]
 
+    def get_users_changed_since(self, since: datetime) -> list[UserInfo]:
+        rs = db.cypher_query(
+            """
+            MATCH (n:User)
+            WHERE n.created >= $since OR n.updated >= $since
+            RETURN n
+            """,
+            params={"since": since},
+            resolve_objects=True,
+        )
+
+        return [self._transform_to_model(item[0]) for item in rs[0]]
+
     @cached(cache=cache_get_user, key=lambda _self, user_id: user_id)
     def get_user(self, user_id: str) -> UserInfo:
         rs = db.cypher_query(
@@ -100,5 +120,97 @@ class UserRepository:
         )
 
         if rs[0]:
-            return self._transform_to_model(rs[0][0][0])
+            user = self._transform_to_model(rs[0][0][0])
+            user_directory.put(user)
+            return user
         return None
+
+
+class UserDirectory:
+    """
+    Process-wide snapshot of the User nodes, keyed by `user_id`.
+
+    The snapshot is loaded with all users on first use, then refreshed with the users
+    created or updated since the latest timestamp seen, once `USER_DIRECTORY_REFRESH_SECONDS` have passed.
+    Ids not in the snapshot are looked up in one query per batch and remembered as unknown until the next refresh.
+    """
+
+    def __init__(self, refresh_interval: float = config.USER_DIRECTORY_REFRESH_SECONDS):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._users: dict[str, UserInfo] = {}
+        self._unknown: frozenset[str] = frozenset()
+        self._watermark: datetime | None = None
+        self._refreshed_at: float | None = None
+
+    def _refresh(self, repo: UserRepository):
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._refreshed_at is not None
+                and now - self._refreshed_at < self.refresh_interval
+            ):
+                return
+            if self._watermark is None:
+                users = {}
+                changed = repo.get_all_users()
+            else:
+                users = dict(self._users)
+                # statement timestamps can be committed out of order, re-read an overlap
+                changed = repo.get_users_changed_since(
+                    self._watermark - timedelta(seconds=self.refresh_interval)
+                )
+            for user in changed:
+                users[user.user_id] = user
+                for timestamp in (user.created, user.updated):
+                    if timestamp is not None and (
+                        self._watermark is None or timestamp > self._watermark
+                    ):
+                        self._watermark = timestamp
+            self._users = users
+            self._unknown = frozenset()
+            self._refreshed_at = now
+            log.debug("User directory refreshed with %s users", len(changed))
+
+    def get_users(
+        self, user_ids: Iterable[str | None], repo: UserRepository | None = None
+    ) -> dict[str, UserInfo]:
+        """Returns the users with the given ids found in the snapshot or, for the ids missing from it, in the database"""
+
+        user_ids = list(user_ids)
+        repo = repo or UserRepository()
+        self._refresh(repo)
+        users = self._users
+        missing = {
+            user_id
+            for user_id in user_ids
+            if user_id and user_id not in users and user_id not in self._unknown
+        }
+        if missing:
+            found = repo.get_users_by_ids(list(missing))
+            with self._lock:
+                self._users = self._users | {user.user_id: user for user in found}
+                self._unknown = self._unknown | (
+                    missing - {user.user_id for user in found}
+                )
+                users = self._users
+        return {
+            user_id: users[user_id]
+            for user_id in user_ids
+            if user_id and user_id in users
+        }
+
+    def put(self, user: UserInfo):
+        with self._lock:
+            self._users = self._users | {user.user_id: user}
+            self._unknown = self._unknown - {user.user_id}
+
+    def clear(self):
+        with self._lock:
+            self._users = {}
+            self._unknown = frozenset()
+            self._watermark = None
+            self._refreshed_at = None
+
+
+user_directory = UserDirectory()
@@ -283,18 +283,34 @@ class StudyDefinitionAR:
         """
         Returns set of possible actions
         """
-        if self.study_status == StudyStatus.DRAFT and not self.latest_locked_metadata:
-            if self.study_parent_part_uid:
+        return self.possible_actions_for(
+            study_status=self.study_status,
+            has_latest_locked=self.latest_locked_metadata is not None,
+            study_parent_part_uid=self.study_parent_part_uid,
+        )
+
+    @staticmethod
+    def possible_actions_for(
+        study_status: StudyStatus,
+        has_latest_locked: bool,
+        study_parent_part_uid: str | None,
+    ):
+        """
+        Returns set of possible actions of a study in the given state,
+        without having to build the whole aggregate
+        """
+        if study_status == StudyStatus.DRAFT and not has_latest_locked:
+            if study_parent_part_uid:
                 return {StudyAction.DELETE}
             return {StudyAction.LOCK, StudyAction.RELEASE, StudyAction.DELETE}
         if (
-            self.study_status in [StudyStatus.DRAFT, StudyStatus.RELEASED]
-            and not self.study_parent_part_uid
+            study_status in [StudyStatus.DRAFT, StudyStatus.RELEASED]
+            and not study_parent_part_uid
         ):
             return {StudyAction.LOCK, StudyAction.RELEASE}
-        if self.study_status == StudyStatus.LOCKED and not self.study_parent_part_uid:
+        if study_status == StudyStatus.LOCKED and not study_parent_part_uid:
             return {StudyAction.UNLOCK}
-        if self.study_status == StudyStatus.DELETED:
+        if study_status == StudyStatus.DELETED:
             return set()
         return frozenset()
 
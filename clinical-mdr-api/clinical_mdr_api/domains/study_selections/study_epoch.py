@@ -1,11 +1,12 @@
 import datetime
 from dataclasses import dataclass, field
-from typing import Mapping
+from typing import Callable, Mapping
 
 from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
     StudyStatus,
 )
 from clinical_mdr_api.domains.study_selections.study_visit import (
+    CTTermMap,
     StudyVisitVO,
     VisitClass,
     VisitSubclass,
@@ -24,11 +25,11 @@ from common.config import (
     VISIT_0_NUMBER,
 )
 
-StudyEpochType: dict[str, SimpleCTTermNameWithConflictFlag] = {}
+StudyEpochType = CTTermMap("StudyEpochType")
 
-StudyEpochSubType: dict[str, SimpleCTTermNameWithConflictFlag] = {}
+StudyEpochSubType = CTTermMap("StudyEpochSubType")
 
-StudyEpochEpoch: dict[str, SimpleCTTermNameWithConflictFlag] = {}
+StudyEpochEpoch = CTTermMap("StudyEpochEpoch")
 
 
 @dataclass
@@ -227,6 +228,74 @@ class TimelineAR:
 
     study_uid: str
     _visits: list[StudyVisitVO]
+    # ordered visits of the last generated timeline, reset when visits are added, updated or removed
+    _ordered_visits: list[StudyVisitVO] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # absolute duration and timing objects from which the timing of each visit was last derived
+    _derived_timings: dict[int, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # visit number, unique visit number and short visit label of the visits as they are persisted
+    _persisted_numbering: dict[str, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._persisted_numbering = {
+            visit.uid: (
+                visit.visit_number,
+                visit.vis_unique_number,
+                visit.vis_short_name,
+            )
+            for visit in self._visits
+            if visit.uid
+        }
+
+    @staticmethod
+    def _absolute_durations() -> Callable[[StudyVisitVO], int | None]:
+        """
+        Returns a function giving the absolute duration of the visits,
+        memoized so that each anchor visit duration is computed once.
+        """
+        durations: dict[int, int | None] = {}
+
+        def absolute_duration(visit: StudyVisitVO) -> int | None:
+            if id(visit) not in durations:
+                durations[id(visit)] = visit.get_absolute_duration(absolute_duration)
+            return durations[id(visit)]
+
+        return absolute_duration
+
+    @staticmethod
+    def _timing_sources(visit: StudyVisitVO) -> tuple:
+        return (
+            visit.study_day,
+            visit.study_duration_days,
+            visit.study_week,
+            visit.study_duration_weeks,
+            visit.week_in_study,
+            visit.day_unit_object,
+            visit.week_unit_object,
+        )
+
+    def _is_timing_derived(self, visit: StudyVisitVO, duration: int | None) -> bool:
+        """
+        Whether the timing of the visit was already derived from the same absolute duration,
+        only the visits affected by a change of the timeline have to be derived again.
+        """
+        derived = self._derived_timings.get(id(visit))
+        return (
+            derived is not None
+            and derived[0] is visit
+            and derived[1] == duration
+            and all(
+                derived_source is source
+                for derived_source, source in zip(
+                    derived[2:], self._timing_sources(visit)
+                )
+            )
+        )
 
     def _generate_timeline(self):
         """
@@ -274,11 +343,12 @@ class TimelineAR:
             ):
                 visits = subvisit_sets[visit.visit_sublabel_reference]
                 visit.set_subvisit_anchor(visits[0].visit)
+        absolute_duration = self._absolute_durations()
         ordered_visits = sorted(
             self._visits,
             key=lambda x: (
-                x.get_absolute_duration() is None,
-                x.get_absolute_duration(),
+                absolute_duration(x) is None,
+                absolute_duration(x),
                 # SpecialVisits anchored to same StudyVisit have the same timing, in scope of the same anchor visit
                 # the early discontinuation visits should be ordered in the end of special visit set
                 x.visit_type.sponsor_preferred_name
@@ -287,6 +357,10 @@ class TimelineAR:
         )
         last_visit_num = 1
         order = 1
+        # The visits numbered from the order or number of a visit that comes later in the timeline
+        # take its previous order or number, the timeline is then not stable and has to be generated again
+        is_stable = True
+        numbered_visits = set()
         for idx, visit in enumerate(ordered_visits):
             if (
                 visit.visit_type.sponsor_preferred_name
@@ -294,6 +368,7 @@ class TimelineAR:
                 and idx == 0
             ):
                 visit.set_order_and_number(VISIT_0_NUMBER, VISIT_0_NUMBER)
+                numbered_visits.add(id(visit))
                 continue
             if visit.visit_class == VisitClass.NON_VISIT:
                 visit.set_order_and_number(NON_VISIT_NUMBER, NON_VISIT_NUMBER)
@@ -307,6 +382,12 @@ class TimelineAR:
                 anchor_for_special_vis = special_visit_anchors[
                     visit.visit_sublabel_reference
                 ]
+                # the special visit was ordered without the timing of its anchor
+                if (
+                    visit.subvisit_anchor is not anchor_for_special_vis
+                    or id(anchor_for_special_vis) not in numbered_visits
+                ):
+                    is_stable = False
                 visit.set_subvisit_anchor(anchor_for_special_vis)
                 visit.set_order_and_number(
                     visit.subvisit_anchor.visit_order,
@@ -329,6 +410,8 @@ class TimelineAR:
                     amount_of_subvisits_for_visit.get(visit.visit_sublabel_reference, 0)
                     + 1
                 )
+                if id(visit.subvisit_anchor) not in numbered_visits:
+                    is_stable = False
                 visit.set_order_and_number(
                     order,
                     visit.subvisit_anchor.visit_number,
@@ -338,8 +421,11 @@ class TimelineAR:
                 VisitClass.SPECIAL_VISIT,
             ]:
                 last_visit_num += 1
+            numbered_visits.add(id(visit))
             order += 1
 
+        # the anchors of the special visits are set, their durations are taken again
+        absolute_duration = self._absolute_durations()
         for order, visit in enumerate(ordered_visits):
             if (
                 visit.visit_subclass
@@ -359,10 +445,7 @@ class TimelineAR:
                     increment_step = 1
                 num = visits[-1].number + increment_step
                 # if additional visit is taking place before anchor visit in group of subvisits
-                if (
-                    visits[-1].visit.get_absolute_duration()
-                    > visit.get_absolute_duration()
-                ):
+                if absolute_duration(visits[-1].visit) > absolute_duration(visit):
                     last_subvisit_number = visits[-1].number
                     # take subvisit number from the last visit
                     visit.set_subvisit_number(last_subvisit_number)
@@ -410,27 +493,40 @@ class TimelineAR:
             # derive timing properties in the end when all subvisits are set
             # for the Visit that is currently being created timepoint will be filled but study_day will be empty as it's
             # being assigned afterwards
-            if visit.timepoint and visit.study_day:
-                visit.study_day.value = visit.derive_study_day_number()
+            duration = absolute_duration(visit)
+            if (
+                visit.timepoint
+                and visit.study_day
+                and not self._is_timing_derived(visit, duration)
+            ):
+                visit.study_day.value = visit.derive_study_day_number(
+                    absolute_duration=duration
+                )
                 visit.study_duration_days.value = (
-                    visit.derive_study_duration_days_number()
+                    visit.derive_study_duration_days_number(duration)
                 )
-                visit.study_week.value = visit.derive_study_week_number()
+                visit.study_week.value = visit.derive_study_week_number(duration)
                 visit.study_duration_weeks.value = (
-                    visit.derive_study_duration_weeks_number()
+                    visit.derive_study_duration_weeks_number(duration)
+                )
+                visit.week_in_study.value = visit.derive_week_in_study_number(duration)
+                self._derived_timings[id(visit)] = (
+                    visit,
+                    duration,
+                    *self._timing_sources(visit),
                 )
-                visit.week_in_study.value = visit.derive_week_in_study_number()
 
         # sort visits that are returned in the end to capture all timing changes
         ordered_visits = sorted(
             self._visits,
             key=lambda x: (
-                x.get_absolute_duration() is None,
-                x.get_absolute_duration(),
+                absolute_duration(x) is None,
+                absolute_duration(x),
             ),
         )
-
-        return ordered_visits
+        if is_stable:
+            self._ordered_visits = ordered_visits
+        return list(ordered_visits)
 
     def collect_visits_to_epochs(
         self, epochs: list[StudyEpochVO]
@@ -507,34 +603,78 @@ class TimelineAR:
                 return epoch
         return None
 
+    def _discard_visits(self, visits: list[StudyVisitVO]):
+        self._ordered_visits = None
+        for visit in visits:
+            self._derived_timings.pop(id(visit), None)
+
     def add_visit(self, visit: StudyVisitVO):
         """
         Add visits to a list of visits - used for preparation of adding new visit - creates order for added visit
         """
         visits = self._visits
-        visits.append(visit)
+        # the visit is already in the timeline when it is added again once it is saved
+        if not any(v is visit for v in visits):
+            visits.append(visit)
         self._visits = visits
+        self._ordered_visits = None
         self._visits = self.ordered_study_visits
+        # the previous visits of the visits anchored to their previous visit are taken in the new order
+        self._ordered_visits = None
 
     def remove_visit(self, visit: StudyVisitVO):
-        visits = [v for v in self._visits if v != visit]
+        self._discard_visits([v for v in self._visits if v is visit])
+        visits = [v for v in self._visits if v is not visit]
         self._visits = visits
 
     def update_visit(self, visit: StudyVisitVO):
         """
         Updates visits to a list of visits - used for preparation of adding new visit
         """
+        self._discard_visits([v for v in self._visits if v.uid == visit.uid])
         new_visits = [v for v in self._visits if v.uid != visit.uid]
         new_visits.append(visit)
         self._visits = new_visits
 
+    def restore_visits(self, visits: list[StudyVisitVO]):
+        """
+        Sets back the visits of the timeline to the given ones - used to revert a change that failed validation
+        """
+        restored_visit_ids = {id(visit) for visit in visits}
+        self._discard_visits(
+            [v for v in self._visits if id(v) not in restored_visit_ids]
+        )
+        self._visits = list(visits)
+
     @property
     def ordered_study_visits(self):
         """
-        Accessor for generated order
+        Accessor for generated order.
+        The timeline is generated again only if visits were added, updated or removed since it was last generated.
         """
-        visits = self._generate_timeline()
-        return visits
+        if self._ordered_visits is not None:
+            return list(self._ordered_visits)
+        return self._generate_timeline()
+
+    def renumbered_visits(self) -> list[StudyVisitVO]:
+        """
+        Returns the ordered visits whose visit number, unique visit number or short visit label
+        differ from the persisted ones, i.e. the visits that have to be saved after a change of the timeline.
+        Visits added to the timeline are not included.
+        """
+        renumbered = []
+        for visit in self.ordered_study_visits:
+            persisted_numbering = self._persisted_numbering.get(visit.uid)
+            if persisted_numbering is None:
+                continue
+            visit_number, unique_visit_number, short_visit_label = persisted_numbering
+            if (
+                visit.visit_number != visit_number
+                or visit.unique_visit_number != unique_visit_number
+                or str(visit.visit_short_name) != str(short_visit_label)
+            ):
+                renumbered.append(visit)
+        return renumbered
 
 
 @dataclass
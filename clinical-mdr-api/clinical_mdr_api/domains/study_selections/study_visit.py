@@ -1,8 +1,10 @@
 import datetime
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 from math import ceil, floor
-from typing import Any, Callable, Self
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, MutableMapping, Self
 
 from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
     StudyStatus,
@@ -18,20 +20,61 @@ from common.config import (
     STUDY_VISIT_TYPE_EARLY_DISCONTINUATION_VISIT,
 )
 
+
+class CTTermMap(MutableMapping[str, SimpleCTTermNameWithConflictFlag]):
+    """
+    Terms of a codelist (term uid -> term) loaded for the current request.
+
+    The terms are held in a context variable, so concurrent requests using terms
+    valid at different effective dates don't overwrite each other's terms.
+    The (shared) mapping passed to `set` is never modified, it is copied on the first write.
+    """
+
+    def __init__(self, name: str):
+        self._terms: ContextVar[Mapping[str, SimpleCTTermNameWithConflictFlag]] = (
+            ContextVar(name, default=MappingProxyType({}))
+        )
+
+    def set(self, terms: Mapping[str, SimpleCTTermNameWithConflictFlag]):
+        self._terms.set(MappingProxyType(terms))
+
+    def _writable_terms(self) -> dict[str, SimpleCTTermNameWithConflictFlag]:
+        terms = self._terms.get()
+        if not isinstance(terms, dict):
+            terms = dict(terms)
+            self._terms.set(terms)
+        return terms
+
+    def __getitem__(self, key: str) -> SimpleCTTermNameWithConflictFlag:
+        return self._terms.get()[key]
+
+    def __setitem__(self, key: str, value: SimpleCTTermNameWithConflictFlag):
+        self._writable_terms()[key] = value
+
+    def __delitem__(self, key: str):
+        del self._writable_terms()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._terms.get())
+
+    def __len__(self) -> int:
+        return len(self._terms.get())
+
+
 VisitTypeNamedTuple = SimpleCTTermNameWithConflictFlag
-StudyVisitType: dict[str, VisitTypeNamedTuple] = {}
+StudyVisitType = CTTermMap("StudyVisitType")
 
 VisitRepeatingFrequencyNamedTuple = SimpleCTTermNameWithConflictFlag
-StudyVisitRepeatingFrequency: dict[str, VisitRepeatingFrequencyNamedTuple] = {}
+StudyVisitRepeatingFrequency = CTTermMap("StudyVisitRepeatingFrequency")
 
 VisitTimeReferenceNamedTuple = SimpleCTTermNameWithConflictFlag
-StudyVisitTimeReference: dict[str, VisitTimeReferenceNamedTuple] = {}
+StudyVisitTimeReference = CTTermMap("StudyVisitTimeReference")
 
 VisitContactModeNamedTuple = SimpleCTTermNameWithConflictFlag
-StudyVisitContactMode: dict[str, VisitContactModeNamedTuple] = {}
+StudyVisitContactMode = CTTermMap("StudyVisitContactMode")
 
 VisitEpochAllocationNamedTuple = SimpleCTTermNameWithConflictFlag
-StudyVisitEpochAllocation: dict[str, VisitEpochAllocationNamedTuple] = {}
+StudyVisitEpochAllocation = CTTermMap("StudyVisitEpochAllocation")
 
 
 class VisitClass(Enum):
@@ -294,9 +337,14 @@ class StudyVisitVO:
             return self.subvisit_anchor.study_week_number
         return None
 
-    def derive_study_day_number(self, relative_duration=False) -> int | None:
+    # The derive methods take the absolute duration of the visit if it is already known
+    def derive_study_day_number(
+        self, relative_duration=False, absolute_duration: int | None = None
+    ) -> int | None:
         if not relative_duration:
-            duration = self.get_absolute_duration()
+            duration = absolute_duration
+            if duration is None:
+                duration = self.get_absolute_duration()
         else:
             duration = self.get_unified_duration()
         if self.day_unit_object and duration is not None:
@@ -306,39 +354,51 @@ class StudyVisitVO:
             return days + 1
         return None
 
-    def derive_study_duration_days_number(self) -> int | None:
-        derived_study_day_number = self.derive_study_day_number()
+    def derive_study_duration_days_number(
+        self, absolute_duration: int | None = None
+    ) -> int | None:
+        derived_study_day_number = self.derive_study_day_number(
+            absolute_duration=absolute_duration
+        )
         if derived_study_day_number:
             if derived_study_day_number > 0:
                 return derived_study_day_number - 1
             return derived_study_day_number
         return None
 
-    def derive_week_value(self) -> float | None:
-        duration = self.get_absolute_duration()
+    def derive_week_value(self, absolute_duration: int | None = None) -> float | None:
+        duration = absolute_duration
+        if duration is None:
+            duration = self.get_absolute_duration()
         if self.week_unit_object and duration is not None:
             weeks = duration / self.week_unit_object.conversion_factor_to_master
             return weeks
         return None
 
-    def derive_study_week_number(self) -> int | None:
-        week_value = self.derive_week_value()
+    def derive_study_week_number(
+        self, absolute_duration: int | None = None
+    ) -> int | None:
+        week_value = self.derive_week_value(absolute_duration)
         if week_value is not None:
             if week_value < 0:
                 return floor(week_value)
             return floor(week_value) + 1
         return None
 
-    def derive_study_duration_weeks_number(self) -> int | None:
-        week_value = self.derive_week_value()
+    def derive_study_duration_weeks_number(
+        self, absolute_duration: int | None = None
+    ) -> int | None:
+        week_value = self.derive_week_value(absolute_duration)
         if week_value is not None:
             if week_value < 0:
                 return ceil(week_value)
             return floor(week_value)
         return None
 
-    def derive_week_in_study_number(self) -> int | None:
-        return self.derive_study_duration_weeks_number()
+    def derive_week_in_study_number(
+        self, absolute_duration: int | None = None
+    ) -> int | None:
+        return self.derive_study_duration_weeks_number(absolute_duration)
 
     @property
     def study_week_label(self):
@@ -378,11 +438,20 @@ class StudyVisitVO:
             return ["edit", "delete", "lock"]
         return None
 
-    def get_absolute_duration(self) -> int | None:
+    def get_absolute_duration(
+        self, anchor_duration: Callable[[Self], int | None] | None = None
+    ) -> int | None:
+        """
+        Returns the duration of the visit from the global anchor.
+        `anchor_duration` returns the absolute duration of the anchor visits,
+        the timeline passes its memoized durations so that anchor chains are resolved once.
+        """
+        if anchor_duration is None:
+            anchor_duration = StudyVisitVO.get_absolute_duration
         # Special visit doesn't have a timing but we want to place it
         # after the anchor visit for the special visit hence we derive timing based on the anchor visit
         if self.visit_class == VisitClass.SPECIAL_VISIT and self.subvisit_anchor:
-            return self.subvisit_anchor.get_absolute_duration()
+            return anchor_duration(self.subvisit_anchor)
         if self.timepoint:
             if self.timepoint.visit_value == 0:
                 return 0
@@ -392,14 +461,10 @@ class StudyVisitVO:
                     == GLOBAL_ANCHOR_VISIT_NAME.lower()
                 ):
                     return self.get_unified_duration()
-                return (
-                    self.get_unified_duration()
-                    + self.anchor_visit.get_absolute_duration()
-                )
+                return self.get_unified_duration() + anchor_duration(self.anchor_visit)
             if self.subvisit_anchor is not None:
-                return (
-                    self.get_unified_duration()
-                    + self.subvisit_anchor.get_absolute_duration()
+                return self.get_unified_duration() + anchor_duration(
+                    self.subvisit_anchor
                 )
             if self.anchor_visit is None:
                 return self.get_unified_duration()
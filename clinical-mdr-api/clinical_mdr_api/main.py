@@ -1,5 +1,6 @@
 """Application main file."""
 
+import json
 import logging
 from contextlib import asynccontextmanager
 from typing import Any
@@ -9,7 +10,6 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
-from fastapi.routing import APIRoute
 from opencensus.ext.azure.trace_exporter import AzureExporter
 from opencensus.trace.samplers import AlwaysOnSampler
 from pydantic import ValidationError
@@ -17,6 +17,12 @@ from starlette.middleware import Middleware
 from starlette_context.middleware import RawContextMiddleware
 
 from clinical_mdr_api.utils.api_version import get_api_version
+from clinical_mdr_api.utils.lazy_routers import (
+    LazyRouter,
+    LazyRouterGroup,
+    LazyRouterMiddleware,
+    include_router_groups,
+)
 from common import config, exceptions
 from common.auth.config import OAUTH_ENABLED, SWAGGER_UI_INIT_OAUTH
 from common.auth.dependencies import dummy_user_auth, validate_token
@@ -85,6 +91,9 @@ middlewares.append(
 # Refer to: fastapi.applications.FastAPI.build_middleware_stack()
 middlewares.append(Middleware(ExceptionTracebackMiddleware))
 
+# Includes the lazily loaded routers matching the path of a request, see `app.state.lazy_router_groups` below
+middlewares.append(Middleware(LazyRouterMiddleware))
+
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
@@ -201,65 +210,6 @@ app.include_router(
     prefix="/notifications",
     tags=["Notifications"],
 )
-app.include_router(
-    routers.odm_study_events_router,
-    prefix="/concepts/odms/study-events",
-    tags=["ODM Study Events"],
-)
-app.include_router(
-    routers.odm_forms_router, prefix="/concepts/odms/forms", tags=["ODM Forms"]
-)
-app.include_router(
-    routers.odm_item_groups_router,
-    prefix="/concepts/odms/item-groups",
-    tags=["ODM Item Groups"],
-)
-app.include_router(
-    routers.odm_item_router, prefix="/concepts/odms/items", tags=["ODM Item"]
-)
-app.include_router(
-    routers.odm_conditions_router,
-    prefix="/concepts/odms/conditions",
-    tags=["ODM Conditions"],
-)
-app.include_router(
-    routers.odm_methods_router,
-    prefix="/concepts/odms/methods",
-    tags=["ODM Methods"],
-)
-app.include_router(
-    routers.odm_formal_expressions_router,
-    prefix="/concepts/odms/formal-expressions",
-    tags=["ODM Formal Expressions"],
-)
-app.include_router(
-    routers.odm_descriptions_router,
-    prefix="/concepts/odms/descriptions",
-    tags=["ODM Descriptions"],
-)
-app.include_router(
-    routers.odm_aliases_router, prefix="/concepts/odms/aliases", tags=["ODM Aliases"]
-)
-app.include_router(
-    routers.odm_vendor_namespace_router,
-    prefix="/concepts/odms/vendor-namespaces",
-    tags=["ODM Vendor Namespaces"],
-)
-app.include_router(
-    routers.odm_vendor_attribute_router,
-    prefix="/concepts/odms/vendor-attributes",
-    tags=["ODM Vendor Attributes"],
-)
-app.include_router(
-    routers.odm_vendor_element_router,
-    prefix="/concepts/odms/vendor-elements",
-    tags=["ODM Vendor Elements"],
-)
-app.include_router(
-    routers.odm_metadata_router,
-    prefix="/concepts/odms/metadata",
-    tags=["ODM Metadata Import/Export"],
-)
 app.include_router(
     routers.activity_instruction_templates_router,
     prefix="/activity-instruction-templates",
@@ -455,21 +405,6 @@ app.include_router(
     prefix="/concepts/unit-definitions",
     tags=["Unit Definitions"],
 )
-app.include_router(
-    routers.metadata_router, prefix="/listings", tags=["Listing Metadata"]
-)
-app.include_router(
-    routers.listing_router, prefix="/listings", tags=["Listing Legacy CDW MMA"]
-)
-app.include_router(
-    routers.sdtm_listing_router, prefix="/listings", tags=["SDTM Study Design Listings"]
-)
-app.include_router(
-    routers.adam_listing_router, prefix="/listings", tags=["ADaM Study Design Listings"]
-)
-app.include_router(
-    routers.study_listing_router, prefix="/listings", tags=["Study Design Listings"]
-)
 app.include_router(
     routers.configuration_router,
     prefix="/configurations",
@@ -530,7 +465,132 @@ app.include_router(
     prefix="/integrations/ms-graph",
     tags=["MS Graph API integrations"],
 )
-app.include_router(routers.ddf_router, prefix="/usdm/v3", tags=["USDM endpoints"])
+
+# Rarely used routers, included on the first request to one of their paths
+app.state.lazy_router_groups = (
+    LazyRouterGroup(
+        "ODM",
+        [
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_study_events",
+                "/concepts/odms/study-events",
+                ["ODM Study Events"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_forms",
+                "/concepts/odms/forms",
+                ["ODM Forms"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_item_groups",
+                "/concepts/odms/item-groups",
+                ["ODM Item Groups"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_items",
+                "/concepts/odms/items",
+                ["ODM Item"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_conditions",
+                "/concepts/odms/conditions",
+                ["ODM Conditions"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_methods",
+                "/concepts/odms/methods",
+                ["ODM Methods"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_formal_expressions",
+                "/concepts/odms/formal-expressions",
+                ["ODM Formal Expressions"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_descriptions",
+                "/concepts/odms/descriptions",
+                ["ODM Descriptions"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_aliases",
+                "/concepts/odms/aliases",
+                ["ODM Aliases"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_vendor_namespaces",
+                "/concepts/odms/vendor-namespaces",
+                ["ODM Vendor Namespaces"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_vendor_attributes",
+                "/concepts/odms/vendor-attributes",
+                ["ODM Vendor Attributes"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_vendor_elements",
+                "/concepts/odms/vendor-elements",
+                ["ODM Vendor Elements"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.concepts.odms.odm_metadata",
+                "/concepts/odms/metadata",
+                ["ODM Metadata Import/Export"],
+            ),
+        ],
+    ),
+    LazyRouterGroup(
+        "Listings",
+        [
+            LazyRouter(
+                "clinical_mdr_api.routers.listings.listings",
+                "/listings",
+                ["Listing Metadata"],
+                attribute="metadata_router",
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.listings.listings",
+                "/listings",
+                ["Listing Legacy CDW MMA"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.listings.listings_sdtm",
+                "/listings",
+                ["SDTM Study Design Listings"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.listings.listings_adam",
+                "/listings",
+                ["ADaM Study Design Listings"],
+            ),
+            LazyRouter(
+                "clinical_mdr_api.routers.listings.listings_study",
+                "/listings",
+                ["Study Design Listings"],
+            ),
+        ],
+    ),
+    LazyRouterGroup(
+        "CTR XML",
+        [
+            LazyRouter(
+                "clinical_mdr_api.routers.ctr_xml.ctr_xml", "", ["Study Selections"]
+            )
+        ],
+        path_pattern=r"/studies/[^/]+/ctr/",
+    ),
+    LazyRouterGroup(
+        "USDM",
+        [
+            LazyRouter(
+                "clinical_mdr_api.routers.ddf.study_definitions",
+                "/usdm/v3",
+                ["USDM endpoints"],
+            )
+        ],
+    ),
+)
+if not config.LAZY_ROUTER_GROUPS:
+    include_router_groups(app)
 
 system_app = FastAPI(
     middleware=None,
@@ -544,10 +604,10 @@ system_app.include_router(routers.system_router, tags=["System"])
 app.mount("/system", system_app)
 
 
-def custom_openapi():
-    if app.openapi_schema:
-        return app.openapi_schema
+def build_openapi_schema() -> dict[str, Any]:
+    """Generates the OpenAPI schema of all the routes, without the servers and security schemes of the deployment"""
 
+    include_router_groups(app)
     openapi_schema = get_openapi(
         title=app.title,
         version=app.version,
@@ -556,6 +616,52 @@ def custom_openapi():
         routes=app.routes,
     )
 
+    # Add `400 Bad Request` error response to all endpoints
+    for path_item in openapi_schema["paths"].values():
+        for operation in path_item.values():
+            if "responses" not in operation:
+                operation["responses"] = {}
+            if "400" not in operation["responses"]:
+                operation["responses"]["400"] = {
+                    "description": "Bad Request",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                        }
+                    },
+                }
+
+    return openapi_schema
+
+
+def load_prebuilt_openapi_schema() -> dict[str, Any] | None:
+    """Returns the schema saved by `generate_openapi_json.py --prebuilt`, if it was built for the current API version"""
+
+    if not config.OPENAPI_PREBUILT_SCHEMA_FILE:
+        return None
+    try:
+        with open(config.OPENAPI_PREBUILT_SCHEMA_FILE, "r", encoding="utf-8") as f:
+            openapi_schema = json.load(f)
+    except FileNotFoundError:
+        return None
+    if openapi_schema.get("info", {}).get("version") != app.version:
+        log.warning(
+            "Prebuilt OpenAPI schema %s is not of API version %s, ignoring it",
+            config.OPENAPI_PREBUILT_SCHEMA_FILE,
+            app.version,
+        )
+        return None
+    return openapi_schema
+
+
+def custom_openapi(prebuilt: bool = True):
+    if app.openapi_schema and prebuilt:
+        return app.openapi_schema
+
+    openapi_schema = load_prebuilt_openapi_schema() if prebuilt else None
+    if openapi_schema is None:
+        openapi_schema = build_openapi_schema()
+
     openapi_schema["servers"] = [{"url": config.OPENAPI_SCHEMA_API_ROOT_PATH}]
 
     if OAUTH_ENABLED:
@@ -576,32 +682,11 @@ def custom_openapi():
         }
 
         # Add 'BearerJwtAuth' security method to all endpoints
-        api_router = [route for route in app.routes if isinstance(route, APIRoute)]
-        for route in api_router:
-            path = getattr(route, "path")
-            methods = [method.lower() for method in getattr(route, "methods")]
-
-            for method in methods:
-                endpoint_security: list[Any] = openapi_schema["paths"][path][
-                    method
-                ].get("security", [])
+        for path_item in openapi_schema["paths"].values():
+            for operation in path_item.values():
+                endpoint_security: list[Any] = operation.get("security", [])
                 endpoint_security.append({"BearerJwtAuth": []})
-                openapi_schema["paths"][path][method]["security"] = endpoint_security
-
-    # Add `400 Bad Request` error response to all endpoints
-    for path, path_item in openapi_schema["paths"].items():
-        for method, operation in path_item.items():
-            if "responses" not in operation:
-                operation["responses"] = {}
-            if "400" not in operation["responses"]:
-                operation["responses"]["400"] = {
-                    "description": "Bad Request",
-                    "content": {
-                        "application/json": {
-                            "schema": {"$ref": "#/components/schemas/ErrorResponse"}
-                        }
-                    },
-                }
+                operation["security"] = endpoint_security
 
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -2,7 +2,7 @@ from typing import Annotated, Any, Self
 
 from pydantic import Field
 
-from clinical_mdr_api.models.utils import BaseModel
+from clinical_mdr_api.models.utils import BaseModel, InputModel
 
 
 class StudyVisitListing(BaseModel):
@@ -504,3 +504,14 @@ class StudyDiseaseMilestoneListing(BaseModel):
             TMDEF=query_result["TMDEF"],
             TMRPT=query_result["TMRPT"],
         )
+
+
+class SDTMTrialDesignStudyInput(InputModel):
+    study_uid: Annotated[str, Field(description="Uid of the study")]
+    study_value_version: Annotated[
+        str | None,
+        Field(
+            description="Released version of the study, the latest data is used if not specified",
+            json_schema_extra={"nullable": True},
+        ),
+    ] = None
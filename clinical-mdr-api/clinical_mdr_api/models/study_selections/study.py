@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated, Callable, Collection, Iterable, Self
+from typing import Annotated, Callable, Collection, Iterable, Self, get_args
 
 from pydantic import ConfigDict, Field
 
@@ -48,6 +48,12 @@ from common.exceptions import (
 )
 
 
+def _study_id_from_summary(summary: dict) -> str | None:
+    if summary["study_number"] is None or summary["study_id_prefix"] is None:
+        return None
+    return f"{summary['study_id_prefix']}-{summary['study_number']}"
+
+
 def update_study_subpart_properties(study: "Study | CompactStudy"):
     if study.study_parent_part and study.study_parent_part.study_id:
         study.current_metadata.identification_metadata.study_id = (
@@ -205,6 +211,23 @@ class RegistryIdentifiersJsonModel(BaseModel):
         Field(json_schema_extra={"nullable": True}),
     ] = None
 
+    @classmethod
+    def from_study_summary(cls, registry_identifiers: list[dict]) -> Self:
+        """
+        Builds the registry identifiers from the study text fields returned by `StudyDefinitionRepositoryImpl.find_all_summaries`.
+        """
+        values = {}
+        for registry_identifier in registry_identifiers:
+            field_name = registry_identifier["field_name"]
+            values[field_name] = registry_identifier["value"]
+            if registry_identifier["null_value_code"]:
+                values[f"{field_name}_null_value_code"] = (
+                    SimpleCTTermNameWithConflictFlag(
+                        **registry_identifier["null_value_code"]
+                    )
+                )
+        return cls(**values)
+
     @classmethod
     def from_study_registry_identifiers_vo(
         cls,
@@ -1443,6 +1466,27 @@ class StudyParentPart(BaseModel):
             ),
         )
 
+    @classmethod
+    def from_study_summary(cls, summary: dict | None) -> Self | None:
+        """
+        Builds the study parent part from the map returned by `StudyDefinitionRepositoryImpl.find_all_summaries`.
+        """
+        if not summary:
+            return None
+
+        return cls(
+            uid=summary["uid"],
+            study_number=summary["study_number"],
+            study_acronym=summary["study_acronym"],
+            project_number=summary["project_number"],
+            description=summary["description"],
+            study_id=_study_id_from_summary(summary),
+            study_title=summary["study_title"],
+            registry_identifiers=RegistryIdentifiersJsonModel.from_study_summary(
+                summary["registry_identifiers"]
+            ),
+        )
+
 
 class StudyStructureOverview(BaseModel):
     study_ids: Annotated[list[str], Field()]
@@ -1519,6 +1563,88 @@ class CompactStudy(BaseModel):
 
         return study
 
+    @classmethod
+    def from_study_summary(cls, study_summary: dict) -> Self:
+        """
+        Builds a compact study from a row returned by `StudyDefinitionRepositoryImpl.find_all_summaries`,
+        without retrieving the snapshot of the study.
+        """
+        summary = study_summary["summary"]
+        study_parent_part = StudyParentPart.from_study_summary(
+            study_summary["study_parent_part"]
+        )
+        study_status = (
+            StudyStatus.DELETED
+            if summary["is_deleted"]
+            else StudyStatus(summary["study_status"])
+        )
+        study = cls(
+            uid=summary["uid"],
+            study_parent_part=study_parent_part,
+            study_subpart_uids=sorted(study_summary["study_subpart_uids"]),
+            possible_actions=sorted(
+                _.value
+                for _ in StudyDefinitionAR.possible_actions_for(
+                    study_status=study_status,
+                    has_latest_locked=summary["has_latest_locked"],
+                    study_parent_part_uid=(
+                        study_parent_part.uid if study_parent_part else None
+                    ),
+                )
+            ),
+            current_metadata=CompactStudyMetadataJsonModel(
+                identification_metadata=CompactStudyIdentificationMetadataJsonModel(
+                    study_number=summary["study_number"],
+                    subpart_id=summary["subpart_id"],
+                    study_acronym=summary["study_acronym"],
+                    study_subpart_acronym=summary["study_subpart_acronym"],
+                    project_number=summary["project_number"],
+                    project_name=study_summary["project_name"],
+                    description=summary["description"],
+                    clinical_programme_name=study_summary["clinical_programme_name"],
+                    study_id=_study_id_from_summary(summary),
+                ),
+                version_metadata=StudyVersionMetadataJsonModel(
+                    study_status=study_status.value,
+                    version_number=summary["version_number"],
+                    version_timestamp=summary["version_timestamp"],
+                    version_author=study_summary["version_author"],
+                ),
+                study_description=StudyDescriptionJsonModel(
+                    study_title=summary["study_title"],
+                    study_short_title=summary["study_short_title"],
+                ),
+            ),
+        )
+
+        update_study_subpart_properties(study)
+
+        return study
+
+
+def is_study_summary_field(field_name: str) -> bool:
+    """
+    Returns whether `field_name` (a dot separated path or the `*` wildcard) can be filtered or sorted on
+    using the compact studies built by `CompactStudy.from_study_summary`.
+    """
+    if field_name == "*":
+        return True
+    model = CompactStudy
+    for part in field_name.split("."):
+        model_field = model.model_fields.get(part) if model is not None else None
+        if model_field is None:
+            return False
+        annotation = model_field.annotation
+        model = next(
+            (
+                arg
+                for arg in (annotation, *get_args(annotation))
+                if isinstance(arg, type) and issubclass(arg, BaseModel)
+            ),
+            None,
+        )
+    return True
+
 
 class Study(BaseModel):
     uid: Annotated[str, Field(description="The unique id of the study.")]
@@ -5,7 +5,18 @@ from pydantic import Field
 from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     SimpleCTTermNameWithConflictFlag,
 )
-from clinical_mdr_api.models.utils import BaseModel, PatchInputModel, PostInputModel
+from clinical_mdr_api.models.error import BatchErrorResponse
+from clinical_mdr_api.models.study_selections.study_selection import (
+    METHOD_FIELD,
+    RESPONSE_CODE_FIELD,
+)
+from clinical_mdr_api.models.utils import (
+    BaseModel,
+    BatchInputModel,
+    InputModel,
+    PatchInputModel,
+    PostInputModel,
+)
 from common import config
 
 
@@ -226,6 +237,27 @@ class StudyEpochVersion(StudyEpoch):
     changes: Annotated[list[str], Field()]
 
 
+class StudyEpochBatchEditInput(StudyEpochEditInput):
+    uid: Annotated[str, Field(description="The unique id of the study epoch to edit")]
+
+
+class StudyEpochBatchDeleteInput(InputModel):
+    uid: Annotated[str, Field(description="The unique id of the study epoch to delete")]
+
+
+class StudyEpochBatchInput(BatchInputModel):
+    method: Annotated[str, METHOD_FIELD]
+    content: Annotated[
+        StudyEpochBatchEditInput | StudyEpochCreateInput | StudyEpochBatchDeleteInput,
+        Field(),
+    ]
+
+
+class StudyEpochBatchOutput(BaseModel):
+    response_code: Annotated[int, RESPONSE_CODE_FIELD]
+    content: Annotated[StudyEpoch | None | BatchErrorResponse, Field()] = None
+
+
 class StudyEpochTypes(BaseModel):
     type: Annotated[str, Field(description="Study Epoch type")]
     type_name: Annotated[str, Field()]
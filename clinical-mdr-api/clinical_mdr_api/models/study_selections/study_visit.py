@@ -6,7 +6,18 @@ from pydantic import ConfigDict, Field
 from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     SimpleCTTermNameWithConflictFlag,
 )
-from clinical_mdr_api.models.utils import BaseModel, PatchInputModel, PostInputModel
+from clinical_mdr_api.models.error import BatchErrorResponse
+from clinical_mdr_api.models.study_selections.study_selection import (
+    METHOD_FIELD,
+    RESPONSE_CODE_FIELD,
+)
+from clinical_mdr_api.models.utils import (
+    BaseModel,
+    BatchInputModel,
+    InputModel,
+    PatchInputModel,
+    PostInputModel,
+)
 from common import config
 
 
@@ -337,6 +348,23 @@ class StudyVisitVersion(StudyVisit):
     changes: Annotated[list[str], Field()]
 
 
+class StudyVisitBatchDeleteInput(InputModel):
+    uid: Annotated[str, Field(description="Uid of the Visit to delete")]
+
+
+class StudyVisitBatchInput(BatchInputModel):
+    method: Annotated[str, METHOD_FIELD]
+    content: Annotated[
+        StudyVisitEditInput | StudyVisitCreateInput | StudyVisitBatchDeleteInput,
+        Field(),
+    ]
+
+
+class StudyVisitBatchOutput(BaseModel):
+    response_code: Annotated[int, RESPONSE_CODE_FIELD]
+    content: Annotated[StudyVisit | None | BatchErrorResponse, Field()] = None
+
+
 class AllowedTimeReferences(BaseModel):
     time_reference_uid: Annotated[str, Field()]
     time_reference_name: Annotated[str, Field()]
@@ -1,7 +1,6 @@
 import datetime
 import json
-import re
-from copy import copy
+from enum import Enum
 from types import NoneType, UnionType
 from typing import Annotated, Any, Callable, Generic, Iterable, Self, TypeVar
 
@@ -9,7 +8,7 @@ import nh3
 from annotated_types import MinLen
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict, Field, ValidationInfo, field_validator
-from pydantic.fields import PydanticUndefined
+from pydantic.fields import FieldInfo, PydanticUndefined
 from starlette.responses import Response
 
 from clinical_mdr_api.domains.concepts.unit_definitions.unit_definition import (
@@ -100,145 +99,225 @@ class BaseModel(PydanticBaseModel):
         It is now possible to declare a source property on a Field()
         call to specify the location where this method should get a
         field's value from.
-        """
-
-        def _extract_part_from_node(node_to_extract, path, extract_from_relationship):
-            """
-            Traverse specified path in the node_to_extract.
-            The possible paths for the traversal are stored in the node _relations dictionary.
-            """
-            if extract_from_relationship:
-                path += "_relationship"
-            if not hasattr(node_to_extract, "_relations"):
-                return None
-            if path not in node_to_extract._relations.keys():
-                # it means that the field is Optional and None was set to be a default value
-                if field.default is None:
-                    return None
-                raise RuntimeError(
-                    f"{path} is not present in node relations (did you forget to fetch it?)"
-                )
-            if node_to_extract._relations[path] == []:
-                return None
-
-            return node_to_extract._relations[path]
-
-        def _get_value_from_source_field(model_field, db_node, db_field):
-            value = getattr(db_node, db_field)
-
-            # In case of author_username model field, we need to lookup the User node using the `source` field value as `User.user_id`
-            if model_field == "author_username":
-                value = UserInfoService.get_author_username_from_id(value)
 
-            return value
+        The fields are mapped following the mapping plan of the model (see `_MappingPlan`),
+        compiled on first use. The mapped values are not set on `obj`,
+        they overlay its attributes in the `_MappedAttributes` validated by Pydantic.
+        """
 
-        ret = []
-        for name, field in cls.model_fields.items():
-            jse = field.json_schema_extra or {}
-            source = jse.get("source")
-            if jse.get("exclude_from_model_validate"):
+        plan = _MAPPING_PLANS.get(cls)
+        if plan is None:
+            plan = _MAPPING_PLANS[cls] = _MappingPlan(cls)
+
+        values: dict[str, Any] = {}
+        attributes = _MappedAttributes(values, obj)
+        ret: list[_MappedAttributes] = []
+        value = None
+        for field_plan in plan.fields:
+            name = field_plan.name
+            if field_plan.kind is _FieldKind.NESTED:
+                value = field_plan.nested_model.model_validate(attributes)
+                # if some value of nested model is initialized then set the whole nested object
+                if isinstance(value, list):
+                    values[name] = value
+                # if all values of nested model are None set the whole object to None
+                else:
+                    values[name] = value if any(value.__dict__.values()) else None
                 continue
-            if not source:
-                if issubclass(get_field_type(field.annotation), BaseModel):
-                    # get out of recursion
-                    if get_field_type(field.annotation) is cls:
-                        continue
-                    # added copy to not override properties in main obj
-                    value = get_field_type(field.annotation).model_validate(copy(obj))
-                    # if some value of nested model is initialized then set the whole nested object
-                    if isinstance(value, list):
-                        if value:
-                            setattr(obj, name, value)
-                        else:
-                            setattr(obj, name, [])
-                    else:
-                        if any(value.dict().values()):
-                            setattr(obj, name, value)
-                        # if all values of nested model are None set the whole object to None
-                        else:
-                            setattr(obj, name, None)
+            if field_plan.kind is _FieldKind.DEFAULT_NONE:
                 # Quick fix to provide default None value to fields that allow it
-                # Not the best place to do this...
-                elif field.default == PydanticUndefined and not hasattr(obj, name):
-                    setattr(obj, name, None)
+                if name not in values and not hasattr(obj, name):
+                    values[name] = None
                 continue
-            if "." in source or "|" in source:
-                orig_source = source
-                # split by . that implicates property on node or | that indicates property on the relationship
-                parts = re.split(r"[.|]", source)
-                source = parts[-1]
-                last_traversal = parts[-2]
-                node = obj
-                parts = parts[:-1]
-                for _, part in enumerate(parts):
-                    extract_from_relationship = False
-                    if part == last_traversal and "|" in orig_source:
-                        extract_from_relationship = True
-                    # if node is a list of nodes we want to extract property/relationship
-                    # from all nodes in list of nodes
-                    if isinstance(node, list):
-                        return_node = []
-                        for item in node:
-                            extracted = _extract_part_from_node(
-                                node_to_extract=item,
-                                path=part,
-                                extract_from_relationship=extract_from_relationship,
-                            )
-                            return_node.extend(extracted)
-                        node = return_node
-                    else:
-                        node = _extract_part_from_node(
-                            node_to_extract=node,
-                            path=part,
-                            extract_from_relationship=extract_from_relationship,
-                        )
-                    if node is None:
-                        break
-            else:
-                node = obj
+
+            node = attributes
+            for relation in field_plan.traversal:
+                # if node is a list of nodes we want to extract property/relationship
+                # from all nodes in list of nodes
+                if isinstance(node, list):
+                    return_node = []
+                    for item in node:
+                        return_node.extend(field_plan.extract(item, relation))
+                    node = return_node
+                else:
+                    node = field_plan.extract(node, relation)
+                if node is None:
+                    break
             if node is not None:
                 # if node is a list we want to
                 # extract property from each element of list and return list of property values
                 if isinstance(node, list):
-                    value = [
-                        _get_value_from_source_field(name, n, source) for n in node
-                    ]
+                    value = [field_plan.get_value(n) for n in node]
                 else:
-                    value = _get_value_from_source_field(name, node, source)
-
+                    value = field_plan.get_value(node)
             else:
                 value = None
+
             # if obtained value is a list and field type is not List
             # it means that we are building some list[BaseModel] but its fields are not of list type
-
-            if isinstance(value, list) and not get_sub_fields(field):
+            if isinstance(value, list) and not field_plan.is_list:
                 # if ret array is not instantiated
                 # it means that the first property out of the whole list [BaseModel] is being instantiated
                 if not ret:
-                    for val in value:
-                        temp_obj = copy(obj)
-                        setattr(temp_obj, name, val)
-                        ret.append(temp_obj)
+                    ret = [
+                        _MappedAttributes(values | {name: val}, obj) for val in value
+                    ]
                 # if ret exists it means that some properties out of whole list [BaseModel] are already instantiated
                 else:
                     for val, item in zip(value, ret):
-                        setattr(item, name, val)
+                        item.mapped_values[name] = val
             else:
-                setattr(obj, name, value)
+                values[name] = value
         # Nothing to return and the value returned by the query
         # is an empty list => return an empty list
         if not ret and isinstance(value, list) and not value:
             return []
         # Returning single BaseModel
-        if not ret and (
-            not isinstance(value, list) or (isinstance(value, list) and value)
-        ):
-            return super().model_validate(obj)
+        if not ret:
+            return super().model_validate(attributes)
         # if ret exists it means that the list of BaseModels is being returned
-        objs_to_return = []
-        for item in ret:
-            objs_to_return.append(super().model_validate(item))
-        return objs_to_return
+        return [super().model_validate(item) for item in ret]
+
+
+class _MappedAttributes:
+    """Attributes of an object overlaid with the values mapped by `BaseModel.model_validate`"""
+
+    # not valid field names, so that they don't shadow the attributes of the object
+    __slots__ = ("mapped_values", "_obj")
+
+    def __init__(self, mapped_values: dict[str, Any], obj: Any):
+        self.mapped_values = mapped_values
+        self._obj = obj
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.mapped_values[name]
+        except KeyError:
+            return getattr(self._obj, name)
+
+
+class _FieldKind(Enum):
+    NESTED = "nested"
+    DEFAULT_NONE = "default_none"
+    SOURCE = "source"
+
+
+class _FieldPlan:
+    """How `BaseModel.model_validate` gets the value of a field"""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "nested_model",
+        "traversal",
+        "property",
+        "is_author",
+        "is_optional",
+        "is_list",
+    )
+
+    def __init__(self, name: str, field: FieldInfo, kind: _FieldKind, **kwargs):
+        self.name = name
+        self.kind = kind
+        self.nested_model: type["BaseModel"] | None = kwargs.get("nested_model")
+        self.traversal: tuple[str, ...] = ()
+        self.property: str | None = None
+        self.is_author = name == "author_username"
+        self.is_optional = field.default is None
+        self.is_list = bool(get_sub_fields(field))
+
+        if kind is _FieldKind.SOURCE:
+            source = kwargs["source"]
+            # split by . that implicates property on node or | that indicates property on the relationship
+            *parts, self.property = source.replace("|", ".").split(".")
+            if parts and "|" in source:
+                # the property is read from the relationship of the last traversal
+                self.traversal = tuple(
+                    f"{part}_relationship" if part == parts[-1] else part
+                    for part in parts
+                )
+            else:
+                self.traversal = tuple(parts)
+
+    def extract(self, node: Any, relation: str) -> Any:
+        """
+        Traverse specified relation of the node.
+        The possible relations for the traversal are stored in the node _relations dictionary.
+        """
+        relations = getattr(node, "_relations", None)
+        if relations is None:
+            return None
+        if relation not in relations:
+            # it means that the field is Optional and None was set to be a default value
+            if self.is_optional:
+                return None
+            raise RuntimeError(
+                f"{relation} is not present in node relations (did you forget to fetch it?)"
+            )
+        if relations[relation] == []:
+            return None
+        return relations[relation]
+
+    def get_value(self, node: Any) -> Any:
+        value = getattr(node, self.property)
+        # In case of author_username model field, we need to lookup the User node using the `source` field value as `User.user_id`
+        if self.is_author:
+            value = UserInfoService.get_author_username_from_id(value)
+        return value
+
+
+class _MappingPlan:
+    """The fields of a model that `BaseModel.model_validate` maps, with how to get their values"""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, model: type[BaseModel]):
+        fields = []
+        for name, field in model.model_fields.items():
+            jse = field.json_schema_extra or {}
+            if jse.get("exclude_from_model_validate"):
+                continue
+            if source := jse.get("source"):
+                fields.append(_FieldPlan(name, field, _FieldKind.SOURCE, source=source))
+                continue
+            field_type = get_field_type(field.annotation)
+            if issubclass(field_type, BaseModel):
+                # get out of recursion
+                if field_type is not model:
+                    fields.append(
+                        _FieldPlan(
+                            name, field, _FieldKind.NESTED, nested_model=field_type
+                        )
+                    )
+            elif field.default == PydanticUndefined:
+                fields.append(_FieldPlan(name, field, _FieldKind.DEFAULT_NONE))
+        self.fields: tuple[_FieldPlan, ...] = tuple(fields)
+
+
+_MAPPING_PLANS: dict[type[BaseModel], _MappingPlan] = {}
+
+
+def compile_mapping_plans() -> int:
+    """
+    Compiles the mapping plans of all the models imported so far, instead of on their first `model_validate` call.
+    Models whose plan cannot be compiled ahead, e.g. generic models, are left to be compiled on first use.
+
+    Returns the number of mapping plans compiled so far.
+    """
+    models = list(BaseModel.__subclasses__())
+    seen = set(models)
+    while models:
+        model = models.pop()
+        for subclass in model.__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                models.append(subclass)
+        if model not in _MAPPING_PLANS:
+            try:
+                _MAPPING_PLANS[model] = _MappingPlan(model)
+            except TypeError:
+                continue
+    return len(_MAPPING_PLANS)
 
 
 class InputModel(BaseModel):
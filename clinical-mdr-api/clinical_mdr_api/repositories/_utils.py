@@ -1,10 +1,14 @@
 import functools
+import inspect
+import json
 import logging
 import re
+import threading
 from datetime import datetime
 from enum import Enum
 from typing import Annotated, Any, Callable
 
+from cachetools import TTLCache
 from dateutil.parser import isoparse
 from neo4j.exceptions import CypherSyntaxError
 from neomodel import Q, db
@@ -17,6 +21,7 @@ from clinical_mdr_api.models.concepts.activities.activity import (
 from clinical_mdr_api.models.concepts.concept import VersionProperties
 from clinical_mdr_api.models.controlled_terminologies.ct_term import SimpleTermModel
 from clinical_mdr_api.models.standard_data_models.sponsor_model import SponsorModelBase
+from common import config
 from common.exceptions import ValidationException
 from common.utils import get_field_type, get_sub_fields, validate_max_skip_clause
 
@@ -1054,7 +1059,126 @@ def sb_clear_cache(caches: list[str] | None = None):
                             cache.currsize,
                         )
                         cache.clear()
+                header_values_cache.clear()
 
         return wrapper
 
     return decorator
+
+
+class HeaderValuesCache:
+    """
+    Short-lived cache of the distinct values returned by the `get_distinct_headers` repository methods.
+
+    Entries are keyed by the repository method, the header field, the normalized filters other than the search string,
+    the remaining arguments (library, package, version, ...) and the lower-cased search string.
+    The search string is matched with a case-insensitive CONTAINS, so when a complete result (less than `page_size` values)
+    is cached for a prefix of the search string, the values are narrowed in memory instead of querying the database.
+    The cache is cleared by the `sb_clear_cache` write hooks, and entries expire after `HEADER_VALUES_CACHE_TTL` seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> list[Any] | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def put(self, key: tuple[Any, ...], values: list[Any]) -> None:
+        with self._lock:
+            self._cache[key] = values
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def is_narrowable(
+        model: type[BaseModel] | None,
+        field_name: str,
+        filters: dict,
+        filter_operator: "FilterOperator | None",
+    ) -> bool:
+        """
+        Whether the values of a longer search string are a subset of the values of its prefix.
+        That holds for fields filtered with a CONTAINS on their string value, combined with the other filters by AND.
+        List fields are filtered by membership instead, and nested fields are filtered on their sub fields.
+        """
+        if filters and filter_operator != FilterOperator.AND:
+            return False
+        if "." in field_name or field_name == "*":
+            return False
+        field = model.model_fields.get(field_name) if model else None
+        return field is None or (
+            get_sub_fields(field) is None and get_field_type(field.annotation) is str
+        )
+
+    @staticmethod
+    def narrow(values: list[Any], search_string: str, page_size: int) -> list[Any]:
+        return [value for value in values if search_string in value.lower()][:page_size]
+
+
+header_values_cache = HeaderValuesCache(
+    maxsize=config.CACHE_MAX_SIZE, ttl=config.HEADER_VALUES_CACHE_TTL
+)
+
+
+def cached_header_values(function):
+    """
+    Decorator caching the values returned by a `get_distinct_headers` repository method in the `header_values_cache`.
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+        arguments.pop("self")
+        arguments |= arguments.pop("kwargs", {})
+
+        field_name = arguments.pop("field_name")
+        search_string = arguments.pop("search_string")
+        filter_by = arguments.pop("filter_by")
+        filter_operator = arguments.pop("filter_operator")
+        page_size = arguments.pop("page_size")
+        if search_string is None or not isinstance(filter_by or {}, dict):
+            return function(self, *args, **kwargs)
+
+        # The search string replaces any filter given on the header field itself
+        filters = dict(filter_by or {})
+        if search_string:
+            filters.pop(field_name, None)
+        key = (
+            type(self).__qualname__,
+            function.__name__,
+            field_name,
+            json.dumps(filters, sort_keys=True, default=str),
+            filter_operator,
+            page_size,
+            json.dumps(arguments, sort_keys=True, default=str),
+        )
+        search_string = search_string.lower()
+
+        values = header_values_cache.get(key + (search_string,))
+        if values is not None:
+            return list(values)
+
+        if HeaderValuesCache.is_narrowable(
+            getattr(self, "return_model", None), field_name, filters, filter_operator
+        ):
+            for length in range(len(search_string) - 1, -1, -1):
+                values = header_values_cache.get(key + (search_string[:length],))
+                if (
+                    values is not None
+                    and len(values) < page_size
+                    and all(isinstance(value, str) for value in values)
+                ):
+                    return HeaderValuesCache.narrow(values, search_string, page_size)
+
+        values = function(self, *args, **kwargs)
+        header_values_cache.put(key + (search_string,), list(values))
+        return values
+
+    return wrapper
@@ -1,5 +1,22 @@
+import json
+import logging
+import zlib
+from typing import Any, Callable
+
+import neo4j.exceptions
+import neo4j.graph
+import neo4j.time
 from neomodel import db
 
+log = logging.getLogger(__name__)
+
+# Codelists of the package containing the term of `package_term`, sorted by uid.
+# They are read from the package, so that the diff of two packages only depends on their contents.
+PACKAGE_TERM_CODELISTS = """
+apoc.coll.sort(apoc.coll.toSet([(package_term)<-[:CONTAINS_TERM]-(:CTPackageCodelist)-[:CONTAINS_ATTRIBUTES]->
+(:CTCodelistAttributesValue)<--(:CTCodelistAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(codelist_root:CTCodelistRoot) | codelist_root.uid]))
+"""
+
 CODELIST_DATA_RETRIEVAL_SPECIFIC_QUERY = """
 MATCH (old_package:CTPackage {name:$old_package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_ATTRIBUTES]->
 (codelist_attr_val)<-[old_versions:HAS_VERSION]-(codelist_attr_root)<-[:HAS_ATTRIBUTES_ROOT]-(old_codelist_root {uid:$codelist_uid})
@@ -16,35 +33,56 @@ WITH old_items, collect(apoc.map.fromValues([new_codelist_root.uid, {
     change_date: latest_date}])) AS new_items
 """
 
-TERM_DATA_RETRIEVAL_SPECIFIC_QUERY = """
-MATCH (old_package:CTPackage {name:$old_package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_TERM]->
+TERM_DATA_RETRIEVAL_SPECIFIC_QUERY = f"""
+MATCH (old_package:CTPackage {{name:$old_package_name}})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_ATTRIBUTES]->
+(:CTCodelistAttributesValue)<--(:CTCodelistAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(:CTCodelistRoot {{uid:$codelist_uid}})
+WITH DISTINCT package_codelist
+MATCH (package_codelist)-[:CONTAINS_TERM]->
 (package_term:CTPackageTerm)-[:CONTAINS_ATTRIBUTES]->(term_attr_val:CTTermAttributesValue)<-[old_versions:HAS_VERSION]-
-(term_attr_root:CTTermAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(old_term_root:CTTermRoot)<-[:HAS_TERM]-(old_codelist_root {uid:$codelist_uid})
+(term_attr_root:CTTermAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(old_term_root:CTTermRoot)
 WITH old_term_root,
-    [(codelist_root)-[:HAS_TERM]->(old_term_root:CTTermRoot) | codelist_root.uid] AS codelists,
+    {PACKAGE_TERM_CODELISTS} AS codelists,
     term_attr_val,
     max(old_versions.start_date) AS latest_date
-WITH collect(apoc.map.fromValues([old_term_root.uid, {
+WITH collect(apoc.map.fromValues([old_term_root.uid, {{
     value_node:term_attr_val,
     codelists: codelists,
-    change_date: latest_date}])) AS old_items
+    change_date: latest_date}}])) AS old_items
 
-MATCH (new_package:CTPackage {name:$new_package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_TERM]->
+MATCH (new_package:CTPackage {{name:$new_package_name}})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_ATTRIBUTES]->
+(:CTCodelistAttributesValue)<--(:CTCodelistAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(:CTCodelistRoot {{uid:$codelist_uid}})
+WITH DISTINCT old_items, package_codelist
+MATCH (package_codelist)-[:CONTAINS_TERM]->
 (package_term:CTPackageTerm)-[:CONTAINS_ATTRIBUTES]->(term_attr_val:CTTermAttributesValue)<-[new_versions:HAS_VERSION]-
-(term_attr_root:CTTermAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(new_term_root:CTTermRoot)<-[:HAS_TERM]-(new_codelist_root {uid:$codelist_uid})
+(term_attr_root:CTTermAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(new_term_root:CTTermRoot)
 WITH old_items,
     new_term_root,
-    [(codelist_root)-[:HAS_TERM]->(new_term_root) | codelist_root.uid] AS codelists,
+    {PACKAGE_TERM_CODELISTS} AS codelists,
     term_attr_val,
     max(new_versions.start_date) AS latest_date
-WITH old_items, collect(apoc.map.fromValues([new_term_root.uid, {
+WITH old_items, collect(apoc.map.fromValues([new_term_root.uid, {{
     value_node: term_attr_val,
     codelists: codelists,
-    change_date: latest_date}])) AS new_items
+    change_date: latest_date}}])) AS new_items
+"""
+
+# The terms of a codelist are compared on their attributes, like `are_terms_different` does,
+# the codelists containing them in each package may differ
+CODELIST_TERM_DIFF_CLAUSE = """
+CASE WHEN old_items_map[common_item].value_node <> new_items_map[common_item].value_node
+    OR old_items_map[common_item].change_date <> new_items_map[common_item].change_date THEN
+apoc.map.fromValues([
+    'uid', common_item,
+    'value_node', apoc.diff.nodes(old_items_map[common_item].value_node, new_items_map[common_item].value_node),
+    'change_date', new_items_map[common_item].change_date,
+    'codelists', new_items_map[common_item].codelists
+    ])
+END AS diff
 """
 
 TERM_NOT_MODIFIED_CLAUSE_SPECIFIC_QUERY = """
-,CASE WHEN old_items_map[common_item] = new_items_map[common_item] THEN
+,CASE WHEN old_items_map[common_item].value_node = new_items_map[common_item].value_node
+    AND old_items_map[common_item].change_date = new_items_map[common_item].change_date THEN
 apoc.map.fromValues([
     'uid', common_item,
     'value_node', new_items_map[common_item].value_node,
@@ -86,19 +124,19 @@ WITH collect(apoc.map.fromValues([codelist_root.uid, {
 RETURN apoc.map.mergeList(items) AS items_map
 """
 
-PACKAGE_TERMS_DATA_RETRIEVAL = """
-MATCH (package:CTPackage {name:$package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_TERM]->
+PACKAGE_TERMS_DATA_RETRIEVAL = f"""
+MATCH (package:CTPackage {{name:$package_name}})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_TERM]->
 (package_term:CTPackageTerm)-[:CONTAINS_ATTRIBUTES]->(term_attr_val:CTTermAttributesValue)<-[versions:HAS_VERSION]-
 (term_attr_root:CTTermAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(term_root:CTTermRoot)
 WITH term_root,
-    [(codelist_root)-[:HAS_TERM]->(term_root) | codelist_root.uid] AS codelists,
+    {PACKAGE_TERM_CODELISTS} AS codelists,
     term_attr_val,
     max(versions.start_date) AS latest_date
-WITH collect(apoc.map.fromValues([term_root.uid, {
+WITH collect(apoc.map.fromValues([term_root.uid, {{
     uid: term_root.uid,
     value_node:term_attr_val,
     codelists: codelists,
-    change_date: latest_date}])) AS items
+    change_date: latest_date}}])) AS items
 RETURN apoc.map.mergeList(items) AS items_map
 """
 
@@ -150,9 +188,112 @@ WITH old_items_map, new_items_map, added_items, removed_items, common_items, com
 """
 
 
-@db.transaction
+PACKAGE_DIFF_RETRIEVAL = """
+MATCH (diff:CTPackageDiff {key:$key})
+RETURN diff.data
+"""
+
+PACKAGE_DIFF_STORE = """
+MERGE (diff:CTPackageDiff {key:$key})
+ON CREATE SET
+    diff.old_package_name=$old_package_name,
+    diff.new_package_name=$new_package_name,
+    diff.codelist_uid=$codelist_uid,
+    diff.data=$data,
+    diff.created=datetime()
+"""
+
+
+# Neo4j temporal types stored in diffs, by the key of their JSON representation
+_TEMPORAL_TYPES = {
+    "$datetime": neo4j.time.DateTime,
+    "$date": neo4j.time.Date,
+    "$time": neo4j.time.Time,
+    "$duration": neo4j.time.Duration,
+}
+
+
+def _encode_diff_value(value: Any) -> Any:
+    """Converts a diff into values serializable as JSON, and read back by `_decode_diff_value`"""
+
+    for key, temporal_type in _TEMPORAL_TYPES.items():
+        # before lists, as durations are tuples
+        if isinstance(value, temporal_type):
+            return {key: value.iso_format()}
+    if isinstance(value, (dict, neo4j.graph.Node)):
+        return {key: _encode_diff_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_diff_value(item) for item in value]
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    # other values, e.g. spatial points, are stored as text
+    return str(value)
+
+
+def _decode_diff_value(value: dict) -> Any:
+    if len(value) == 1:
+        key, iso_value = next(iter(value.items()))
+        if key in _TEMPORAL_TYPES:
+            return _TEMPORAL_TYPES[key].from_iso_format(iso_value)
+    return value
+
+
+def _get_stored_diff(
+    old_package_name: str,
+    new_package_name: str,
+    compute: Callable[[], dict],
+    codelist_uid: str | None = None,
+) -> dict:
+    """
+    Returns the diff of two packages, or of one codelist between two packages, stored in a `CTPackageDiff` node.
+    The diff is computed by `compute` from the contents of the packages only, which do not change once loaded.
+    So it is computed on first request only, in a read transaction, and then stored as compressed JSON
+    under a key made of the package names and the codelist uid, in a separate write transaction.
+    """
+
+    key = f"{old_package_name}|{new_package_name}|{codelist_uid or ''}"
+    with db.read_transaction:
+        stored, _ = db.cypher_query(PACKAGE_DIFF_RETRIEVAL, {"key": key})
+        if stored and stored[0][0] is not None:
+            return json.loads(
+                zlib.decompress(stored[0][0]), object_hook=_decode_diff_value
+            )
+        data = json.dumps(_encode_diff_value(compute()))
+
+    try:
+        with db.write_transaction:
+            db.cypher_query(
+                PACKAGE_DIFF_STORE,
+                {
+                    "key": key,
+                    "old_package_name": old_package_name,
+                    "new_package_name": new_package_name,
+                    "codelist_uid": codelist_uid,
+                    "data": zlib.compress(data.encode()),
+                },
+            )
+    except neo4j.exceptions.Neo4jError as error:
+        # the diff is computed again on next request
+        log.warning("Storing the diff %s failed: %s", key, error)
+    # returned in the same representation as it is read from the store
+    return json.loads(data, object_hook=_decode_diff_value)
+
+
 def get_ct_packages_codelist_changes(
     old_package_name: str, new_package_name: str, codelist_uid: str
+) -> dict:
+    return _get_stored_diff(
+        old_package_name,
+        new_package_name,
+        lambda: _compute_ct_packages_codelist_changes(
+            old_package_name, new_package_name, codelist_uid
+        ),
+        codelist_uid=codelist_uid,
+    )
+
+
+def _compute_ct_packages_codelist_changes(
+    old_package_name: str, new_package_name: str, codelist_uid: str
 ) -> dict:
     query_params = {
         "old_package_name": old_package_name,
@@ -189,7 +330,7 @@ def get_ct_packages_codelist_changes(
         [
             TERM_DATA_RETRIEVAL_SPECIFIC_QUERY,
             COMPARISON_PART,
-            TERM_DIFF_CLAUSE,
+            CODELIST_TERM_DIFF_CLAUSE,
             TERM_NOT_MODIFIED_CLAUSE_SPECIFIC_QUERY,
             TERM_RETURN_CLAUSE_SPECIFIC_QUERY,
         ]
@@ -309,8 +450,15 @@ def codelist_diff(left_cl, right_cl):
     return result
 
 
-@db.transaction
 def get_ct_packages_changes(old_package_name: str, new_package_name: str) -> dict:
+    return _get_stored_diff(
+        old_package_name,
+        new_package_name,
+        lambda: _compute_ct_packages_changes(old_package_name, new_package_name),
+    )
+
+
+def _compute_ct_packages_changes(old_package_name: str, new_package_name: str) -> dict:
     output = {}
     # codelists query
     # Fetch the codelists and terms and do the comparison here.
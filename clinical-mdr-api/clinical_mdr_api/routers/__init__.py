@@ -40,41 +40,6 @@ from clinical_mdr_api.routers.concepts.numeric_values import (
 from clinical_mdr_api.routers.concepts.numeric_values_with_unit import (
     router as numeric_values_with_unit_router,
 )
-from clinical_mdr_api.routers.concepts.odms.odm_aliases import (
-    router as odm_aliases_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_conditions import (
-    router as odm_conditions_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_descriptions import (
-    router as odm_descriptions_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_formal_expressions import (
-    router as odm_formal_expressions_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_forms import router as odm_forms_router
-from clinical_mdr_api.routers.concepts.odms.odm_item_groups import (
-    router as odm_item_groups_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_items import router as odm_item_router
-from clinical_mdr_api.routers.concepts.odms.odm_metadata import (
-    router as odm_metadata_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_methods import (
-    router as odm_methods_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_study_events import (
-    router as odm_study_events_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_vendor_attributes import (
-    router as odm_vendor_attribute_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_vendor_elements import (
-    router as odm_vendor_element_router,
-)
-from clinical_mdr_api.routers.concepts.odms.odm_vendor_namespaces import (
-    router as odm_vendor_namespace_router,
-)
 from clinical_mdr_api.routers.concepts.pharmaceutical_products import (
     router as pharmaceutical_products_router,
 )
@@ -113,8 +78,6 @@ from clinical_mdr_api.routers.controlled_terminologies.ct_term_names import (
 from clinical_mdr_api.routers.controlled_terminologies.ct_terms import (
     router as ct_terms_router,
 )
-from clinical_mdr_api.routers.ctr_xml.ctr_xml import router as ctr_xml_router
-from clinical_mdr_api.routers.ddf.study_definitions import router as ddf_router
 from clinical_mdr_api.routers.dictionaries.dictionary_codelists import (
     router as dictionary_codelists_router,
 )
@@ -124,17 +87,6 @@ from clinical_mdr_api.routers.dictionaries.dictionary_terms import (
 from clinical_mdr_api.routers.feature_flags import router as feature_flags_router
 from clinical_mdr_api.routers.libraries.libraries import router as libraries_router
 from clinical_mdr_api.routers.libraries.time_points import router as time_points_router
-from clinical_mdr_api.routers.listings.listings import metadata_router
-from clinical_mdr_api.routers.listings.listings import router as listing_router
-from clinical_mdr_api.routers.listings.listings_adam import (
-    router as adam_listing_router,
-)
-from clinical_mdr_api.routers.listings.listings_sdtm import (
-    router as sdtm_listing_router,
-)
-from clinical_mdr_api.routers.listings.listings_study import (
-    router as study_listing_router,
-)
 from clinical_mdr_api.routers.notifications import router as notifications_router
 from clinical_mdr_api.routers.projects.projects import router as projects_router
 from clinical_mdr_api.routers.standard_data_models.data_model_igs import (
@@ -270,22 +222,9 @@ __all__ = [
     "active_substances_router",
     "pharmaceutical_products_router",
     "medicinal_products_router",
-    "odm_study_events_router",
-    "odm_forms_router",
-    "odm_item_groups_router",
-    "odm_item_router",
-    "odm_conditions_router",
-    "odm_methods_router",
-    "odm_formal_expressions_router",
-    "odm_descriptions_router",
-    "odm_aliases_router",
-    "odm_vendor_namespace_router",
-    "odm_vendor_element_router",
-    "odm_vendor_attribute_router",
     "activity_instances_router",
     "activity_instance_classes_router",
     "activity_item_classes_router",
-    "odm_metadata_router",
     "compounds_router",
     "compound_aliases_router",
     "activity_subgroups_router",
@@ -305,7 +244,6 @@ __all__ = [
     "ct_term_names_router",
     "ct_term_attributes_router",
     "ct_stats_router",
-    "ctr_xml_router",
     "dictionary_codelists_router",
     "dictionary_terms_router",
     "activity_instructions_router",
@@ -346,11 +284,6 @@ __all__ = [
     "study_duration_weeks_router",
     "study_days_router",
     "study_weeks_router",
-    "metadata_router",
-    "listing_router",
-    "sdtm_listing_router",
-    "adam_listing_router",
-    "study_listing_router",
     "unit_definition_router",
     "configuration_router",
     "study_design_figure",
@@ -368,5 +301,4 @@ __all__ = [
     "dataset_classes_router",
     "class_variables_router",
     "dataset_variables_router",
-    "ddf_router",
 ]
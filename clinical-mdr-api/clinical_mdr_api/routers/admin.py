@@ -2,6 +2,10 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Query
 
+from clinical_mdr_api.domain_repositories.feature_flag_repository import feature_flags
+from clinical_mdr_api.domain_repositories.notification_repository import (
+    published_notifications,
+)
 from clinical_mdr_api.domain_repositories.user_repository import UserRepository
 from clinical_mdr_api.models.user import UserInfo, UserInfoPatchInput
 from clinical_mdr_api.routers import _generic_descriptions
@@ -16,6 +20,7 @@ CACHE_STORE_NAMES = [
     "cache_store_item_by_uid",
     "cache_store_item_by_study_uid",
     "cache_store_item_by_project_number",
+    "cache_store_ct_terms_by_codelists",
 ]
 
 
@@ -37,7 +42,7 @@ def get_caches(show_items: Annotated[bool | None, Query()] = False) -> list[dict
 @router.delete(
     "/caches",
     dependencies=[rbac.ADMIN_WRITE],
-    summary="Clears all cache stores",
+    summary="Clears all cache stores and snapshots",
     status_code=200,
     responses={
         403: _generic_descriptions.ERROR_403,
@@ -51,6 +56,8 @@ def clear_caches() -> list[dict]:
             cache_store = getattr(repo, store_name, None)
             if cache_store is not None:
                 cache_store.clear()
+    for snapshot in (feature_flags, published_notifications):
+        snapshot.invalidate()
 
     return get_caches()
 
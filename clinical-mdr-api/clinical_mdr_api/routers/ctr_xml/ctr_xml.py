@@ -2,18 +2,20 @@
 
 from typing import Annotated
 
-from fastapi import Path
-from fastapi.responses import Response
+from fastapi import APIRouter, Path
+from fastapi.responses import StreamingResponse
 
 from clinical_mdr_api.routers import _generic_descriptions
-from clinical_mdr_api.routers.studies.study import router
 from clinical_mdr_api.services.ctr_xml.ctr_xml_service import CTRXMLService
 from common.auth import rbac
 
+# Included lazily, on the first request to a CTR document (see `app.state.lazy_router_groups`)
+router = APIRouter()
+
 StudyUID = Path(description="The unique id of the study.")
 
 
-class XMLResponse(Response):
+class XMLResponse(StreamingResponse):
     media_type = "text/xml"
 
 
@@ -31,4 +33,4 @@ class XMLResponse(Response):
 def get_odm_xml(
     study_uid: Annotated[str, StudyUID],
 ) -> XMLResponse:
-    return XMLResponse(content=CTRXMLService().get_ctr_odm(study_uid))
+    return XMLResponse(content=CTRXMLService().get_ctr_odm_stream(study_uid))
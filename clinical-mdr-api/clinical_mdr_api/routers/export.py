@@ -2,24 +2,34 @@ import collections
 import csv
 import functools
 import io
+import itertools
+import tempfile
 from copy import copy
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 import yaml
 from dict2xml import dict2xml
 from fastapi.responses import StreamingResponse
 from openpyxl import Workbook
+from pydantic import BaseModel as PydanticBaseModel
 
 from clinical_mdr_api.models import utils
 from clinical_mdr_api.models.utils import BaseModel
+from common import config
 
 REGISTERED_EXPORT_FORMATS = {}
 
+# Number of items fetched per call of a list endpoint when all items are exported
+EXPORT_PAGE_SIZE = config.MAX_PAGE_SIZE
+# Size of the chunks written to the response
+EXPORT_CHUNK_SIZE = 64 * 1024
+
 
 def register_export_format(name: str):
     """Decorator used to register an export function.
 
-    Give a valid MIME type for name.
+    Give a valid MIME type for name. The export function yields the
+    exported content in chunks.
     """
 
     def decorator(func):
@@ -50,12 +60,73 @@ def _convert_headers_to_dict(headers: list[Any]) -> dict:
     return dict_headers
 
 
-def _extract_values_from_data(data: dict, headers: dict):
+def _get(item: Any, key: str, default: Any = "") -> Any:
+    """Returns the value of `key` in a dictionary or the value of field `key` of a model."""
+    if isinstance(item, dict):
+        return item.get(key, default)
+    if isinstance(item, PydanticBaseModel) and (
+        key in type(item).model_fields or key in type(item).model_computed_fields
+    ):
+        return getattr(item, key)
+    return default
+
+
+def _is_mapping(item: Any) -> bool:
+    return isinstance(item, dict | PydanticBaseModel)
+
+
+def _compile_path(target: str) -> Callable[[Any], Any]:
+    """
+    Compiles a header target into a function returning its value for an item.
+
+    A plain target returns the value of the item field, booleans being exported as Yes/No.
+    A dotted target navigates nested items, joining the values found in collections.
+    """
+
+    if "." not in target:
+
+        def get_value(item: Any) -> Any:
+            value = _get(item, target)
+            if isinstance(value, bool):
+                return "Yes" if value else "No"
+            return value
+
+        return get_value
+
+    parts = target.split(".")
+
+    def get_path_value(item: Any) -> Any:
+        value = item
+        for index, path in enumerate(parts):
+            if isinstance(value, list):
+                items = []
+                for elm in value:
+                    subvalue = _get(elm, path)
+                    if isinstance(subvalue, float | int | str):
+                        # collection[].key
+                        items.append(str(subvalue))
+                    elif _is_mapping(subvalue):
+                        # collection[].key1.key2
+                        items.append(_get(subvalue, parts[index + 1]))
+                value = ", ".join(items)
+            elif _is_mapping(value):
+                value = _get(value, path)
+            if not value:
+                break
+        return value
+
+    return get_path_value
+
+
+def _extract_values_from_data(data: Iterable[Any], headers: dict) -> Iterator[dict]:
     """
     Extracts required values from data and yields them.
 
+    The header paths are compiled once, the items are read as they are
+    without being converted to dictionaries.
+
     Args:
-        data (dict): The data to extract values from.
+        data (Iterable[Any]): The items (models or dictionaries) to extract values from.
         headers (dict): The headers containing the keys to extract.
 
     Yields:
@@ -65,41 +136,18 @@ def _extract_values_from_data(data: dict, headers: dict):
         data = data.items
     if isinstance(data, BaseModel):
         data = [data]
+    getters = [(header, _compile_path(target)) for header, target in headers.items()]
     for item in data:
         result = {}
-        if not isinstance(item, dict):
-            item = item.dict()
-        for header, target in headers.items():
-            if "." in target:
-                value = item
-                parts = target.split(".")
-                for index, path in enumerate(parts):
-                    if isinstance(value, list):
-                        items = []
-                        for elm in value:
-                            subvalue = elm.get(path, "")
-                            if isinstance(subvalue, float | int | str):
-                                # collection[].key
-                                items.append(str(subvalue))
-                            elif isinstance(subvalue, dict):
-                                # collection[].key1.key2
-                                items.append(subvalue[parts[index + 1]])
-                        value = ", ".join(items)
-                    elif isinstance(value, dict):
-                        value = value.get(path, "")
-                    if not value:
-                        break
-            else:
-                value = item.get(target, "")
-                if isinstance(value, bool):
-                    value = "Yes" if value else "No"
+        for header, get_value in getters:
+            value = get_value(item)
             if value == []:
                 value = ""
             result[header] = value
         yield result
 
 
-def _convert_data_to_rows(data: dict, headers: list[Any]):
+def _convert_data_to_rows(data: Iterable[Any], headers: list[Any]) -> Iterator[list]:
     """Generate rows based on given data."""
     # First, convert received headers to a more usable representation
     dict_headers = _convert_headers_to_dict(headers)
@@ -118,18 +166,8 @@ def _convert_data_to_rows(data: dict, headers: list[Any]):
         yield rs
 
 
-def _convert_data_to_list(data: dict, headers: list[Any]) -> list[Any]:
-    """Generate a list of dictionaries based on given data."""
-    # First, convert received headers to a more usable representation
-    dict_headers = _convert_headers_to_dict(headers)
-    result = []
-    for value in _extract_values_from_data(data, dict_headers):
-        result.append(value)
-    return result
-
-
 @register_export_format("text/csv")
-def _export_to_csv(data: dict, headers: list[Any]):
+def _export_to_csv(data: Iterable[Any], headers: list[Any]) -> Iterator[str]:
     """Export given data to CSV.
 
     The generated CSV content will only contain items listed in
@@ -139,53 +177,70 @@ def _export_to_csv(data: dict, headers: list[Any]):
     writer = csv.writer(stream, delimiter=",", quoting=csv.QUOTE_ALL)
     for row in _convert_data_to_rows(data, headers):
         writer.writerow(row)
-    return stream.getvalue()
+        if stream.tell() >= EXPORT_CHUNK_SIZE:
+            yield stream.getvalue()
+            stream.seek(0)
+            stream.truncate()
+    yield stream.getvalue()
 
 
 @register_export_format(
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 )
-def _export_to_xslx(data: dict, headers: list[Any]):
+def _export_to_xslx(data: Iterable[Any], headers: list[Any]) -> Iterator[bytes]:
     """Export given data to XLSX.
 
     The generated content will only contain items listed in headers.
+    The rows are written by a write-only workbook to a temporary file,
+    which is streamed once the workbook is complete.
     """
-    stream = io.BytesIO()
-    workbook = Workbook()
-    # grab the active worksheet
-    worksheet = workbook.active
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
     for row in _convert_data_to_rows(data, headers):
         worksheet.append(row)
-    workbook.save(stream)
-    return stream.getvalue()
+    with tempfile.SpooledTemporaryFile(max_size=EXPORT_CHUNK_SIZE) as stream:
+        workbook.save(stream)
+        stream.seek(0)
+        while chunk := stream.read(EXPORT_CHUNK_SIZE):
+            yield chunk
 
 
 @register_export_format("text/xml")
-def _export_to_xml(data: dict, headers: list[Any]):
+def _export_to_xml(data: Iterable[Any], headers: list[Any]) -> Iterator[str]:
     """Export given data to XML.
 
     The generated content will only contain items listed in headers.
     """
-    export_dict = {"item": _convert_data_to_list(data, headers)}
+    values = _extract_values_from_data(data, _convert_headers_to_dict(headers))
     # If data is a single BaseModel instance we don't won't to wrap the export into <items> tags
     if isinstance(data, BaseModel):
-        return dict2xml(export_dict, indent="  ")
-    return dict2xml(export_dict, wrap="items", indent="  ")
+        yield dict2xml({"item": list(values)}, indent="  ")
+        return
+    first = next(values, None)
+    if first is None:
+        yield dict2xml({"item": []}, wrap="items", indent="  ")
+        return
+    yield "<items>"
+    for value in itertools.chain([first], values):
+        item = dict2xml({"item": value}, indent="  ")
+        yield "\n" + "\n".join(f"  {line}" for line in item.split("\n"))
+    yield "\n</items>"
 
 
 @register_export_format("application/x-yaml")
 # pylint: disable=unused-argument
-def _export_to_yaml(data: BaseModel, headers: list[Any]):
+def _export_to_yaml(data: BaseModel, headers: list[Any]) -> Iterator[str]:
     """Export given data to YAML."""
-    return yaml.dump(data.model_dump())
+    yield yaml.dump(data.model_dump())
 
 
-def export(export_format: str, data: dict, export_definition: dict, *args, **kwargs):
+def export(export_format: str, data: Any, export_definition: dict, *args, **kwargs):
     """Generic export function.
 
     Use this function when you want to export data to given data. It
     will return a StreamingResponse instance or the given data if
-    format is not supported.
+    format is not supported. The data can be a model, a page of items
+    or an iterator of items, which is consumed while the response is streamed.
     """
     if export_format in export_definition:
         headers = export_definition[export_format]
@@ -196,24 +251,70 @@ def export(export_format: str, data: dict, export_definition: dict, *args, **kwa
             data = data.items
         extra_headers = export_definition.get("include_if_exists")
         headers = copy(headers)
-        if extra_headers and data:
-            headers += [
-                extra_header
-                for extra_header in extra_headers
-                if extra_header in data[0]
-            ]
+        if extra_headers and not isinstance(data, BaseModel):
+            data = iter(data)
+            first = next(data, None)
+            if first is not None:
+                data = itertools.chain([first], data)
+                headers += [
+                    extra_header
+                    for extra_header in extra_headers
+                    if extra_header in first
+                ]
 
         result = REGISTERED_EXPORT_FORMATS[export_format](
             data, headers, *args, **kwargs
         )
-        response = StreamingResponse(iter([result]), media_type=export_format)
+        response = StreamingResponse(result, media_type=export_format)
         response.headers["Content-Disposition"] = "attachment; filename=export"
         return response
     return data
 
 
+def _page_items(page: Any) -> list[Any]:
+    if isinstance(page, utils.CustomPage | utils.GenericFilteringReturn):
+        return page.items
+    return page
+
+
+def _fetch_all_pages(func: Callable, args: tuple, kwargs: dict) -> Iterator[Any]:
+    """
+    Yields all the items of a list endpoint by calling it for consecutive pages of `EXPORT_PAGE_SIZE` items.
+
+    The first page is fetched immediately so that errors are raised before the response is started,
+    the next pages are fetched while the response is streamed.
+    """
+
+    kwargs = {**kwargs, "page_size": EXPORT_PAGE_SIZE, "page_number": 1}
+    if "total_count" in kwargs:
+        kwargs["total_count"] = False
+    items = _page_items(func(*args, **kwargs))
+
+    def iterate(items: list[Any]) -> Iterator[Any]:
+        page_number = 1
+        while True:
+            yield from items
+            if len(items) != EXPORT_PAGE_SIZE:
+                return
+            page_number += 1
+            next_items = _page_items(
+                func(*args, **{**kwargs, "page_number": page_number})
+            )
+            if next_items and next_items[0] == items[0]:
+                # the endpoint does not page its results
+                return
+            items = next_items
+
+    return iterate(items)
+
+
 def allow_exports(export_definition: dict):
-    """Decorator used to add export functionality to list type endpoint."""
+    """Decorator used to add export functionality to list type endpoint.
+
+    When all items of a paginated endpoint are exported (`page_size` of 0),
+    the endpoint is called page by page and the items are written to the
+    response as they are fetched.
+    """
 
     def decorator(func):
         @functools.wraps(func)
@@ -222,12 +323,18 @@ def allow_exports(export_definition: dict):
             accept = None
             if request:
                 accept = request.headers.get("accept", "application/json")
-            result = func(*args, **kwargs)
-            formats = export_definition.get("formats", [])
-            formats.extend(export_definition.keys())
-            if accept and accept in formats:
-                result = export(accept, result, export_definition)
-            return result
+            formats = [*export_definition.get("formats", []), *export_definition]
+            if not (accept and accept in formats):
+                return func(*args, **kwargs)
+            if (
+                accept in REGISTERED_EXPORT_FORMATS
+                and kwargs.get("page_size") == 0
+                and "page_number" in kwargs
+            ):
+                result = _fetch_all_pages(func, args, kwargs)
+            else:
+                result = func(*args, **kwargs)
+            return export(accept, result, export_definition)
 
         return wrapper
 
@@ -1,10 +1,12 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Body, Path, Query
+from fastapi.responses import StreamingResponse
 from pydantic.types import Json
 from starlette.requests import Request
 
 from clinical_mdr_api.models.listings.listings_sdtm import (
+    SDTMTrialDesignStudyInput,
     StudyArmListing,
     StudyCriterionListing,
     StudyDiseaseMilestoneListing,
@@ -18,6 +20,7 @@ from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.services.listings.listings_sdtm import (
     SDTMListingsService as ListingsService,
 )
+from clinical_mdr_api.services.studies.study import StudyService
 from common import config
 from common.auth import rbac
 
@@ -569,3 +572,46 @@ def get_tdm(
         page=page_number,
         size=page_size,
     )
+
+
+@router.post(
+    "/studies/sdtm/trial-design",
+    dependencies=[rbac.STUDY_READ],
+    summary="SDTM trial design domains of multiple studies as a ZIP archive",
+    description="""
+Builds the TA, TE, TV, TI, TS and TDM datasets of each of the given studies and returns them as a ZIP archive,
+with one CSV file per study and domain: `{study_uid}/{domain}.csv`, or `{study_uid}_{study_value_version}/{domain}.csv`
+when a study version is given.
+
+The studies are built concurrently and the archive is streamed as they complete.
+""",
+    response_class=StreamingResponse,
+    status_code=200,
+    responses={
+        200: {"content": {"application/zip": {}}},
+        403: _generic_descriptions.ERROR_403,
+        404: _generic_descriptions.ERROR_404,
+    },
+)
+def get_trial_design_archive(
+    studies: Annotated[
+        list[SDTMTrialDesignStudyInput],
+        Body(description="The studies, and optionally their versions, to export"),
+    ],
+) -> StreamingResponse:
+    study_service = StudyService()
+    for study in studies:
+        study_service.check_if_study_uid_and_version_exists(
+            study_uid=study.study_uid, study_value_version=study.study_value_version
+        )
+
+    response = StreamingResponse(
+        ListingsService().get_trial_design_archive(
+            [(study.study_uid, study.study_value_version) for study in studies]
+        ),
+        media_type="application/zip",
+    )
+    response.headers["Content-Disposition"] = (
+        "attachment; filename=sdtm-trial-design.zip"
+    )
+    return response
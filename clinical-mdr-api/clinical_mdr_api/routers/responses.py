@@ -3,7 +3,9 @@
 from typing import Any
 
 import yaml
-from fastapi import Response
+from fastapi import Request, Response
+
+from clinical_mdr_api.domain_repositories.snapshot import SnapshotDocument
 
 
 class YAMLResponse(Response):
@@ -11,3 +13,20 @@ class YAMLResponse(Response):
 
     def render(self, content: Any) -> bytes:
         return yaml.dump(content, encoding="utf-8")
+
+
+def snapshot_response(request: Request, document: SnapshotDocument) -> Response:
+    """
+    Returns the JSON document with its ETag, or `304 Not Modified` if the client sent the ETag in `If-None-Match`.
+    Clients revalidate the document on every use (`Cache-Control: no-cache`).
+    """
+
+    headers = {"ETag": document.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or document.etag
+        in {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(document.body, media_type="application/json", headers=headers)
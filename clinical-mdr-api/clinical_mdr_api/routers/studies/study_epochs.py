@@ -530,6 +530,40 @@ def patch_update_epoch(
     )
 
 
+@router.post(
+    "/studies/{study_uid}/study-epochs/batch",
+    dependencies=[rbac.STUDY_WRITE],
+    summary="Batch operations (create, edit, delete) for study epochs",
+    description="""
+State before:
+ - Study must exist and study status must be in draft.
+
+Business logic:
+ - The operations are applied in the given order in a single transaction, each one as the corresponding POST, PATCH or DELETE request on /study-epochs.
+ - An operation that fails is reported in its response and doesn't stop the following operations.
+
+State after:
+ - Study epochs are created, edited and deleted.
+ - Added new entries in the audit trail for the changed study epochs.
+    """,
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+        404: _generic_descriptions.ERROR_404,
+    },
+)
+@decorators.validate_if_study_is_not_locked("study_uid")
+def study_epoch_batch_operations(
+    study_uid: Annotated[str, studyUID],
+    operations: Annotated[
+        list[study_epoch.StudyEpochBatchInput],
+        Body(description="List of operation to perform"),
+    ],
+) -> list[study_epoch.StudyEpochBatchOutput]:
+    service = StudyEpochService(study_uid=study_uid)
+    return service.handle_batch_operations(study_uid, operations)
+
+
 @router.get(
     "/epochs/allowed-configs",
     dependencies=[rbac.STUDY_READ],
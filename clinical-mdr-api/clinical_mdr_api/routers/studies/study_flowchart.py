@@ -5,7 +5,7 @@ import os
 from typing import Annotated
 
 from fastapi import Path, Query
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from starlette.requests import Request
 
 from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
@@ -72,7 +72,7 @@ def get_study_flowchart_coordinates(
         403: _generic_descriptions.ERROR_403,
         404: _generic_descriptions.ERROR_404,
     },
-    response_model_exclude_none=True,
+    response_model=TableWithFootnotes,
 )
 def get_study_flowchart(
     study_uid: Annotated[str, STUDY_UID_PATH],
@@ -85,7 +85,7 @@ def get_study_flowchart(
         bool | None,
         Query(description="Force building of SoA without using any saved snapshot"),
     ] = False,
-) -> TableWithFootnotes:
+) -> JSONResponse:
     table = StudyFlowchartService().get_flowchart_table(
         study_uid=study_uid,
         time_unit=time_unit,
@@ -94,7 +94,8 @@ def get_study_flowchart(
         force_build=force_build,
     )
 
-    return table
+    # the table is serialized as is, without building and validating a TableWithFootnotes model
+    return JSONResponse(table.to_dict())
 
 
 @router.get(
@@ -155,15 +156,11 @@ def get_study_flowchart_docx(
     time_unit: Annotated[str | None, TIME_UNIT_QUERY] = None,
     layout: Annotated[SoALayout, LAYOUT_QUERY] = SoALayout.PROTOCOL,
 ) -> StreamingResponse:
-    stream = (
-        StudyFlowchartService()
-        .get_study_flowchart_docx(
-            study_uid=study_uid,
-            study_value_version=study_value_version,
-            layout=layout,
-            time_unit=time_unit,
-        )
-        .get_document_stream()
+    stream = StudyFlowchartService().get_study_flowchart_docx(
+        study_uid=study_uid,
+        study_value_version=study_value_version,
+        layout=layout,
+        time_unit=time_unit,
     )
 
     study_id = _get_study_id(study_uid, study_value_version)
@@ -32,7 +32,7 @@ def get_study_interventions(
     study_uid: Annotated[str, StudyUID],
 ) -> TableWithFootnotes:
     StudyService().check_if_study_exists(study_uid)
-    return StudyInterventionsService().get_table(study_uid)
+    return StudyInterventionsService().get_table(study_uid).to_model()
 
 
 @router.get(
@@ -8,6 +8,8 @@ from clinical_mdr_api.models.study_selections.study_visit import (
     AllowedTimeReferences,
     SimpleStudyVisit,
     StudyVisit,
+    StudyVisitBatchInput,
+    StudyVisitBatchOutput,
     StudyVisitCreateInput,
     StudyVisitEditInput,
     StudyVisitVersion,
@@ -447,6 +449,41 @@ def delete_study_visit(
     service.delete(study_uid=study_uid, study_visit_uid=study_visit_uid)
 
 
+@router.post(
+    "/studies/{study_uid}/study-visits/batch",
+    dependencies=[rbac.STUDY_WRITE],
+    summary="Batch operations (create, edit, delete) for study visits",
+    description="""
+State before:
+ - Study must exist and study status must be in draft.
+
+Business logic:
+ - The operations are applied in the given order to the study visits loaded once, each one is validated as the corresponding POST, PATCH or DELETE request on /study-visits.
+ - An operation that fails validation is reported in its response and doesn't affect the following operations.
+ - The visit numbers and timings are derived once all operations are applied, the changed visits are saved in a single transaction.
+
+State after:
+ - Study visits are created, edited and deleted.
+ - Added new entries in the audit trail for the changed study visits.
+    """,
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+        404: _generic_descriptions.ERROR_404,
+    },
+)
+@decorators.validate_if_study_is_not_locked("study_uid")
+def study_visit_batch_operations(
+    study_uid: Annotated[str, studyUID],
+    operations: Annotated[
+        list[StudyVisitBatchInput],
+        Body(description="List of operation to perform"),
+    ],
+) -> list[StudyVisitBatchOutput]:
+    service = StudyVisitService(study_uid=study_uid)
+    return service.handle_batch_operations(study_uid, operations)
+
+
 @router.get(
     "/studies/{study_uid}/study-visits/{study_visit_uid}/audit-trail",
     dependencies=[rbac.STUDY_READ],
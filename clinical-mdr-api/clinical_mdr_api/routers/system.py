@@ -2,13 +2,14 @@
 
 import os
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import FileResponse, PlainTextResponse
 
 from clinical_mdr_api.models.feature_flag import FeatureFlag
 from clinical_mdr_api.models.notification import Notification
 from clinical_mdr_api.models.system import SystemInformation
 from clinical_mdr_api.routers import _generic_descriptions
+from clinical_mdr_api.routers.responses import snapshot_response
 from clinical_mdr_api.services import system as service
 from clinical_mdr_api.services.feature_flags import FeatureFlagService
 from clinical_mdr_api.services.notifications import NotificationService
@@ -74,22 +75,32 @@ def get_license_md() -> FileResponse:
 @router.get(
     "/feature-flags",
     summary="Returns all feature flags.",
+    description="Served from memory with an ETag, `If-None-Match` requests are answered with `304 Not Modified` when unchanged.",
     status_code=200,
+    response_model=list[FeatureFlag],
     responses={
+        304: {"description": "Not Modified"},
         404: _generic_descriptions.ERROR_404,
     },
 )
-def get_all_feature_flags() -> list[FeatureFlag]:
-    return FeatureFlagService().get_all_feature_flags()
+def get_all_feature_flags(request: Request) -> Response:
+    return snapshot_response(
+        request, FeatureFlagService().get_all_feature_flags_document()
+    )
 
 
 @router.get(
     "/notifications",
     summary="Returns all notifications that are both published and in the specified time.",
+    description="Served from memory with an ETag, `If-None-Match` requests are answered with `304 Not Modified` when unchanged.",
     status_code=200,
+    response_model=list[Notification],
     responses={
+        304: {"description": "Not Modified"},
         404: _generic_descriptions.ERROR_404,
     },
 )
-def get_all_active_notifications() -> list[Notification]:
-    return NotificationService().get_all_active_notifications()
+def get_all_active_notifications(request: Request) -> Response:
+    return snapshot_response(
+        request, NotificationService().get_all_active_notifications_document()
+    )
@@ -1,9 +1,15 @@
+import copy
+import io
+import tempfile
 from datetime import datetime, timezone
 from functools import cached_property
+from threading import Lock
 from types import MappingProxyType
+from typing import Iterator
 
 # pylint: disable=wrong-import-order # disagreement between isort and pylint
 import ctrxml
+from cachetools import LRUCache
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.models.datatype import XmlDateTime
@@ -37,8 +43,18 @@ from clinical_mdr_api.services.controlled_terminologies.ct_codelist_attributes i
 from clinical_mdr_api.services.projects.project import ProjectService
 from clinical_mdr_api.services.studies.study import StudyService
 from clinical_mdr_api.services.studies.study_visit import StudyVisitService
+from common import config
+from common.db_thread_pool import DatabaseThreadPool
 from common.exceptions import BusinessLogicException
 
+# Size of the chunks of a streamed ODM document
+ODM_CHUNK_SIZE = 64 * 1024
+
+# Threads loading the sections of the ODM documents concurrently
+_prefetch_pool = DatabaseThreadPool(
+    "ctr-xml-prefetch", max_workers=config.CTR_XML_PREFETCH_WORKERS
+)
+
 
 def iso639_shortest(code: str) -> str:
     """Convert a language code to the shortest ISO 639 code, suitable value for xml:lang attribute"""
@@ -59,19 +75,90 @@ class CTRXMLService:
         }
     )
 
-    def get_ctr_odm(self, study_uid: str):
+    # Study sections of locked study versions, which do not change, by (study_uid, version).
+    # Each request works on its own copy of the sections.
+    cache_store_locked_sections = LRUCache(maxsize=config.CACHE_MAX_SIZE)
+    lock_store_locked_sections = Lock()
+
+    def get_odm(self, study_uid: str) -> ctrxml.Odm:
         odm_builder = ODMBuilder(study_uid)
-        odm = odm_builder.get_odm()
+
+        locked_version = StudyService().get_current_locked_version(study_uid)
+        key = (study_uid, locked_version)
+        sections = None
+        if locked_version:
+            with self.lock_store_locked_sections:
+                sections = self.cache_store_locked_sections.get(key)
+            if sections:
+                odm_builder.__dict__.update(copy.deepcopy(sections))
+
+        odm_builder.prefetch()
+
+        if locked_version and not sections:
+            with self.lock_store_locked_sections:
+                self.cache_store_locked_sections[key] = copy.deepcopy(
+                    {
+                        name: odm_builder.__dict__[name]
+                        for name in ODMBuilder.STUDY_SECTIONS
+                    }
+                )
+
+        return odm_builder.get_odm()
+
+    def get_ctr_odm(self, study_uid: str) -> str:
         # noinspection PyTypeChecker
-        return self.serializer.render(odm, ns_map=self.namespaces)
+        return self.serializer.render(self.get_odm(study_uid), ns_map=self.namespaces)
+
+    def get_ctr_odm_stream(self, study_uid: str) -> Iterator[bytes]:
+        """
+        Builds the ODM of the study, and returns an iterator of the chunks of its XML document.
+
+        The document is serialized into a spooled temporary file, which is kept in memory
+        up to `CTR_XML_SPOOL_MAX_SIZE` bytes and written to disk beyond.
+        """
+
+        odm = self.get_odm(study_uid)
+
+        def stream() -> Iterator[bytes]:
+            with tempfile.SpooledTemporaryFile(
+                max_size=config.CTR_XML_SPOOL_MAX_SIZE
+            ) as spool:
+                text = io.TextIOWrapper(spool, encoding="utf-8")
+                # noinspection PyTypeChecker
+                self.serializer.write(text, odm, ns_map=self.namespaces)
+                text.flush()
+                text.detach()
+                spool.seek(0)
+                while chunk := spool.read(ODM_CHUNK_SIZE):
+                    yield chunk
+
+        return stream()
 
 
 class ODMBuilder:
     study_uid: str
 
+    # Sections read from the study version, unlike the ODM forms read from the library
+    STUDY_SECTIONS = ("study_metadata", "study_visits")
+
     def __init__(self, study_uid: str):
         self.study_uid = study_uid
 
+    def prefetch(self):
+        """
+        Loads the sections that do not depend on each other concurrently:
+        the study metadata, the study visits and the ODM forms with their item groups, items and codelists.
+        """
+
+        sections = [
+            name
+            for name in (*self.STUDY_SECTIONS, "ct_codelist_attributes")
+            if name not in self.__dict__
+        ]
+        futures = [_prefetch_pool.submit(getattr, self, name) for name in sections]
+        for future in futures:
+            future.result()
+
     @cached_property
     def project(self) -> Project:
         project = ProjectService().get_by_study_uid(self.study_uid)
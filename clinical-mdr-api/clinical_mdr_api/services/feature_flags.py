@@ -1,9 +1,12 @@
 # pylint: disable=invalid-name
 from neomodel import db
+from pydantic import TypeAdapter
 
 from clinical_mdr_api.domain_repositories.feature_flag_repository import (
     FeatureFlagRepository,
+    feature_flags,
 )
+from clinical_mdr_api.domain_repositories.snapshot import SnapshotDocument
 from clinical_mdr_api.models.feature_flag import (
     FeatureFlag,
     FeatureFlagInput,
@@ -11,6 +14,8 @@ from clinical_mdr_api.models.feature_flag import (
 )
 from common.exceptions import AlreadyExistsException
 
+_FEATURE_FLAGS_ADAPTER = TypeAdapter(list[FeatureFlag])
+
 
 class FeatureFlagService:
     repo: FeatureFlagRepository
@@ -19,11 +24,18 @@ class FeatureFlagService:
         self.repo = FeatureFlagRepository()
 
     def get_all_feature_flags(self) -> list[FeatureFlag]:
-        return self.repo.retrieve_all_feature_flags()
+        return list(feature_flags.get())
+
+    def get_all_feature_flags_document(self) -> SnapshotDocument:
+        version, flags = feature_flags.current()
+        return feature_flags.document(
+            version, None, lambda: _FEATURE_FLAGS_ADAPTER.dump_json(flags)
+        )
 
     def get_feature_flag(self, sn: int) -> FeatureFlag:
         return self.repo.retrieve_feature_flag(sn)
 
+    @feature_flags.invalidates
     @db.transaction
     def create_feature_flag(
         self,
@@ -42,6 +54,7 @@ class FeatureFlagService:
             description=feature_flag_input.description,
         )
 
+    @feature_flags.invalidates
     @db.transaction
     def update_feature_flag(
         self,
@@ -52,6 +65,7 @@ class FeatureFlagService:
             sn=sn, enabled=feature_flag_patch_input.enabled
         )
 
+    @feature_flags.invalidates
     @db.transaction
     def delete_feature_flag(self, sn: int) -> None:
         return self.repo.delete_feature_flag(sn)
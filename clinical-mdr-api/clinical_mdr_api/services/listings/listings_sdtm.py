@@ -1,3 +1,10 @@
+import csv
+import io
+import zipfile
+from threading import Lock
+from typing import Iterator
+
+from cachetools import LRUCache
 from neomodel import db
 
 from clinical_mdr_api.listings.query_service import QueryService
@@ -9,15 +16,148 @@ from clinical_mdr_api.models.listings.listings_sdtm import (
     StudySummaryListing,
     StudyVisitListing,
 )
-from clinical_mdr_api.models.utils import GenericFilteringReturn
+from clinical_mdr_api.models.utils import BaseModel, GenericFilteringReturn
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.services._utils import service_level_generic_filtering
+from common import config
+from common.db_thread_pool import DatabaseThreadPool
+
+# Trial design domains, in the order they are written to archives
+SDTM_TRIAL_DESIGN_DOMAINS: dict[str, type[BaseModel]] = {
+    "ta": StudyArmListing,
+    "te": StudyElementListing,
+    "tv": StudyVisitListing,
+    "ti": StudyCriterionListing,
+    "ts": StudySummaryListing,
+    "tdm": StudyDiseaseMilestoneListing,
+}
+
+# Threads building the trial design datasets of the studies of archives
+_archive_pool = DatabaseThreadPool(
+    "sdtm-archive", max_workers=config.SDTM_LISTINGS_BATCH_WORKERS
+)
+
+
+class _ArchiveStream(io.RawIOBase):
+    """Write-only stream collecting the bytes written by a `ZipFile` until they are drained"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
 
 
 class SDTMListingsService:
+    # Datasets of released study versions, which do not change, by (domain, study_uid, study_value_version)
+    cache_store_dataset = LRUCache(maxsize=config.CACHE_MAX_SIZE)
+    lock_store_dataset = Lock()
+
     def __init__(self):
         self._query_service = QueryService()
 
+    def _get_dataset(
+        self, domain: str, study_uid: str, study_value_version: str | None = None
+    ) -> list[BaseModel]:
+        model = SDTM_TRIAL_DESIGN_DOMAINS[domain]
+        query = getattr(self._query_service, f"get_{domain}")
+        if not study_value_version:
+            return list(
+                map(
+                    model.from_query,
+                    query(study_uid=study_uid, study_value_version=None),
+                )
+            )
+
+        key = (domain, study_uid, study_value_version)
+        with self.lock_store_dataset:
+            dataset = self.cache_store_dataset.get(key)
+        if dataset is None:
+            dataset = tuple(
+                map(
+                    model.from_query,
+                    query(study_uid=study_uid, study_value_version=study_value_version),
+                )
+            )
+            # an empty dataset may be a version that is not released yet
+            if dataset:
+                with self.lock_store_dataset:
+                    self.cache_store_dataset[key] = dataset
+        # the filtering sorts the list in place
+        return list(dataset)
+
+    @db.transaction
+    def get_trial_design_datasets(
+        self, study_uid: str, study_value_version: str | None = None
+    ) -> dict[str, list[BaseModel]]:
+        """Returns the datasets of all trial design domains of a study"""
+
+        return {
+            domain: self._get_dataset(
+                domain, study_uid=study_uid, study_value_version=study_value_version
+            )
+            for domain in SDTM_TRIAL_DESIGN_DOMAINS
+        }
+
+    @staticmethod
+    def _dataset_to_csv(dataset: list[BaseModel], model: type[BaseModel]) -> str:
+        stream = io.StringIO()
+        writer = csv.writer(stream, delimiter=",", quoting=csv.QUOTE_ALL)
+        writer.writerow(model.model_fields)
+        for item in dataset:
+            writer.writerow(getattr(item, field) for field in model.model_fields)
+        return stream.getvalue()
+
+    def get_trial_design_archive(
+        self, studies: list[tuple[str, str | None]]
+    ) -> Iterator[bytes]:
+        """
+        Builds the trial design datasets of the given (study_uid, study_value_version) pairs concurrently,
+        and yields a ZIP archive with one CSV file per study and domain, `{study_uid}/{domain}.csv`
+        (`{study_uid}_{study_value_version}/{domain}.csv` for study versions), written in the order of `studies`.
+        """
+
+        stream = _ArchiveStream()
+        futures = [
+            _archive_pool.submit(
+                SDTMListingsService().get_trial_design_datasets,
+                study_uid,
+                study_value_version,
+            )
+            for study_uid, study_value_version in studies
+        ]
+        try:
+            with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+                for (study_uid, study_value_version), future in zip(studies, futures):
+                    folder = (
+                        f"{study_uid}_{study_value_version}"
+                        if study_value_version
+                        else study_uid
+                    )
+                    for domain, dataset in future.result().items():
+                        archive.writestr(
+                            f"{folder}/{domain}.csv",
+                            self._dataset_to_csv(
+                                dataset, SDTM_TRIAL_DESIGN_DOMAINS[domain]
+                            ),
+                        )
+                    yield stream.drain()
+            yield stream.drain()
+        finally:
+            # the studies not built yet are skipped when the download is interrupted
+            for future in futures:
+                future.cancel()
+
     @db.transaction
     def list_tv(
         self,
@@ -30,10 +170,9 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyVisitListing]:
-        data = self._query_service.get_tv(
-            study_uid=study_uid, study_value_version=study_value_version
+        result = self._get_dataset(
+            "tv", study_uid=study_uid, study_value_version=study_value_version
         )
-        result = list(map(StudyVisitListing.from_query, data))
 
         filtered_items = service_level_generic_filtering(
             items=result,
@@ -59,10 +198,9 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyArmListing]:
-        data = self._query_service.get_ta(
-            study_uid=study_uid, study_value_version=study_value_version
+        result = self._get_dataset(
+            "ta", study_uid=study_uid, study_value_version=study_value_version
         )
-        result = list(map(StudyArmListing.from_query, data))
 
         filtered_items = service_level_generic_filtering(
             items=result,
@@ -88,10 +226,9 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyCriterionListing]:
-        data = self._query_service.get_ti(
-            study_uid=study_uid, study_value_version=study_value_version
+        result = self._get_dataset(
+            "ti", study_uid=study_uid, study_value_version=study_value_version
         )
-        result = list(map(StudyCriterionListing.from_query, data))
 
         filtered_items = service_level_generic_filtering(
             items=result,
@@ -117,10 +254,9 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudySummaryListing]:
-        data = self._query_service.get_ts(
-            study_uid=study_uid, study_value_version=study_value_version
+        result = self._get_dataset(
+            "ts", study_uid=study_uid, study_value_version=study_value_version
         )
-        result = list(map(StudySummaryListing.from_query, data))
 
         filtered_items = service_level_generic_filtering(
             items=result,
@@ -146,10 +282,9 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyElementListing]:
-        data = self._query_service.get_te(
-            study_uid=study_uid, study_value_version=study_value_version
+        result = self._get_dataset(
+            "te", study_uid=study_uid, study_value_version=study_value_version
         )
-        result = list(map(StudyElementListing.from_query, data))
 
         filtered_items = service_level_generic_filtering(
             items=result,
@@ -175,10 +310,9 @@ class SDTMListingsService:
         total_count: bool = False,
         study_value_version: str | None = None,
     ) -> GenericFilteringReturn[StudyDiseaseMilestoneListing]:
-        data = self._query_service.get_tdm(
-            study_uid=study_uid, study_value_version=study_value_version
+        result = self._get_dataset(
+            "tdm", study_uid=study_uid, study_value_version=study_value_version
         )
-        result = list(map(StudyDiseaseMilestoneListing.from_query, data))
 
         filtered_items = service_level_generic_filtering(
             items=result,
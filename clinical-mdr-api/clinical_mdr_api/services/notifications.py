@@ -2,16 +2,21 @@
 from datetime import datetime, timezone
 
 from neomodel import db
+from pydantic import TypeAdapter
 
 from clinical_mdr_api.domain_repositories.notification_repository import (
     NotificationRepository,
+    published_notifications,
 )
+from clinical_mdr_api.domain_repositories.snapshot import SnapshotDocument
 from clinical_mdr_api.models.notification import (
     Notification,
     NotificationPatchInput,
     NotificationPostInput,
 )
 
+_NOTIFICATIONS_ADAPTER = TypeAdapter(list[Notification])
+
 
 class NotificationService:
     repo: NotificationRepository
@@ -22,12 +27,35 @@ class NotificationService:
     def get_all_notifications(self) -> list[Notification]:
         return self.repo.retrieve_all_notifications()
 
+    @staticmethod
+    def _active_notifications(
+        notifications: list[Notification], now: datetime
+    ) -> list[Notification]:
+        return [
+            notification
+            for notification in notifications
+            if (notification.started_at is None or notification.started_at <= now)
+            and (notification.ended_at is None or notification.ended_at >= now)
+        ]
+
     def get_all_active_notifications(self) -> list[Notification]:
-        return self.repo.retrieve_all_active_notifications()
+        return self._active_notifications(
+            published_notifications.get(), datetime.now(timezone.utc)
+        )
+
+    def get_all_active_notifications_document(self) -> SnapshotDocument:
+        version, notifications = published_notifications.current()
+        active = self._active_notifications(notifications, datetime.now(timezone.utc))
+        return published_notifications.document(
+            version,
+            tuple(notification.sn for notification in active),
+            lambda: _NOTIFICATIONS_ADAPTER.dump_json(active),
+        )
 
     def get_notification(self, sn: int) -> Notification:
         return self.repo.retrieve_notification(sn)
 
+    @published_notifications.invalidates
     @db.transaction
     def create_notification(
         self,
@@ -44,6 +72,7 @@ class NotificationService:
             ),
         )
 
+    @published_notifications.invalidates
     @db.transaction
     def update_notification(
         self,
@@ -62,6 +91,7 @@ class NotificationService:
             ),
         )
 
+    @published_notifications.invalidates
     @db.transaction
     def delete_notification(self, sn: int) -> None:
         return self.repo.delete_notification(sn)
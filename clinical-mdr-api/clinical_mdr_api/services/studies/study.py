@@ -62,6 +62,7 @@ from clinical_mdr_api.models.study_selections.study import (
     StudySubpartAuditTrail,
     StudySubpartCreateInput,
     StudySubpartReorderingInput,
+    is_study_summary_field,
 )
 from clinical_mdr_api.models.utils import GenericFilteringReturn
 from clinical_mdr_api.repositories._utils import FilterOperator
@@ -828,38 +829,51 @@ class StudyService:
             # Some transformation logic is happening from an aggregated object to the pydantic return model
             # This logic prevents us from doing the filtering, sorting, and pagination on the Cypher side
             # Consequently, this has to be done here in the service layer
-            all_items = self._repos.study_definition_repository.find_all(
-                has_study_footnote=has_study_footnote,
-                has_study_objective=has_study_objective,
-                has_study_endpoint=has_study_endpoint,
-                has_study_criteria=has_study_criteria,
-                has_study_activity=has_study_activity,
-                has_study_activity_instruction=has_study_activity_instruction,
-                sort_by={},
-                total_count=False,
-                filter_by={},
-                deleted=deleted,
-            )
-
             if not sort_by:
                 sort_by = {"uid": True}
 
-            # then prepare and return response of our service
-            parsed_items = [
-                self._models_compact_study_from_study_definition_ar(
-                    study_definition_ar=item,
-                    find_project_by_project_number=self._repos.project_repository.find_by_project_number,
-                    find_clinical_programme_by_uid=self._repos.clinical_programme_repository.find_by_uid,
-                    find_study_parent_part_by_uid=self._repos.study_definition_repository.find_by_uid,
+            if not all(
+                is_study_summary_field(field_name)
+                for field_name in [*(filter_by or {}), *sort_by]
+            ):
+                return self._get_all_from_snapshots(
                     include_sections=include_sections,
                     exclude_sections=exclude_sections,
+                    has_study_footnote=has_study_footnote,
+                    has_study_objective=has_study_objective,
+                    has_study_endpoint=has_study_endpoint,
+                    has_study_criteria=has_study_criteria,
+                    has_study_activity=has_study_activity,
+                    has_study_activity_instruction=has_study_activity_instruction,
+                    sort_by=sort_by,
+                    page_number=page_number,
+                    page_size=page_size,
+                    filter_by=filter_by,
+                    filter_operator=filter_operator,
+                    total_count=total_count,
+                    deleted=deleted,
                 )
-                for item in all_items.items
-            ]
 
-            # Do filtering, sorting, pagination and count
+            # Filtering, sorting and pagination is done on compact studies built from the study summaries,
+            # full snapshots are only retrieved for the studies of the requested page
+            summary_items = [
+                self.filter_result_by_requested_fields(
+                    CompactStudy.from_study_summary(study_summary),
+                    include_sections=include_sections,
+                    exclude_sections=exclude_sections,
+                )
+                for study_summary in self._repos.study_definition_repository.find_all_summaries(
+                    has_study_footnote=has_study_footnote,
+                    has_study_objective=has_study_objective,
+                    has_study_endpoint=has_study_endpoint,
+                    has_study_criteria=has_study_criteria,
+                    has_study_activity=has_study_activity,
+                    has_study_activity_instruction=has_study_activity_instruction,
+                    deleted=deleted,
+                )
+            ]
             filtered_items = service_level_generic_filtering(
-                items=parsed_items,
+                items=summary_items,
                 filter_by=filter_by,
                 filter_operator=filter_operator,
                 sort_by=sort_by,
@@ -868,11 +882,92 @@ class StudyService:
                 page_size=page_size,
             )
 
+            page_uids = [item.uid for item in filtered_items.items]
+            studies_by_uid = {
+                item.uid: item
+                for item in self._repos.study_definition_repository.find_all(
+                    sort_by={},
+                    total_count=False,
+                    filter_by={},
+                    deleted=deleted,
+                    uids=page_uids,
+                ).items
+            }
+            filtered_items.items = [
+                self._models_compact_study_from_study_definition_ar(
+                    study_definition_ar=studies_by_uid[uid],
+                    find_project_by_project_number=self._repos.project_repository.find_by_project_number,
+                    find_clinical_programme_by_uid=self._repos.clinical_programme_repository.find_by_uid,
+                    find_study_parent_part_by_uid=self._repos.study_definition_repository.find_by_uid,
+                    include_sections=include_sections,
+                    exclude_sections=exclude_sections,
+                )
+                for uid in page_uids
+                if uid in studies_by_uid
+            ]
             return filtered_items
 
         finally:
             self._close_all_repos()
 
+    def _get_all_from_snapshots(
+        self,
+        include_sections: list[StudyComponentEnum] | None,
+        exclude_sections: list[StudyComponentEnum] | None,
+        has_study_footnote: bool | None,
+        has_study_objective: bool | None,
+        has_study_endpoint: bool | None,
+        has_study_criteria: bool | None,
+        has_study_activity: bool | None,
+        has_study_activity_instruction: bool | None,
+        sort_by: dict,
+        page_number: int,
+        page_size: int,
+        filter_by: dict | None,
+        filter_operator: FilterOperator | None,
+        total_count: bool,
+        deleted: bool,
+    ) -> GenericFilteringReturn[CompactStudy]:
+        """Filters, sorts and paginates the full snapshots of all studies,
+        used when filtering or sorting on fields that are not part of the study summaries
+        """
+        all_items = self._repos.study_definition_repository.find_all(
+            has_study_footnote=has_study_footnote,
+            has_study_objective=has_study_objective,
+            has_study_endpoint=has_study_endpoint,
+            has_study_criteria=has_study_criteria,
+            has_study_activity=has_study_activity,
+            has_study_activity_instruction=has_study_activity_instruction,
+            sort_by={},
+            total_count=False,
+            filter_by={},
+            deleted=deleted,
+        )
+
+        # then prepare and return response of our service
+        parsed_items = [
+            self._models_compact_study_from_study_definition_ar(
+                study_definition_ar=item,
+                find_project_by_project_number=self._repos.project_repository.find_by_project_number,
+                find_clinical_programme_by_uid=self._repos.clinical_programme_repository.find_by_uid,
+                find_study_parent_part_by_uid=self._repos.study_definition_repository.find_by_uid,
+                include_sections=include_sections,
+                exclude_sections=exclude_sections,
+            )
+            for item in all_items.items
+        ]
+
+        # Do filtering, sorting, pagination and count
+        return service_level_generic_filtering(
+            items=parsed_items,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            sort_by=sort_by,
+            total_count=total_count,
+            page_number=page_number,
+            page_size=page_size,
+        )
+
     def get_study_snapshot_history(
         self,
         study_uid: str,
@@ -926,6 +1021,23 @@ class StudyService:
         # Some transformation logic is happening from an aggregated object to the pydantic return model
         # This logic prevents us from doing the filtering, sorting, and pagination on the Cypher side
         # Consequently, this has to be done here in the service layer
+        if all(
+            is_study_summary_field(name) and name != "*"
+            for name in [field_name, *(filter_by or {})]
+        ):
+            summary_items = [
+                CompactStudy.from_study_summary(study_summary)
+                for study_summary in self._repos.study_definition_repository.find_all_summaries()
+            ]
+            return service_level_generic_header_filtering(
+                items=summary_items,
+                field_name=field_name,
+                search_string=search_string,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                page_size=page_size,
+            )
+
         all_items = self._repos.study_definition_repository.find_all(
             sort_by={}, total_count=False, filter_by={}
         )
@@ -2009,6 +2121,11 @@ class StudyService:
             study_uid=study_uid
         )
 
+    def get_current_locked_version(self, study_uid: str) -> str | None:
+        return self._repos.study_definition_repository.get_current_locked_version(
+            study_uid=study_uid
+        )
+
     def check_if_study_exists(self, study_uid: str):
         NotFoundException.raise_if_not(
             self._repos.study_definition_repository.study_exists_by_uid(
@@ -5,7 +5,7 @@ import datetime
 from fastapi import status
 from neomodel import db
 
-from clinical_mdr_api.domain_repositories.models._utils import ListDistinct
+from clinical_mdr_api.domain_repositories.models._projection import Projection
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivityInstruction as StudyActivityInstructionNeoModel,
 )
@@ -38,6 +38,27 @@ from clinical_mdr_api.services.syntax_instances.activity_instructions import (
 from common import exceptions
 from common.auth.user import user
 
+INSTRUCTION_RELATIONS = (
+    "study_activity",
+    "activity_instruction_value__activity_instruction_root",
+    "has_after__audit_trail",
+)
+INSTRUCTION_PROJECTION = Projection(
+    StudyActivityInstructionNeoModel,
+    StudyActivityInstruction,
+    INSTRUCTION_RELATIONS,
+)
+INSTRUCTION_OF_LATEST_STUDY_VALUE_PROJECTION = Projection(
+    StudyActivityInstructionNeoModel,
+    StudyActivityInstruction,
+    INSTRUCTION_RELATIONS + ("study_value__latest_value",),
+)
+INSTRUCTION_OF_STUDY_VALUE_PROJECTION = Projection(
+    StudyActivityInstructionNeoModel,
+    StudyActivityInstruction,
+    INSTRUCTION_RELATIONS + ("study_value__has_version",),
+)
+
 
 class StudyActivityInstructionService(StudySelectionMixin):
     _repos: MetaRepository
@@ -56,16 +77,7 @@ class StudyActivityInstructionService(StudySelectionMixin):
         filter_operator: FilterOperator | None = FilterOperator.AND,
         total_count: bool = False,
     ) -> GenericFilteringReturn[StudyActivityInstruction]:
-        query = StudyActivityInstructionNeoModel.nodes.fetch_relations(
-            "study_value__latest_value",
-            "study_activity",
-            "activity_instruction_value__activity_instruction_root",
-            "has_after__audit_trail",
-        )
-        items = [
-            StudyActivityInstruction.model_validate(sai_node)
-            for sai_node in ListDistinct(query.resolve_subgraph()).distinct()
-        ]
+        items = INSTRUCTION_OF_LATEST_STUDY_VALUE_PROJECTION.fetch()
 
         # Do filtering, sorting, pagination and count
         filtered_items = service_level_generic_filtering(
@@ -96,19 +108,9 @@ class StudyActivityInstructionService(StudySelectionMixin):
                 "study_activity__has_study_activity__latest_value__uid": study_uid,
             }
 
-        study_activity_instructions_ogm: list[StudyActivityInstruction] = [
-            StudyActivityInstruction.model_validate(sai_node)
-            for sai_node in ListDistinct(
-                StudyActivityInstructionNeoModel.nodes.fetch_relations(
-                    "study_activity",
-                    "study_value__has_version",
-                    "activity_instruction_value__activity_instruction_root",
-                    "has_after__audit_trail",
-                )
-                .filter(**filters)
-                .resolve_subgraph()
-            ).distinct()
-        ]
+        study_activity_instructions_ogm: list[StudyActivityInstruction] = (
+            INSTRUCTION_OF_STUDY_VALUE_PROJECTION.fetch(**filters)
+        )
         study_activity_instruction_response_model = [
             StudyActivityInstruction.from_vo(
                 StudyActivityInstructionVO(
@@ -130,22 +132,11 @@ class StudyActivityInstructionService(StudySelectionMixin):
     def get_all_study_instructions_for_specific_study_activity(
         self, study_uid: str, study_activity_uid: str
     ) -> list[StudyActivityInstruction]:
-        return [
-            StudyActivityInstruction.model_validate(sas_node)
-            for sas_node in ListDistinct(
-                StudyActivityInstructionNeoModel.nodes.fetch_relations(
-                    "study_activity",
-                    "activity_instruction_value__activity_instruction_root",
-                    "has_after__audit_trail",
-                )
-                .filter(
-                    study_value__latest_value__uid=study_uid,
-                    study_activity__uid=study_activity_uid,
-                    study_activity__has_study_activity__latest_value__uid=study_uid,
-                )
-                .resolve_subgraph()
-            ).distinct()
-        ]
+        return INSTRUCTION_PROJECTION.fetch(
+            study_value__latest_value__uid=study_uid,
+            study_activity__uid=study_activity_uid,
+            study_activity__has_study_activity__latest_value__uid=study_uid,
+        )
 
     def _create_activity_instruction(
         self, activity_instruction_data: ActivityInstructionCreateInput
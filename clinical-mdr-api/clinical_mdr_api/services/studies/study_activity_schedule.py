@@ -3,12 +3,13 @@ import datetime
 from fastapi import status
 from neomodel import db
 
-from clinical_mdr_api.domain_repositories.models._utils import ListDistinct
+from clinical_mdr_api.domain_repositories.models._projection import Projection
 from clinical_mdr_api.domain_repositories.models.study_selections import (
     StudyActivitySchedule as StudyActivityScheduleNeoModel,
 )
 from clinical_mdr_api.domain_repositories.study_selections.study_activity_schedule_repository import (
     SelectionHistory,
+    StudyScheduleGrid,
 )
 from clinical_mdr_api.domains.study_selections.study_activity_schedule import (
     StudyActivityScheduleVO,
@@ -30,6 +31,26 @@ from common import exceptions
 from common.auth.user import user
 from common.telemetry import trace_calls
 
+SCHEDULE_RELATIONS = (
+    "has_after__audit_trail",
+    "study_visit__has_visit_name__has_latest_value",
+    "study_activity__has_selected_activity",
+)
+SCHEDULE_PROJECTION = Projection(
+    StudyActivityScheduleNeoModel, StudyActivitySchedule, SCHEDULE_RELATIONS
+)
+SCHEDULE_WITH_INSTANCE_PROJECTION = Projection(
+    StudyActivityScheduleNeoModel,
+    StudyActivitySchedule,
+    SCHEDULE_RELATIONS
+    + ("study_activity__study_activity_has_study_activity_instance",),
+)
+SCHEDULE_FOR_ACTIVITY_PROJECTION = Projection(
+    StudyActivityScheduleNeoModel,
+    StudyActivitySchedule,
+    SCHEDULE_RELATIONS + ("study_activity__has_study_activity",),
+)
+
 
 class StudyActivityScheduleService(StudySelectionMixin):
     _repos: MetaRepository
@@ -64,61 +85,35 @@ class StudyActivityScheduleService(StudySelectionMixin):
     def get_all_schedules_for_specific_visit(
         self, study_uid: str, study_visit_uid: str, detailed_soa: bool = True
     ) -> list[StudyActivitySchedule]:
-        relations_to_fetch = [
-            "has_after__audit_trail",
-            "study_visit__has_visit_name__has_latest_value",
-            "study_activity__has_selected_activity",
-        ]
         filters = {
             "study_value__latest_value__uid": study_uid,
             "study_visit__uid": study_visit_uid,
             "study_visit__has_study_visit__latest_value__uid": study_uid,
         }
         if detailed_soa:
+            projection = SCHEDULE_PROJECTION
             filters.update(
                 {"study_activity__has_study_activity__latest_value__uid": study_uid}
             )
         else:
-            relations_to_fetch.append(
-                "study_activity__study_activity_has_study_activity_instance"
-            )
+            projection = SCHEDULE_WITH_INSTANCE_PROJECTION
             filters.update(
                 {
                     "study_activity__study_activity_has_study_activity_instance__has_study_activity_instance__latest_value__uid": study_uid
                 }
             )
-        return [
-            StudyActivitySchedule.model_validate(sas_node)
-            for sas_node in ListDistinct(
-                StudyActivityScheduleNeoModel.nodes.fetch_relations(*relations_to_fetch)
-                .filter(**filters)
-                .order_by("uid")
-                .resolve_subgraph()
-            ).distinct()
-        ]
+        return projection.fetch(order_by="uid", **filters)
 
     def get_all_schedules_for_specific_activity(
         self, study_uid: str, study_activity_uid: str
     ) -> list[StudyActivitySchedule]:
-        return [
-            StudyActivitySchedule.model_validate(sas_node)
-            for sas_node in ListDistinct(
-                StudyActivityScheduleNeoModel.nodes.fetch_relations(
-                    "has_after__audit_trail",
-                    "study_visit__has_visit_name__has_latest_value",
-                    "study_activity__has_selected_activity",
-                    "study_activity__has_study_activity",
-                )
-                .filter(
-                    study_value__latest_value__uid=study_uid,
-                    study_activity__uid=study_activity_uid,
-                    study_visit__has_study_visit__latest_value__uid=study_uid,
-                    study_activity__has_study_activity__latest_value__uid=study_uid,
-                )
-                .order_by("uid")
-                .resolve_subgraph()
-            ).distinct()
-        ]
+        return SCHEDULE_FOR_ACTIVITY_PROJECTION.fetch(
+            order_by="uid",
+            study_value__latest_value__uid=study_uid,
+            study_activity__uid=study_activity_uid,
+            study_visit__has_study_visit__latest_value__uid=study_uid,
+            study_activity__has_study_activity__latest_value__uid=study_uid,
+        )
 
     def _from_input_values(
         self, study_uid: str, schedule_input: StudyActivityScheduleCreateInput
@@ -225,29 +220,81 @@ class StudyActivityScheduleService(StudySelectionMixin):
         finally:
             repos.close()
 
+    def _add_to_grid(
+        self, grid: StudyScheduleGrid, schedule: StudyActivityScheduleVO
+    ) -> None:
+        exceptions.NotFoundException.raise_if(
+            schedule.study_activity_uid not in grid.study_activity_instance_uids,
+            "Study Activity",
+            schedule.study_activity_uid,
+        )
+        exceptions.NotFoundException.raise_if(
+            schedule.study_visit_uid not in grid.study_visit_uids,
+            "Study Visit",
+            schedule.study_visit_uid,
+        )
+        pair = (schedule.study_activity_uid, schedule.study_visit_uid)
+        exceptions.BusinessLogicException.raise_if(
+            pair in grid.scheduled_pairs,
+            msg=f"There already exist a schedule for the same Activity and Visit in the Study with UID '{schedule.study_uid}'",
+        )
+        grid.scheduled_pairs.add(pair)
+        schedule.study_activity_instance_uid = grid.study_activity_instance_uids[
+            schedule.study_activity_uid
+        ]
+
+    def _remove_from_grid(
+        self, study_uid: str, grid: StudyScheduleGrid, schedule_uid: str
+    ) -> StudyActivityScheduleVO:
+        pair = grid.schedules.pop(schedule_uid, None)
+        exceptions.NotFoundException.raise_if(
+            pair is None, "Study Activity Schedule", schedule_uid
+        )
+        grid.scheduled_pairs.discard(pair)
+        study_activity_uid, study_visit_uid = pair
+        return StudyActivityScheduleVO(
+            uid=schedule_uid,
+            study_uid=study_uid,
+            study_activity_uid=study_activity_uid,
+            study_activity_instance_uid=None,
+            study_visit_uid=study_visit_uid,
+            author_id=self.author,
+            start_date=datetime.datetime.now(datetime.timezone.utc),
+        )
+
     @ensure_transaction(db)
     def handle_batch_operations(
         self,
         study_uid: str,
         operations: list[StudyActivityScheduleBatchInput],
     ) -> list[StudyActivityScheduleBatchOutput]:
-        results = []
+        """
+        Validates the operations against the activities, visits and schedules of the study loaded once,
+        then writes all created and deleted schedules at once.
+        """
+        repository = self._repos.study_activity_schedule_repository
+        grid = repository.get_schedule_grid(study_uid)
+        created_schedules = []
+        deleted_schedules = []
+        results: list[StudyActivityScheduleVO | StudyActivityScheduleBatchOutput] = []
         for operation in operations:
-            result = {}
-            item = None
             try:
                 if operation.method == "POST":
-                    item = self.create(study_uid, operation.content)
-                    response_code = status.HTTP_201_CREATED
+                    schedule = self._from_input_values(study_uid, operation.content)
+                    self._add_to_grid(grid, schedule)
+                    created_schedules.append(schedule)
+                    results.append(schedule)
                 elif operation.method == "DELETE":
-                    self.delete(study_uid, operation.content.uid)
-                    response_code = status.HTTP_204_NO_CONTENT
+                    deleted_schedules.append(
+                        self._remove_from_grid(study_uid, grid, operation.content.uid)
+                    )
+                    results.append(
+                        StudyActivityScheduleBatchOutput(
+                            response_code=status.HTTP_204_NO_CONTENT
+                        )
+                    )
                 else:
                     raise exceptions.MethodNotAllowedException(method=operation.method)
-                result["response_code"] = response_code
-                if item:
-                    result["content"] = item.model_dump()
-                results.append(StudyActivityScheduleBatchOutput(**result))
             except exceptions.MDRApiBaseException as error:
                 results.append(
                     StudyActivityScheduleBatchOutput.model_construct(
@@ -255,4 +302,17 @@ class StudyActivityScheduleService(StudySelectionMixin):
                         content=BatchErrorResponse(message=str(error)),
                     )
                 )
-        return results
+        repository.save_all(
+            study_uid, created_schedules, deleted_schedules, self.author
+        )
+        return [
+            (
+                StudyActivityScheduleBatchOutput(
+                    response_code=status.HTTP_201_CREATED,
+                    content=StudyActivitySchedule.from_vo(result),
+                )
+                if isinstance(result, StudyActivityScheduleVO)
+                else result
+            )
+            for result in results
+        ]
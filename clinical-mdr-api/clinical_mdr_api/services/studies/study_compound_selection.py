@@ -46,6 +46,20 @@ class StudyCompoundSelectionService(
             study_uid=study_selection.study_uid,
             study_value_version=study_value_version,
         )
+        self._loader.prime_terms(
+            (
+                term_uid
+                for selection in study_selection.study_compounds_selection
+                for term_uid in (
+                    selection.type_of_treatment_uid,
+                    selection.dose_frequency_uid,
+                    selection.dispenser_uid,
+                    selection.delivery_device_uid,
+                    selection.reason_for_missing_value_uid,
+                )
+            ),
+            at_specific_date=terms_at_specific_datetime,
+        )
         for order, selection in enumerate(
             study_selection.study_compounds_selection, start=1
         ):
@@ -38,6 +38,7 @@ from clinical_mdr_api.services._utils import (
 )
 from clinical_mdr_api.services.studies.study_selection_base import StudySelectionMixin
 from clinical_mdr_api.services.syntax_instances.endpoints import EndpointService
+from common import config as settings
 from common import exceptions
 from common.auth.user import user
 
@@ -63,9 +64,12 @@ class StudyEndpointSelectionService(StudySelectionMixin):
         no_brackets: bool = False,
         study_value_version: str | None = None,
     ) -> StudySelectionObjective:
-        repos = self._repos
-        selection_aggregate = repos.study_objective_repository.find_by_study(
-            study_uid, study_value_version=study_value_version
+        # all the endpoints of a study share the objectives aggregate
+        selection_aggregate = self._loader.get(
+            ("study_objectives", study_uid, study_value_version),
+            lambda: self._repos.study_objective_repository.find_by_study(
+                study_uid, study_value_version=study_value_version
+            ),
         )
         assert selection_aggregate is not None
         _, order = selection_aggregate.get_specific_objective_selection(
@@ -90,15 +94,27 @@ class StudyEndpointSelectionService(StudySelectionMixin):
         study_selection: StudySelectionEndpointsAR,
         no_brackets: bool = False,
         study_value_version: str | None = None,
+        selection_uids: list[str] | None = None,
     ) -> list[StudySelectionEndpoint]:
         result = []
         terms_at_specific_datetime = self._extract_study_standards_effective_date(
             study_uid=study_selection.study_uid,
             study_value_version=study_value_version,
         )
-        for order, selection in enumerate(
-            study_selection.study_endpoints_selection, start=1
+        selections = self._ordered_selections(
+            study_selection.study_endpoints_selection, selection_uids
+        )
+        for codelist_name, attribute in (
+            (settings.STUDY_ENDPOINT_LEVEL_NAME, "endpoint_level_uid"),
+            ("Endpoint Sub Level", "endpoint_sublevel_uid"),
         ):
+            self._loader.prime_terms(
+                (getattr(selection, attribute) for _, selection in selections),
+                status=LibraryItemStatus.FINAL,
+                at_specific_date=terms_at_specific_datetime,
+                codelist_name=codelist_name,
+            )
+        for order, selection in selections:
             result.append(
                 self._transform_single_to_response_model(
                     selection,
@@ -857,6 +873,30 @@ class StudyEndpointSelectionService(StudySelectionMixin):
                 )
                 return GenericFilteringReturn.create(filtered_items, count)
 
+            endpoint_repo = repos.study_endpoint_repository
+            if self._is_page_query(
+                endpoint_repo.page_fields, filter_by, sort_by, no_brackets
+            ):
+                # Filtering only needs data that can be queried in the database,
+                # so that only the returned page is transformed to the response model
+                selection_uids, count = endpoint_repo.find_page_by_study(
+                    study_uid,
+                    study_value_version=study_value_version,
+                    filter_by=filter_by,
+                    filter_operator=filter_operator,
+                    sort_by=sort_by,
+                    page_number=page_number,
+                    page_size=page_size,
+                    total_count=total_count,
+                )
+                filtered_items = self._transform_all_to_response_model(
+                    endpoint_selection_ar,
+                    no_brackets=no_brackets,
+                    study_value_version=study_value_version,
+                    selection_uids=selection_uids,
+                )
+                return GenericFilteringReturn.create(filtered_items, count)
+
             # Fall back to full generic filtering
             selection = self._transform_all_to_response_model(
                 endpoint_selection_ar,
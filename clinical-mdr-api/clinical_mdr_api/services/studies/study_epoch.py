@@ -1,5 +1,6 @@
 import datetime
 
+from fastapi import status
 from neomodel import db
 
 from clinical_mdr_api.domains.controlled_terminologies.ct_term_attributes import (
@@ -33,8 +34,11 @@ from clinical_mdr_api.domains.versioned_object_aggregate import LibraryVO
 from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     SimpleCTTermNameWithConflictFlag,
 )
+from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_epoch import (
     StudyEpoch,
+    StudyEpochBatchInput,
+    StudyEpochBatchOutput,
     StudyEpochCreateInput,
     StudyEpochEditInput,
     StudyEpochTypes,
@@ -61,9 +65,22 @@ from common.config import STUDY_EPOCH_EPOCH_UID
 from common.exceptions import (
     AlreadyExistsException,
     BusinessLogicException,
+    MDRApiBaseException,
+    MethodNotAllowedException,
     ValidationException,
 )
 
+# the codelists whose terms are loaded, through the CT term registry, by `_create_ctlist_map`
+CT_CODELIST_NAMES = [
+    settings.STUDY_EPOCH_TYPE_NAME,
+    settings.STUDY_EPOCH_SUBTYPE_NAME,
+    settings.STUDY_EPOCH_EPOCH_NAME,
+    settings.STUDY_VISIT_TYPE_NAME,
+    settings.STUDY_VISIT_TIMEREF_NAME,
+    settings.STUDY_VISIT_CONTACT_MODE_NAME,
+    settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME,
+]
+
 
 class StudyEpochService(StudySelectionMixin):
     def __init__(
@@ -91,13 +108,6 @@ class StudyEpochService(StudySelectionMixin):
             self.terms_at_specific_datetime = self._extract_terms_at_date(
                 study_uid=study_uid, study_value_version=study_value_version
             )
-        self.study_epoch_types = []
-        self.study_epoch_subtypes = []
-        self.study_epoch_epochs = []
-        self.study_visit_types = []
-        self.study_visit_timeref = []
-        self.study_visit_contact_mode = []
-        self.study_visit_epoch_allocation = []
         self._create_ctlist_map()
 
     def _extract_terms_at_date(self, study_uid, study_value_version: str = None):
@@ -133,112 +143,18 @@ class StudyEpochService(StudySelectionMixin):
         )
 
     def _create_ctlist_map(self):
-        ct_terms = self.repo.fetch_ctlist(
-            codelist_names=[
-                settings.STUDY_EPOCH_TYPE_NAME,
-                settings.STUDY_EPOCH_SUBTYPE_NAME,
-                settings.STUDY_EPOCH_EPOCH_NAME,
-                settings.STUDY_VISIT_TYPE_NAME,
-                settings.STUDY_VISIT_TIMEREF_NAME,
-                settings.STUDY_VISIT_CONTACT_MODE_NAME,
-                settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME,
-            ]
-        )
-        for ct_term_uid, codelist_names in ct_terms.items():
-            if settings.STUDY_EPOCH_TYPE_NAME in codelist_names:
-                self.study_epoch_types.append(ct_term_uid)
-            if settings.STUDY_EPOCH_SUBTYPE_NAME in codelist_names:
-                self.study_epoch_subtypes.append(ct_term_uid)
-            if settings.STUDY_EPOCH_EPOCH_NAME in codelist_names:
-                self.study_epoch_epochs.append(ct_term_uid)
-            if settings.STUDY_VISIT_TYPE_NAME in codelist_names:
-                self.study_visit_types.append(ct_term_uid)
-            if settings.STUDY_VISIT_TIMEREF_NAME in codelist_names:
-                self.study_visit_timeref.append(ct_term_uid)
-            if settings.STUDY_VISIT_CONTACT_MODE_NAME in codelist_names:
-                self.study_visit_contact_mode.append(ct_term_uid)
-            if settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME in codelist_names:
-                self.study_visit_epoch_allocation.append(ct_term_uid)
-
-        ctterm_uids = list(
-            set(
-                self.study_epoch_types
-                + self.study_epoch_subtypes
-                + self.study_epoch_epochs
-                + self.study_visit_types
-                + self.study_visit_timeref
-                + self.study_visit_contact_mode
-                + self.study_visit_epoch_allocation
-            )
-        )
-
-        ctterms = self._find_terms_by_uids(
-            term_uids=ctterm_uids,
-            at_specific_date=self.terms_at_specific_datetime,
-            return_simple_object=True,
-        )
-
-        StudyEpochType.clear()
-        StudyEpochType.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_epoch_types
-            ]
-        )
-
-        StudyEpochSubType.clear()
-        StudyEpochSubType.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_epoch_subtypes
-            ]
-        )
-
-        StudyEpochEpoch.clear()
-        StudyEpochEpoch.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_epoch_epochs
-            ]
-        )
-
-        StudyVisitType.clear()
-        StudyVisitType.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_types
-            ]
-        )
-
-        StudyVisitTimeReference.clear()
-        StudyVisitTimeReference.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_timeref
-            ]
-        )
-
-        StudyVisitContactMode.clear()
-        StudyVisitContactMode.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_contact_mode
-            ]
+        ct_terms = self.repo.fetch_ct_terms(
+            codelist_names=CT_CODELIST_NAMES,
+            effective_date=self.terms_at_specific_datetime,
         )
-
-        StudyVisitEpochAllocation.clear()
-        StudyVisitEpochAllocation.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_epoch_allocation
-            ]
+        StudyEpochType.set(ct_terms[settings.STUDY_EPOCH_TYPE_NAME])
+        StudyEpochSubType.set(ct_terms[settings.STUDY_EPOCH_SUBTYPE_NAME])
+        StudyEpochEpoch.set(ct_terms[settings.STUDY_EPOCH_EPOCH_NAME])
+        StudyVisitType.set(ct_terms[settings.STUDY_VISIT_TYPE_NAME])
+        StudyVisitTimeReference.set(ct_terms[settings.STUDY_VISIT_TIMEREF_NAME])
+        StudyVisitContactMode.set(ct_terms[settings.STUDY_VISIT_CONTACT_MODE_NAME])
+        StudyVisitEpochAllocation.set(
+            ct_terms[settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME]
         )
 
         self._allowed_configs = self._get_allowed_configs(
@@ -795,7 +711,7 @@ class StudyEpochService(StudySelectionMixin):
     def _get_epoch_number_from_epoch_name(self, epoch_name: str):
         return epoch_name.split()[-1]
 
-    @db.transaction
+    @ensure_transaction(db)
     def create(self, study_uid: str, study_epoch_input: StudyEpochCreateInput):
         self._validate_creation(study_epoch_input)
         all_epochs = self.repo.find_all_epochs_by_study(study_uid)
@@ -834,7 +750,7 @@ class StudyEpochService(StudySelectionMixin):
         created_study_epoch.uid = "preview"
         return self._transform_all_to_response_model(created_study_epoch)
 
-    @db.transaction
+    @ensure_transaction(db)
     def edit(
         self,
         study_uid: str,
@@ -843,12 +759,8 @@ class StudyEpochService(StudySelectionMixin):
     ):
         self._validate_update(study_epoch_input)
 
-        study_epoch = self.repo.find_by_uid(
-            uid=study_epoch_uid, study_uid=study_epoch_input.study_uid
-        )
-        study_visits = self.visit_repo.find_all_visits_by_study_uid(study_uid)
-        timeline = TimelineAR(study_uid, _visits=study_visits)
-        timeline.collect_visits_to_epochs(self.repo.find_all_epochs_by_study(study_uid))
+        # an epoch of another study is not found
+        study_epoch = self.repo.find_by_uid(uid=study_epoch_uid, study_uid=study_uid)
 
         fill_missing_values_in_base_model_from_reference_base_model(
             base_model_with_missing_values=study_epoch_input,
@@ -922,7 +834,7 @@ class StudyEpochService(StudySelectionMixin):
             epoch,
         )
 
-    @db.transaction
+    @ensure_transaction(db)
     def delete(self, study_uid: str, study_epoch_uid: str):
         # get the possible connected StudyDesign Cells attached to it
         design_cells_on_epoch = None
@@ -984,6 +896,42 @@ class StudyEpochService(StudySelectionMixin):
             epochs_to_synchronize=epochs_in_subtype, all_epochs=all_epochs_in_study
         )
 
+    @db.transaction
+    def handle_batch_operations(
+        self, study_uid: str, operations: list[StudyEpochBatchInput]
+    ) -> list[StudyEpochBatchOutput]:
+        """
+        Applies the create, edit and delete operations in a single transaction, using the terms loaded once by the service.
+        """
+        results = []
+        for operation in operations:
+            item = None
+            try:
+                if operation.method == "POST":
+                    item = self.create(study_uid, operation.content)
+                    response_code = status.HTTP_201_CREATED
+                elif operation.method == "PATCH":
+                    item = self.edit(
+                        study_uid, operation.content.uid, operation.content
+                    )
+                    response_code = status.HTTP_200_OK
+                elif operation.method == "DELETE":
+                    self.delete(study_uid, operation.content.uid)
+                    response_code = status.HTTP_204_NO_CONTENT
+                else:
+                    raise MethodNotAllowedException(method=operation.method)
+                results.append(
+                    StudyEpochBatchOutput(response_code=response_code, content=item)
+                )
+            except MDRApiBaseException as error:
+                results.append(
+                    StudyEpochBatchOutput.model_construct(
+                        response_code=error.status_code,
+                        content=BatchErrorResponse(message=str(error)),
+                    )
+                )
+        return results
+
     def _get_allowed_configs(self, effective_date: datetime.datetime | None = None):
         resp = []
         for item in self.repo.get_allowed_configs(effective_date=effective_date):
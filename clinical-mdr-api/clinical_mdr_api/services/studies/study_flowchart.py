@@ -1,3 +1,4 @@
+import io
 import logging
 from collections import defaultdict
 from datetime import datetime
@@ -59,14 +60,13 @@ from clinical_mdr_api.services.studies.study_epoch import StudyEpochService
 from clinical_mdr_api.services.studies.study_soa_footnote import StudySoAFootnoteService
 from clinical_mdr_api.services.studies.study_soa_group import StudySoAGroupService
 from clinical_mdr_api.services.studies.study_visit import StudyVisitService
-from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
 from clinical_mdr_api.services.utils.table_f import (
-    Ref,
+    Cell,
+    CellRef,
+    Row,
     SimpleFootnote,
-    TableCell,
-    TableRow,
-    TableWithFootnotes,
-    table_to_docx,
+    Table,
+    table_to_docx_stream,
     table_to_html,
     table_to_xlsx,
 )
@@ -588,8 +588,8 @@ class StudyFlowchartService:
         layout: SoALayout,
         time_unit: str | None = None,
         force_build: bool = False,
-    ) -> TableWithFootnotes:
-        """Returns internal TableWithFootnotes representation of SoA, either from snapshot or freshly built"""
+    ) -> Table:
+        """Returns internal Table representation of SoA, either from snapshot or freshly built"""
 
         if study_value_version and layout == SoALayout.PROTOCOL and not force_build:
             # Return protocol SoA from snapshot for a locked study version
@@ -625,7 +625,7 @@ class StudyFlowchartService:
         study_value_version: str | None,
         layout: SoALayout,
         time_unit: str | None = None,
-    ) -> TableWithFootnotes:
+    ) -> Table:
         """
         Builds SoA flowchart table
 
@@ -636,7 +636,7 @@ class StudyFlowchartService:
             time_unit (str): The preferred time unit, either "day" or "week".
 
         Returns:
-            TableWithFootnotes: SoA flowchart table with footnotes.
+            Table: SoA flowchart table with footnotes.
         """
 
         soa_preferences = self._get_soa_preferences(
@@ -684,7 +684,7 @@ class StudyFlowchartService:
             layout=layout,
         )
 
-        table = TableWithFootnotes(
+        table = Table(
             rows=header_rows + activity_rows,
             num_header_rows=len(header_rows),
             num_header_cols=1,
@@ -791,8 +791,8 @@ class StudyFlowchartService:
         study_value_version: str | None,
         layout: SoALayout,
         time_unit: str | None,
-    ) -> DocxBuilder:
-        """Returns a DOCX document with SoA table and footnotes"""
+    ) -> io.BytesIO:
+        """Returns a DOCX document stream with SoA table and footnotes"""
 
         # build internal representation of flowchart
         table = self.get_flowchart_table(
@@ -811,7 +811,7 @@ class StudyFlowchartService:
             self.add_protocol_section_column(table)
 
         # convert flowchart to DOCX document applying styles
-        return table_to_docx(
+        return table_to_docx_stream(
             table,
             styles=(
                 OPERATIONAL_DOCX_STYLES
@@ -865,7 +865,7 @@ class StudyFlowchartService:
         study_uid: str,
         time_unit: str | None = None,
         study_value_version: str | None = None,
-    ) -> TableWithFootnotes:
+    ) -> Table:
         """
         Builds operational SoA table in spreadsheet format
 
@@ -875,7 +875,7 @@ class StudyFlowchartService:
             study_value_version (str | None): The version of the study to check. Defaults to None.
 
         Returns:
-            TableWithFootnotes: Operational SoA flowchart table.
+            Table: Operational SoA flowchart table.
         """
 
         study = self._get_study(study_uid, study_value_version=study_value_version)
@@ -919,51 +919,51 @@ class StudyFlowchartService:
 
         # header rows
         rows = [
-            TableRow(
+            Row(
                 cells=[
-                    TableCell(
+                    Cell(
                         f"study_version: {study_version(study)}",
                         span=3,
                         style="studyVersion",
                     )
                 ]
-                + [TableCell(span=0, style="studyVersion")] * 2
+                + [Cell(span=0, style="studyVersion")] * 2
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell(
+                    Cell(
                         f"study_number: {study.current_metadata.identification_metadata.study_id}",
                         span=3,
                         style="studyNumber",
                     )
                 ]
-                + [TableCell(span=0, style="studyNumber")] * 2
+                + [Cell(span=0, style="studyNumber")] * 2
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell(
+                    Cell(
                         f"Date/time of extraction: {datetime.now().strftime('%Y-%m-%d %H:%M:%S Z')}",
                         span=3,
                         style="dateTime",
                     ),
-                    TableCell(span=0, style="dateTime"),
-                    TableCell(span=0, style="dateTime"),
-                    TableCell(f"By: {user().id()}", span=2, style="extractedBy"),
-                    TableCell(span=0, style="extractedBy"),
-                    TableCell(span=2),
-                    TableCell("Epochs", style="header1"),
+                    Cell(span=0, style="dateTime"),
+                    Cell(span=0, style="dateTime"),
+                    Cell(f"By: {user().id()}", span=2, style="extractedBy"),
+                    Cell(span=0, style="extractedBy"),
+                    Cell(span=2),
+                    Cell("Epochs", style="header1"),
                 ]
             ),
-            TableRow(
+            Row(
                 cells=[
-                    TableCell("lowest visibility layer", style="header3"),
-                    TableCell("SoA group", style="header3"),
-                    TableCell("Group", style="header3"),
-                    TableCell("Subgroup", style="header3"),
-                    TableCell("Activity", style="header3"),
-                    TableCell("Topic Code", style="header3"),
-                    TableCell("ADaM Param Code", style="header3"),
-                    TableCell("Visits", style="header1"),
+                    Cell("lowest visibility layer", style="header3"),
+                    Cell("SoA group", style="header3"),
+                    Cell("Group", style="header3"),
+                    Cell("Subgroup", style="header3"),
+                    Cell("Activity", style="header3"),
+                    Cell("Topic Code", style="header3"),
+                    Cell("ADaM Param Code", style="header3"),
+                    Cell("Visits", style="header1"),
                 ]
             ),
         ]
@@ -979,7 +979,7 @@ class StudyFlowchartService:
                     perv_study_epoch_uid = study_epoch_uid
 
                     rows[-2].cells.append(
-                        TableCell(
+                        Cell(
                             text=visit.study_epoch.sponsor_preferred_name,
                             span=len(visit_groups),
                             style="header2",
@@ -987,11 +987,11 @@ class StudyFlowchartService:
                     )
 
                 else:
-                    rows[-2].cells.append(TableCell(span=0, style="header2"))
+                    rows[-2].cells.append(Cell(span=0, style="header2"))
 
                 # Visit
                 rows[-1].cells.append(
-                    TableCell(
+                    Cell(
                         (
                             visit.consecutive_visit_group
                             if len(group) > 1
@@ -1013,35 +1013,35 @@ class StudyFlowchartService:
             if not getattr(study_selection_activity, "activity_instance", None):
                 continue
 
-            rows.append(row := TableRow())
+            rows.append(row := Row())
 
             # Visibility
             if getattr(
                 study_selection_activity, "show_activity_in_protocol_flowchart", True
             ):
-                row.cells.append(TableCell(_T("activity"), style="visibility"))
+                row.cells.append(Cell(_T("activity"), style="visibility"))
             elif getattr(
                 study_selection_activity,
                 "show_activity_subgroup_in_protocol_flowchart",
                 True,
             ):
-                row.cells.append(TableCell(_T("subgroup"), style="visibility"))
+                row.cells.append(Cell(_T("subgroup"), style="visibility"))
             elif getattr(
                 study_selection_activity,
                 "show_activity_group_in_protocol_flowchart",
                 True,
             ):
-                row.cells.append(TableCell(_T("group"), style="visibility"))
+                row.cells.append(Cell(_T("group"), style="visibility"))
             elif getattr(
                 study_selection_activity, "show_soa_group_in_protocol_flowchart", True
             ):
-                row.cells.append(TableCell(_T("soagroup"), style="visibility"))
+                row.cells.append(Cell(_T("soagroup"), style="visibility"))
             else:
-                row.cells.append(TableCell(style="visibility"))
+                row.cells.append(Cell(style="visibility"))
 
             # SoA Group
             row.cells.append(
-                TableCell(
+                Cell(
                     study_selection_activity.study_soa_group.soa_group_term_name,
                     style="soaGroup",
                 )
@@ -1049,7 +1049,7 @@ class StudyFlowchartService:
 
             # Activity Group
             row.cells.append(
-                TableCell(
+                Cell(
                     (
                         study_selection_activity.study_activity_group.activity_group_name
                         if study_selection_activity.study_activity_group.activity_group_uid
@@ -1061,7 +1061,7 @@ class StudyFlowchartService:
 
             # Activity Sub-Group
             row.cells.append(
-                TableCell(
+                Cell(
                     (
                         study_selection_activity.study_activity_subgroup.activity_subgroup_name
                         if study_selection_activity.study_activity_subgroup.activity_subgroup_uid
@@ -1073,12 +1073,12 @@ class StudyFlowchartService:
 
             # Activity
             row.cells.append(
-                TableCell(study_selection_activity.activity.name, style="activity")
+                Cell(study_selection_activity.activity.name, style="activity")
             )
 
             # Topic Code
             row.cells.append(
-                TableCell(
+                Cell(
                     (
                         study_selection_activity.activity_instance.topic_code
                         if study_selection_activity.activity_instance
@@ -1090,7 +1090,7 @@ class StudyFlowchartService:
 
             # ADaM Param Code
             row.cells.append(
-                TableCell(
+                Cell(
                     (
                         study_selection_activity.activity_instance.adam_param_code
                         if study_selection_activity.activity_instance
@@ -1101,7 +1101,7 @@ class StudyFlowchartService:
             )
 
             # Empty header column
-            row.cells.append(TableCell())
+            row.cells.append(Cell())
 
             # Scheduling crosses
             self._append_activity_crosses(
@@ -1111,7 +1111,7 @@ class StudyFlowchartService:
                 study_selection_activity.study_activity_instance_uid,
             )
 
-        table = TableWithFootnotes(
+        table = Table(
             rows=rows,
             num_header_rows=4,
             num_header_cols=7,
@@ -1128,7 +1128,7 @@ class StudyFlowchartService:
         time_unit: str,
         soa_preferences: StudySoaPreferencesInput,
         layout: SoALayout,
-    ) -> list[TableRow]:
+    ) -> list[Row]:
         """Builds the 4 header rows of protocol SoA flowchart"""
 
         visit_timing_prop = cls._get_visit_timing_property(time_unit, soa_preferences)
@@ -1136,8 +1136,8 @@ class StudyFlowchartService:
         rows = []
 
         # Header line 1: Epoch names
-        rows.append(epochs_row := TableRow())
-        epochs_row.cells.append(TableCell(text=_T("study_epoch"), style="header1"))
+        rows.append(epochs_row := Row())
+        epochs_row.cells.append(Cell(text=_T("study_epoch"), style="header1"))
         epochs_row.hide = not (
             layout == SoALayout.OPERATIONAL or soa_preferences.show_epochs
         )
@@ -1145,25 +1145,25 @@ class StudyFlowchartService:
         # Header line 2 (optional): Milestones
         milestones_row = None
         if layout != SoALayout.OPERATIONAL and soa_preferences.show_milestones:
-            rows.append(milestones_row := TableRow())
+            rows.append(milestones_row := Row())
             milestones_row.cells.append(
-                TableCell(text=_T("study_milestone"), style="header1")
+                Cell(text=_T("study_milestone"), style="header1")
             )
             milestones_row.hide = not soa_preferences.show_milestones
 
         # Header line 2/3: Visit names
-        rows.append(visits_row := TableRow())
-        visits_row.cells.append(TableCell(text=_T("visit_short_name"), style="header2"))
+        rows.append(visits_row := Row())
+        visits_row.cells.append(Cell(text=_T("visit_short_name"), style="header2"))
 
         # Header line 3/4: Visit timing day/week sequence
-        rows.append(timing_row := TableRow())
+        rows.append(timing_row := Row())
         if time_unit == "day":
-            timing_row.cells.append(TableCell(text=_T("study_day"), style="header3"))
+            timing_row.cells.append(Cell(text=_T("study_day"), style="header3"))
         else:
-            timing_row.cells.append(TableCell(text=_T("study_week"), style="header3"))
+            timing_row.cells.append(Cell(text=_T("study_week"), style="header3"))
 
         # Header line 4/5: Visit window
-        rows.append(window_row := TableRow())
+        rows.append(window_row := Row())
 
         visit_window_unit = next(
             (
@@ -1175,7 +1175,7 @@ class StudyFlowchartService:
         )
         # Append window unit used for all StudyVisits
         window_row.cells.append(
-            TableCell(
+            Cell(
                 text=_T("visit_window").format(unit_name=visit_window_unit),
                 style="header4",
             )
@@ -1183,13 +1183,11 @@ class StudyFlowchartService:
 
         # Add Operation SoA's extra columns
         if layout == SoALayout.OPERATIONAL:
-            epochs_row.cells.append(TableCell(text=_T("topic_code"), style="header2"))
-            epochs_row.cells.append(
-                TableCell(text=_T("adam_param_code"), style="header2")
-            )
+            epochs_row.cells.append(Cell(text=_T("topic_code"), style="header2"))
+            epochs_row.cells.append(Cell(text=_T("adam_param_code"), style="header2"))
             for row in rows[1:]:
                 for _j in range(NUM_OPERATIONAL_CODE_ROWS):
-                    row.cells.append(TableCell())
+                    row.cells.append(Cell())
 
         perv_study_epoch_uid = None
         prev_visit_type_uid = None
@@ -1202,13 +1200,13 @@ class StudyFlowchartService:
                     perv_study_epoch_uid = study_epoch_uid
 
                     epochs_row.cells.append(
-                        TableCell(
+                        Cell(
                             text=visit.study_epoch.sponsor_preferred_name,
                             span=len(visit_groups),
                             style="header1",
                             refs=[
-                                Ref(
-                                    type_=SoAItemType.STUDY_EPOCH.value,
+                                CellRef(
+                                    type=SoAItemType.STUDY_EPOCH.value,
                                     uid=visit.study_epoch_uid,
                                 )
                             ],
@@ -1217,7 +1215,7 @@ class StudyFlowchartService:
 
                 else:
                     # Add empty cells after Epoch cell with span > 1
-                    epochs_row.cells.append(TableCell(span=0))
+                    epochs_row.cells.append(Cell(span=0))
 
                 # Milestones
                 if milestones_row:
@@ -1225,13 +1223,13 @@ class StudyFlowchartService:
                         if prev_visit_type_uid == visit.visit_type_uid:
                             # Same visit_type, then merge with the previous cell in Milestone row
                             prev_milestone_cell.span += 1
-                            milestones_row.cells.append(TableCell(span=0))
+                            milestones_row.cells.append(Cell(span=0))
 
                         else:
                             # Different visit_type, new label in Milestones row
                             prev_visit_type_uid = visit.visit_type_uid
                             milestones_row.cells.append(
-                                prev_milestone_cell := TableCell(
+                                prev_milestone_cell := Cell(
                                     visit.visit_type.sponsor_preferred_name,
                                     style="header1",
                                 )
@@ -1240,7 +1238,7 @@ class StudyFlowchartService:
                     else:
                         # Just an empty cell for non-milestones
                         prev_visit_type_uid = None
-                        milestones_row.cells.append(TableCell())
+                        milestones_row.cells.append(Cell())
 
                 visit_timing = ""
 
@@ -1265,24 +1263,24 @@ class StudyFlowchartService:
 
                 # Visit name cell
                 visits_row.cells.append(
-                    TableCell(
+                    Cell(
                         visit_name,
                         style="header2",
                         refs=[
-                            Ref(type_=SoAItemType.STUDY_VISIT.value, uid=vis.uid)
+                            CellRef(type=SoAItemType.STUDY_VISIT.value, uid=vis.uid)
                             for vis in group
                         ],
                     )
                 )
 
                 # Visit timing cell
-                timing_row.cells.append(TableCell(visit_timing, style="header3"))
+                timing_row.cells.append(Cell(visit_timing, style="header3"))
 
                 # Visit window
                 visit_window = cls._get_visit_window(visit)
 
                 # Visit window cell
-                window_row.cells.append(TableCell(visit_window, style="header4"))
+                window_row.cells.append(Cell(visit_window, style="header4"))
 
         if layout == SoALayout.PROTOCOL:
             # amend procedure label on protocol SoA
@@ -1370,7 +1368,7 @@ class StudyFlowchartService:
         study_activity_schedules: Sequence[StudyActivitySchedule],
         grouped_visits: dict[str, dict[str, list[StudyVisit]]],
         layout: SoALayout,
-    ) -> list[TableRow]:
+    ) -> list[Row]:
         """Builds activity rows also adding various group header rows when required"""
 
         # Ordered StudyVisit.uids of visits to show (showing only the first visit of a consecutive_visit_group)
@@ -1448,8 +1446,8 @@ class StudyFlowchartService:
                     prev_activity_group_uids.add(study_activity_group_uid)
                     activity_group_row.cells[0].refs.insert(
                         -1,
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_GROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_GROUP.value,
                             uid=study_selection_activity.study_activity_group.study_activity_group_uid,
                         ),
                     )
@@ -1489,8 +1487,8 @@ class StudyFlowchartService:
                     # Reference uids of merged StudyActivitySubGroups
                     activity_subgroup_row.cells[0].refs.insert(
                         -1,
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
                             uid=study_selection_activity.study_activity_subgroup.study_activity_subgroup_uid,
                         ),
                     )
@@ -1542,10 +1540,10 @@ class StudyFlowchartService:
             StudySelectionActivity | StudySelectionActivityInstance
         ),
         layout: SoALayout,
-    ) -> TableRow:
-        """returns TableRow for Activity"""
+    ) -> Row:
+        """returns Row for Activity"""
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.order,
             level=4,
             hide=not getattr(
@@ -1560,24 +1558,24 @@ class StudyFlowchartService:
 
         if layout == SoALayout.OPERATIONAL:
             for _ in range(NUM_OPERATIONAL_CODE_ROWS):
-                row.cells.append(TableCell())
+                row.cells.append(Cell())
 
         return row
 
     @staticmethod
     def _get_study_activity_cell(
         study_selection_activity: StudySelectionActivity,
-    ) -> TableCell:
-        return TableCell(
+    ) -> Cell:
+        return Cell(
             study_selection_activity.activity.name,
             style="activity",
             refs=[
-                Ref(
-                    type_=SoAItemType.STUDY_ACTIVITY.value,
+                CellRef(
+                    type=SoAItemType.STUDY_ACTIVITY.value,
                     uid=study_selection_activity.study_activity_uid,
                 ),
-                Ref(
-                    type_="Activity",
+                CellRef(
+                    type="Activity",
                     uid=study_selection_activity.activity.uid,
                 ),
             ],
@@ -1585,14 +1583,14 @@ class StudyFlowchartService:
 
     @staticmethod
     def _append_activity_crosses(
-        row: TableRow,
+        row: Row,
         visit_groups: Iterable[list[StudyVisit]],
         study_activity_schedules_mapping: Mapping[
             tuple[str, str], StudyActivitySchedule
         ],
         activity_id: str,
     ) -> None:
-        """appends TableCells to TableRow with crosses based on Activity Schedules to StudyVisit mapping"""
+        """appends Cells to Row with crosses based on Activity Schedules to StudyVisit mapping"""
 
         # Iterate over visit groups to look up scheduled Activities
         for visit_group in visit_groups:
@@ -1615,12 +1613,12 @@ class StudyFlowchartService:
             # Append a cell with check-mark if Activities are scheduled
             if study_activity_schedule_uids:
                 row.cells.append(
-                    TableCell(
+                    Cell(
                         SOA_CHECK_MARK,
                         style="activitySchedule",
                         refs=[
-                            Ref(
-                                type_=SoAItemType.STUDY_ACTIVITY_SCHEDULE.value,
+                            CellRef(
+                                type=SoAItemType.STUDY_ACTIVITY_SCHEDULE.value,
                                 uid=uid,
                             )
                             for uid in study_activity_schedule_uids
@@ -1630,15 +1628,15 @@ class StudyFlowchartService:
 
             # Append an empty cell if no Activity is scheduled
             else:
-                row.cells.append(TableCell())
+                row.cells.append(Cell())
 
     @staticmethod
     def _get_activity_instance_row(
         study_selection_activity: StudySelectionActivityInstance,
-    ) -> TableRow:
-        """returns TableRow for Activity Instance row"""
+    ) -> Row:
+        """returns Row for Activity Instance row"""
 
-        row = TableRow(
+        row = Row(
             hide=not getattr(
                 study_selection_activity,
                 "show_activity_instance_in_protocol_flowchart",
@@ -1648,12 +1646,12 @@ class StudyFlowchartService:
 
         # Activity name cell (Activity row first column)
         row.cells.append(
-            TableCell(
+            Cell(
                 study_selection_activity.activity_instance.name,
                 style="activityInstance",
                 refs=[
-                    Ref(
-                        type_=SoAItemType.STUDY_ACTIVITY_INSTANCE.value,
+                    CellRef(
+                        type=SoAItemType.STUDY_ACTIVITY_INSTANCE.value,
                         uid=study_selection_activity.study_activity_instance_uid,
                     )
                 ],
@@ -1661,10 +1659,10 @@ class StudyFlowchartService:
         )
 
         row.cells.append(
-            TableCell(study_selection_activity.activity_instance.topic_code or "")
+            Cell(study_selection_activity.activity_instance.topic_code or "")
         )
         row.cells.append(
-            TableCell(study_selection_activity.activity_instance.adam_param_code or "")
+            Cell(study_selection_activity.activity_instance.adam_param_code or "")
         )
 
         return row
@@ -1674,10 +1672,10 @@ class StudyFlowchartService:
         cls,
         study_selection_activity: StudySelectionActivity,
         num_cols: int,
-    ) -> TableRow:
-        """returns TableRow for SoA Group row"""
+    ) -> Row:
+        """returns Row for SoA Group row"""
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.study_soa_group.order,
             level=1,
             hide=not getattr(
@@ -1690,22 +1688,22 @@ class StudyFlowchartService:
         )
 
         # fill the row with empty cells for visits #
-        row.cells += [TableCell() for _ in range(num_cols - 1)]
+        row.cells += [Cell() for _ in range(num_cols - 1)]
 
         return row
 
     @staticmethod
-    def _get_soa_group_cell(study_soa_group: StudySoAGroup) -> TableCell:
-        return TableCell(
+    def _get_soa_group_cell(study_soa_group: StudySoAGroup) -> Cell:
+        return Cell(
             study_soa_group.soa_group_term_name,
             style="soaGroup",
             refs=[
-                Ref(
-                    type_=SoAItemType.STUDY_SOA_GROUP.value,
+                CellRef(
+                    type=SoAItemType.STUDY_SOA_GROUP.value,
                     uid=study_soa_group.study_soa_group_uid,
                 ),
-                Ref(
-                    type_="CTTerm",
+                CellRef(
+                    type="CTTerm",
                     uid=study_soa_group.soa_group_term_uid,
                 ),
             ],
@@ -1715,8 +1713,8 @@ class StudyFlowchartService:
     def _get_activity_group_row(
         study_selection_activity: StudySelectionActivity,
         num_cols: int,
-    ) -> TableRow:
-        """returns TableRow for Activity Group row"""
+    ) -> Row:
+        """returns Row for Activity Group row"""
 
         group_name = (
             study_selection_activity.study_activity_group.activity_group_name
@@ -1724,7 +1722,7 @@ class StudyFlowchartService:
             else _T("no_study_group")
         )
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.study_activity_group.order,
             level=2,
             hide=not getattr(
@@ -1735,17 +1733,17 @@ class StudyFlowchartService:
         )
 
         row.cells.append(
-            TableCell(
+            Cell(
                 group_name,
                 style="group",
                 refs=(
                     [
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_GROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_GROUP.value,
                             uid=study_selection_activity.study_activity_group.study_activity_group_uid,
                         ),
-                        Ref(
-                            type_="ActivityGroup",
+                        CellRef(
+                            type="ActivityGroup",
                             uid=study_selection_activity.study_activity_group.activity_group_uid,
                         ),
                     ]
@@ -1756,29 +1754,29 @@ class StudyFlowchartService:
         )
 
         # fill the row with empty cells for visits #
-        row.cells += [TableCell() for _ in range(num_cols - 1)]
+        row.cells += [Cell() for _ in range(num_cols - 1)]
 
         return row
 
     @staticmethod
-    def _get_activity_group_cell(study_activity_group: StudyActivityGroup) -> TableCell:
+    def _get_activity_group_cell(study_activity_group: StudyActivityGroup) -> Cell:
         name = (
             study_activity_group.activity_group_name
             if study_activity_group.activity_group_uid
             else _T("no_study_group")
         )
 
-        return TableCell(
+        return Cell(
             name,
             style="group",
             refs=(
                 [
-                    Ref(
-                        type_=SoAItemType.STUDY_ACTIVITY_GROUP.value,
+                    CellRef(
+                        type=SoAItemType.STUDY_ACTIVITY_GROUP.value,
                         uid=study_activity_group.study_activity_group_uid,
                     ),
-                    Ref(
-                        type_="ActivityGroup",
+                    CellRef(
+                        type="ActivityGroup",
                         uid=study_activity_group.activity_group_uid,
                     ),
                 ]
@@ -1791,8 +1789,8 @@ class StudyFlowchartService:
     def _get_activity_subgroup_row(
         study_selection_activity: StudySelectionActivity,
         num_cols: int,
-    ) -> TableRow:
-        """returns TableRow for Activity SubGroup row"""
+    ) -> Row:
+        """returns Row for Activity SubGroup row"""
 
         group_name = (
             study_selection_activity.study_activity_subgroup.activity_subgroup_name
@@ -1800,7 +1798,7 @@ class StudyFlowchartService:
             else _T("no_study_subgroup")
         )
 
-        row = TableRow(
+        row = Row(
             order=study_selection_activity.study_activity_subgroup.order,
             level=3,
             hide=not getattr(
@@ -1811,17 +1809,17 @@ class StudyFlowchartService:
         )
 
         row.cells.append(
-            TableCell(
+            Cell(
                 group_name,
                 style="subGroup",
                 refs=(
                     [
-                        Ref(
-                            type_=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
+                        CellRef(
+                            type=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
                             uid=study_selection_activity.study_activity_subgroup.study_activity_subgroup_uid,
                         ),
-                        Ref(
-                            type_="ActivitySubGroup",
+                        CellRef(
+                            type="ActivitySubGroup",
                             uid=study_selection_activity.study_activity_subgroup.activity_subgroup_uid,
                         ),
                     ]
@@ -1832,31 +1830,31 @@ class StudyFlowchartService:
         )
 
         # fill the row with empty cells for visits #
-        row.cells += [TableCell() for _ in range(num_cols - 1)]
+        row.cells += [Cell() for _ in range(num_cols - 1)]
 
         return row
 
     @staticmethod
     def _get_activity_subgroup_cell(
         study_activity_subgroup: StudyActivitySubGroup,
-    ) -> TableCell:
+    ) -> Cell:
         name = (
             study_activity_subgroup.activity_subgroup_name
             if study_activity_subgroup.activity_subgroup_uid
             else _T("no_study_subgroup")
         )
 
-        return TableCell(
+        return Cell(
             name,
             style="subGroup",
             refs=(
                 [
-                    Ref(
-                        type_=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
+                    CellRef(
+                        type=SoAItemType.STUDY_ACTIVITY_SUBGROUP.value,
                         uid=study_activity_subgroup.study_activity_subgroup_uid,
                     ),
-                    Ref(
-                        type_="ActivitySubGroup",
+                    CellRef(
+                        type="ActivitySubGroup",
                         uid=study_activity_subgroup.activity_subgroup_uid,
                     ),
                 ]
@@ -1869,7 +1867,7 @@ class StudyFlowchartService:
     @trace_calls
     def add_footnotes(
         cls,
-        table: TableWithFootnotes,
+        table: Table,
         footnotes: list[StudySoAFootnote],
     ):
         """Adds footnote symbols to table rows based on the referenced uids"""
@@ -1889,17 +1887,17 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def show_hidden_rows(rows: Iterable[TableRow]):
+    def show_hidden_rows(rows: Iterable[Row]):
         """Unhides all rows in-place"""
 
-        row: TableRow
+        row: Row
         for row in rows:
             # unhide all rows
             row.hide = False
 
     @staticmethod
     @trace_calls
-    def remove_hidden_rows(table: TableWithFootnotes):
+    def remove_hidden_rows(table: Table):
         """Removes hidden rows from table"""
 
         hidden_header_rows_count = sum(
@@ -1910,7 +1908,7 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def propagate_hidden_rows(rows: Iterable[TableRow], propagate_refs: bool = False):
+    def propagate_hidden_rows(rows: Iterable[Row], propagate_refs: bool = False):
         """
         Modify table in place to for Protocol SoA
 
@@ -1921,7 +1919,7 @@ class StudyFlowchartService:
         activity_group_row = None
         activity_subgroup_row = None
 
-        row: TableRow
+        row: Row
         for row in rows:
             if not (row.cells and row.cells[0].refs):
                 continue
@@ -1952,9 +1950,9 @@ class StudyFlowchartService:
                     update_row = soa_group_term_row
 
                 if update_row and len(update_row.cells) == len(row.cells):
-                    cell: TableCell
+                    cell: Cell
                     for i, cell in enumerate(row.cells):
-                        update_cell: TableCell = update_row.cells[i]
+                        update_cell: Cell = update_row.cells[i]
 
                         if i > 0:
                             update_cell.text = update_cell.text or cell.text
@@ -1969,21 +1967,21 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def add_protocol_section_column(table: TableWithFootnotes):
+    def add_protocol_section_column(table: Table):
         """Add Protocol Section column to table, updates table in place"""
 
         table.rows[0].cells.insert(
             table.num_header_cols,
-            TableCell(text=_T("protocol_section"), style="header1"),
+            Cell(text=_T("protocol_section"), style="header1"),
         )
 
-        row: TableRow
+        row: Row
         for row in table.rows[1:]:
-            row.cells.insert(table.num_header_cols, TableCell())
+            row.cells.insert(table.num_header_cols, Cell())
 
     @staticmethod
     @trace_calls
-    def amend_procedure_label(rows: Iterable[TableRow]):
+    def amend_procedure_label(rows: Iterable[Row]):
         """Overwrite text in the first column of the first visible row (among the first two rows)"""
         for row in rows[: min(3, len(rows))]:
             if not row.hide:
@@ -1992,9 +1990,7 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def add_coordinates(
-        table: TableWithFootnotes, coordinates: Mapping[str, tuple[int, int]]
-    ):
+    def add_coordinates(table: Table, coordinates: Mapping[str, tuple[int, int]]):
         """Append coordinates as if they were footnote references to each table cell"""
         for row in table.rows:
             for cell in row.cells:
@@ -2007,7 +2003,7 @@ class StudyFlowchartService:
 
     @staticmethod
     @trace_calls
-    def add_uid_debug(table: TableWithFootnotes):
+    def add_uid_debug(table: Table):
         """Append coordinates as if they were footnote references to each table cell"""
         for row in table.rows:
             for cell in row.cells:
@@ -2236,7 +2232,7 @@ class StudyFlowchartService:
         study_value_version: str | None = None,
         layout: SoALayout = SoALayout.PROTOCOL,
         time_unit: str | None = None,
-    ) -> TableWithFootnotes:
+    ) -> Table:
         """Loads SoA snapshot from db, and reconstructs SoA table and footnotes"""
 
         self._study_service.check_if_study_uid_and_version_exists(
@@ -2327,30 +2323,30 @@ class StudyFlowchartService:
             msg=f"Study with uid '{study_uid}' and version '{study_value_version}' has insufficient data in SoA snapshot",
         )
 
-        table = TableWithFootnotes(
+        table = Table(
             rows=[
-                TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
+                Row(cells=[Cell() for _ in range(num_cols)], hide=False)
                 for _ in range(num_rows)
             ],
             num_header_cols=1,
             title=_T("protocol_flowchart"),
         )
 
-        epoch_row = TableRow(
-            cells=[TableCell(span=0) for _ in range(num_cols)],
+        epoch_row = Row(
+            cells=[Cell(span=0) for _ in range(num_cols)],
             hide=not (layout == SoALayout.OPERATIONAL or soa_preferences.show_epochs),
         )
-        epoch_row.cells[0] = TableCell(text=_T("study_epoch"), style="header1")
+        epoch_row.cells[0] = Cell(text=_T("study_epoch"), style="header1")
 
         for col_idx, ref in epoch_references.items():
             study_epoch = study_epochs_by_uid[ref.referenced_item.item_uid]
-            epoch_row.cells[col_idx] = TableCell(
+            epoch_row.cells[col_idx] = Cell(
                 text=study_epoch.epoch_name,
                 span=ref.span,
                 style="header1",
                 refs=[
-                    Ref(
-                        type_=ref.referenced_item.item_type.value,
+                    CellRef(
+                        type=ref.referenced_item.item_type.value,
                         uid=study_epoch.uid,
                     )
                 ],
@@ -2360,25 +2356,25 @@ class StudyFlowchartService:
             for i in range(1, ref.span):
                 epoch_row.cells[col_idx + i].span = 0
 
-        milestone_row = TableRow(
-            cells=[TableCell() for _ in range(num_cols)],
+        milestone_row = Row(
+            cells=[Cell() for _ in range(num_cols)],
             hide=(
                 layout == SoALayout.OPERATIONAL or not soa_preferences.show_milestones
             ),
         )
-        milestone_row.cells[0] = TableCell(text=_T("study_milestone"), style="header1")
+        milestone_row.cells[0] = Cell(text=_T("study_milestone"), style="header1")
 
-        visit_row = TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
-        visit_row.cells[0] = TableCell(text=_T("visit_short_name"), style="header2")
+        visit_row = Row(cells=[Cell() for _ in range(num_cols)], hide=False)
+        visit_row.cells[0] = Cell(text=_T("visit_short_name"), style="header2")
 
-        timing_row = TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
+        timing_row = Row(cells=[Cell() for _ in range(num_cols)], hide=False)
         if time_unit == "day":
-            timing_row.cells[0] = TableCell(text=_T("study_day"), style="header3")
+            timing_row.cells[0] = Cell(text=_T("study_day"), style="header3")
         else:
-            timing_row.cells[0] = TableCell(text=_T("study_week"), style="header3")
+            timing_row.cells[0] = Cell(text=_T("study_week"), style="header3")
         visit_timing_prop = self._get_visit_timing_property(time_unit, soa_preferences)
 
-        window_row = TableRow(cells=[TableCell() for _ in range(num_cols)], hide=False)
+        window_row = Row(cells=[Cell() for _ in range(num_cols)], hide=False)
         visit_window_unit = next(
             (
                 study_visits_by_uid[ref.referenced_item.item_uid].visit_window_unit_name
@@ -2388,7 +2384,7 @@ class StudyFlowchartService:
             "",
         )
         # Append window unit used by all StudyVisits
-        window_row.cells[0] = TableCell(
+        window_row.cells[0] = Cell(
             text=_T("visit_window").format(unit_name=visit_window_unit), style="header4"
         )
 
@@ -2409,17 +2405,17 @@ class StudyFlowchartService:
                 else:
                     # Different visit_type, new label in Milestones row
                     prev_visit_type_uid = visit.visit_type_uid
-                    milestone_row.cells[col_idx] = prev_milestone_cell = TableCell(
+                    milestone_row.cells[col_idx] = prev_milestone_cell = Cell(
                         visit.visit_type.sponsor_preferred_name,
                         style="header1",
                     )
 
-            visit_row.cells[col_idx] = TableCell(
+            visit_row.cells[col_idx] = Cell(
                 self._get_visit_name(visit, num_visits_in_group=len(visits_in_group)),
                 style="header2",
                 refs=[
-                    Ref(
-                        type_=ref.referenced_item.item_type.value,
+                    CellRef(
+                        type=ref.referenced_item.item_type.value,
                         uid=ref.referenced_item.item_uid,
                     )
                     for ref in refs
@@ -2428,12 +2424,12 @@ class StudyFlowchartService:
                 footnotes=[fr.symbol for fr in refs[0].footnote_references] or None,
             )
 
-            timing_row.cells[col_idx] = TableCell(
+            timing_row.cells[col_idx] = Cell(
                 self._get_visit_timing(visits_in_group, visit_timing_prop),
                 style="header3",
             )
 
-            window_row.cells[col_idx] = TableCell(
+            window_row.cells[col_idx] = Cell(
                 self._get_visit_window(visit), style="header4"
             )
 
@@ -2479,8 +2475,8 @@ class StudyFlowchartService:
                 # add refs only for non-propagated rows to avoid footnote propagation
                 if not ref.is_propagated:
                     cell.refs = [
-                        Ref(
-                            type_=ref.referenced_item.item_type.value,
+                        CellRef(
+                            type=ref.referenced_item.item_type.value,
                             uid=ref.referenced_item.item_uid,
                         )
                     ]
@@ -2491,8 +2487,8 @@ class StudyFlowchartService:
             if not ref.is_propagated:
                 # append remaining refs to cell to exactly match result of get_soa_flowchart()
                 add_refs = [
-                    Ref(
-                        type_=ref.referenced_item.item_type.value,
+                    CellRef(
+                        type=ref.referenced_item.item_type.value,
                         uid=ref.referenced_item.item_uid,
                     )
                     for ref in refs[1:]
@@ -2572,7 +2568,7 @@ class StudyFlowchartService:
     @staticmethod
     @trace_calls
     def _extract_soa_footnote_refs(
-        table: TableWithFootnotes,
+        table: Table,
     ) -> list[SoAFootnoteReference]:
         footnote_references = [
             SoAFootnoteReference(
@@ -2605,10 +2601,10 @@ class StudyFlowchartService:
         return visits
 
     @staticmethod
-    def _get_visit_refs(header_rows: Iterable[TableRow]) -> dict[int, Ref]:
+    def _get_visit_refs(header_rows: Iterable[Row]) -> dict[int, CellRef]:
         """Extracts StudyVisit references from SoA table header rows, indexed by column index"""
 
-        visit_refs: dict[int, Ref] = {}
+        visit_refs: dict[int, CellRef] = {}
 
         for i, cell in enumerate(header_rows[-3].cells):
             if cell.refs:
@@ -2624,7 +2620,7 @@ class StudyFlowchartService:
     @staticmethod
     @trace_calls
     def _extract_soa_cell_refs(
-        table: TableWithFootnotes, layout: SoALayout
+        table: Table, layout: SoALayout
     ) -> list[SoACellReference]:
         """Extracts SoA cell references from SoA table
 
@@ -2638,7 +2634,7 @@ class StudyFlowchartService:
         def collect_cell_references(
             row_idx: int,
             col_idx: int,
-            cell: TableCell,
+            cell: Cell,
             accepted_ref_types: Iterable[str],
             is_propagated=False,
             order: int = 0,
@@ -2691,7 +2687,7 @@ class StudyFlowchartService:
                     (
                         layout == SoALayout.OPERATIONAL
                         and SoAItemType.STUDY_ACTIVITY_INSTANCE.value
-                        # No Ref.type will match with False as Ref.type cannot be bool by model definition
+                        # No CellRef.type will match with False as CellRef.type cannot be bool by model definition
                     ),
                 },
             )
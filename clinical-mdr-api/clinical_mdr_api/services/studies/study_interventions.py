@@ -20,9 +20,9 @@ from clinical_mdr_api.services.studies.study_compound_selection import (
     StudyCompoundSelectionService,
 )
 from clinical_mdr_api.services.utils.table_f import (
-    TableCell,
-    TableRow,
-    TableWithFootnotes,
+    Cell,
+    Row,
+    Table,
     table_to_docx,
     table_to_html,
 )
@@ -62,7 +62,7 @@ DOCX_STYLES = {
 
 
 class StudyInterventionsService:
-    def get_table(self, study_uid: str) -> TableWithFootnotes:
+    def get_table(self, study_uid: str) -> Table:
         compounds = self._get_study_compounds(study_uid)
         arms = self._get_arms_for_compounds(study_uid)
         dosings = self._get_compound_dosings(study_uid)
@@ -84,8 +84,8 @@ class StudyInterventionsService:
         compounds: list[StudySelectionCompound],
         arms: Mapping[str, list[StudySelectionArm]],
         dosings: Mapping[str, list[StudyCompoundDosing]],
-    ) -> TableWithFootnotes:
-        table = TableWithFootnotes(
+    ) -> Table:
+        table = Table(
             num_header_rows=1,
             num_header_cols=1,
             title=_gettext("study_interventions"),
@@ -93,47 +93,39 @@ class StudyInterventionsService:
         )
 
         table.rows.append(
-            row := TableRow(
-                cells=[
-                    TableCell(
-                        text=_gettext("intervention_or_arm_name"), style="header1"
-                    )
-                ]
+            row := Row(
+                cells=[Cell(text=_gettext("intervention_or_arm_name"), style="header1")]
             )
         )
         for cmp in compounds:
             row.cells.append(
-                TableCell(
+                Cell(
                     text=StudyInterventionsService._arm_txt(cmp, arms), style="header2"
                 )
             )
 
         table.rows.append(
-            row := TableRow(
-                cells=[TableCell(text=_gettext("intervention_name"), style="header2")]
+            row := Row(
+                cells=[Cell(text=_gettext("intervention_name"), style="header2")]
             )
         )
         for cmp in compounds:
-            row.cells.append(
-                TableCell(text=cmp.compound.name if cmp.compound.name else "")
-            )
+            row.cells.append(Cell(text=cmp.compound.name if cmp.compound.name else ""))
 
         table.rows.append(
-            row := TableRow(
-                cells=[TableCell(text=_gettext("intervention_type"), style="header2")]
+            row := Row(
+                cells=[Cell(text=_gettext("intervention_type"), style="header2")]
             )
         )
         for cmp in compounds:
             row.cells.append(
-                TableCell(
-                    text=cmp.type_of_treatment.name if cmp.type_of_treatment else ""
-                )
+                Cell(text=cmp.type_of_treatment.name if cmp.type_of_treatment else "")
             )
 
         table.rows.append(
-            row := TableRow(
+            row := Row(
                 cells=[
-                    TableCell(
+                    Cell(
                         text=_gettext("investigational_or_non_investigational"),
                         style="header2",
                     )
@@ -141,28 +133,28 @@ class StudyInterventionsService:
             )
         )
         for _ in compounds:
-            row.cells.append(TableCell(text="?"))  # TODO
+            row.cells.append(Cell(text="?"))  # TODO
 
         # table.rows.append(
-        #     row := TableRow(
-        #         cells=[TableCell(text=_gettext("pharmaceutical_form"), style="header2")]
+        #     row := Row(
+        #         cells=[Cell(text=_gettext("pharmaceutical_form"), style="header2")]
         #     )
         # )
         # for cmp in compounds:
         #     row.cells.append(
-        #         TableCell(text=cmp.dosage_form.name if cmp.dosage_form else "")
+        #         Cell(text=cmp.dosage_form.name if cmp.dosage_form else "")
         #     )
 
         # table.rows.append(
-        #     row := TableRow(
+        #     row := Row(
         #         cells=[
-        #             TableCell(text=_gettext("route_of_administration"), style="header2")
+        #             Cell(text=_gettext("route_of_administration"), style="header2")
         #         ]
         #     )
         # )
         # for cmp in compounds:
         #     row.cells.append(
-        #         TableCell(
+        #         Cell(
         #             text=cmp.route_of_administration.name
         #             if cmp.route_of_administration
         #             else ""
@@ -170,12 +162,12 @@ class StudyInterventionsService:
         #     )
 
         # table.rows.append(
-        #     row := TableRow(
-        #         cells=[TableCell(text=_gettext("medical_device"), style="header2")]
+        #     row := Row(
+        #         cells=[Cell(text=_gettext("medical_device"), style="header2")]
         #     )
         # )
         # for cmp in compounds:
-        #     row.cells.append(cell := TableCell())
+        #     row.cells.append(cell := Cell())
         #     mapping = {
         #         "device": cmp.delivery_device.name
         #         if cmp.delivery_device
@@ -187,14 +179,14 @@ class StudyInterventionsService:
         #     cell.text = _gettext("medical_device_template").format_map(mapping)
 
         # table.rows.append(
-        #     row := TableRow(
+        #     row := Row(
         #         cells=[
-        #             TableCell(text=_gettext("trial_product_strength"), style="header2")
+        #             Cell(text=_gettext("trial_product_strength"), style="header2")
         #         ]
         #     )
         # )
         # for cmp in compounds:
-        #     row.cells.append(cell := TableCell())
+        #     row.cells.append(cell := Cell())
         #     if cmp.strength_value:
         #         mapping = {
         #             "unit": cmp.strength_value.unit_label,
@@ -205,19 +197,19 @@ class StudyInterventionsService:
         #         )
 
         # table.rows.append(
-        #     row := TableRow(
-        #         cells=[TableCell(text=_gettext("dose_and_frequency"), style="header2")]
+        #     row := Row(
+        #         cells=[Cell(text=_gettext("dose_and_frequency"), style="header2")]
         #     )
         # )
         # for cmp in compounds:
         #     row.cells.append(
-        #         TableCell(text=StudyInterventionsService._dosing_txt(cmp, dosings))
+        #         Cell(text=StudyInterventionsService._dosing_txt(cmp, dosings))
         #     )
 
         # table.rows.append(
-        #     row := TableRow(
+        #     row := Row(
         #         cells=[
-        #             TableCell(
+        #             Cell(
         #                 text=_gettext("dosing_and_administration"), style="header2"
         #             )
         #         ]
@@ -225,48 +217,40 @@ class StudyInterventionsService:
         # )
         # for cmp in compounds:
         #     row.cells.append(
-        #         TableCell(text=cmp.other_info or _gettext("no_information"))
+        #         Cell(text=cmp.other_info or _gettext("no_information"))
         #     )
 
         table.rows.append(
-            row := TableRow(
+            row := Row(
                 cells=[
-                    TableCell(
-                        text=_gettext("transfer_from_other_therapy"), style="header2"
-                    )
+                    Cell(text=_gettext("transfer_from_other_therapy"), style="header2")
                 ]
             )
         )
         for _ in compounds:
-            row.cells.append(TableCell(text="?"))  # TODO
+            row.cells.append(Cell(text="?"))  # TODO
 
         table.rows.append(
-            row := TableRow(
-                cells=[TableCell(text=_gettext("sourcing"), style="header2")]
-            )
+            row := Row(cells=[Cell(text=_gettext("sourcing"), style="header2")])
         )
         for _ in compounds:
-            row.cells.append(TableCell(text="?"))  # TODO
+            row.cells.append(Cell(text="?"))  # TODO
 
         table.rows.append(
-            row := TableRow(
-                cells=[
-                    TableCell(text=_gettext("packaging_and_labelling"), style="header2")
-                ]
+            row := Row(
+                cells=[Cell(text=_gettext("packaging_and_labelling"), style="header2")]
             )
         )
         for _ in compounds:
-            row.cells.append(TableCell(text="?"))  # TODO
+            row.cells.append(Cell(text="?"))  # TODO
 
         table.rows.append(
-            row := TableRow(
-                cells=[
-                    TableCell(text=_gettext("authorisation_status_in"), style="header2")
-                ]
+            row := Row(
+                cells=[Cell(text=_gettext("authorisation_status_in"), style="header2")]
             )
         )
         for _ in compounds:
-            row.cells.append(TableCell(text="?"))  # TODO
+            row.cells.append(Cell(text="?"))  # TODO
 
         return table
 
@@ -43,6 +43,7 @@ from clinical_mdr_api.services._utils import (
 )
 from clinical_mdr_api.services.studies.study_selection_base import StudySelectionMixin
 from clinical_mdr_api.services.syntax_instances.objectives import ObjectiveService
+from common import config as settings
 from common import exceptions
 from common.auth.user import user
 
@@ -99,15 +100,27 @@ class StudyObjectiveSelectionService(StudySelectionMixin):
         study_selection: StudySelectionObjectivesAR,
         no_brackets: bool,
         study_value_version: str | None = None,
+        selection_uids: list[str] | None = None,
     ) -> list[StudySelectionObjective]:
         result = []
         terms_at_specific_datetime = self._extract_study_standards_effective_date(
             study_uid=study_selection.study_uid,
             study_value_version=study_value_version,
         )
-        for order, selection in enumerate(
-            study_selection.study_objectives_selection, start=1
-        ):
+        selections = self._ordered_selections(
+            study_selection.study_objectives_selection, selection_uids
+        )
+        self._loader.prime_terms(
+            (
+                selection.objective_level_uid
+                for _, selection in selections
+                if selection.is_instance
+            ),
+            status=LibraryItemStatus.FINAL,
+            at_specific_date=terms_at_specific_datetime,
+            codelist_name=settings.STUDY_OBJECTIVE_LEVEL_NAME,
+        )
+        for order, selection in selections:
             if selection.is_instance:
                 result.append(
                     StudySelectionObjective.from_study_selection_objectives_ar_and_order(
@@ -759,6 +772,30 @@ class StudyObjectiveSelectionService(StudySelectionMixin):
                 )
                 return GenericFilteringReturn.create(filtered_items, count)
 
+            objective_repo = repos.study_objective_repository
+            if self._is_page_query(
+                objective_repo.page_fields, filter_by, sort_by, no_brackets
+            ):
+                # Filtering only needs data that can be queried in the database,
+                # so that only the returned page is transformed to the response model
+                selection_uids, count = objective_repo.find_page_by_study(
+                    study_uid,
+                    study_value_version=study_value_version,
+                    filter_by=filter_by,
+                    filter_operator=filter_operator,
+                    sort_by=sort_by,
+                    page_number=page_number,
+                    page_size=page_size,
+                    total_count=total_count,
+                )
+                filtered_items = self._transform_all_to_response_model(
+                    objective_selection_ar,
+                    no_brackets=no_brackets,
+                    study_value_version=study_value_version,
+                    selection_uids=selection_uids,
+                )
+                return GenericFilteringReturn.create(filtered_items, count)
+
             # Fall back to full generic filtering
             selections = []
             parsed_selections = self._transform_all_to_response_model(
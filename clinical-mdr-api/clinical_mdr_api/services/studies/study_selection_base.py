@@ -1,9 +1,12 @@
 """Base classes/mixins related to study selection."""
 
+from collections.abc import Hashable
 from datetime import datetime
-from typing import Sequence
+from functools import cached_property
+from typing import Any, Callable, Iterable, Sequence, TypeVar
 
 from clinical_mdr_api.domain_repositories.models.controlled_terminology import CTPackage
+from clinical_mdr_api.domains.controlled_terminologies.ct_term_name import CTTermNameAR
 from clinical_mdr_api.domains.versioned_object_aggregate import LibraryItemStatus
 from clinical_mdr_api.models.concepts.activities.activity import (
     ActivityForStudyActivity,
@@ -34,145 +37,272 @@ from clinical_mdr_api.models.syntax_templates.endpoint_template import EndpointT
 from clinical_mdr_api.models.syntax_templates.objective_template import (
     ObjectiveTemplate,
 )
+from clinical_mdr_api.repositories._utils import ComparisonOperator, FilterDict
 from common import exceptions
 
+_T = TypeVar("_T")
 
-class StudySelectionMixin:
-    def _transform_latest_endpoint_model(self, endpoint_uid: str) -> Endpoint:
-        endpoint_repo = self._repos.endpoint_repository
+
+class StudySelectionLoader:
+    """
+    Request-scoped loader of the CT terms and library items referenced by study selections.
+
+    The uids of the terms needed to build a list of selections are collected up front with `prime_terms`
+    and resolved with a single query per kind of lookup.
+    Everything loaded is memoized for the lifetime of the loader, i.e. of the service handling the request.
+    """
+
+    def __init__(self, repos):
+        self._repos = repos
+        self._terms: dict[tuple, CTTermNameAR | None] = {}
+        self._items: dict[Hashable, Any] = {}
+
+    def prime_terms(
+        self,
+        term_uids: Iterable[str | None],
+        status: LibraryItemStatus | None = None,
+        at_specific_date: datetime | None = None,
+        codelist_name: str | None = None,
+        include_retired_versions: bool = False,
+    ) -> None:
+        lookup = (status, at_specific_date, codelist_name, include_retired_versions)
+        missing = sorted(
+            {uid for uid in term_uids if uid and (uid, *lookup) not in self._terms}
+        )
+        if not missing:
+            return
         try:
-            endpoint = endpoint_repo.find_by_uid(
-                uid=endpoint_uid, status=LibraryItemStatus.FINAL
+            terms = self._repos.ct_term_name_repository.find_by_uids(
+                term_uids=missing,
+                status=status,
+                at_specific_date=at_specific_date,
+                codelist_name=codelist_name,
+                include_retired_versions=include_retired_versions,
             )
         except exceptions.NotFoundException:
-            endpoint = endpoint_repo.find_by_uid(
-                uid=endpoint_uid, status=LibraryItemStatus.RETIRED
+            # left to `find_term`, which reports the missing term
+            return
+        for term in terms:
+            self._terms[(term.uid, *lookup)] = term
+
+    def find_term(
+        self,
+        term_uid: str,
+        status: LibraryItemStatus | None = None,
+        at_specific_date: datetime | None = None,
+        codelist_name: str | None = None,
+        include_retired_versions: bool = False,
+    ) -> CTTermNameAR | None:
+        key = (
+            term_uid,
+            status,
+            at_specific_date,
+            codelist_name,
+            include_retired_versions,
+        )
+        if key not in self._terms:
+            self._terms[key] = self._repos.ct_term_name_repository.find_by_uid(
+                term_uid=term_uid,
+                at_specific_date=at_specific_date,
+                version=None,
+                status=status,
+                for_update=False,
+                codelist_name=codelist_name,
+                include_retired_versions=include_retired_versions,
             )
+        return self._terms[key]
+
+    def get(self, key: Hashable, load: Callable[[], _T]) -> _T:
+        """Returns the item stored under `key`, calling `load` to get it the first time"""
+        if key not in self._items:
+            self._items[key] = load()
+        return self._items[key]
+
+
+def _find_latest_final_or_retired(repository, uid: str):
+    try:
+        return repository.find_by_uid(uid=uid, status=LibraryItemStatus.FINAL)
+    except exceptions.NotFoundException:
+        return repository.find_by_uid(uid=uid, status=LibraryItemStatus.RETIRED)
+
+
+class StudySelectionMixin:
+    @cached_property
+    def _loader(self) -> StudySelectionLoader:
+        return StudySelectionLoader(self._repos)
+
+    @staticmethod
+    def _is_page_query(
+        page_fields: dict[str, str],
+        filter_by: dict | None,
+        sort_by: dict | None,
+        no_brackets: bool,
+    ) -> bool:
+        """
+        Whether the selections can be filtered, sorted and paginated by the `find_page_by_study` repository method,
+        i.e. only equal or contains filters and sort keys on the `page_fields` of the repository.
+        The names are stored with brackets, so they are filtered on the response model when brackets are removed.
+        """
+        fields = {
+            field
+            for field in page_fields
+            if not (no_brackets and field.endswith(".name"))
+        }
+        filters = FilterDict(elements=filter_by or {}).elements
+        return all(
+            key in fields
+            and element.op in (ComparisonOperator.EQUALS, ComparisonOperator.CONTAINS)
+            for key, element in filters.items()
+        ) and all(key in fields for key in sort_by or {})
+
+    @staticmethod
+    def _ordered_selections(
+        selections: Sequence[_T], selection_uids: list[str] | None = None
+    ) -> list[tuple[int, _T]]:
+        """
+        Returns the selections of an aggregate with their 1-based order,
+        limited to the given selection uids and in the same sequence when `selection_uids` is given.
+        """
+        ordered = list(enumerate(selections, start=1))
+        if selection_uids is None:
+            return ordered
+        by_uid = {
+            selection.study_selection_uid: (order, selection)
+            for order, selection in ordered
+        }
+        return [by_uid[uid] for uid in selection_uids if uid in by_uid]
+
+    def _transform_latest_endpoint_model(self, endpoint_uid: str) -> Endpoint:
+        endpoint = self._loader.get(
+            ("endpoint", endpoint_uid),
+            lambda: _find_latest_final_or_retired(
+                self._repos.endpoint_repository, endpoint_uid
+            ),
+        )
         return Endpoint.from_endpoint_ar(endpoint)
 
     def _transform_endpoint_model(
         self, endpoint_uid: str, objective_version: str
     ) -> Endpoint:
-        endpoint_repo = self._repos.endpoint_repository
-        endpoint = endpoint_repo.find_by_uid(
-            uid=endpoint_uid, version=objective_version
+        endpoint = self._loader.get(
+            ("endpoint", endpoint_uid, objective_version),
+            lambda: self._repos.endpoint_repository.find_by_uid(
+                uid=endpoint_uid, version=objective_version
+            ),
         )
         return Endpoint.from_endpoint_ar(endpoint)
 
     def _transform_latest_endpoint_template_model(
         self, endpoint_template_uid: str
     ) -> EndpointTemplate:
-        endpoint_template_repo = self._repos.endpoint_template_repository
-        try:
-            endpoint_template = endpoint_template_repo.find_by_uid(
-                uid=endpoint_template_uid, status=LibraryItemStatus.FINAL
-            )
-        except exceptions.NotFoundException:
-            endpoint_template = endpoint_template_repo.find_by_uid(
-                uid=endpoint_template_uid, status=LibraryItemStatus.RETIRED
-            )
+        endpoint_template = self._loader.get(
+            ("endpoint_template", endpoint_template_uid),
+            lambda: _find_latest_final_or_retired(
+                self._repos.endpoint_template_repository, endpoint_template_uid
+            ),
+        )
         return EndpointTemplate.from_endpoint_template_ar(endpoint_template)
 
     def _transform_endpoint_template_model(
         self, endpoint_template_uid: str, endpoint_template_version: str
     ) -> EndpointTemplate:
-        endpoint_template_repo = self._repos.endpoint_template_repository
-        endpoint_template = endpoint_template_repo.find_by_uid(
-            uid=endpoint_template_uid, version=endpoint_template_version
+        endpoint_template = self._loader.get(
+            ("endpoint_template", endpoint_template_uid, endpoint_template_version),
+            lambda: self._repos.endpoint_template_repository.find_by_uid(
+                uid=endpoint_template_uid, version=endpoint_template_version
+            ),
         )
         return EndpointTemplate.from_endpoint_template_ar(endpoint_template)
 
     def _transform_latest_objective_model(self, objective_uid: str) -> Objective:
-        objective_repo = self._repos.objective_repository
-        objective = objective_repo.find_by_uid(uid=objective_uid)
+        objective = self._loader.get(
+            ("objective", objective_uid),
+            lambda: self._repos.objective_repository.find_by_uid(uid=objective_uid),
+        )
         return Objective.from_objective_ar(objective)
 
     def _transform_objective_model(
         self, objective_uid: str, objective_version: str
     ) -> Objective:
-        objective_repo = self._repos.objective_repository
-        objective = objective_repo.find_by_uid(
-            uid=objective_uid, version=objective_version
+        objective = self._loader.get(
+            ("objective", objective_uid, objective_version),
+            lambda: self._repos.objective_repository.find_by_uid(
+                uid=objective_uid, version=objective_version
+            ),
         )
         return Objective.from_objective_ar(objective)
 
     def _transform_latest_objective_template_model(
         self, objective_template_uid: str
     ) -> ObjectiveTemplate:
-        objective_template_repo = self._repos.objective_template_repository
-        try:
-            objective_template = objective_template_repo.find_by_uid(
-                uid=objective_template_uid, status=LibraryItemStatus.FINAL
-            )
-        except exceptions.NotFoundException:
-            objective_template = objective_template_repo.find_by_uid(
-                uid=objective_template_uid, status=LibraryItemStatus.RETIRED
-            )
+        objective_template = self._loader.get(
+            ("objective_template", objective_template_uid),
+            lambda: _find_latest_final_or_retired(
+                self._repos.objective_template_repository, objective_template_uid
+            ),
+        )
         return ObjectiveTemplate.from_objective_template_ar(objective_template)
 
     def _transform_objective_template_model(
         self, objective_template_uid: str, objective_template_version: str
     ) -> ObjectiveTemplate:
-        objective_template_repo = self._repos.objective_template_repository
-        objective_template = objective_template_repo.find_by_uid(
-            uid=objective_template_uid, version=objective_template_version
+        objective_template = self._loader.get(
+            ("objective_template", objective_template_uid, objective_template_version),
+            lambda: self._repos.objective_template_repository.find_by_uid(
+                uid=objective_template_uid, version=objective_template_version
+            ),
         )
         return ObjectiveTemplate.from_objective_template_ar(objective_template)
 
     def _transform_latest_timeframe_model(self, timeframe_uid: str) -> Timeframe:
-        timeframe_repo = self._repos.timeframe_repository
-        try:
-            timeframe = timeframe_repo.find_by_uid(
-                uid=timeframe_uid, status=LibraryItemStatus.FINAL
-            )
-        except exceptions.NotFoundException:
-            timeframe = timeframe_repo.find_by_uid(
-                uid=timeframe_uid, status=LibraryItemStatus.RETIRED
-            )
+        timeframe = self._loader.get(
+            ("timeframe", timeframe_uid),
+            lambda: _find_latest_final_or_retired(
+                self._repos.timeframe_repository, timeframe_uid
+            ),
+        )
         return Timeframe.from_timeframe_ar(timeframe)
 
     def _transform_timeframe_model(
         self, timeframe_uid: str, timeframe_version: str
     ) -> Timeframe:
-        timeframe_repo = self._repos.timeframe_repository
-        timeframe = timeframe_repo.find_by_uid(
-            uid=timeframe_uid, version=timeframe_version
+        timeframe = self._loader.get(
+            ("timeframe", timeframe_uid, timeframe_version),
+            lambda: self._repos.timeframe_repository.find_by_uid(
+                uid=timeframe_uid, version=timeframe_version
+            ),
         )
         return Timeframe.from_timeframe_ar(timeframe)
 
     def _transform_latest_criteria_template_model(
         self, criteria_template_uid: str
     ) -> CriteriaTemplate:
-        criteria_template_repo = self._repos.criteria_template_repository
-        try:
-            criteria_template = criteria_template_repo.find_by_uid(
-                uid=criteria_template_uid, status=LibraryItemStatus.FINAL
-            )
-        except exceptions.NotFoundException:
-            criteria_template = criteria_template_repo.find_by_uid(
-                uid=criteria_template_uid, status=LibraryItemStatus.RETIRED
-            )
+        criteria_template = self._loader.get(
+            ("criteria_template", criteria_template_uid),
+            lambda: _find_latest_final_or_retired(
+                self._repos.criteria_template_repository, criteria_template_uid
+            ),
+        )
         return CriteriaTemplate.from_criteria_template_ar(criteria_template)
 
     def _transform_criteria_template_model(
         self, criteria_template_uid: str, criteria_template_version: str
     ) -> CriteriaTemplate:
-        criteria_template_repo = self._repos.criteria_template_repository
-        criteria_template = criteria_template_repo.find_by_uid(
-            uid=criteria_template_uid, version=criteria_template_version
+        criteria_template = self._loader.get(
+            ("criteria_template", criteria_template_uid, criteria_template_version),
+            lambda: self._repos.criteria_template_repository.find_by_uid(
+                uid=criteria_template_uid, version=criteria_template_version
+            ),
         )
         return CriteriaTemplate.from_criteria_template_ar(criteria_template)
 
     def _transform_latest_criteria_model(self, criteria_uid: str) -> Criteria:
-        criteria_repo = self._repos.criteria_repository
-        try:
-            criteria = criteria_repo.find_by_uid(
-                uid=criteria_uid, status=LibraryItemStatus.FINAL
-            )
-        except exceptions.NotFoundException:
-            criteria = criteria_repo.find_by_uid(
-                uid=criteria_uid, status=LibraryItemStatus.RETIRED
-            )
+        criteria = self._loader.get(
+            ("criteria", criteria_uid),
+            lambda: _find_latest_final_or_retired(
+                self._repos.criteria_repository, criteria_uid
+            ),
+        )
         return Criteria.from_criteria_ar(
             criteria,
         )
@@ -180,8 +310,12 @@ class StudySelectionMixin:
     def _transform_criteria_model(
         self, criteria_uid: str, criteria_version: str
     ) -> Criteria:
-        criteria_repo = self._repos.criteria_repository
-        criteria = criteria_repo.find_by_uid(uid=criteria_uid, version=criteria_version)
+        criteria = self._loader.get(
+            ("criteria", criteria_uid, criteria_version),
+            lambda: self._repos.criteria_repository.find_by_uid(
+                uid=criteria_uid, version=criteria_version
+            ),
+        )
         return Criteria.from_criteria_ar(
             criteria,
         )
@@ -190,8 +324,9 @@ class StudySelectionMixin:
         self, activity_uid: str
     ) -> ActivityForStudyActivity:
         """Finds the activity with a given UID."""
-        activity_ar = self._repos.activity_repository.find_by_uid_optimized(
-            activity_uid
+        activity_ar = self._loader.get(
+            ("activity", activity_uid),
+            lambda: self._repos.activity_repository.find_by_uid_optimized(activity_uid),
         )
         return ActivityForStudyActivity.from_activity_ar(activity_ar=activity_ar)
 
@@ -200,8 +335,11 @@ class StudySelectionMixin:
     ) -> ActivityForStudyActivity:
         """Finds the activity with given UID and version."""
         return ActivityForStudyActivity.from_activity_ar(
-            activity_ar=self._repos.activity_repository.find_by_uid_optimized(
-                activity_uid, version=activity_version
+            activity_ar=self._loader.get(
+                ("activity", activity_uid, activity_version),
+                lambda: self._repos.activity_repository.find_by_uid_optimized(
+                    activity_uid, version=activity_version
+                ),
             )
         )
 
@@ -237,12 +375,18 @@ class StudySelectionMixin:
         Finds the compound template parameter value with a given UID.
         """
         return Compound.from_compound_ar(
-            compound_ar=self._repos.compound_repository.find_by_uid_2(compound_uid),
+            compound_ar=self._loader.get(
+                ("compound", compound_uid),
+                lambda: self._repos.compound_repository.find_by_uid_2(compound_uid),
+            ),
         )
 
     def _transform_compound_alias_model(self, uid: str) -> CompoundAlias:
         return CompoundAlias.from_ar(
-            ar=self._repos.compound_alias_repository.find_by_uid_2(uid),
+            ar=self._loader.get(
+                ("compound_alias", uid),
+                lambda: self._repos.compound_alias_repository.find_by_uid_2(uid),
+            ),
             find_compound_by_uid=self._repos.compound_repository.find_by_uid_2,
         )
 
@@ -253,8 +397,9 @@ class StudySelectionMixin:
         if not uid:
             return None
         return MedicinalProduct.from_medicinal_product_ar(
-            medicinal_product_ar=self._repos.medicinal_product_repository.find_by_uid_2(
-                uid
+            medicinal_product_ar=self._loader.get(
+                ("medicinal_product", uid),
+                lambda: self._repos.medicinal_product_repository.find_by_uid_2(uid),
             ),
             find_term_by_uid=self._repos.ct_term_name_repository.find_by_uid,
             find_numeric_value_by_uid=self._repos.numeric_value_with_unit_repository.find_by_uid_2,
@@ -267,8 +412,9 @@ class StudySelectionMixin:
         """Helper function to find CT term names."""
         return SimpleTermModel.from_ct_code(
             uid,
-            self._repos.ct_term_name_repository.find_by_uid,
-            at_specific_date=at_specific_date,
+            lambda term_uid: self._loader.find_term(
+                term_uid, at_specific_date=at_specific_date
+            ),
         )
 
     def _find_by_uid_or_raise_not_found(
@@ -279,12 +425,10 @@ class StudySelectionMixin:
         at_specific_date: datetime | None = None,
         include_retired_versions: bool = False,
     ) -> CTTermName:
-        item = self._repos.ct_term_name_repository.find_by_uid(
-            term_uid=term_uid,
-            at_specific_date=at_specific_date,
-            version=None,
+        item = self._loader.find_term(
+            term_uid,
             status=status,
-            for_update=False,
+            at_specific_date=at_specific_date,
             codelist_name=codelist_name,
             include_retired_versions=include_retired_versions,
         )
@@ -1,7 +1,8 @@
 import dataclasses
 import datetime
-from typing import Any
+from typing import Collection
 
+from fastapi import status
 from neomodel import Q, db
 
 from clinical_mdr_api.domain_repositories.models.study_visit import (
@@ -49,6 +50,9 @@ from clinical_mdr_api.domains.concepts.unit_definitions.unit_definition import (
 from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
     StudyStatus,
 )
+from clinical_mdr_api.domains.study_selections.study_activity_schedule import (
+    StudyActivityScheduleVO,
+)
 from clinical_mdr_api.domains.study_selections.study_epoch import (
     StudyEpochEpoch,
     StudyEpochSubType,
@@ -72,6 +76,7 @@ from clinical_mdr_api.domains.study_selections.study_visit import (
     VisitSubclass,
 )
 from clinical_mdr_api.domains.versioned_object_aggregate import LibraryVO
+from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.study_selections.study_selection import (
     StudyActivityScheduleCreateInput,
 )
@@ -79,6 +84,8 @@ from clinical_mdr_api.models.study_selections.study_visit import (
     AllowedTimeReferences,
     SimpleStudyVisit,
     StudyVisit,
+    StudyVisitBatchInput,
+    StudyVisitBatchOutput,
     StudyVisitCreateInput,
     StudyVisitEditInput,
     StudyVisitVersion,
@@ -118,6 +125,18 @@ from common.exceptions import (
 )
 from common.telemetry import trace_calls
 
+# the codelists whose terms are loaded, through the CT term registry, by `_create_ctlist_map`
+CT_CODELIST_NAMES = [
+    settings.STUDY_EPOCH_TYPE_NAME,
+    settings.STUDY_EPOCH_SUBTYPE_NAME,
+    settings.STUDY_EPOCH_EPOCH_NAME,
+    settings.STUDY_VISIT_TYPE_NAME,
+    settings.STUDY_VISIT_REPEATING_FREQUENCY,
+    settings.STUDY_VISIT_TIMEREF_NAME,
+    settings.STUDY_VISIT_CONTACT_MODE_NAME,
+    settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME,
+]
+
 
 class StudyVisitService(StudySelectionMixin):
     def __init__(
@@ -127,21 +146,12 @@ class StudyVisitService(StudySelectionMixin):
     ):
         self._repos = MetaRepository()
         self.repo = self._repos.study_visit_repository
-        self.study_epoch_types = []
-        self.study_epoch_subtypes = []
-        self.study_epoch_epochs = []
-        self.study_visit_types = []
-        self.study_visit_repeating_frequency = []
-        self.study_visit_timeref = []
-        self.study_visit_contact_mode = []
-        self.study_visit_epoch_allocation = []
         self.author = user().id()
         self.terms_at_specific_datetime = self._extract_effective_date(
             study_uid=study_uid,
             study_value_version=study_value_version,
         )
         self._create_ctlist_map()
-        self._day_unit, self._week_unit = self.repo.get_day_week_units()
 
     def _extract_effective_date(self, study_uid, study_value_version: str = None):
         study_standard_versions = self._repos.study_standard_version_repository.find_standard_versions_in_study(
@@ -176,125 +186,21 @@ class StudyVisitService(StudySelectionMixin):
         )
 
     def _create_ctlist_map(self):
-        ct_terms = self.repo.fetch_ctlist(
-            codelist_names=[
-                settings.STUDY_EPOCH_TYPE_NAME,
-                settings.STUDY_EPOCH_SUBTYPE_NAME,
-                settings.STUDY_EPOCH_EPOCH_NAME,
-                settings.STUDY_VISIT_TYPE_NAME,
-                settings.STUDY_VISIT_REPEATING_FREQUENCY,
-                settings.STUDY_VISIT_TIMEREF_NAME,
-                settings.STUDY_VISIT_CONTACT_MODE_NAME,
-                settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME,
-            ]
-        )
-        for ct_term_uid, codelist_names in ct_terms.items():
-            if settings.STUDY_EPOCH_TYPE_NAME in codelist_names:
-                self.study_epoch_types.append(ct_term_uid)
-            if settings.STUDY_EPOCH_SUBTYPE_NAME in codelist_names:
-                self.study_epoch_subtypes.append(ct_term_uid)
-            if settings.STUDY_EPOCH_EPOCH_NAME in codelist_names:
-                self.study_epoch_epochs.append(ct_term_uid)
-            if settings.STUDY_VISIT_TYPE_NAME in codelist_names:
-                self.study_visit_types.append(ct_term_uid)
-            if settings.STUDY_VISIT_REPEATING_FREQUENCY in codelist_names:
-                self.study_visit_repeating_frequency.append(ct_term_uid)
-            if settings.STUDY_VISIT_TIMEREF_NAME in codelist_names:
-                self.study_visit_timeref.append(ct_term_uid)
-            if settings.STUDY_VISIT_CONTACT_MODE_NAME in codelist_names:
-                self.study_visit_contact_mode.append(ct_term_uid)
-            if settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME in codelist_names:
-                self.study_visit_epoch_allocation.append(ct_term_uid)
-
-        ctterm_uids = list(
-            set(
-                self.study_epoch_types
-                + self.study_epoch_subtypes
-                + self.study_epoch_epochs
-                + self.study_visit_types
-                + self.study_visit_repeating_frequency
-                + self.study_visit_timeref
-                + self.study_visit_contact_mode
-                + self.study_visit_epoch_allocation
-            )
-        )
-
-        ctterms = self._find_terms_by_uids(
-            term_uids=ctterm_uids,
-            at_specific_date=self.terms_at_specific_datetime,
-            return_simple_object=True,
-        )
-
-        StudyEpochType.clear()
-        StudyEpochType.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_epoch_types
-            ]
-        )
-
-        StudyEpochSubType.clear()
-        StudyEpochSubType.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_epoch_subtypes
-            ]
+        ct_terms = self.repo.fetch_ct_terms(
+            codelist_names=CT_CODELIST_NAMES,
+            effective_date=self.terms_at_specific_datetime,
         )
-
-        StudyEpochEpoch.clear()
-        StudyEpochEpoch.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_epoch_epochs
-            ]
-        )
-
-        StudyVisitType.clear()
-        StudyVisitType.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_types
-            ]
+        StudyEpochType.set(ct_terms[settings.STUDY_EPOCH_TYPE_NAME])
+        StudyEpochSubType.set(ct_terms[settings.STUDY_EPOCH_SUBTYPE_NAME])
+        StudyEpochEpoch.set(ct_terms[settings.STUDY_EPOCH_EPOCH_NAME])
+        StudyVisitType.set(ct_terms[settings.STUDY_VISIT_TYPE_NAME])
+        StudyVisitRepeatingFrequency.set(
+            ct_terms[settings.STUDY_VISIT_REPEATING_FREQUENCY]
         )
-
-        StudyVisitRepeatingFrequency.clear()
-        StudyVisitRepeatingFrequency.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_repeating_frequency
-            ]
-        )
-
-        StudyVisitTimeReference.clear()
-        StudyVisitTimeReference.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_timeref
-            ]
-        )
-
-        StudyVisitContactMode.clear()
-        StudyVisitContactMode.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_contact_mode
-            ]
-        )
-
-        StudyVisitEpochAllocation.clear()
-        StudyVisitEpochAllocation.update(
-            [
-                (ct_term.term_uid, ct_term)
-                for ct_term in ctterms
-                if ct_term.term_uid in self.study_visit_epoch_allocation
-            ]
+        StudyVisitTimeReference.set(ct_terms[settings.STUDY_VISIT_TIMEREF_NAME])
+        StudyVisitContactMode.set(ct_terms[settings.STUDY_VISIT_CONTACT_MODE_NAME])
+        StudyVisitEpochAllocation.set(
+            ct_terms[settings.STUDY_VISIT_EPOCH_ALLOCATION_NAME]
         )
 
     def get_allowed_time_references_for_study(self, study_uid: str):
@@ -729,6 +635,7 @@ class StudyVisitService(StudySelectionMixin):
         create: bool = True,
         preview: bool = False,
         study_visits: list[StudyVisitVO | None] = None,
+        study_epochs: list[StudyEpochVO] | None = None,
     ):
         if study_visits is None:
             study_visits = []
@@ -934,11 +841,12 @@ class StudyVisitService(StudySelectionMixin):
                 )
 
             if not preview:
-                study_epochs = (
-                    self._repos.study_epoch_repository.find_all_epochs_by_study(
-                        study_uid=visit_vo.study_uid
+                if study_epochs is None:
+                    study_epochs = (
+                        self._repos.study_epoch_repository.find_all_epochs_by_study(
+                            study_uid=visit_vo.study_uid
+                        )
                     )
-                )
                 timeline.collect_visits_to_epochs(study_epochs)
 
                 for epoch in study_epochs:
@@ -1133,15 +1041,16 @@ class StudyVisitService(StudySelectionMixin):
             )
         else:
             time_unit_object = None
+        day_unit, week_unit = self.repo.get_day_week_units()
         day_unit_object = TimeUnit(
             name="day",
-            conversion_factor_to_master=self._day_unit.concept_vo.conversion_factor_to_master,
+            conversion_factor_to_master=day_unit.concept_vo.conversion_factor_to_master,
             from_timedelta=lambda u, x: u.conversion_factor_to_master * x,
         )
 
         week_unit_object = TimeUnit(
             name="Week",
-            conversion_factor_to_master=self._week_unit.concept_vo.conversion_factor_to_master,
+            conversion_factor_to_master=week_unit.concept_vo.conversion_factor_to_master,
             from_timedelta=lambda u, x: u.conversion_factor_to_master * x,
         )
         visit_class = (
@@ -1239,17 +1148,21 @@ class StudyVisitService(StudySelectionMixin):
         return study_visit_vo
 
     def synchronize_visit_numbers(
-        self, ordered_visits: list[Any], start_index_to_synchronize: int
+        self, timeline: TimelineAR, excluded_visit_uids: Collection[str] = ()
     ):
         """
         Fixes the visit number if some visit was added in between of others or some of the visits were removed, edited.
-        :param ordered_visits:
-        :param start_index_to_synchronize:
+        Only the visits renumbered by the change of the timeline are saved.
+        :param timeline:
+        :param excluded_visit_uids: uids of the changed visits, which are saved separately
         :return:
         """
-        for visit in ordered_visits[start_index_to_synchronize:]:
+        for visit in timeline.renumbered_visits():
             # Manually defined visits have explicitly specified order properties
-            if visit.visit_class != VisitClass.MANUALLY_DEFINED_VISIT:
+            if (
+                visit.visit_class != VisitClass.MANUALLY_DEFINED_VISIT
+                and visit.uid not in excluded_visit_uids
+            ):
                 self.assign_props_derived_from_visit_number(study_visit=visit)
                 self.repo.save(visit)
 
@@ -1325,13 +1238,9 @@ class StudyVisitService(StudySelectionMixin):
 
         timeline.add_visit(added_item)
 
-        ordered_visits = timeline.ordered_study_visits
         # if added item is not last in ordered_study_visits, then we have to synchronize Visit Numbers
-        if added_item.uid != ordered_visits[-1].uid:
-            self.synchronize_visit_numbers(
-                ordered_visits=ordered_visits,
-                start_index_to_synchronize=int(added_item.visit_number),
-            )
+        # of the visits that follow it
+        self.synchronize_visit_numbers(timeline)
         return self._transform_all_to_response_model(added_item)
 
     @db.transaction
@@ -1352,19 +1261,12 @@ class StudyVisitService(StudySelectionMixin):
         self.assign_props_derived_from_visit_absolute_timing(study_visit_vo=study_visit)
         return self._transform_all_to_response_model(study_visit)
 
-    @db.transaction
-    def edit(
+    def _edited_visit(
         self,
-        study_uid: str,
-        study_visit_uid: str,
+        study_visit: StudyVisitVO,
         study_visit_input: StudyVisitEditInput,
-    ):
-        study_visits = self.repo.find_all_visits_by_study_uid(study_uid)
-        study_visit = self.repo.find_by_uid(study_uid=study_uid, uid=study_visit_uid)
-
-        epoch = self._repos.study_epoch_repository.find_by_uid(
-            uid=study_visit_input.study_epoch_uid, study_uid=study_uid
-        )
+        epoch: StudyEpochVO,
+    ) -> StudyVisitVO:
         updated_visit = self._from_input_values(study_visit_input, epoch)
         update_dict = {
             k: v
@@ -1385,24 +1287,32 @@ class StudyVisitService(StudySelectionMixin):
 
         new_study_visit = dataclasses.replace(study_visit, **update_dict)
         new_study_visit.epoch_connector = epoch
+        return new_study_visit
+
+    @db.transaction
+    def edit(
+        self,
+        study_uid: str,
+        study_visit_uid: str,
+        study_visit_input: StudyVisitEditInput,
+    ):
+        study_visits = self.repo.find_all_visits_by_study_uid(study_uid)
+        study_visit = self.repo.find_by_uid(study_uid=study_uid, uid=study_visit_uid)
+
+        epoch = self._repos.study_epoch_repository.find_by_uid(
+            uid=study_visit_input.study_epoch_uid, study_uid=study_uid
+        )
+        new_study_visit = self._edited_visit(study_visit, study_visit_input, epoch)
 
         timeline = TimelineAR(study_uid=study_uid, _visits=study_visits)
         timeline.update_visit(new_study_visit)
 
         self._validate_visit(study_visit_input, new_study_visit, timeline, create=False)
 
-        ordered_visits = timeline.ordered_study_visits
-
         # If Visit Number was edited, then we have to synchronize the Visit Numbers in the database
-        if study_visit.visit_number != new_study_visit.visit_number:
-            if new_study_visit.visit_number < study_visit.visit_number:
-                start_index_to_sync = int(new_study_visit.visit_number) - 1
-            else:
-                start_index_to_sync = int(study_visit.visit_number) - 1
-            self.synchronize_visit_numbers(
-                ordered_visits=ordered_visits,
-                start_index_to_synchronize=start_index_to_sync,
-            )
+        self.synchronize_visit_numbers(
+            timeline, excluded_visit_uids={new_study_visit.uid}
+        )
         self.assign_props_derived_from_visit_absolute_timing(
             study_visit_vo=new_study_visit
         )
@@ -1460,18 +1370,180 @@ class StudyVisitService(StudySelectionMixin):
 
         study_visit.delete()
         timeline.remove_visit(study_visit)
-        ordered_visits = timeline.ordered_study_visits
         self.repo.save(study_visit)
 
-        # we want to synchronize numbers if we have more than one visit
-        if len(ordered_visits) > 0:
-            # After removing specific visit if it was not the last visit,
-            # we have to synchronize the Visit Numbers to fill in the gap
-            if study_visit.uid != ordered_visits[-1].uid:
-                self.synchronize_visit_numbers(
-                    ordered_visits=ordered_visits,
-                    start_index_to_synchronize=int(study_visit.visit_number) - 1,
+        # After removing specific visit if it was not the last visit,
+        # we have to synchronize the Visit Numbers to fill in the gap
+        self.synchronize_visit_numbers(timeline)
+
+    def _get_epoch(
+        self, study_epochs: list[StudyEpochVO], study_epoch_uid: str
+    ) -> StudyEpochVO:
+        for epoch in study_epochs:
+            if epoch.uid == study_epoch_uid:
+                return epoch
+        raise ValidationException(
+            msg=f"StudyEpoch with UID '{study_epoch_uid}' doesn't exist."
+        )
+
+    def _get_visit(self, timeline: TimelineAR, study_visit_uid: str) -> StudyVisitVO:
+        for visit in timeline._visits:
+            if visit.uid == study_visit_uid:
+                return visit
+        raise ValidationException(
+            msg=f"StudyVisit with UID '{study_visit_uid}' doesn't exist in Study '{timeline.study_uid}'"
+        )
+
+    def _delete_schedules_of_visits(
+        self, study_uid: str, study_visits: list[StudyVisitVO]
+    ):
+        schedules_service = StudyActivityScheduleService()
+        deleted_schedules = []
+        for study_visit in study_visits:
+            study_activity_schedules = (
+                schedules_service.get_all_schedules_for_specific_visit(
+                    study_uid=study_uid, study_visit_uid=study_visit.uid
+                )
+            )
+            for study_activity_schedule in study_activity_schedules:
+                deleted_schedules.append(
+                    StudyActivityScheduleVO(
+                        uid=study_activity_schedule.study_activity_schedule_uid,
+                        study_uid=study_uid,
+                        study_activity_uid=study_activity_schedule.study_activity_uid,
+                        study_activity_instance_uid=None,
+                        study_visit_uid=study_activity_schedule.study_visit_uid,
+                        start_date=datetime.datetime.now(datetime.timezone.utc),
+                        author_id=self.author,
+                    )
+                )
+        self._repos.study_activity_schedule_repository.save_all(
+            study_uid, [], deleted_schedules, self.author
+        )
+
+    @db.transaction
+    def handle_batch_operations(
+        self, study_uid: str, operations: list[StudyVisitBatchInput]
+    ) -> list[StudyVisitBatchOutput]:
+        """
+        Applies the create, edit and delete operations to a single timeline of the study visits,
+        then saves the created, edited, deleted and renumbered visits once all operations are applied.
+        An operation that fails validation is reported and leaves the timeline as it was before the operation.
+        """
+        study_visits = self.repo.find_all_visits_by_study_uid(study_uid)
+        study_epochs = self._repos.study_epoch_repository.find_all_epochs_by_study(
+            study_uid=study_uid
+        )
+        timeline = TimelineAR(study_uid=study_uid, _visits=study_visits)
+        persisted_visit_uids = {visit.uid for visit in study_visits}
+        created_visit_uids: set[str] = set()
+        changed_visits: dict[str, StudyVisitVO] = {}
+        deleted_visits: list[StudyVisitVO] = []
+        results: list[tuple[int, str | None] | StudyVisitBatchOutput] = []
+        for operation in operations:
+            visits = list(timeline._visits)
+            try:
+                if operation.method == "POST":
+                    visit = self._from_input_values(
+                        operation.content,
+                        self._get_epoch(
+                            study_epochs, operation.content.study_epoch_uid
+                        ),
+                    )
+                    self._validate_visit(
+                        operation.content,
+                        visit,
+                        timeline,
+                        create=True,
+                        study_visits=visits,
+                        study_epochs=study_epochs,
+                    )
+                    timeline.add_visit(visit)
+                    created_visit_uids.add(visit.uid)
+                    changed_visits[visit.uid] = visit
+                    results.append((status.HTTP_201_CREATED, visit.uid))
+                elif operation.method == "PATCH":
+                    visit = self._edited_visit(
+                        self._get_visit(timeline, operation.content.uid),
+                        operation.content,
+                        self._get_epoch(
+                            study_epochs, operation.content.study_epoch_uid
+                        ),
+                    )
+                    timeline.update_visit(visit)
+                    self._validate_visit(
+                        operation.content,
+                        visit,
+                        timeline,
+                        create=False,
+                        study_epochs=study_epochs,
+                    )
+                    changed_visits[visit.uid] = visit
+                    results.append((status.HTTP_200_OK, visit.uid))
+                elif operation.method == "DELETE":
+                    visit = self._get_visit(timeline, operation.content.uid)
+                    BusinessLogicException.raise_if(
+                        visit.status != StudyStatus.DRAFT,
+                        msg="Cannot delete visits non DRAFT status",
+                    )
+                    subvisits_references = [
+                        v
+                        for v in timeline._visits
+                        if v.visit_sublabel_reference == visit.uid
+                    ]
+                    BusinessLogicException.raise_if(
+                        subvisits_references,
+                        msg=f"The Visit can't be deleted as other visits ({[x.visit_short_name for x in subvisits_references]}) are referencing this Visit",
+                    )
+                    timeline.remove_visit(visit)
+                    changed_visits.pop(visit.uid, None)
+                    if visit.uid in persisted_visit_uids:
+                        visit.delete()
+                        deleted_visits.append(visit)
+                    results.append(
+                        StudyVisitBatchOutput(response_code=status.HTTP_204_NO_CONTENT)
+                    )
+                else:
+                    raise exceptions.MethodNotAllowedException(method=operation.method)
+            except exceptions.MDRApiBaseException as error:
+                timeline.restore_visits(visits)
+                results.append(
+                    StudyVisitBatchOutput.model_construct(
+                        response_code=error.status_code,
+                        content=BatchErrorResponse(message=str(error)),
+                    )
+                )
+
+        self._delete_schedules_of_visits(study_uid, deleted_visits)
+
+        # the visit numbers and timings are derived from the timeline with all operations applied
+        for visit in timeline.ordered_study_visits:
+            if visit.uid in changed_visits:
+                self.assign_props_derived_from_visit_number(study_visit=visit)
+                self.assign_props_derived_from_visit_absolute_timing(
+                    study_visit_vo=visit
+                )
+        self.repo.save_all(
+            deleted_visits + list(changed_visits.values()), created_visit_uids
+        )
+        self.synchronize_visit_numbers(
+            timeline, excluded_visit_uids=changed_visits.keys()
+        )
+
+        outputs = []
+        for result in results:
+            if isinstance(result, tuple):
+                response_code, study_visit_uid = result
+                # the visit was deleted by a following operation
+                visit = changed_visits.get(study_visit_uid)
+                result = StudyVisitBatchOutput(
+                    response_code=response_code,
+                    content=(
+                        self._transform_all_to_response_model(visit) if visit else None
+                    ),
                 )
+            outputs.append(result)
+        return outputs
 
     @db.transaction
     def get_consecutive_groups(self, study_uid: str):
@@ -1,4 +1,9 @@
-from clinical_mdr_api.domain_repositories.user_repository import UserRepository
+from typing import Iterable
+
+from clinical_mdr_api.domain_repositories.user_repository import (
+    UserRepository,
+    user_directory,
+)
 from clinical_mdr_api.models.user import UserInfo
 
 
@@ -24,5 +29,21 @@ class UserInfoService:
 
     @classmethod
     def get_author_username_from_id(cls, user_id: str) -> str:
-        user = cls().repo.get_user(user_id)
-        return user.username if user and user.username else user_id
+        return cls.get_author_usernames_from_ids([user_id]).get(user_id, user_id)
+
+    @classmethod
+    def get_author_usernames_from_ids(
+        cls, user_ids: Iterable[str | None]
+    ) -> dict[str, str]:
+        """Maps each of the given user ids to the username of the user, or to the id itself for unknown users"""
+
+        user_ids = set(user_ids)
+        users = user_directory.get_users(user_ids, cls().repo)
+        return {
+            user_id: (
+                users[user_id].username
+                if user_id in users and users[user_id].username
+                else user_id
+            )
+            for user_id in user_ids
+        }
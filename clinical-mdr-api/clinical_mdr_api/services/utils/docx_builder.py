@@ -1,7 +1,9 @@
+import copy
 import io
 import logging
 import os
-from functools import reduce
+import threading
+from functools import lru_cache, reduce
 from itertools import zip_longest
 from typing import Mapping
 
@@ -10,8 +12,8 @@ from docx import Document
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_ORIENTATION
 from docx.enum.text import WD_BREAK
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.section import Section
 from docx.shared import Inches
 from docx.table import Table, _Cell, _Row
@@ -24,6 +26,8 @@ INLINE_ELEMENTS_TO_FONT_PROPERTIES = {"b", "em", "i", "sub", "sup", "s", "strong
 
 log = logging.getLogger(__name__)
 
+_template_lock = threading.Lock()
+
 
 class DocxBuilder:
     DEFAULT_TEMPLATE_FILENAME = "template.docx"
@@ -85,12 +89,19 @@ class DocxBuilder:
         self.document._element.body.clear_content()
 
     @staticmethod
-    @trace_calls(args=[0], kwargs=["template_filename"])
-    def load_document(template_filename: str) -> Document:
+    @lru_cache(maxsize=8)
+    def _load_template(template_filename: str) -> Document:
         log.debug("Reading document: %s", template_filename)
         with open(template_filename, "rb") as file:
             return Document(file)
 
+    @staticmethod
+    @trace_calls(args=[0], kwargs=["template_filename"])
+    def load_document(template_filename: str) -> Document:
+        """Returns a copy of the parsed template document, templates are read and parsed only once"""
+        with _template_lock:
+            return copy.deepcopy(DocxBuilder._load_template(template_filename))
+
     def create_table(self, num_rows: int, num_columns: int) -> Table:
         table = self.document.add_table(rows=num_rows, cols=num_columns)
         table.autofit = True
@@ -99,6 +110,26 @@ class DocxBuilder:
             table.style = self.document.styles[style[0]]
         return table
 
+    @staticmethod
+    def get_column_widths(table: Table) -> list[int]:
+        """Returns the widths of the table grid columns in twips"""
+        # pylint: disable=protected-access
+        return [grid_col.w.twips for grid_col in table._tbl.tblGrid.gridCol_lst]
+
+    def get_style_id(self, style_name: str) -> str | None:
+        """Returns the id of a style to reference in OOXML, None for the default style of its type"""
+        style = self.document.styles[style_name]
+        if style == self.document.styles.default(style.type):
+            return None
+        return style.style_id
+
+    @staticmethod
+    def append_table_rows(table: Table, rows_xml: list[str]):
+        """Appends rows given as OOXML `<w:tr>` elements (without namespace declarations) to the table"""
+        # pylint: disable=protected-access
+        rows = parse_xml(f"<w:tbl {nsdecls('w')}>{''.join(rows_xml)}</w:tbl>")
+        table._tbl.extend(list(rows))
+
     @staticmethod
     def add_row(table: Table, cell_text_content: list[str | None]) -> _Row:
         """Adds a row to the table and fills the cells text content"""
@@ -1,17 +1,25 @@
+import functools
+import io
+import multiprocessing
 import os
+import threading
 from collections import defaultdict
-from typing import Annotated, Any, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Annotated, Any, Mapping, NamedTuple
+from xml.sax.saxutils import escape as xml_escape
 
 import yattag
 from docx.shared import Inches
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import NamedStyle
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.worksheet.table import Table as XLSXTable
+from openpyxl.worksheet.table import TableStyleInfo
 from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import BaseModel, ConfigDict, Field
 
 from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+from common import config
 from common.telemetry import trace_calls
 
 CHAR_WIDTHS = {
@@ -192,9 +200,252 @@ class TableWithFootnotes(BaseModel):
     ] = None
 
 
+class CellRef(NamedTuple):
+    """Internal representation of a reference to an item (`Ref`)"""
+
+    type: str | None
+    uid: str
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.type is None:
+            return {"uid": self.uid}
+        return {"type": self.type, "uid": self.uid}
+
+    @classmethod
+    def from_model(cls, ref: Ref) -> "CellRef":
+        return cls(ref.type, ref.uid)
+
+
+class Cell:
+    """
+    Internal representation of a table cell (`TableCell`) used while building and rendering tables.
+
+    A slotted plain object with the attributes of `TableCell`, without validation on construction and assignment.
+    """
+
+    __slots__ = ("text", "span", "style", "refs", "footnotes", "vertical")
+
+    def __init__(
+        self,
+        text: str = "",
+        span: int = 1,
+        style: str | None = None,
+        refs: list[CellRef] | None = None,
+        footnotes: list[str] | None = None,
+        vertical: bool | None = None,
+    ):
+        self.text = text
+        self.span = span
+        self.style = style
+        self.refs = refs
+        self.footnotes = footnotes
+        self.vertical = vertical
+
+    def __eq__(self, other):
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        return f"Cell({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+    def to_dict(self) -> dict[str, Any]:
+        cell = {"text": self.text, "span": self.span}
+        if self.style is not None:
+            cell["style"] = self.style
+        if self.refs is not None:
+            cell["refs"] = [ref.to_dict() for ref in self.refs]
+        if self.footnotes is not None:
+            cell["footnotes"] = self.footnotes
+        if self.vertical is not None:
+            cell["vertical"] = self.vertical
+        return cell
+
+    @classmethod
+    def from_model(cls, cell: TableCell) -> "Cell":
+        return cls(
+            text=cell.text,
+            span=cell.span,
+            style=cell.style,
+            refs=(
+                [CellRef.from_model(ref) for ref in cell.refs]
+                if cell.refs is not None
+                else None
+            ),
+            footnotes=list(cell.footnotes) if cell.footnotes is not None else None,
+            vertical=cell.vertical,
+        )
+
+
+class Row:
+    """Internal representation of a table row (`TableRow`)"""
+
+    __slots__ = ("cells", "hide", "order", "level")
+
+    def __init__(
+        self,
+        cells: list[Cell] | None = None,
+        hide: bool = False,
+        order: int | None = None,
+        level: int | None = None,
+    ):
+        self.cells = cells if cells is not None else []
+        self.hide = hide
+        self.order = order
+        self.level = level
+
+    def __eq__(self, other):
+        if not isinstance(other, Row):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        return f"Row({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+    def to_dict(self) -> dict[str, Any]:
+        row = {"cells": [cell.to_dict() for cell in self.cells], "hide": self.hide}
+        if self.order is not None:
+            row["order"] = self.order
+        if self.level is not None:
+            row["level"] = self.level
+        return row
+
+    @classmethod
+    def from_model(cls, row: TableRow) -> "Row":
+        return cls(
+            cells=[Cell.from_model(cell) for cell in row.cells],
+            hide=row.hide,
+            order=row.order,
+            level=row.level,
+        )
+
+
+class Table:
+    """
+    Internal representation of a table with footnotes (`TableWithFootnotes`).
+
+    Tables are built, altered and rendered in this form. They are converted to JSON with `to_dict()`,
+    without building the `TableWithFootnotes` API model, which is only described in the OpenAPI schema.
+    """
+
+    __slots__ = (
+        "rows",
+        "footnotes",
+        "num_header_rows",
+        "num_header_cols",
+        "title",
+        "id",
+    )
+
+    def __init__(
+        self,
+        rows: list[Row] | None = None,
+        footnotes: dict[str, SimpleFootnote] | None = None,
+        num_header_rows: int = 0,
+        num_header_cols: int = 0,
+        title: str | None = None,
+        id: str | None = None,  # pylint: disable=redefined-builtin
+    ):
+        self.rows = rows if rows is not None else []
+        self.footnotes = footnotes
+        self.num_header_rows = num_header_rows
+        self.num_header_cols = num_header_cols
+        self.title = title
+        self.id = id
+
+    def __eq__(self, other):
+        if not isinstance(other, Table):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        return f"Table({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the JSON-compatible content of `TableWithFootnotes`, leaving out None values"""
+
+        table = {
+            "rows": [row.to_dict() for row in self.rows],
+            "num_header_rows": self.num_header_rows,
+            "num_header_cols": self.num_header_cols,
+        }
+        if self.footnotes is not None:
+            table["footnotes"] = {
+                symbol: footnote.model_dump()
+                for symbol, footnote in self.footnotes.items()
+            }
+        if self.title is not None:
+            table["title"] = self.title
+        if self.id is not None:
+            table["id"] = self.id
+        return table
+
+    def to_model(self) -> TableWithFootnotes:
+        return TableWithFootnotes.model_validate(self.to_dict())
+
+    @classmethod
+    def from_model(cls, table: TableWithFootnotes) -> "Table":
+        return cls(
+            rows=[Row.from_model(row) for row in table.rows],
+            footnotes=dict(table.footnotes) if table.footnotes is not None else None,
+            num_header_rows=table.num_header_rows,
+            num_header_cols=table.num_header_cols,
+            title=table.title,
+            id=table.id,
+        )
+
+
+def _docx_text_runs(text: str, properties: str = "") -> str:
+    """OOXML runs of `text`, like assigning `Paragraph.text` (tabs and line breaks become elements)"""
+
+    content = []
+    for i, line in enumerate(text.split("\n")):
+        if i:
+            content.append("<w:br/>")
+        for j, chunk in enumerate(line.split("\t")):
+            if j:
+                content.append("<w:tab/>")
+            if chunk:
+                space = ' xml:space="preserve"' if chunk != chunk.strip() else ""
+                content.append(f"<w:t{space}>{xml_escape(chunk)}</w:t>")
+    return f"<w:r>{properties}{''.join(content)}</w:r>"
+
+
+def _docx_cell(
+    cell: Cell | None,
+    width: int,
+    span: int,
+    style_id: str | None,
+) -> str:
+    """OOXML of a table cell, like python-docx builds for a cell of `table_to_docx`"""
+
+    properties = f'<w:tcW w:type="dxa" w:w="{width}"/>'
+    if span > 1:
+        properties += f'<w:gridSpan w:val="{span}"/>'
+    if cell and cell.vertical:
+        properties += '<w:textDirection w:val="btLr"/>'
+
+    paragraph = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ""
+    if cell and cell.text:
+        paragraph += _docx_text_runs(cell.text)
+    if cell and cell.footnotes:
+        paragraph += _docx_text_runs(
+            "\u00A0".join(cell.footnotes),
+            '<w:rPr><w:b/><w:vertAlign w:val="superscript"/></w:rPr>',
+        )
+
+    return f"<w:tc><w:tcPr>{properties}</w:tcPr><w:p>{paragraph}</w:p></w:tc>"
+
+
 @trace_calls()
 def table_to_docx(
-    table: TableWithFootnotes,
+    table: Table,
     styles: Mapping[str, tuple[str, Any]] | None = None,
     template: str | None = None,
 ) -> DocxBuilder:
@@ -206,64 +457,62 @@ def table_to_docx(
         styles=styles, landscape=True, margins=[0.5, 0.5, 0.5, 0.5], template=template
     )
 
-    # adds a table to the document
-    x_table = docx.create_table(
-        num_rows=sum(1 for row in table.rows if not row.hide),
-        num_columns=num_cols,
-    )
+    # adds a table to the document, rows are generated as OOXML,
+    # as python-docx cell access and merging is slow on large tables
+    x_table = docx.create_table(num_rows=0, num_columns=num_cols)
+    column_widths = docx.get_column_widths(x_table)
 
     # set width of first column
     x_table.columns[0].width = Inches(4)
 
-    # cache porperty for performance issues, see github.com/python-openxml/python-docx/issues/174
-    x_cells = x_table._cells
-    x_rows = x_table.rows
+    style_ids = {}
+    if styles:
+        for key, (style_name, _) in styles.items():
+            style_ids[key] = docx.get_style_id(style_name)
 
+    rows_xml = []
     for r, t_row in enumerate((row for row in table.rows if not row.hide)):
-        num_merge, merge_to = 0, None
+        row_xml = ["<w:tr>"]
 
         # set header row to repeat on each page
         if r < table.num_header_rows:
-            docx.repeat_table_header(x_rows[r])
-
-        for c, t_cell in enumerate(t_row.cells):
-            x_cell = x_cells[r * num_cols + c]
+            row_xml.append('<w:trPr><w:tblHeader w:val="true"/></w:trPr>')
 
-            # merge with previous spanning cell
-            if num_merge:
-                merge_to.merge(x_cell)
-                num_merge -= 1
-                continue
+        c = 0
+        cells = iter(t_row.cells)
+        for t_cell in cells:
+            if c >= num_cols:
+                break
 
             # skip invisible cells (should not get here if spans are coherent)
             if t_cell.span < 1:
+                row_xml.append(_docx_cell(None, column_widths[c], 1, None))
+                c += 1
                 continue
 
             # when cell span > 1 merge the following N cells into this one
-            num_merge = t_cell.span - 1
-            merge_to = x_cell
-
-            # all docx cells host one or more paragraph for contents
-            x_para = x_cell.paragraphs[0]
-
-            # set cell text in the paragraph
-            if t_cell.text:
-                x_para.text = t_cell.text
+            span = min(t_cell.span, num_cols - c)
+            for _ in range(span - 1):
+                next(cells, None)
+
+            row_xml.append(
+                _docx_cell(
+                    t_cell,
+                    sum(column_widths[c : c + span]),
+                    span,
+                    style_ids.get(t_cell.style),
+                )
+            )
+            c += span
 
-            # resolve style name and apply to paragraph
-            style_name = styles.get(t_cell.style, [None])[0] if styles else None
-            if style_name:
-                x_para.style = style_name
+        # fill the row up to the number of columns
+        for i in range(c, num_cols):
+            row_xml.append(_docx_cell(None, column_widths[i], 1, None))
 
-            # set vertical text direction
-            if t_cell.vertical:
-                docx.set_vertical_cell_direction(x_cell, "btLr")
+        row_xml.append("</w:tr>")
+        rows_xml.append("".join(row_xml))
 
-            # add footnote symbols to a run within the paragraph
-            if t_cell.footnotes:
-                run = x_para.add_run("\u00A0".join(t_cell.footnotes))
-                run.font.bold = True
-                run.font.superscript = True
+    docx.append_table_rows(x_table, rows_xml)
 
     # add footnotes
     if table.footnotes:
@@ -284,15 +533,73 @@ def table_to_docx(
     return docx
 
 
+def _table_to_docx_bytes(
+    table: Table,
+    styles: Mapping[str, tuple[str, Any]] | None,
+    template: str | None,
+) -> bytes:
+    return (
+        table_to_docx(table, styles=styles, template=template)
+        .get_document_stream()
+        .getvalue()
+    )
+
+
+_docx_rendering_pool_lock = threading.Lock()
+
+
+@functools.cache
+def _create_docx_rendering_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=config.DOCX_RENDERING_WORKERS,
+        # workers don't inherit the state (db connections, threads) of the api process
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _get_docx_rendering_pool() -> ProcessPoolExecutor:
+    # the lock keeps concurrent first calls from each starting a pool
+    with _docx_rendering_pool_lock:
+        return _create_docx_rendering_pool()
+
+
+@trace_calls()
+def table_to_docx_stream(
+    table: Table,
+    styles: Mapping[str, tuple[str, Any]] | None = None,
+    template: str | None = None,
+) -> io.BytesIO:
+    """
+    Renders table into a DOCX document stream.
+
+    Tables of at least `DOCX_RENDERING_WORKER_MIN_CELLS` cells are rendered in a worker process
+    when `DOCX_RENDERING_WORKERS` is set, to keep the CPU-bound rendering off the api process.
+    """
+
+    if (
+        config.DOCX_RENDERING_WORKERS
+        and sum(len(row.cells) for row in table.rows)
+        >= config.DOCX_RENDERING_WORKER_MIN_CELLS
+    ):
+        content = (
+            _get_docx_rendering_pool()
+            .submit(_table_to_docx_bytes, table, styles, template)
+            .result()
+        )
+    else:
+        content = _table_to_docx_bytes(table, styles, template)
+    return io.BytesIO(content)
+
+
 @trace_calls
-def table_to_html(table: TableWithFootnotes, css_style: str | None = None) -> str:
-    """Renders TableWithFootnotes into an HTML document
+def table_to_html(table: Table, css_style: str | None = None) -> str:
+    """Renders Table into an HTML document
 
-    Renders TableWithFootnotes into an HTML document with a TABLE and footnotes into a DL (if they exist).
+    Renders Table into an HTML document with a TABLE and footnotes into a DL (if they exist).
     Optional CSS text can be provided in `css_style` added as <style> tag.
 
     :param table: The table data to be rendered into HTML, including rows, cells, headers, and footnotes.
-    :type table: TableWithFootnotes
+    :type table: Table
     :param css_style: CSS text to be added as <style type="text/css"> tag in the HTML head.
     :type css_style: str
     :return: The rendered HTML document as a string.
@@ -377,7 +684,7 @@ def _cell_to_attrs(cell):
 
 @trace_calls
 def table_to_xlsx(
-    table: TableWithFootnotes,
+    table: Table,
     styles: Mapping[str, str] | None = None,
     template: str | None = None,
 ) -> Workbook:
@@ -431,7 +738,7 @@ def table_to_xlsx(
                     cell.style = styles[table.rows[r].cells[c].style]
 
     # define table
-    tab = Table(
+    tab = XLSXTable(
         displayName="Table1",
         ref=f"A1:{get_column_letter(len(table.rows[-1].cells))}{len(table.rows)}",
     )
@@ -2,6 +2,7 @@
 
 from clinical_mdr_api.tests.fixtures.app import *
 from clinical_mdr_api.tests.fixtures.auth import *
+from clinical_mdr_api.tests.fixtures.cypher_capture import *
 from clinical_mdr_api.tests.fixtures.database import *
 from clinical_mdr_api.tests.fixtures.logging import *
 from clinical_mdr_api.tests.fixtures.routes import *
@@ -24,3 +25,10 @@ def pytest_addoption(parser):
         default=False,
         help="Enables logging of tracing messages of OpenCensus tracer",
     )
+    parser.addoption(
+        "--capture-cypher",
+        action="store",
+        default=None,
+        metavar="FILE",
+        help="Write all executed Cypher queries with their execution counts to a JSON file, used by the index advisor",
+    )
@@ -0,0 +1,38 @@
+import json
+import logging
+from collections import Counter
+
+import pytest
+
+from common.telemetry.request_metrics import capture_cypher_queries
+
+__all__ = ["cypher_capture"]
+
+log = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cypher_capture(request: pytest.FixtureRequest):
+    """Records the text and execution count of all Cypher queries of the test session
+    when Pytest executed with `--capture-cypher=<file>` option, see `developer_tools/index_advisor.py`
+    """
+
+    if not (path := request.config.getoption("--capture-cypher")):
+        yield
+        return
+
+    log.info("%s fixture: capturing Cypher queries to %s", request.fixturename, path)
+    queries = Counter()
+
+    with capture_cypher_queries(
+        lambda query, params, walltime: queries.update([query])
+    ):
+        yield
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(dict(queries.most_common()), file, indent=2)
+    log.info(
+        "%s fixture: captured %i distinct Cypher queries",
+        request.fixturename,
+        len(queries),
+    )
@@ -30,7 +30,7 @@ from clinical_mdr_api.services.studies.study_flowchart import (
     OPERATIONAL_DOCX_STYLES,
     StudyFlowchartService,
 )
-from clinical_mdr_api.services.utils.table_f import TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Table, TableWithFootnotes
 from clinical_mdr_api.tests.fixtures.database import TempDatabasePopulated
 
 # pylint: disable=unused-import
@@ -255,7 +255,7 @@ def test_flowchart_html(
     request,
     soa_test_data: SoATestData,
     api_client: TestClient,
-    soa_table: TableWithFootnotes,
+    soa_table: Table,
     layout: SoALayout,
     time_unit: str,
 ):
@@ -265,7 +265,7 @@ def test_flowchart_html(
     Go fix test_flowchart() first if both tests are failing.
     """
 
-    soa_table: TableWithFootnotes = deepcopy(request.getfixturevalue(soa_table))
+    soa_table: Table = deepcopy(request.getfixturevalue(soa_table))
 
     # Layout alterations of get_study_flowchart_docx()
     if layout != SoALayout.PROTOCOL:
@@ -332,7 +332,7 @@ def test_flowchart_docx(
     request,
     soa_test_data: SoATestData,
     api_client: TestClient,
-    soa_table: TableWithFootnotes,
+    soa_table: Table,
     layout: SoALayout,
     time_unit: str,
 ):
@@ -341,7 +341,7 @@ def test_flowchart_docx(
 
     Go fix test_flowchart() first if both tests are failing.
     """
-    soa_table: TableWithFootnotes = deepcopy(request.getfixturevalue(soa_table))
+    soa_table: Table = deepcopy(request.getfixturevalue(soa_table))
 
     # Layout alterations of get_study_flowchart_docx()
     if layout != SoALayout.PROTOCOL:
@@ -203,6 +203,40 @@ class TestStudyDefinitionRepository(unittest.TestCase):
         print("RET", retrieved_study)
         assert_dataclasses_equal(retrieved_study, created_study)
 
+    def test__save__deleted__header_is_refreshed(self):
+        with db.transaction:
+            repository1 = StudyDefinitionRepositoryImpl(current_function_name())
+            created_study = create_random_study(
+                generate_uid_callback=repository1.generate_uid,
+                new_id_metadata_fixed_values={
+                    "project_number": self.created_project.project_number
+                },
+                is_study_after_create=True,
+                author_id=current_function_name(),
+            )
+            repository1.save(created_study)
+            repository1.close()
+
+        # when
+        with db.transaction:
+            repository2 = StudyDefinitionRepositoryImpl(current_function_name())
+            study_to_delete = repository2.find_by_uid(
+                created_study.uid, for_update=True
+            )
+            study_to_delete.mark_deleted()
+            repository2.save(study_to_delete)
+            repository2.close()
+
+        # then
+        headers, _ = db.cypher_query(
+            """
+            MATCH (:StudyRoot {uid: $uid})-[:HAS_HEADER]->(header:StudyHeader)
+            RETURN header.is_deleted
+            """,
+            {"uid": created_study.uid},
+        )
+        assert headers == [[True]]
+
     def test__save__locked__locked(self):
         def can_lock(_: StudyDefinitionAR) -> bool:
             return _.current_metadata.id_metadata.study_id is not None
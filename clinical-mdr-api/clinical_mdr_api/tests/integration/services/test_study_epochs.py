@@ -356,6 +356,20 @@ class TestStudyEpochManagement(unittest.TestCase):
         )
         self.assertEqual(epoch.color_hash, "#FFFFFF")
 
+    def test__edit_epoch_of_another_study__raises_error(self):
+        epoch: StudyEpoch = create_study_epoch("EpochSubType_0001")
+
+        epoch_service = StudyEpochService()
+        edit_input = StudyEpochEditInput(
+            study_uid="Study_000999", start_rule="New start rule"
+        )
+        with self.assertRaises(exceptions.ValidationException):
+            epoch_service.edit(
+                study_uid="Study_000999",
+                study_epoch_uid=epoch.uid,
+                study_epoch_input=edit_input,
+            )
+
     def test__get_versions(self):
         epoch: StudyEpoch = create_study_epoch(epoch_subtype_uid="EpochSubType_0001")
         epoch_service = StudyEpochService()
@@ -40,7 +40,7 @@ from clinical_mdr_api.services.studies.study_flowchart import (
 )
 from clinical_mdr_api.services.studies.study_soa_footnote import StudySoAFootnoteService
 from clinical_mdr_api.services.studies.study_visit import StudyVisitService
-from clinical_mdr_api.services.utils.table_f import TableRow, TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Row, Table
 from clinical_mdr_api.tests.fixtures.database import TempDatabasePopulated
 from clinical_mdr_api.tests.integration.utils.factory_soa import SoATestData
 from clinical_mdr_api.tests.integration.utils.utils import TestUtils
@@ -62,7 +62,7 @@ def soa_test_data(temp_database_populated: TempDatabasePopulated) -> SoATestData
 
 
 @pytest.fixture(scope="module")
-def detailed_soa_table__days(soa_test_data: SoATestData) -> TableWithFootnotes:
+def detailed_soa_table__days(soa_test_data: SoATestData) -> Table:
     """get non-operational SoA table directly from StudyFlowchartService"""
     service = StudyFlowchartService()
     soa_table = service.build_flowchart_table(
@@ -75,7 +75,7 @@ def detailed_soa_table__days(soa_test_data: SoATestData) -> TableWithFootnotes:
 
 
 @pytest.fixture(scope="module")
-def detailed_soa_table__weeks(soa_test_data: SoATestData) -> TableWithFootnotes:
+def detailed_soa_table__weeks(soa_test_data: SoATestData) -> Table:
     """get non-operational SoA table directly from StudyFlowchartService"""
     service = StudyFlowchartService()
     soa_table = service.build_flowchart_table(
@@ -88,10 +88,10 @@ def detailed_soa_table__weeks(soa_test_data: SoATestData) -> TableWithFootnotes:
 
 
 @pytest.fixture(scope="module")
-def protocol_soa_table__days(soa_test_data: SoATestData) -> TableWithFootnotes:
+def protocol_soa_table__days(soa_test_data: SoATestData) -> Table:
     """get non-operational SoA table directly from StudyFlowchartService"""
     service = StudyFlowchartService()
-    soa_table: TableWithFootnotes = service.build_flowchart_table(
+    soa_table: Table = service.build_flowchart_table(
         study_uid=soa_test_data.study.uid,
         study_value_version=None,
         layout=SoALayout.PROTOCOL,
@@ -103,10 +103,10 @@ def protocol_soa_table__days(soa_test_data: SoATestData) -> TableWithFootnotes:
 
 
 @pytest.fixture(scope="module")
-def protocol_soa_table__weeks(soa_test_data: SoATestData) -> TableWithFootnotes:
+def protocol_soa_table__weeks(soa_test_data: SoATestData) -> Table:
     """get non-operational SoA table directly from StudyFlowchartService"""
     service = StudyFlowchartService()
-    soa_table: TableWithFootnotes = service.build_flowchart_table(
+    soa_table: Table = service.build_flowchart_table(
         study_uid=soa_test_data.study.uid,
         study_value_version=None,
         layout=SoALayout.PROTOCOL,
@@ -118,7 +118,7 @@ def protocol_soa_table__weeks(soa_test_data: SoATestData) -> TableWithFootnotes:
 
 
 @pytest.fixture(scope="module")
-def operational_soa_table__days(soa_test_data: SoATestData) -> TableWithFootnotes:
+def operational_soa_table__days(soa_test_data: SoATestData) -> Table:
     """get non-operational SoA table directly from StudyFlowchartService"""
     service = StudyFlowchartService()
     soa_table = service.build_flowchart_table(
@@ -131,7 +131,7 @@ def operational_soa_table__days(soa_test_data: SoATestData) -> TableWithFootnote
 
 
 @pytest.fixture(scope="module")
-def operational_soa_table__weeks(soa_test_data: SoATestData) -> TableWithFootnotes:
+def operational_soa_table__weeks(soa_test_data: SoATestData) -> Table:
     """get non-operational SoA table directly from StudyFlowchartService"""
     service = StudyFlowchartService()
     soa_table = service.build_flowchart_table(
@@ -373,7 +373,7 @@ def test_build_flowchart_table(
             assert (
                 sas.study_activity_uid in rows_by_uid
             ), f"No row with reference to activity {sas.study_activity_uid}"
-            row: TableRow = rows_by_uid[sas.study_activity_uid]
+            row: Row = rows_by_uid[sas.study_activity_uid]
 
             # THEN Activity name in 1st row
             assert row.cells[0].text == study_activity.activity.name
@@ -447,15 +447,13 @@ def ensure_flowchart_table_has_no_footnotes(table: dict):
 )
 def test_propagate_hidden_rows(request, soa_table_fixture_name):
     """Validates propagation of crosses and footnotes from hidden rows to the first visible parent row"""
-    soa_table: TableWithFootnotes = deepcopy(
-        request.getfixturevalue(soa_table_fixture_name)
-    )
+    soa_table: Table = deepcopy(request.getfixturevalue(soa_table_fixture_name))
     StudyFlowchartService.propagate_hidden_rows(soa_table.rows)
     check_hidden_row_propagation(soa_table)
 
 
 def test_get_flowchart_item_uid_coordinates(
-    soa_test_data: SoATestData, detailed_soa_table__weeks: TableWithFootnotes
+    soa_test_data: SoATestData, detailed_soa_table__weeks: Table
 ):
     service = StudyFlowchartService()
     results = service.get_flowchart_item_uid_coordinates(
@@ -1297,7 +1295,7 @@ class TestSoASnapshot:
             time_unit=time_unit,
         )
 
-        assert table.dict() == expected_table.dict()
+        assert table == expected_table
 
 
 def test_soa_snapshot_versioning_with_footnote_linking(
@@ -1334,7 +1332,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
         layout=layout,
         force_build=True,
     )
-    assert soa.dict() == soa_v1.dict()
+    assert soa == soa_v1
 
     # check v1 SoA snapshot
     cell_references, footnote_references = service.repository.load(
@@ -1374,7 +1372,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
     )
 
     # ensure SoA changed between Study versions
-    assert soa_v1.dict() != soa_v2.dict()
+    assert soa_v1 != soa_v2
 
     # check v1 SoA after modifications to draft
     soa = service.get_flowchart_table(
@@ -1383,7 +1381,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
         layout=layout,
         force_build=True,
     )
-    assert soa.dict() == soa_v1.dict()
+    assert soa == soa_v1
 
     # check v1 SoA snapshot build after modifications to draft
     cell_references, footnote_references = service.build_soa_snapshot(
@@ -1415,7 +1413,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
         layout=layout,
         force_build=True,
     )
-    assert soa.dict() == soa_v1.dict()
+    assert soa == soa_v1
 
     # check v1 SoA snapshot build after modifications to draft
     cell_references, footnote_references = service.build_soa_snapshot(
@@ -1465,7 +1463,7 @@ def test_soa_snapshot_versioning_with_footnote_linking(
     soa = service.load_soa_snapshot(
         study_uid=soa_test_data.study.uid, study_value_version=v1_version, layout=layout
     )
-    assert soa.dict() == soa_v1.dict()
+    assert soa == soa_v1
 
     # check v2 SoA snapshot
     expected_cell_references, expected_footnote_references = service.repository.load(
@@ -1500,4 +1498,4 @@ def test_soa_snapshot_versioning_with_footnote_linking(
     soa = service.load_soa_snapshot(
         study_uid=soa_test_data.study.uid, study_value_version=v2_version, layout=layout
     )
-    assert soa.dict() == soa_v2.dict()
+    assert soa == soa_v2
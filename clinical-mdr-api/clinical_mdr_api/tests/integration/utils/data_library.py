@@ -3464,7 +3464,9 @@ def create_stub(path, methods):
 
 def create_paths():
     from clinical_mdr_api.main import app
+    from clinical_mdr_api.utils.lazy_routers import include_router_groups
 
+    include_router_groups(app)
     return _create_paths(app)
 
 
@@ -48,7 +48,7 @@ from clinical_mdr_api.services.studies.study_activity_instance_selection import
     StudyActivityInstanceSelectionService,
 )
 from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
-from clinical_mdr_api.services.utils.table_f import TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Table
 from clinical_mdr_api.tests.integration.utils.utils import LIBRARY_NAME, TestUtils
 from common import config
 
@@ -1186,7 +1186,7 @@ def test_soa_test_data(temp_database_populated):
     test_data = SoATestData(project=temp_database_populated.project)
     study_flowchart_service = StudyFlowchartService()
 
-    soa_table: TableWithFootnotes = study_flowchart_service.build_flowchart_table(
+    soa_table: Table = study_flowchart_service.build_flowchart_table(
         study_uid=test_data.study.uid,
         study_value_version=None,
         layout=SoALayout.OPERATIONAL,
@@ -1199,7 +1199,7 @@ def test_soa_test_data(temp_database_populated):
         len(soa_table.rows[-1].cells) == test_data.NUM_VISIT_COLS + 3
     ), "SoA table num cols mismatch"
 
-    soa_table: TableWithFootnotes = study_flowchart_service.build_flowchart_table(
+    soa_table: Table = study_flowchart_service.build_flowchart_table(
         study_uid=test_data.study.uid,
         study_value_version=None,
         layout=SoALayout.DETAILED,
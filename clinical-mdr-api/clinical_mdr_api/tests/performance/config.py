@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+
+# Shape of the synthetic study portfolio: N studies x M visits x K activities
+PERF_STUDIES = int(os.environ.get("PERF_STUDIES", "3"))
+PERF_VISITS = int(os.environ.get("PERF_VISITS", "20"))
+PERF_ACTIVITIES = int(os.environ.get("PERF_ACTIVITIES", "30"))
+
+# Number of timed runs per benchmark, the fastest run is compared to the baseline
+PERF_REPEATS = int(os.environ.get("PERF_REPEATS", "3"))
+
+# Allowed relative increase over the baseline before a benchmark fails
+PERF_TIME_TOLERANCE = float(os.environ.get("PERF_TIME_TOLERANCE", "0.5"))
+PERF_DB_HITS_TOLERANCE = float(os.environ.get("PERF_DB_HITS_TOLERANCE", "0.1"))
+
+# Overwrite the stored baseline with the results of this run instead of comparing
+PERF_UPDATE_BASELINE = os.environ.get("PERF_UPDATE_BASELINE", "false").lower() == "true"
+
+PERF_BASELINE_FILE = Path(
+    os.environ.get("PERF_BASELINE_FILE", Path(__file__).parent / "baseline.json")
+)
+
+PORTFOLIO_SHAPE = f"{PERF_STUDIES}x{PERF_VISITS}x{PERF_ACTIVITIES}"
@@ -0,0 +1,125 @@
+import copy
+import logging
+
+from clinical_mdr_api.models.projects.project import Project
+from clinical_mdr_api.tests.integration.utils.factory_soa import SoATestData
+from clinical_mdr_api.tests.integration.utils.utils import TestUtils
+from common import config
+
+log = logging.getLogger(__name__)
+
+SOA_GROUPS = ["Subject Related Information", "Efficacy", "Safety", "Biomarkers"]
+ACTIVITY_GROUPS = ["General", "Vital Signs", "Laboratory Assessments"]
+
+
+def synthetic_visits(num_visits: int) -> dict[str, dict]:
+    """Screening anchor visit followed by weekly treatment visits, the last fifth are follow-up visits"""
+
+    visits = {
+        "V1": {
+            "epoch": "Screening",
+            "type": "Screening",
+            "visit_contact_mode": "On Site Visit",
+            "is_global_anchor_visit": True,
+            "day": 0,
+            "min_window": -7,
+            "max_window": 3,
+        }
+    }
+    first_follow_up = num_visits - num_visits // 5
+    for i in range(2, num_visits + 1):
+        epoch = "Follow-Up" if i > first_follow_up else "Treatment"
+        visits[f"V{i}"] = {
+            "epoch": epoch,
+            "type": epoch,
+            "visit_contact_mode": "On Site Visit" if i % 2 else "Virtual Visit",
+            "day": 7 * (i - 1),
+            "min_window": -1,
+            "max_window": 1,
+        }
+    return visits
+
+
+def synthetic_activities(
+    num_activities: int, visit_names: list[str]
+) -> dict[str, dict]:
+    """Activities spread over SoA groups and activity groups, the k-th activity is scheduled every (k % 4 + 1)-th visit"""
+
+    activities = {}
+    for k in range(num_activities):
+        group = ACTIVITY_GROUPS[k % len(ACTIVITY_GROUPS)]
+        activities[f"Synthetic activity {k + 1}"] = {
+            "soa_group": SOA_GROUPS[k % len(SOA_GROUPS)],
+            "group": group,
+            "subgroup": f"{group} subgroup {k % 5 + 1}",
+            "visits": visit_names[:: k % 4 + 1],
+            "show_soa_group": True,
+            "show_group": True,
+            "show_subgroup": True,
+            "show_activity": True,
+        }
+    return activities
+
+
+class SyntheticSoATestData(SoATestData):
+    """SoATestData with a generated number of visits and activities, without footnotes"""
+
+    FOOTNOTES = {}
+
+    @classmethod
+    def with_shape(
+        cls, num_visits: int, num_activities: int
+    ) -> type["SyntheticSoATestData"]:
+        visits = synthetic_visits(num_visits)
+        activities = synthetic_activities(num_activities, list(visits))
+        return type(
+            f"{cls.__name__}{num_visits}x{num_activities}",
+            (cls,),
+            {
+                "VISITS": visits,
+                "NUM_VISIT_COLS": num_visits,
+                "ACTIVITIES": activities,
+            },
+        )
+
+    def clone_into_new_study(self, project: Project) -> "SyntheticSoATestData":
+        """Creates another study with the same epochs, visits and scheduled activities,
+        reusing the library concepts and codelists of this instance"""
+
+        other = copy.copy(self)
+        other.study = TestUtils.create_study(
+            number=TestUtils.random_str(4),
+            project_number=project.project_number,
+            description=f"Test study ({self.__class__.__name__})",
+        )
+        TestUtils.set_study_standard_version(
+            study_uid=other.study.uid, catalogue=config.SDTM_CT_CATALOGUE_NAME
+        )
+        TestUtils.set_study_title(other.study.uid)
+
+        other.study_activities = {}
+        other.study_activity_schedules = []
+        other.study_epochs = other.create_study_epochs(self.EPOCHS)
+        other.study_visits = other.create_study_visits(self.VISITS)
+        for name, act in self.ACTIVITIES.items():
+            other.create_study_activity(name, **act)
+
+        return other
+
+
+def create_portfolio(
+    project: Project, num_studies: int, num_visits: int, num_activities: int
+) -> list[SyntheticSoATestData]:
+    """Seeds `num_studies` studies, each with `num_visits` visits and `num_activities` scheduled activities"""
+
+    log.info(
+        "seeding synthetic portfolio of %i studies x %i visits x %i activities",
+        num_studies,
+        num_visits,
+        num_activities,
+    )
+    first = SyntheticSoATestData.with_shape(num_visits, num_activities)(project)
+    portfolio = [first]
+    for _ in range(num_studies - 1):
+        portfolio.append(first.clone_into_new_study(project))
+    return portfolio
@@ -0,0 +1,127 @@
+import json
+import logging
+import time
+from typing import Callable, Mapping
+
+import neo4j
+import neo4j.exceptions
+from neomodel.sync_.core import db
+from pydantic import BaseModel
+
+from clinical_mdr_api.tests.performance import config as perf_config
+from common.telemetry.request_metrics import capture_cypher_queries
+
+log = logging.getLogger(__name__)
+
+
+class RecordedQuery(BaseModel):
+    query: str
+    params: dict
+    walltime: float
+
+
+class BenchmarkResult(BaseModel):
+    time: float
+    query_count: int
+    db_hits: int | None = None
+
+
+def count_db_hits(plan: Mapping) -> int:
+    """Sums up db hits of a PROFILE plan and all of its children"""
+
+    return plan.get("dbHits", 0) + sum(
+        count_db_hits(child) for child in plan.get("children", [])
+    )
+
+
+def profile_query(query: str, params: Mapping) -> int | None:
+    """Returns db hits of a read query, or None if the query can't be profiled (e.g. a write query)"""
+
+    # pylint: disable=no-member
+    with db.driver.session(
+        database=db._database_name, default_access_mode=neo4j.READ_ACCESS
+    ) as session:
+        try:
+            summary = session.run(f"PROFILE {query}", dict(params or {})).consume()
+        except neo4j.exceptions.Neo4jError as exc:
+            log.debug("Query could not be profiled: %s", exc.message)
+            return None
+    return count_db_hits(summary.profile) if summary.profile else None
+
+
+def run_benchmark(func: Callable[[], object], repeats: int) -> BenchmarkResult:
+    """Times `func` (fastest of `repeats` runs after a warm-up call)
+    and profiles the Cypher queries executed by the last run"""
+
+    func()
+
+    timings = []
+    queries: list[RecordedQuery] = []
+    for _ in range(repeats):
+        queries.clear()
+        with capture_cypher_queries(
+            lambda query, params, walltime: queries.append(
+                RecordedQuery(query=query, params=params or {}, walltime=walltime)
+            )
+        ):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+    db_hits = [profile_query(q.query, q.params) for q in queries]
+    return BenchmarkResult(
+        time=min(timings),
+        query_count=len(queries),
+        db_hits=(
+            sum(hits for hits in db_hits if hits is not None)
+            if any(hits is not None for hits in db_hits)
+            else None
+        ),
+    )
+
+
+def load_baseline() -> dict[str, BenchmarkResult]:
+    if not perf_config.PERF_BASELINE_FILE.exists():
+        return {}
+    with open(perf_config.PERF_BASELINE_FILE, encoding="utf-8") as file:
+        return {
+            name: BenchmarkResult(**result) for name, result in json.load(file).items()
+        }
+
+
+def save_baseline(baseline: dict[str, BenchmarkResult]):
+    with open(perf_config.PERF_BASELINE_FILE, "w", encoding="utf-8") as file:
+        json.dump(
+            {name: result.model_dump() for name, result in sorted(baseline.items())},
+            file,
+            indent=2,
+        )
+        file.write("\n")
+
+
+def find_regressions(
+    result: BenchmarkResult,
+    baseline: BenchmarkResult,
+    time_tolerance: float = perf_config.PERF_TIME_TOLERANCE,
+    db_hits_tolerance: float = perf_config.PERF_DB_HITS_TOLERANCE,
+) -> list[str]:
+    """Returns a description of each metric of `result` that regressed past the tolerance of `baseline`"""
+
+    regressions = []
+    if result.time > baseline.time * (1 + time_tolerance):
+        regressions.append(
+            f"time {result.time:.3f}s > baseline {baseline.time:.3f}s (+{time_tolerance:.0%})"
+        )
+    if result.query_count > baseline.query_count:
+        regressions.append(
+            f"query count {result.query_count} > baseline {baseline.query_count}"
+        )
+    if (
+        result.db_hits is not None
+        and baseline.db_hits is not None
+        and result.db_hits > baseline.db_hits * (1 + db_hits_tolerance)
+    ):
+        regressions.append(
+            f"db hits {result.db_hits} > baseline {baseline.db_hits} (+{db_hits_tolerance:.0%})"
+        )
+    return regressions
@@ -0,0 +1,121 @@
+"""
+Query-plan and response time regression benchmarks of frequently used endpoints.
+
+Each benchmark times an endpoint against a synthetic study portfolio,
+profiles the Cypher queries it executed, and fails if the results regress past
+the baseline stored in `baseline.json` (keyed by benchmark name and portfolio shape).
+Run with `PERF_UPDATE_BASELINE=true` to store the results of the run as the new baseline.
+"""
+
+# pylint: disable=unused-argument
+# pylint: disable=redefined-outer-name
+
+# pytest fixture functions have other fixture functions as arguments,
+# which pylint interprets as unused arguments
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from clinical_mdr_api.tests.performance import config as perf_config
+from clinical_mdr_api.tests.performance.portfolio import (
+    SyntheticSoATestData,
+    create_portfolio,
+)
+from clinical_mdr_api.tests.performance.profiling import (
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+from clinical_mdr_api.tests.utils.checks import assert_response_status_code
+
+log = logging.getLogger(__name__)
+
+# Endpoints of the main API, {study_uid} is substituted with the uid of a portfolio study
+API_BENCHMARKS = {
+    "flowchart_protocol": "/studies/{study_uid}/flowchart?force_build=true",
+    "flowchart_detailed": "/studies/{study_uid}/flowchart?layout=detailed&force_build=true",
+    "flowchart_operational": "/studies/{study_uid}/flowchart?layout=operational&force_build=true",
+    "study_activities": "/studies/{study_uid}/study-activities?page_size=0",
+    "study_activity_schedules": "/studies/{study_uid}/study-activity-schedules",
+    "study_visits": "/studies/{study_uid}/study-visits?page_size=0",
+    "study_epochs": "/studies/{study_uid}/study-epochs?page_size=0",
+    "studies": "/studies?page_size=0",
+    "activities_library": "/concepts/activities/activities?page_size=0",
+    "ct_terms_library": "/ct/terms?page_size=0",
+}
+
+CONSUMER_API_BENCHMARKS = {
+    "consumer_studies": "/v1/studies?page_size=1000",
+    "consumer_study_visits": "/v1/studies/{study_uid}/study-visits?page_size=1000",
+    "consumer_study_activities": "/v1/studies/{study_uid}/study-activities?page_size=1000",
+    "consumer_detailed_soa": "/v1/studies/{study_uid}/detailed-soa?page_size=1000",
+}
+
+baseline: dict[str, BenchmarkResult] = {}
+results: dict[str, BenchmarkResult] = {}
+
+
+@pytest.fixture(scope="module")
+def portfolio(temp_database_populated) -> list[SyntheticSoATestData]:
+    return create_portfolio(
+        project=temp_database_populated.project,
+        num_studies=perf_config.PERF_STUDIES,
+        num_visits=perf_config.PERF_VISITS,
+        num_activities=perf_config.PERF_ACTIVITIES,
+    )
+
+
+@pytest.fixture(scope="module")
+def consumer_api_client() -> TestClient:
+    from consumer_api.consumer_api import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stored_baseline():
+    baseline.update(load_baseline())
+    yield
+    if perf_config.PERF_UPDATE_BASELINE:
+        log.info("Updating benchmark baseline %s", perf_config.PERF_BASELINE_FILE)
+        save_baseline({**baseline, **results})
+
+
+def benchmark(name: str, client: TestClient, url: str):
+    def call():
+        response = client.get(url)
+        assert_response_status_code(response, 200)
+
+    key = f"{name}[{perf_config.PORTFOLIO_SHAPE}]"
+    result = results[key] = run_benchmark(call, perf_config.PERF_REPEATS)
+    log.info(
+        "Benchmark %s: %.3f s, %i queries, %s db hits",
+        key,
+        result.time,
+        result.query_count,
+        result.db_hits,
+    )
+
+    if perf_config.PERF_UPDATE_BASELINE:
+        return
+    if key not in baseline:
+        log.warning("Benchmark %s has no baseline, only recording the results", key)
+        return
+    regressions = find_regressions(result, baseline[key])
+    assert not regressions, f"Benchmark {key} regressed: {'; '.join(regressions)}"
+
+
+@pytest.mark.parametrize("name, url", API_BENCHMARKS.items(), ids=API_BENCHMARKS)
+def test_api_hot_paths(api_client, portfolio, name, url):
+    benchmark(name, api_client, url.format(study_uid=portfolio[-1].study.uid))
+
+
+@pytest.mark.parametrize(
+    "name, url", CONSUMER_API_BENCHMARKS.items(), ids=CONSUMER_API_BENCHMARKS
+)
+def test_consumer_api_hot_paths(consumer_api_client, portfolio, name, url):
+    benchmark(name, consumer_api_client, url.format(study_uid=portfolio[-1].study.uid))
@@ -0,0 +1,49 @@
+from clinical_mdr_api.developer_tools.import_profiler import (
+    ModuleImport,
+    format_report,
+    package_totals,
+    parse_importtime,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     clinical_mdr_api.models.utils
+import time:      2000 |       2120 |   clinical_mdr_api.models
+import time:       500 |        500 |   clinical_mdr_api.routers.admin
+import time:       100 |       2720 | clinical_mdr_api.main
+some other stderr output
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(IMPORTTIME_OUTPUT) == [
+        ModuleImport("clinical_mdr_api.models.utils", 120, 120, 2),
+        ModuleImport("clinical_mdr_api.models", 2000, 2120, 1),
+        ModuleImport("clinical_mdr_api.routers.admin", 500, 500, 1),
+        ModuleImport("clinical_mdr_api.main", 100, 2720, 0),
+    ]
+
+
+def test_package_totals():
+    assert package_totals(parse_importtime(IMPORTTIME_OUTPUT), depth=2) == {
+        "clinical_mdr_api.models": 2120,
+        "clinical_mdr_api.routers": 500,
+        "clinical_mdr_api.main": 100,
+    }
+
+
+def test_format_report():
+    report = format_report(parse_importtime(IMPORTTIME_OUTPUT), top=1, depth=2)
+
+    assert report.splitlines() == [
+        "4 modules imported in 0.00s",
+        "",
+        "# Top 1 modules by cumulative time",
+        "       2.7 ms  clinical_mdr_api.main",
+        "",
+        "# Top 1 modules by self time",
+        "       2.0 ms  clinical_mdr_api.models",
+        "",
+        "# Top 1 packages by self time",
+        "       2.1 ms  clinical_mdr_api.models",
+    ]
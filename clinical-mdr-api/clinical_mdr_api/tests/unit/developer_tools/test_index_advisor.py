@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+from clinical_mdr_api.developer_tools.index_advisor import (
+    Predicate,
+    advise,
+    extract_predicates,
+    format_report,
+)
+
+SCHEMA = SimpleNamespace(
+    CONSTRAINT_TYPE_NODE_KEY="NODE KEY",
+    CONSTRAINT_TYPE_NOT_NULL="NOT NULL",
+    INDEXES=[("StudyValue", "study_number")],
+    TEXT_INDEXES=[("Library", "name")],
+    REL_INDEXES=[("HAS_VERSION", "end_date")],
+    CONSTRAINTS=[("StudyRoot", "uid", "NODE KEY")],
+)
+
+
+def test_extract_predicates_inline_properties():
+    predicates = extract_predicates(
+        "MATCH (sr:StudyRoot {uid: $uid})-[hv:HAS_VERSION {status: 'DRAFT'}]->(sv:StudyValue) RETURN sv"
+    )
+    assert predicates == {
+        Predicate("StudyRoot", "uid", "="),
+        Predicate("HAS_VERSION", "status", "=", True),
+    }
+
+
+def test_extract_predicates_where_and_order_by():
+    predicates = extract_predicates(
+        """
+        MATCH (sr:StudyRoot)-[hv:HAS_VERSION]->(sv:StudyValue)
+        WHERE sv.study_acronym CONTAINS $text AND $number = sv.study_number
+        // MATCH (x:Commented) WHERE x.prop = 1
+        WITH sr, hv ORDER BY hv.end_date DESC, hv.version
+        SET sv.flag = true
+        RETURN sr LIMIT 1
+        """
+    )
+    assert predicates == {
+        Predicate("StudyValue", "study_acronym", "CONTAINS"),
+        Predicate("StudyValue", "study_number", "="),
+        Predicate("HAS_VERSION", "end_date", "ORDER BY", True),
+        Predicate("HAS_VERSION", "version", "ORDER BY", True),
+    }
+
+
+def test_extract_predicates_multiple_labels():
+    predicates = extract_predicates(
+        "MATCH (n:ActivityRoot|ActivityGroupRoot) WHERE n.uid IN $uids RETURN n"
+    )
+    assert predicates == {
+        Predicate("ActivityRoot", "uid", "IN"),
+        Predicate("ActivityGroupRoot", "uid", "IN"),
+    }
+
+
+def test_advise_proposes_unindexed_predicates():
+    queries = {
+        "MATCH (sr:StudyRoot {uid: $uid})-[hv:HAS_VERSION]->(sv:StudyValue) "
+        "WHERE sv.study_number = $n RETURN hv ORDER BY hv.end_date": 5,
+        "MATCH (lib:Library)-[:CONTAINS_CONCEPT]->(ar:ActivityRoot) "
+        "WHERE lib.name = $name AND ar.uid = $uid RETURN ar": 3,
+        "MATCH (n:User {user_id: $id}) RETURN n": 2,
+        "MATCH (ar:ActivityRoot)-[hv:HAS_VERSION]->(:ActivityValue) "
+        "WHERE hv.author_id CONTAINS $author RETURN ar": 1,
+    }
+
+    proposals = advise(queries, SCHEMA)
+
+    assert [(p.schema_list, p.label, p.prop, p.query_count) for p in proposals] == [
+        ("CONSTRAINTS", "ActivityRoot", "uid", 3),
+        ("INDEXES", "User", "user_id", 2),
+        ("REL_INDEXES", "HAS_VERSION", "author_id", 1),
+    ]
+
+    report = format_report(proposals)
+    assert '("ActivityRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),' in report
+    assert '("User", "user_id"),' in report
+    assert "# Proposed additions to REL_INDEXES" in report
+
+
+def test_advise_nothing_to_propose():
+    assert not advise({"MATCH (sr:StudyRoot {uid: $uid}) RETURN sr": 1}, SCHEMA)
@@ -0,0 +1,180 @@
+import dataclasses
+import datetime
+
+from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
+    StudyStatus,
+)
+from clinical_mdr_api.domains.study_selections.study_epoch import TimelineAR
+from clinical_mdr_api.domains.study_selections.study_visit import (
+    NumericValue,
+    StudyVisitVO,
+    TextValue,
+    TimePoint,
+    TimeUnit,
+    VisitClass,
+    VisitSubclass,
+)
+from clinical_mdr_api.models.controlled_terminologies.ct_term import (
+    SimpleCTTermNameWithConflictFlag,
+)
+
+DAY = TimeUnit(
+    name="day",
+    conversion_factor_to_master=86400,
+    from_timedelta=lambda u, x: u.conversion_factor_to_master * x,
+)
+WEEK = TimeUnit(
+    name="week",
+    conversion_factor_to_master=604800,
+    from_timedelta=lambda u, x: u.conversion_factor_to_master * x,
+)
+
+
+def term(name: str) -> SimpleCTTermNameWithConflictFlag:
+    return SimpleCTTermNameWithConflictFlag(term_uid=name, sponsor_preferred_name=name)
+
+
+def study_visit(
+    uid: str | None,
+    visit_type: str,
+    time_reference: str,
+    time_value: int,
+    visit_number: int = 0,
+) -> StudyVisitVO:
+    return StudyVisitVO(
+        uid=uid,
+        consecutive_visit_group=None,
+        visit_window_min=-1,
+        visit_window_max=1,
+        window_unit_uid="UnitDefinition_day",
+        description="",
+        start_rule="",
+        end_rule="",
+        visit_contact_mode=term("On Site Visit"),
+        visit_type=term(visit_type),
+        status=StudyStatus.DRAFT,
+        start_date=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+        author_id="author",
+        author_username="author",
+        visit_class=VisitClass.SINGLE_VISIT,
+        visit_subclass=VisitSubclass.SINGLE_VISIT,
+        is_global_anchor_visit=False,
+        visit_number=visit_number,
+        visit_order=visit_number,
+        show_visit=True,
+        timepoint=TimePoint(
+            uid="TimePoint_000001",
+            visit_timereference=term(time_reference),
+            time_unit_uid="UnitDefinition_day",
+            visit_value=time_value,
+        ),
+        study_day=NumericValue(uid="NumericValue_000001", value=None),
+        study_duration_days=NumericValue(uid="NumericValue_000002", value=None),
+        study_week=NumericValue(uid="NumericValue_000003", value=None),
+        study_duration_weeks=NumericValue(uid="NumericValue_000004", value=None),
+        week_in_study=NumericValue(uid="NumericValue_000005", value=None),
+        visit_name_sc=TextValue(uid="TextValue_000001", name=f"Visit {visit_number}"),
+        time_unit_object=DAY,
+        window_unit_object=DAY,
+        day_unit_object=DAY,
+        week_unit_object=WEEK,
+        vis_unique_number=visit_number * 100,
+        vis_short_name=f"V{visit_number}",
+    )
+
+
+def persisted_visits() -> list[StudyVisitVO]:
+    return [
+        study_visit("StudyVisit_000001", "Screening", "Screening", 0, 1),
+        study_visit("StudyVisit_000002", "Treatment", "Screening", 7, 2),
+        study_visit("StudyVisit_000003", "Follow-up", "Previous Visit", 7, 3),
+        study_visit("StudyVisit_000004", "Follow-up", "Previous Visit", 7, 4),
+    ]
+
+
+def test_renumbered_visits_after_visit_inserted():
+    timeline = TimelineAR("Study_000001", _visits=persisted_visits())
+    assert not timeline.renumbered_visits()
+
+    added_visit = study_visit(None, "Treatment", "Screening", 10)
+    timeline.add_visit(added_visit)
+    added_visit.uid = "StudyVisit_000005"
+    # the added visit is added again once it is saved
+    timeline.add_visit(added_visit)
+
+    assert [visit.uid for visit in timeline.ordered_study_visits] == [
+        "StudyVisit_000001",
+        "StudyVisit_000002",
+        "StudyVisit_000005",
+        "StudyVisit_000003",
+        "StudyVisit_000004",
+    ]
+    assert added_visit.visit_number == 3
+    assert [
+        (visit.uid, visit.visit_number) for visit in timeline.renumbered_visits()
+    ] == [("StudyVisit_000003", 4), ("StudyVisit_000004", 5)]
+
+
+def test_update_visit_derives_timing_of_dependent_visits():
+    visits = persisted_visits()[:2] + [
+        study_visit("StudyVisit_000003", "Follow-up", "Treatment", 7, 3),
+        study_visit("StudyVisit_000004", "Follow-up", "Treatment", 14, 4),
+    ]
+    timeline = TimelineAR("Study_000001", _visits=visits)
+    last_visit = timeline.ordered_study_visits[-1]
+    assert last_visit.study_day.value == 22
+
+    treatment = next(
+        visit for visit in timeline._visits if visit.uid == "StudyVisit_000002"
+    )
+    timeline.update_visit(
+        dataclasses.replace(
+            treatment,
+            timepoint=dataclasses.replace(treatment.timepoint, visit_value=14),
+        )
+    )
+
+    # both following visits are anchored to the treatment visit
+    assert [visit.study_day.value for visit in timeline.ordered_study_visits] == [
+        1,
+        15,
+        22,
+        29,
+    ]
+    assert not timeline.renumbered_visits()
+
+
+def test_ordered_study_visits_is_generated_once():
+    timeline = TimelineAR("Study_000001", _visits=persisted_visits())
+
+    first = timeline.ordered_study_visits
+    second = timeline.ordered_study_visits
+
+    assert first == second
+    assert first is not second
+    assert timeline._ordered_visits is not None
+    timeline.remove_visit(first[1])
+    assert timeline._ordered_visits is None
+    assert [visit.visit_number for visit in timeline.ordered_study_visits] == [
+        1,
+        2,
+        3,
+    ]
+
+
+def test_restore_visits_reverts_failed_change():
+    timeline = TimelineAR("Study_000001", _visits=persisted_visits())
+    visits = list(timeline._visits)
+    assert len(timeline.ordered_study_visits) == 4
+
+    timeline.add_visit(study_visit("StudyVisit_000005", "Treatment", "Screening", 3))
+    assert timeline.ordered_study_visits[1].uid == "StudyVisit_000005"
+    timeline.restore_visits(visits)
+
+    assert [visit.uid for visit in timeline.ordered_study_visits] == [
+        "StudyVisit_000001",
+        "StudyVisit_000002",
+        "StudyVisit_000003",
+        "StudyVisit_000004",
+    ]
+    assert not timeline.renumbered_visits()
@@ -0,0 +1,104 @@
+import contextvars
+import datetime
+import re
+from types import SimpleNamespace
+
+from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_term_registry import (
+    CTTermRegistry,
+)
+from clinical_mdr_api.domain_repositories.study_selections import study_epoch_repository
+from clinical_mdr_api.domains.study_selections.study_visit import CTTermMap
+from clinical_mdr_api.models.controlled_terminologies.ct_term import (
+    SimpleCTTermNameWithConflictFlag,
+)
+
+EFFECTIVE_DATE = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def term(uid: str) -> SimpleCTTermNameWithConflictFlag:
+    return SimpleCTTermNameWithConflictFlag(term_uid=uid, sponsor_preferred_name=uid)
+
+
+def test_get_or_load_loads_once_per_codelists_and_effective_date():
+    registry = CTTermRegistry(maxsize=10, ttl=60)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return {"Visit Type": {"CTTerm_1": term("CTTerm_1")}}
+
+    first = registry.get_or_load(["Visit Type", "Epoch"], EFFECTIVE_DATE, load)
+    second = registry.get_or_load(["Epoch", "Visit Type"], EFFECTIVE_DATE, load)
+    registry.get_or_load(["Epoch", "Visit Type"], None, load)
+
+    assert first is second
+    assert first["Visit Type"]["CTTerm_1"].term_uid == "CTTerm_1"
+    assert len(loads) == 2
+
+
+def test_clear_discards_terms_loaded_concurrently():
+    registry = CTTermRegistry(maxsize=10, ttl=60)
+
+    def load():
+        # the terms change while they are being loaded
+        registry.clear()
+        return {"Visit Type": {}}
+
+    registry.get_or_load(["Visit Type"], None, load)
+
+    assert registry.currsize == 0
+
+
+def test_ct_term_map_copies_shared_terms_on_write():
+    terms_map = CTTermMap("TestTerms")
+    shared_terms = {"CTTerm_1": term("CTTerm_1")}
+
+    def use_terms():
+        terms_map.set(shared_terms)
+        terms_map["CTTerm_2"] = term("CTTerm_2")
+        return set(terms_map)
+
+    assert contextvars.copy_context().run(use_terms) == {"CTTerm_1", "CTTerm_2"}
+    assert set(shared_terms) == {"CTTerm_1"}
+    assert not terms_map
+
+
+def test_get_ct_terms_by_codelist_at_effective_date(monkeypatch):
+    queries = []
+
+    def cypher_query(query, params):
+        queries.append((query, params))
+        # a term also in a codelist that was not requested
+        return [["CTTerm_1", ["Visit Type", "Other"]], ["CTTerm_2", ["Epoch"]]], None
+
+    monkeypatch.setattr(
+        study_epoch_repository, "CT_TERM_REGISTRY", CTTermRegistry(maxsize=10, ttl=60)
+    )
+    monkeypatch.setattr(study_epoch_repository.db, "cypher_query", cypher_query)
+    monkeypatch.setattr(
+        study_epoch_repository.CTTermNameRepository,
+        "find_by_uids",
+        lambda self, term_uids, **kwargs: term_uids,
+    )
+    monkeypatch.setattr(
+        study_epoch_repository,
+        "SimpleCTTermNameWithConflictFlag",
+        SimpleNamespace(from_ct_term_ar=term),
+    )
+
+    terms = study_epoch_repository.get_ct_terms_by_codelist(
+        ["Visit Type", "Epoch"], effective_date=EFFECTIVE_DATE
+    )
+
+    assert {name: set(uids) for name, uids in terms.items()} == {
+        "Visit Type": {"CTTerm_1"},
+        "Epoch": {"CTTerm_2"},
+    }
+    query, params = queries[0]
+    # the effective date conditions only apply to the terms of the requested codelists
+    assert re.search(
+        r"IN \$codelist_names AND \(\s*\(hv\.start_date.*\) OR \(hv\.end_date IS NULL.*\)\s*\)",
+        query,
+        re.DOTALL,
+    )
+    assert params["effective_date"] == "2025-01-01T00:00:00.000000Z"
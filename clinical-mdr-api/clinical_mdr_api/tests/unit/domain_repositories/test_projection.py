@@ -0,0 +1,143 @@
+import datetime
+from unittest.mock import patch
+
+import neo4j.time
+
+from clinical_mdr_api.domain_repositories.models._projection import Projection
+from clinical_mdr_api.domain_repositories.models._utils import ListDistinct
+from clinical_mdr_api.domain_repositories.models.study_selections import (
+    StudyActivityInstruction as StudyActivityInstructionNeoModel,
+)
+from clinical_mdr_api.models.study_selections.study_selection import (
+    StudyActivityInstruction,
+)
+from clinical_mdr_api.models.user import UserInfo
+
+INSTRUCTION_PROJECTION = Projection(
+    StudyActivityInstructionNeoModel,
+    StudyActivityInstruction,
+    (
+        "study_activity",
+        "activity_instruction_value__activity_instruction_root",
+        "has_after__audit_trail",
+        "study_value__has_version",
+    ),
+)
+
+
+def projected_instruction(uid: str) -> dict:
+    return {
+        "uid": uid,
+        "study_activity": {"node": {"uid": "StudyActivity_000001"}},
+        "activity_instruction_value": {
+            "node": {
+                "name": "Fasting",
+                "activity_instruction_root": {
+                    "node": {"uid": "ActivityInstruction_000001"}
+                },
+            }
+        },
+        "has_after": {
+            "node": {
+                "author_id": "unknown-user",
+                "date": neo4j.time.DateTime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+                "audit_trail": {"node": {"uid": "Study_000001"}},
+            }
+        },
+        "study_value": {"node": {"has_version": {"node": {}}}},
+    }
+
+
+@patch(
+    "clinical_mdr_api.services.user_info.user_directory.get_users",
+    return_value={
+        "unknown-user": UserInfo(
+            user_id="unknown-user",
+            username="unknown-user@example.com",
+            name="Unknown User",
+            email=None,
+            azp=None,
+            oid=None,
+            created=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+            updated=None,
+        )
+    },
+)
+@patch("neomodel.db.cypher_query")
+def test_projection_fetch(mock_cypher_query, mock_get_users):
+    mock_cypher_query.return_value = (
+        [[projected_instruction("StudyActivityInstruction_000001")]],
+        None,
+    )
+
+    (instruction,) = INSTRUCTION_PROJECTION.fetch(
+        order_by="uid",
+        **{
+            "study_value__has_version|version": "1",
+            "study_value__has_version__uid": "Study_000001",
+            "study_activity__has_study_activity__has_version|version": "1",
+            "study_activity__has_study_activity__has_version__uid": "Study_000001",
+        },
+    )
+
+    query, params = mock_cypher_query.call_args.args
+    # the authors of all rows are resolved in one batch
+    assert mock_get_users.call_args_list[0].args[0] == {"unknown-user"}
+    assert "WHERE r7.version = $p0 AND n7.uid = $p1" in query
+    assert (
+        "EXISTS { MATCH (n1)<-[:HAS_STUDY_ACTIVITY]-(:StudyValue)<-[filtered_rel:HAS_VERSION]-(filtered:StudyRoot)"
+        " WHERE filtered_rel.version = $p2 AND filtered.uid = $p3 }" in query
+    )
+    assert (
+        "EXISTS { MATCH (n0)<-[r6:HAS_STUDY_ACTIVITY_INSTRUCTION]-(n6:StudyValue)"
+        " WHERE EXISTS { MATCH (n6)<-[r7:HAS_VERSION]-(n7:StudyRoot) WHERE r7.version = $p0 AND n7.uid = $p1 } }"
+        in query
+    )
+    assert query.endswith("ORDER BY n0.uid")
+    assert params == {"p0": "1", "p1": "Study_000001", "p2": "1", "p3": "Study_000001"}
+
+    assert instruction.study_activity_instruction_uid == (
+        "StudyActivityInstruction_000001"
+    )
+    assert instruction.study_uid == "Study_000001"
+    assert instruction.study_activity_uid == "StudyActivity_000001"
+    assert instruction.activity_instruction_uid == "ActivityInstruction_000001"
+    assert instruction.activity_instruction_name == "Fasting"
+    assert instruction.start_date == datetime.datetime(
+        2025, 1, 1, tzinfo=datetime.timezone.utc
+    )
+    assert instruction.author_username == "unknown-user@example.com"
+
+
+def test_projection_picks_related_node_matching_descendant_filters():
+    # an instruction selected in a locked and in a draft study version is linked to both StudyValues,
+    # the projected StudyValue must be the one of the filtered version
+    query = INSTRUCTION_PROJECTION._query(
+        ("study_value__has_version|version", "study_value__has_version__uid"), None
+    )
+
+    assert (
+        "study_value: head([(n0)<-[r6:HAS_STUDY_ACTIVITY_INSTRUCTION]-(n6:StudyValue)"
+        " WHERE EXISTS { MATCH (n6)<-[r7:HAS_VERSION]-(n7:StudyRoot) WHERE r7.version = $p0 AND n7.uid = $p1 }"
+        " | {node: {has_version: head([(n6)<-[r7:HAS_VERSION]-(n7:StudyRoot)"
+        " WHERE r7.version = $p0 AND n7.uid = $p1 | {node: {}}])}}])" in query
+    )
+    # without filters, the related nodes are picked among the ones having the rest of the relation path
+    assert (
+        "activity_instruction_value: head([(n0)-[r2:HAS_SELECTED_ACTIVITY_INSTRUCTION]->(n2:ActivityInstructionValue)"
+        " WHERE EXISTS { MATCH (n2)<-[r3:LATEST]-(n3:ActivityInstructionRoot) } |"
+        in query
+    )
+    assert "IS NOT NULL" not in query
+
+
+def test_list_distinct_keeps_first_occurrence_of_each_node():
+    first, second, duplicate = (
+        StudyActivityInstructionNeoModel(uid=uid) for uid in ("a", "b", "a")
+    )
+    first.element_id_property = "4:node:1"
+    second.element_id_property = "4:node:2"
+    duplicate.element_id_property = "4:node:1"
+
+    assert ListDistinct([first, second, duplicate]).distinct() == [first, second]
+    assert ListDistinct([first, second, duplicate]).distinct()[0] is first
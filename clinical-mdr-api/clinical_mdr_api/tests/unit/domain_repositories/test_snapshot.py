@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI, Request
+from starlette.testclient import TestClient
+
+from clinical_mdr_api.domain_repositories.snapshot import (
+    InvalidationChannel,
+    Snapshot,
+    SnapshotDocument,
+)
+from clinical_mdr_api.routers.responses import snapshot_response
+
+
+def snapshot(tmp_path, load, max_age=0) -> Snapshot:
+    return Snapshot(
+        "test", load, max_age=max_age, channel=InvalidationChannel("test", tmp_path)
+    )
+
+
+def test_snapshot_loads_once_until_invalidated(tmp_path):
+    load = MagicMock(return_value=["a"])
+    data = snapshot(tmp_path, load)
+
+    assert data.current() == (1, ["a"])
+    assert data.current() == (1, ["a"])
+    assert load.call_count == 1
+
+    data.invalidate()
+    assert data.current() == (1, ["a"])
+    assert load.call_count == 2
+
+    load.return_value = ["a", "b"]
+    data.invalidate()
+    assert data.current() == (2, ["a", "b"])
+    assert load.call_count == 3
+
+
+def test_snapshot_reloads_on_change_published_by_other_worker(tmp_path):
+    load = MagicMock(return_value=["a"])
+    data = snapshot(tmp_path, load)
+    other_worker = snapshot(tmp_path, load)
+
+    assert data.get() == ["a"]
+    load.return_value = ["b"]
+    other_worker.invalidate()
+
+    assert data.current() == (2, ["b"])
+    assert load.call_count == 2
+
+
+def test_snapshot_reloads_after_max_age(tmp_path, monkeypatch):
+    load = MagicMock(return_value=["a"])
+    data = snapshot(tmp_path, load, max_age=60)
+    now = 1000.0
+    monkeypatch.setattr(
+        "clinical_mdr_api.domain_repositories.snapshot.time.monotonic", lambda: now
+    )
+
+    data.get()
+    now += 59
+    data.get()
+    assert load.call_count == 1
+
+    now += 2
+    data.get()
+    assert load.call_count == 2
+
+
+def test_invalidates_decorator(tmp_path):
+    load = MagicMock(return_value=["a"])
+    data = snapshot(tmp_path, load)
+    data.get()
+
+    @data.invalidates
+    def write():
+        return "written"
+
+    assert write() == "written"
+    data.get()
+    assert load.call_count == 2
+
+
+def test_snapshot_document_is_rendered_once_per_version(tmp_path):
+    load = MagicMock(return_value=["a"])
+    data = snapshot(tmp_path, load)
+    render = MagicMock(return_value=b'["a"]')
+
+    version, _ = data.current()
+    document = data.document(version, None, render)
+    assert data.document(version, None, render) is document
+    assert render.call_count == 1
+    assert document == SnapshotDocument.of(b'["a"]')
+
+    load.return_value = ["b"]
+    data.invalidate()
+    version, _ = data.current()
+    data.document(version, None, render)
+    assert render.call_count == 2
+
+
+def test_snapshot_response_not_modified():
+    document = SnapshotDocument.of(b'["a"]')
+    app = FastAPI()
+
+    @app.get("/document")
+    def get_document(request: Request):
+        return snapshot_response(request, document)
+
+    client = TestClient(app)
+    response = client.get("/document")
+    assert response.status_code == 200
+    assert response.json() == ["a"]
+    assert response.headers["etag"] == document.etag
+
+    for if_none_match in (document.etag, f'"x", W/{document.etag}', "*"):
+        response = client.get("/document", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.headers["etag"] == document.etag
+
+    response = client.get("/document", headers={"If-None-Match": '"x"'})
+    assert response.status_code == 200
@@ -0,0 +1,106 @@
+import dataclasses
+import datetime
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_activity_base_repository import (
+    get_shifted_selection_uids,
+)
+from clinical_mdr_api.domain_repositories.study_selections.study_soa_group_repository import (
+    StudySoAGroupRepository,
+)
+from clinical_mdr_api.domains.study_selections.study_soa_group_selection import (
+    StudySoAGroupAR,
+    StudySoAGroupVO,
+)
+
+
+def soa_group(uid: str) -> StudySoAGroupVO:
+    return StudySoAGroupVO(
+        study_uid="Study_000001",
+        study_selection_uid=uid,
+        soa_group_term_uid="CTTerm_000001",
+        soa_group_term_name=None,
+        show_soa_group_in_protocol_flowchart=False,
+        order=None,
+        study_activity_group_uids=None,
+        start_date=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+        author_id="author",
+    )
+
+
+def selections(*items: StudySoAGroupVO) -> dict:
+    return {
+        item.study_selection_uid: (order, item)
+        for order, item in enumerate(items, start=1)
+    }
+
+
+def test_get_shifted_selection_uids_of_move_to_top():
+    a, b, c, d = (soa_group(uid) for uid in "abcd")
+
+    assert get_shifted_selection_uids(
+        selections(a, b, c, d), selections(d, a, b, c)
+    ) == {"a", "b", "c"}
+
+
+def test_get_shifted_selection_uids_of_removal_and_edit():
+    a, b, c, d = (soa_group(uid) for uid in "abcd")
+    edited_c = dataclasses.replace(c, show_soa_group_in_protocol_flowchart=True)
+
+    assert get_shifted_selection_uids(
+        selections(a, b, c, d), selections(a, edited_c, d)
+    ) == {"d"}
+
+
+def test_get_shifted_selection_uids_without_order_change():
+    a, b = (soa_group(uid) for uid in "ab")
+
+    assert not get_shifted_selection_uids(selections(a, b), selections(a, b))
+
+
+@patch("neomodel.db.cypher_query")
+def test_save_reorder_writes_only_moved_selection(mock_cypher_query):
+    a, b, c, d = (soa_group(uid) for uid in "abcd")
+    aggregate = StudySoAGroupAR.from_repository_values(
+        study_uid="Study_000001", study_objects_selection=[a, b, c, d]
+    )
+    aggregate.repository_closure_data = [a, b, c, d]
+    aggregate.set_new_order_for_selection("d", 1, "author")
+    # "c" is shared with a locked study version, its order can't be updated in place
+    mock_cypher_query.return_value = ([["a"], ["b"]], None)
+
+    StudySoAGroupRepository().save(aggregate, "author")
+
+    order_update_call, write_call = mock_cypher_query.call_args_list
+    assert sorted(
+        order_update_call.args[1]["order_updates"], key=lambda item: item["uid"]
+    ) == [
+        {"uid": "a", "order": 2},
+        {"uid": "b", "order": 3},
+        {"uid": "c", "order": 4},
+    ]
+    writes = write_call.args[1]["writes"]
+    assert [(write["uid"], write["action"]) for write in writes] == [
+        ("d", "Edit"),
+        ("c", "Edit"),
+    ]
+    assert [write["properties"]["order"] for write in writes] == [1, 4]
+
+
+@patch("neomodel.db.cypher_query")
+def test_save_removal_writes_deleted_selection(mock_cypher_query):
+    a, b, c = (soa_group(uid) for uid in "abc")
+    aggregate = StudySoAGroupAR.from_repository_values(
+        study_uid="Study_000001", study_objects_selection=[a, b, c]
+    )
+    aggregate.repository_closure_data = [a, b, c]
+    aggregate.remove_object_selection("a")
+    mock_cypher_query.return_value = ([["b"], ["c"]], None)
+
+    StudySoAGroupRepository().save(aggregate, "author")
+
+    _, write_call = mock_cypher_query.call_args_list
+    (write,) = write_call.args[1]["writes"]
+    assert write["uid"] == "a"
+    assert write["action"] == "Delete"
+    assert write["for_deletion"]
@@ -0,0 +1,80 @@
+import datetime
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_activity_schedule_repository import (
+    StudyActivityScheduleRepository,
+)
+from clinical_mdr_api.domains.study_selections.study_activity_schedule import (
+    StudyActivityScheduleVO,
+)
+
+
+def schedule(uid: str | None, study_visit_uid: str) -> StudyActivityScheduleVO:
+    return StudyActivityScheduleVO(
+        uid=uid,
+        study_uid="Study_000001",
+        study_activity_uid="StudyActivity_000001",
+        study_activity_instance_uid=None,
+        study_visit_uid=study_visit_uid,
+        start_date=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+        author_id="author",
+    )
+
+
+@patch("neomodel.db.cypher_query")
+def test_get_schedule_grid(mock_cypher_query):
+    mock_cypher_query.return_value = (
+        [
+            [
+                [["StudyActivity_000001", "StudyActivityInstance_000001"]],
+                ["StudyVisit_000001", "StudyVisit_000002"],
+                [
+                    [
+                        "StudyActivity_000001",
+                        "StudyVisit_000001",
+                        "StudyActivitySchedule_000001",
+                    ]
+                ],
+            ]
+        ],
+        None,
+    )
+
+    grid = StudyActivityScheduleRepository().get_schedule_grid("Study_000001")
+
+    assert grid.study_activity_instance_uids == {
+        "StudyActivity_000001": "StudyActivityInstance_000001"
+    }
+    assert grid.study_visit_uids == {"StudyVisit_000001", "StudyVisit_000002"}
+    assert grid.schedules == {
+        "StudyActivitySchedule_000001": ("StudyActivity_000001", "StudyVisit_000001")
+    }
+    assert grid.scheduled_pairs == {("StudyActivity_000001", "StudyVisit_000001")}
+
+
+@patch("neomodel.db.cypher_query")
+def test_save_all_writes_schedules_in_single_query(mock_cypher_query):
+    mock_cypher_query.return_value = ([[12]], None)
+    created = [schedule(None, "StudyVisit_000002"), schedule(None, "StudyVisit_000003")]
+
+    StudyActivityScheduleRepository().save_all(
+        "Study_000001",
+        created,
+        [schedule("StudyActivitySchedule_000001", "StudyVisit_000001")],
+        "author",
+    )
+
+    uid_call, write_call = mock_cypher_query.call_args_list
+    assert uid_call.args[1] == {"count": 2}
+    assert [item.uid for item in created] == [
+        "StudyActivitySchedule_000011",
+        "StudyActivitySchedule_000012",
+    ]
+    writes = write_call.args[1]["writes"]
+    assert [
+        (write["uid"], write["action"], write["for_deletion"]) for write in writes
+    ] == [
+        ("StudyActivitySchedule_000011", "Create", False),
+        ("StudyActivitySchedule_000012", "Create", False),
+        ("StudyActivitySchedule_000001", "Delete", True),
+    ]
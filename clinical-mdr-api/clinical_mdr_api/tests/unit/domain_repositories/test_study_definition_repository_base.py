@@ -135,6 +135,9 @@ class StudyDefinitionRepositoryFake(StudyDefinitionRepository):
     def check_if_study_is_locked(self, study_uid: str) -> bool:
         return False
 
+    def get_current_locked_version(self, study_uid: str) -> str | None:
+        return None
+
     @staticmethod
     def check_if_study_uid_and_version_exists(
         study_uid: str, study_value_version: str | None = None
@@ -222,10 +225,13 @@ class StudyDefinitionRepositoryFake(StudyDefinitionRepository):
         filter_operator: FilterOperator | None = FilterOperator.AND,
         total_count: bool = False,
         deleted: bool = False,
+        uids: list[str] | None = None,
     ) -> GenericFilteringReturn[StudyDefinitionSnapshot]:
-        everything: list[StudyDefinitionSnapshot] = list(
-            self._simulated_db.get_all_instances()
-        )
+        everything: list[StudyDefinitionSnapshot] = [
+            snapshot
+            for snapshot in self._simulated_db.get_all_instances()
+            if uids is None or snapshot.uid in uids
+        ]
         filtered_items = service_level_generic_filtering(
             items=everything,
             filter_by=filter_by,
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from clinical_mdr_api.domain_repositories.study_selections.study_endpoint_repository import (
+    StudySelectionEndpointRepository,
+)
+
+
+@patch("neomodel.db.cypher_query")
+def test_find_page_by_study_filters_sorts_and_counts_in_database(mock_cypher_query):
+    mock_cypher_query.side_effect = [
+        (
+            [["StudyEndpoint_000003", 3], ["StudyEndpoint_000001", 1]],
+            ["uid", "position"],
+        ),
+        ([[5]], ["total_count"]),
+    ]
+
+    uids, count = StudySelectionEndpointRepository().find_page_by_study(
+        "Study_000001",
+        study_value_version="1.0",
+        filter_by={"endpoint.name": {"v": ["Pain"], "op": "co"}},
+        sort_by={"start_date": False},
+        page_number=2,
+        page_size=2,
+        total_count=True,
+    )
+
+    assert uids == ["StudyEndpoint_000003", "StudyEndpoint_000001"]
+    assert count == 5
+    query, params = mock_cypher_query.call_args_list[0].kwargs.values()
+    assert "HAS_VERSION {status: 'RELEASED', version: $study_value_version}" in query
+    assert "WHERE toLower(toString(endpoint_name)) CONTAINS $endpoint_name_0" in query
+    assert "ORDER BY start_date DESC,position SKIP $page_number * $page_size" in query
+    assert params == {
+        "endpoint_name_0": "pain",
+        "page_number": 1,
+        "page_size": 2,
+        "study_uid": "Study_000001",
+        "study_value_version": "1.0",
+    }
+    count_query, _ = mock_cypher_query.call_args_list[1].args
+    assert count_query.endswith("RETURN count(*) AS total_count")
+
+
+@patch("neomodel.db.cypher_query")
+def test_find_page_by_study_sorts_by_position_by_default(mock_cypher_query):
+    mock_cypher_query.return_value = (
+        [["StudyEndpoint_000001", 1]],
+        ["uid", "position"],
+    )
+
+    uids, _ = StudySelectionEndpointRepository().find_page_by_study(
+        "Study_000001", page_number=1, page_size=10
+    )
+
+    assert uids == ["StudyEndpoint_000001"]
+    query, _ = mock_cypher_query.call_args.kwargs.values()
+    assert "ORDER BY position ASC SKIP $page_number * $page_size" in query
@@ -0,0 +1,51 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+from clinical_mdr_api.domain_repositories.user_repository import UserDirectory
+from clinical_mdr_api.models.user import UserInfo
+
+
+def user(user_id: str, username: str, created_hour: int) -> UserInfo:
+    return UserInfo(
+        user_id=user_id,
+        username=username,
+        name=None,
+        email=None,
+        azp=None,
+        oid=None,
+        created=datetime.datetime(
+            2025, 1, 1, created_hour, tzinfo=datetime.timezone.utc
+        ),
+        updated=None,
+    )
+
+
+@patch("clinical_mdr_api.domain_repositories.user_repository.time.monotonic")
+def test_user_directory_refreshes_incrementally(mock_monotonic):
+    repo = MagicMock()
+    repo.get_all_users.return_value = [user("1", "alice", 1), user("2", "bob", 2)]
+    repo.get_users_by_ids.return_value = []
+    directory = UserDirectory(refresh_interval=10)
+
+    mock_monotonic.return_value = 100.0
+    for _ in range(2):
+        users = directory.get_users(["1", "2", "unknown"], repo)
+        assert {user_id: user.username for user_id, user in users.items()} == {
+            "1": "alice",
+            "2": "bob",
+        }
+    repo.get_all_users.assert_called_once_with()
+    # the ids missing from the snapshot are looked up once until the next refresh
+    repo.get_users_by_ids.assert_called_once_with(["unknown"])
+
+    repo.get_users_changed_since.return_value = [user("2", "robert", 3)]
+    mock_monotonic.return_value = 111.0
+    users = directory.get_users(["1", "2"], repo)
+
+    repo.get_users_changed_since.assert_called_once_with(
+        datetime.datetime(2025, 1, 1, 2, tzinfo=datetime.timezone.utc)
+        - datetime.timedelta(seconds=10)
+    )
+    assert users["1"].username == "alice"
+    assert users["2"].username == "robert"
+    repo.get_all_users.assert_called_once_with()
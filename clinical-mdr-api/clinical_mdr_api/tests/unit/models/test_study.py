@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from clinical_mdr_api.models.study_selections.study import (
+    CompactStudy,
+    is_study_summary_field,
+)
+from clinical_mdr_api.services._utils import service_level_generic_filtering
+
+
+def study_summary(**kwargs) -> dict:
+    return {
+        "uid": "Study_000001",
+        "study_number": "1234",
+        "subpart_id": None,
+        "study_acronym": "ACR",
+        "study_subpart_acronym": None,
+        "study_id_prefix": "CDISC DEV",
+        "description": "Description",
+        "project_number": "123",
+        "study_title": "Title",
+        "study_short_title": "Short title",
+        "study_status": "DRAFT",
+        "version_number": None,
+        "version_timestamp": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "version_author_id": "user-id",
+        "has_latest_locked": False,
+        "is_deleted": False,
+    } | kwargs
+
+
+REGISTRY_IDENTIFIERS = [
+    {"field_name": "ct_gov_id", "value": "NCT0001", "null_value_code": None},
+    {
+        "field_name": "eudract_id",
+        "value": None,
+        "null_value_code": {
+            "term_uid": "C48660",
+            "sponsor_preferred_name": "Not Applicable",
+            "date_conflict": False,
+        },
+    },
+]
+
+
+def summary_row(summary: dict, study_parent_part: dict | None = None) -> dict:
+    return {
+        "summary": summary,
+        "study_parent_part": study_parent_part,
+        "study_subpart_uids": [],
+        "project_name": "Project",
+        "clinical_programme_name": "Programme",
+        "version_author": "user",
+    }
+
+
+@pytest.mark.parametrize(
+    "field_name, expected",
+    [
+        ("*", True),
+        ("uid", True),
+        ("possible_actions", True),
+        ("current_metadata.identification_metadata.study_id", True),
+        ("current_metadata.version_metadata.version_timestamp", True),
+        ("study_parent_part.study_title", True),
+        ("study_parent_part.registry_identifiers.ct_gov_id", True),
+        ("current_metadata.high_level_study_design.study_type_code", False),
+        ("uid.unknown", False),
+    ],
+)
+def test_is_study_summary_field(field_name, expected):
+    assert is_study_summary_field(field_name) is expected
+
+
+def test_compact_study_from_study_summary():
+    study = CompactStudy.from_study_summary(summary_row(study_summary()))
+
+    assert study.uid == "Study_000001"
+    assert study.study_parent_part is None
+    assert study.possible_actions == ["delete", "lock", "release"]
+    identification_metadata = study.current_metadata.identification_metadata
+    assert identification_metadata.study_id == "CDISC DEV-1234"
+    assert identification_metadata.project_name == "Project"
+    assert identification_metadata.clinical_programme_name == "Programme"
+    assert study.current_metadata.version_metadata.study_status == "DRAFT"
+    assert study.current_metadata.version_metadata.version_author == "user"
+    assert study.current_metadata.study_description.study_title == "Title"
+
+
+def test_compact_study_from_study_summary_of_subpart():
+    study = CompactStudy.from_study_summary(
+        summary_row(
+            study_summary(uid="Study_000002", subpart_id="a"),
+            study_parent_part=study_summary(
+                study_status="LOCKED", registry_identifiers=REGISTRY_IDENTIFIERS
+            ),
+        )
+    )
+
+    assert study.study_parent_part.uid == "Study_000001"
+    assert study.possible_actions == ["delete"]
+    assert study.current_metadata.identification_metadata.study_id == "CDISC DEV-1234-a"
+    registry_identifiers = study.study_parent_part.registry_identifiers
+    assert registry_identifiers.ct_gov_id == "NCT0001"
+    assert registry_identifiers.eudract_id is None
+    assert registry_identifiers.eudract_id_null_value_code.term_uid == "C48660"
+    assert (
+        registry_identifiers.eudract_id_null_value_code.sponsor_preferred_name
+        == "Not Applicable"
+    )
+
+
+@pytest.mark.parametrize("search", ["NCT0001", "Not Applicable"])
+def test_wildcard_filter_matches_registry_identifiers_of_study_parent_part(search):
+    subpart = CompactStudy.from_study_summary(
+        summary_row(
+            study_summary(uid="Study_000002", subpart_id="a"),
+            study_parent_part=study_summary(registry_identifiers=REGISTRY_IDENTIFIERS),
+        )
+    )
+    other = CompactStudy.from_study_summary(
+        summary_row(study_summary(uid="Study_000003"))
+    )
+
+    result = service_level_generic_filtering(
+        items=[subpart, other], filter_by={"*": {"v": [search]}}
+    )
+
+    assert [item.uid for item in result.items] == ["Study_000002"]
+
+
+def test_compact_study_from_study_summary_of_deleted_study():
+    study = CompactStudy.from_study_summary(summary_row(study_summary(is_deleted=True)))
+
+    assert study.possible_actions == []
+    # as in the snapshot of a deleted study
+    assert study.current_metadata.version_metadata.study_status == "DELETED"
@@ -1,17 +1,21 @@
-# pylint: disable=no-member
+# pylint: disable=no-member,protected-access
 from typing import Mapping
+from unittest.mock import patch
 
 import bs4
 import docx
 import pytest
 from docx.enum.style import WD_STYLE_TYPE
 
+from clinical_mdr_api.services.utils import table_f
 from clinical_mdr_api.services.utils.table_f import (
     SimpleFootnote,
+    Table,
     TableCell,
     TableRow,
     TableWithFootnotes,
     table_to_docx,
+    table_to_docx_stream,
     table_to_html,
 )
 
@@ -178,6 +182,14 @@ def test_table_to_html_expected():
     assert html == EXPECTED_HTML
 
 
+def test_table_from_and_to_model():
+    table = Table.from_model(TEST_TABLE)
+
+    assert table.to_dict() == TEST_TABLE.model_dump(exclude_none=True)
+    assert table.to_model() == TEST_TABLE
+    assert table_to_html(table) == EXPECTED_HTML
+
+
 @pytest.mark.parametrize("test_table", [TEST_TABLE])
 def test_table_to_html(test_table: TableWithFootnotes):
     """Tests table_to_html by comparing table contents to TableWithFootnotes input"""
@@ -328,6 +340,50 @@ def test_table_to_docx(test_table: TableWithFootnotes):
         compare_docx_footnotes(docx_doc, test_table.footnotes, DOCX_STYLES)
 
 
+@pytest.mark.parametrize("test_table", [TEST_TABLE])
+def test_table_to_docx_stream(test_table: TableWithFootnotes):
+    """Tests table_to_docx_stream() by comparing DOCX document to TableWithFootnotes input"""
+
+    docx_doc = docx.Document(
+        table_to_docx_stream(Table.from_model(test_table), styles=DOCX_STYLES)
+    )
+
+    assert len(docx_doc.tables) == 1, "expected exactly 1 table in DOCX SoA"
+    compare_docx_table(docx_doc.tables[0], test_table, DOCX_STYLES)
+    compare_docx_footnotes(docx_doc, test_table.footnotes, DOCX_STYLES)
+
+
+@pytest.mark.parametrize("test_table", [TEST_TABLE])
+def test_table_to_docx_stream_in_worker_process(
+    test_table: TableWithFootnotes, monkeypatch
+):
+    """Tests table_to_docx_stream() renders large tables in the shared worker process pool"""
+
+    monkeypatch.setattr(table_f.config, "DOCX_RENDERING_WORKERS", 1)
+    monkeypatch.setattr(table_f.config, "DOCX_RENDERING_WORKER_MIN_CELLS", 1)
+    table_f._create_docx_rendering_pool.cache_clear()
+    try:
+        pool = table_f._get_docx_rendering_pool()
+        with patch.object(pool, "submit", wraps=pool.submit) as submit:
+            docx_doc = docx.Document(
+                table_to_docx_stream(Table.from_model(test_table), styles=DOCX_STYLES)
+            )
+            docx_doc_again = docx.Document(
+                table_to_docx_stream(Table.from_model(test_table), styles=DOCX_STYLES)
+            )
+
+        # THEN both documents are rendered by the same pool
+        assert submit.call_count == 2
+        assert table_f._get_docx_rendering_pool() is pool
+
+        compare_docx_table(docx_doc.tables[0], test_table, DOCX_STYLES)
+        compare_docx_footnotes(docx_doc, test_table.footnotes, DOCX_STYLES)
+        assert docx_doc_again.element.body.xml == docx_doc.element.body.xml
+    finally:
+        table_f._get_docx_rendering_pool().shutdown()
+        table_f._create_docx_rendering_pool.cache_clear()
+
+
 def compare_docx_table(
     tablex: docx.table.Table,
     test_table: TableWithFootnotes,
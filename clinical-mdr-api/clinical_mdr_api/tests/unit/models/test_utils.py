@@ -3,7 +3,14 @@ from typing import Annotated
 import pytest
 from pydantic import Field
 
-from clinical_mdr_api.models.utils import InputModel, sanitize_html
+from clinical_mdr_api.domain_repositories.models._projection import ProjectedNode
+from clinical_mdr_api.models.utils import (
+    _MAPPING_PLANS,
+    BaseModel,
+    InputModel,
+    compile_mapping_plans,
+    sanitize_html,
+)
 
 TEXT_INPUTS = [
     (" HellO", "HellO"),
@@ -105,3 +112,73 @@ def test_input_model(
     assert obj.title == input_string.strip()
     assert obj.body == expected_sanitized_string
     assert obj.tags is None
+
+
+class MockVersion(BaseModel):
+    uid: Annotated[str | None, Field(json_schema_extra={"source": "versions.uid"})] = (
+        None
+    )
+    version: Annotated[
+        str | None, Field(json_schema_extra={"source": "versions|version"})
+    ] = None
+
+
+class MockLibrary(BaseModel):
+    name: Annotated[str | None, Field(json_schema_extra={"source": "library.name"})] = (
+        None
+    )
+
+
+class MockOutput(BaseModel):
+    uid: Annotated[str, Field(json_schema_extra={"source": "uid"})]
+    description: str | None
+    library: MockLibrary | None = None
+    versions: list[MockVersion] | None = None
+
+
+def test_model_validate_maps_node_through_cached_plan():
+    node = ProjectedNode(
+        {"uid": "Item_000001"},
+        {
+            "library": ProjectedNode({"name": "Sponsor"}, {}),
+            "versions": [
+                ProjectedNode({"uid": "V1"}, {}),
+                ProjectedNode({"uid": "V2"}, {}),
+            ],
+            "versions_relationship": [
+                ProjectedNode({"version": "1.0"}, {}),
+                ProjectedNode({"version": "2.0"}, {}),
+            ],
+        },
+    )
+
+    obj = MockOutput.model_validate(node)
+
+    assert obj.uid == "Item_000001"
+    assert obj.description is None
+    assert obj.library == MockLibrary(name="Sponsor")
+    assert obj.versions == [
+        MockVersion(uid="V1", version="1.0"),
+        MockVersion(uid="V2", version="2.0"),
+    ]
+    assert MockOutput in _MAPPING_PLANS
+    # the node is left untouched
+    assert not hasattr(node, "description")
+
+    empty = ProjectedNode(
+        {"uid": "Item_000002"},
+        {"library": [], "versions": [], "versions_relationship": []},
+    )
+    obj = MockOutput.model_validate(empty)
+    assert obj.library is None
+
+
+def test_compile_mapping_plans_of_all_imported_models():
+    class MockSubOutput(MockOutput):
+        extra: str | None = None
+
+    _MAPPING_PLANS.pop(MockOutput, None)
+
+    assert compile_mapping_plans() == len(_MAPPING_PLANS)
+    assert MockOutput in _MAPPING_PLANS
+    assert MockSubOutput in _MAPPING_PLANS
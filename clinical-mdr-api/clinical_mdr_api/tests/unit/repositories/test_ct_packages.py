@@ -0,0 +1,98 @@
+import datetime
+import json
+from unittest.mock import patch
+
+import neo4j.exceptions
+import neo4j.time
+
+from clinical_mdr_api.repositories import ct_packages
+
+CHANGES = {
+    "new_codelists": [
+        {
+            "uid": "C66737",
+            "value_node": {"name": "Trial Phase", "extensible": True},
+            "change_date": neo4j.time.DateTime(
+                2024, 3, 29, tzinfo=datetime.timezone.utc
+            ),
+        }
+    ],
+    "deleted_codelists": [],
+    "updated_codelists": [],
+    "new_terms": [],
+    "deleted_terms": [],
+    "updated_terms": [],
+}
+
+
+@patch.object(ct_packages, "_compute_ct_packages_changes", return_value=CHANGES)
+@patch.object(ct_packages, "db")
+def test_ct_packages_changes_are_computed_once(mock_db, mock_compute):
+    stored = {}
+
+    def cypher_query(query, params):
+        if query == ct_packages.PACKAGE_DIFF_STORE:
+            stored[params["key"]] = params["data"]
+            return [], []
+        if params["key"] in stored:
+            return [[stored[params["key"]]]], ["diff.data"]
+        return [], ["diff.data"]
+
+    mock_db.cypher_query.side_effect = cypher_query
+    get_changes = ct_packages.get_ct_packages_changes
+
+    computed = get_changes("SDTM CT 2023-12-15", "SDTM CT 2024-03-29")
+    loaded = get_changes("SDTM CT 2023-12-15", "SDTM CT 2024-03-29")
+
+    mock_compute.assert_called_once_with("SDTM CT 2023-12-15", "SDTM CT 2024-03-29")
+    assert list(stored) == ["SDTM CT 2023-12-15|SDTM CT 2024-03-29|"]
+    assert computed == loaded == CHANGES
+    assert isinstance(loaded["new_codelists"][0]["change_date"], neo4j.time.DateTime)
+    # the diff is read and computed in a read transaction, and stored in a write transaction
+    assert mock_db.read_transaction.__enter__.call_count == 2
+    assert mock_db.write_transaction.__enter__.call_count == 1
+
+
+@patch.object(ct_packages, "_compute_ct_packages_changes", return_value=CHANGES)
+@patch.object(ct_packages, "db")
+def test_ct_packages_changes_are_returned_when_they_cannot_be_stored(
+    mock_db, mock_compute
+):
+    def cypher_query(query, _params):
+        if query == ct_packages.PACKAGE_DIFF_STORE:
+            raise neo4j.exceptions.ClientError("Writing in read access mode")
+        return [], ["diff.data"]
+
+    mock_db.cypher_query.side_effect = cypher_query
+
+    assert (
+        ct_packages.get_ct_packages_changes("SDTM CT 2023-12-15", "SDTM CT 2024-03-29")
+        == CHANGES
+    )
+    mock_compute.assert_called_once()
+
+
+def test_diff_values_round_trip():
+    values = {
+        "datetime": neo4j.time.DateTime(2024, 3, 29, tzinfo=datetime.timezone.utc),
+        "date": neo4j.time.Date(2024, 3, 29),
+        "time": neo4j.time.Time(12, 30, 15),
+        "duration": neo4j.time.Duration(days=3, seconds=5),
+    }
+
+    data = json.dumps(ct_packages._encode_diff_value(values))
+
+    assert json.loads(data, object_hook=ct_packages._decode_diff_value) == values
+    assert ct_packages._encode_diff_value({"other": [object]}) == {
+        "other": [str(object)]
+    }
+
+
+def test_term_codelists_are_read_from_the_packages():
+    # the diffs are stored, so they must not depend on the codelists of the terms outside the packages
+    for query in (
+        ct_packages.PACKAGE_TERMS_DATA_RETRIEVAL,
+        ct_packages.TERM_DATA_RETRIEVAL_SPECIFIC_QUERY,
+    ):
+        assert "HAS_TERM" not in query
+        assert "(package_term)<-[:CONTAINS_TERM]-(:CTPackageCodelist)" in query
@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from clinical_mdr_api.repositories._utils import (
+    FilterOperator,
+    cached_header_values,
+    header_values_cache,
+    sb_clear_cache,
+)
+
+
+class MockModel(BaseModel):
+    name: str
+    synonyms: list[str]
+
+
+class MockRepository:
+    return_model = MockModel
+
+    def __init__(self, values: list):
+        self.query = MagicMock(side_effect=lambda *_: list(values))
+
+    @cached_header_values
+    def get_distinct_headers(
+        self,
+        field_name: str,
+        library: str | None = None,
+        search_string: str | None = "",
+        filter_by: dict | None = None,
+        filter_operator: FilterOperator | None = FilterOperator.AND,
+        page_size: int = 10,
+    ) -> list:
+        return self.query(
+            field_name, library, search_string, filter_by, filter_operator, page_size
+        )
+
+    @sb_clear_cache()
+    def save(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clear_header_values_cache():
+    header_values_cache.clear()
+    yield
+    header_values_cache.clear()
+
+
+def test_longer_search_string_narrows_cached_values():
+    repository = MockRepository(["Aspirin", "Paracetamol", "Ibuprofen"])
+
+    assert repository.get_distinct_headers("name", search_string="P") == [
+        "Aspirin",
+        "Paracetamol",
+        "Ibuprofen",
+    ]
+    assert repository.get_distinct_headers("name", search_string="pRo") == ["Ibuprofen"]
+    assert repository.get_distinct_headers("name", search_string="P") == [
+        "Aspirin",
+        "Paracetamol",
+        "Ibuprofen",
+    ]
+    repository.query.assert_called_once_with(
+        "name", None, "P", None, FilterOperator.AND, 10
+    )
+
+    # other filters, arguments and page sizes are cached separately
+    repository.get_distinct_headers("name", search_string="pro", library="Sponsor")
+    repository.get_distinct_headers(
+        "name", search_string="pro", filter_by={"uid": {"v": ["1"]}}
+    )
+    repository.get_distinct_headers("name", search_string="pro", page_size=2)
+    assert repository.query.call_count == 4
+
+
+@pytest.mark.parametrize(
+    "field_name, filter_by, filter_operator, values",
+    [
+        # a truncated result may miss values matching the longer search string
+        ("name", None, FilterOperator.AND, ["Aspirin", "Paracetamol"]),
+        # list fields are filtered by membership
+        ("synonyms", None, FilterOperator.AND, ["Aspirin"]),
+        # OR-ed filters may match values not containing the search string
+        ("name", {"uid": {"v": ["1"]}}, FilterOperator.OR, ["Aspirin"]),
+    ],
+)
+def test_values_are_not_narrowed_when_not_a_superset(
+    field_name, filter_by, filter_operator, values
+):
+    repository = MockRepository(values)
+
+    for search_string in ("p", "pa"):
+        repository.get_distinct_headers(
+            field_name,
+            search_string=search_string,
+            filter_by=filter_by,
+            filter_operator=filter_operator,
+            page_size=2,
+        )
+    assert repository.query.call_count == 2
+
+
+def test_write_hooks_clear_header_values():
+    repository = MockRepository(["Aspirin"])
+
+    repository.get_distinct_headers("name")
+    repository.save()
+    repository.get_distinct_headers("name")
+
+    assert repository.query.call_count == 2
@@ -0,0 +1,101 @@
+import asyncio
+import csv
+import io
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from clinical_mdr_api.models.utils import BaseModel, CustomPage
+from clinical_mdr_api.routers import export
+
+EXPORT_DEFINITION = {
+    "defaults": ["uid", "Names=terms.name", "is_final"],
+    "formats": ["text/csv", "text/xml"],
+}
+
+
+class Term(BaseModel):
+    name: str
+
+
+class Item(BaseModel):
+    uid: str
+    terms: list[Term] = []
+    is_final: bool = False
+
+
+ITEMS = [
+    Item(uid=f"Item_{i}", terms=[Term(name=f"a{i}"), Term(name=f"b{i}")])
+    for i in range(5)
+]
+
+
+def body(response) -> str:
+    async def read():
+        return [chunk async for chunk in response.body_iterator]
+
+    return "".join(
+        chunk if isinstance(chunk, str) else chunk.decode()
+        for chunk in asyncio.run(read())
+    )
+
+
+def list_endpoint(calls: list):
+    @export.allow_exports(EXPORT_DEFINITION)
+    def get_items(page_number: int = 1, page_size: int = 0, **_request_kwargs):
+        calls.append((page_number, page_size))
+        start = (page_number - 1) * page_size
+        items = ITEMS[start : start + page_size] if page_size else ITEMS
+        return CustomPage.create(
+            items=items, total=len(ITEMS), page=page_number, size=page_size
+        )
+
+    return get_items
+
+
+@patch.object(export, "EXPORT_PAGE_SIZE", 2)
+def test_export_of_all_items_fetches_pages():
+    calls = []
+    request = SimpleNamespace(headers={"accept": "text/csv"})
+
+    response = list_endpoint(calls)(request=request, page_number=1, page_size=0)
+    # the first page is fetched before the response is streamed
+    assert calls == [(1, 2)]
+
+    rows = list(csv.reader(io.StringIO(body(response))))
+    assert calls == [(1, 2), (2, 2), (3, 2)]
+    assert rows[0] == ["uid", "Names", "is_final"]
+    assert rows[1:] == [[f"Item_{i}", f"a{i}, b{i}", "No"] for i in range(5)]
+
+
+@patch.object(export, "EXPORT_PAGE_SIZE", 2)
+def test_export_of_a_page_fetches_only_that_page():
+    calls = []
+    request = SimpleNamespace(headers={"accept": "text/xml"})
+
+    response = list_endpoint(calls)(request=request, page_number=2, page_size=2)
+
+    assert body(response) == (
+        "<items>\n"
+        "  <item>\n"
+        "    <Names>a2, b2</Names>\n"
+        "    <is_final>No</is_final>\n"
+        "    <uid>Item_2</uid>\n"
+        "  </item>\n"
+        "  <item>\n"
+        "    <Names>a3, b3</Names>\n"
+        "    <is_final>No</is_final>\n"
+        "    <uid>Item_3</uid>\n"
+        "  </item>\n"
+        "</items>"
+    )
+    assert calls == [(2, 2)]
+
+
+def test_json_response_is_not_exported():
+    calls = []
+    request = SimpleNamespace(headers={"accept": "application/json"})
+
+    result = list_endpoint(calls)(request=request, page_number=1, page_size=0)
+
+    assert result.items == ITEMS
+    assert calls == [(1, 0)]
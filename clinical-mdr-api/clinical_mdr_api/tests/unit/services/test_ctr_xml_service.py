@@ -0,0 +1,78 @@
+import threading
+from functools import cached_property
+from unittest.mock import MagicMock, patch
+
+import ctrxml
+
+from clinical_mdr_api.services.ctr_xml import ctr_xml_service
+from clinical_mdr_api.services.ctr_xml.ctr_xml_service import CTRXMLService, ODMBuilder
+
+
+class ODMBuilderFake(ODMBuilder):
+    loaded_in: dict[str, str] = {}
+
+    def _load(self, name: str) -> list:
+        self.loaded_in[name] = threading.current_thread().name
+        return [name]
+
+    @cached_property
+    def study_metadata(self):
+        return self._load("study_metadata")
+
+    @cached_property
+    def study_visits(self):
+        return self._load("study_visits")
+
+    @cached_property
+    def ct_codelist_attributes(self):
+        return self._load("ct_codelist_attributes")
+
+
+def test_prefetch_loads_sections_concurrently():
+    builder = ODMBuilderFake("Study_000001")
+    builder.__dict__["study_visits"] = ["cached"]
+
+    builder.prefetch()
+
+    assert builder.study_metadata == ["study_metadata"]
+    assert builder.study_visits == ["cached"]
+    assert builder.ct_codelist_attributes == ["ct_codelist_attributes"]
+    assert set(builder.loaded_in) == {"study_metadata", "ct_codelist_attributes"}
+    assert threading.current_thread().name not in builder.loaded_in.values()
+
+
+def test_locked_study_sections_are_cached_and_copied_per_request():
+    CTRXMLService.cache_store_locked_sections.clear()
+    ODMBuilderFake.loaded_in = {}
+
+    study_service = MagicMock()
+    study_service.return_value.get_current_locked_version.return_value = "1"
+
+    with patch.object(ctr_xml_service, "StudyService", study_service), patch.object(
+        ctr_xml_service, "ODMBuilder", ODMBuilderFake
+    ), patch.object(ODMBuilderFake, "get_odm", lambda self: self):
+        first = CTRXMLService().get_odm("Study_000001")
+        first.study_visits.append("changed by the first request")
+        ODMBuilderFake.loaded_in = {}
+        second = CTRXMLService().get_odm("Study_000001")
+
+    assert second.study_visits == ["study_visits"]
+    assert set(ODMBuilderFake.loaded_in) == {"ct_codelist_attributes"}
+    CTRXMLService.cache_store_locked_sections.clear()
+
+
+def test_ctr_odm_stream():
+    odm = ctrxml.Odm(
+        odmversion=ctrxml.Odmversion.VALUE_1_3_2,
+        file_type=ctrxml.FileType.SNAPSHOT,
+        granularity=ctrxml.Granularity.METADATA,
+        source_system="OpenStudyBuilder",
+        study=[ctrxml.Study(oid="NN-1234")],
+    )
+
+    with patch.object(CTRXMLService, "get_odm", return_value=odm):
+        streamed = b"".join(CTRXMLService().get_ctr_odm_stream("Study_000001"))
+        rendered = CTRXMLService().get_ctr_odm("Study_000001")
+
+    assert streamed.decode() == rendered
+    assert 'OID="NN-1234"' in rendered
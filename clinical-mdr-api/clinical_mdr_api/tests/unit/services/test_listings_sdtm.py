@@ -0,0 +1,79 @@
+import io
+import zipfile
+from unittest.mock import patch
+
+from clinical_mdr_api.services.listings.listings_sdtm import SDTMListingsService
+
+
+def visit(study_id: str, number: int) -> dict:
+    return {
+        "STUDYID": study_id,
+        "DOMAIN": "TV",
+        "VISITNUM": number,
+        "VISIT": f"Visit {number}",
+        "VISITDY": number,
+        "ARMCD": None,
+        "ARM": None,
+        "TVSTRL": None,
+        "TVENRL": None,
+    }
+
+
+@patch("clinical_mdr_api.services.listings.listings_sdtm.QueryService")
+def test_released_datasets_are_cached(mock_query_service):
+    SDTMListingsService.cache_store_dataset.clear()
+    get_tv = mock_query_service.return_value.get_tv
+    get_tv.return_value = [visit("NN-123", 2), visit("NN-123", 1)]
+    service = SDTMListingsService()
+
+    for _ in range(2):
+        items = service._get_dataset(
+            "tv", study_uid="Study_000001", study_value_version="1"
+        )
+        items.sort(key=lambda item: item.VISITNUM)
+    service._get_dataset("tv", study_uid="Study_000001")
+    service._get_dataset("tv", study_uid="Study_000001")
+
+    assert get_tv.call_count == 3
+    assert [
+        item.VISITNUM
+        for item in service._get_dataset(
+            "tv", study_uid="Study_000001", study_value_version="1"
+        )
+    ] == [2, 1]
+
+
+@patch("clinical_mdr_api.services.listings.listings_sdtm.QueryService")
+def test_trial_design_archive(mock_query_service):
+    SDTMListingsService.cache_store_dataset.clear()
+    query_service = mock_query_service.return_value
+    for domain in ("ta", "te", "ti", "ts", "tdm"):
+        getattr(query_service, f"get_{domain}").return_value = []
+    query_service.get_tv.side_effect = lambda study_uid, study_value_version: [
+        visit(study_uid, 1)
+    ]
+
+    # runs the datasets of a study outside of a database transaction
+    with patch.object(
+        SDTMListingsService,
+        "get_trial_design_datasets",
+        SDTMListingsService.get_trial_design_datasets.__wrapped__,
+    ):
+        archive = b"".join(
+            SDTMListingsService().get_trial_design_archive(
+                [("Study_000001", None), ("Study_000002", "2")]
+            )
+        )
+
+    with zipfile.ZipFile(io.BytesIO(archive)) as zip_file:
+        names = zip_file.namelist()
+        tv = zip_file.read("Study_000002_2/tv.csv").decode()
+    assert names == [
+        f"{folder}/{domain}.csv"
+        for folder in ("Study_000001", "Study_000002_2")
+        for domain in ("ta", "te", "tv", "ti", "ts", "tdm")
+    ]
+    assert tv.splitlines() == [
+        '"STUDYID","DOMAIN","VISITNUM","VISIT","VISITDY","ARMCD","ARM","TVSTRL","TVENRL"',
+        '"Study_000002","TV","1","Visit 1","1","","","",""',
+    ]
@@ -1,7 +1,6 @@
 # pylint: disable=too-many-lines
 
 from collections import defaultdict
-from copy import deepcopy
 
 import pytest
 from pydantic import BaseModel
@@ -17,7 +16,7 @@ from clinical_mdr_api.models.study_selections.study_soa_footnote import StudySoA
 from clinical_mdr_api.models.study_selections.study_visit import StudyVisit
 from clinical_mdr_api.services.studies.study_flowchart import _T as _gettext
 from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
-from clinical_mdr_api.services.utils.table_f import TableRow, TableWithFootnotes
+from clinical_mdr_api.services.utils.table_f import Row, Table, TableWithFootnotes
 from clinical_mdr_api.tests.unit.services.soa_test_data import (
     ADD_PROTOCOL_SECTION_COLUMN_CASE1,
     ADD_PROTOCOL_SECTION_COLUMN_CASE2,
@@ -70,7 +69,7 @@ class MockStudyFlowchartService(StudyFlowchartService):
 
 
 def check_flowchart_table_dimensions(
-    table: TableWithFootnotes,
+    table: Table,
     layout: SoALayout,
     soa_preferences: StudySoaPreferencesInput,
 ):
@@ -96,7 +95,7 @@ def check_flowchart_table_dimensions(
 
 
 def check_flowchart_table_first_rows(
-    table: TableWithFootnotes,
+    table: Table,
     layout: SoALayout,
     study_epochs: list[StudyEpoch | MockStudyEpoch],
     study_visits: list[StudyVisit],
@@ -281,7 +280,7 @@ def check_flowchart_table_footnotes(table: dict, soa_footnotes: list[StudySoAFoo
 
 
 def check_flowchart_table_visit_rows(
-    table: TableWithFootnotes,
+    table: Table,
     layout: SoALayout,
     time_unit: str,
     study_visits: list[StudyVisit],
@@ -427,7 +426,7 @@ def check_flowchart_table_visit_rows(
     return visit_idx_by_uid
 
 
-def check_hidden_row_propagation(table: TableWithFootnotes):
+def check_hidden_row_propagation(table: Table):
     """Validates propagation of crosses from hidden rows to the first visible parent row"""
 
     path = []
@@ -659,7 +658,7 @@ def test_build_flowchart_table(mock_study_flowchart_service):
     assert table.title == DETAILED_SOA_TABLE.title
     assert table.footnotes == DETAILED_SOA_TABLE.footnotes
 
-    assert table.dict() == DETAILED_SOA_TABLE.model_dump()
+    assert table.to_model().model_dump() == DETAILED_SOA_TABLE.model_dump()
 
 
 @pytest.mark.parametrize(
@@ -672,21 +671,21 @@ def test_build_flowchart_table(mock_study_flowchart_service):
 def test_propagate_hidden_rows(
     propagate_refs: bool, soa: TableWithFootnotes, expected_soa: TableWithFootnotes
 ):
-    table = deepcopy(soa)
+    table = Table.from_model(soa)
     StudyFlowchartService.propagate_hidden_rows(
         table.rows, propagate_refs=propagate_refs
     )
-    assert table.model_dump() == expected_soa.model_dump()
+    assert table.to_model().model_dump() == expected_soa.model_dump()
 
 
 def test_propagate_hidden_rows_2():
-    table: TableWithFootnotes = deepcopy(DETAILED_SOA_TABLE)
+    table = Table.from_model(DETAILED_SOA_TABLE)
     StudyFlowchartService.propagate_hidden_rows(table.rows)
     check_hidden_row_propagation(table)
 
 
 def test_show_hidden_rows():
-    table = deepcopy(DETAILED_SOA_TABLE)
+    table = Table.from_model(DETAILED_SOA_TABLE)
     StudyFlowchartService.show_hidden_rows(table.rows)
 
     assert table.num_header_rows == DETAILED_SOA_TABLE.num_header_rows
@@ -695,8 +694,8 @@ def test_show_hidden_rows():
     assert table.footnotes == DETAILED_SOA_TABLE.footnotes
     assert len(table.rows) == len(DETAILED_SOA_TABLE.rows)
 
-    row: TableRow
-    for row, expected_row in zip(table.rows, DETAILED_SOA_TABLE.rows):
+    row: Row
+    for row, expected_row in zip(table.rows, Table.from_model(DETAILED_SOA_TABLE).rows):
         assert row.cells == expected_row.cells
         assert row.hide is False
 
@@ -772,9 +771,7 @@ def test_get_header_rows_with_soa_preferences(
         layout=layout,
     )
 
-    table = TableWithFootnotes(
-        rows=header_rows, num_header_rows=len(header_rows), num_header_cols=1
-    )
+    table = Table(rows=header_rows, num_header_rows=len(header_rows), num_header_cols=1)
 
     # Test dimensions
     check_flowchart_table_dimensions(table, layout, soa_preferences)
@@ -795,6 +792,6 @@ def test_get_header_rows_with_soa_preferences(
     ],
 )
 def test_add_protocol_section_column(test_table, expected_table):
-    table = deepcopy(test_table)
+    table = Table.from_model(test_table)
     StudyFlowchartService.add_protocol_section_column(table)
-    assert table.dict() == expected_table.dict()
+    assert table.to_model().model_dump() == expected_table.model_dump()
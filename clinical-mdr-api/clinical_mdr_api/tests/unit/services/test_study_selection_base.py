@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock
+
+from clinical_mdr_api.domains.versioned_object_aggregate import LibraryItemStatus
+from clinical_mdr_api.services.studies.study_selection_base import (
+    StudySelectionLoader,
+    StudySelectionMixin,
+)
+
+
+def term(uid: str) -> MagicMock:
+    return MagicMock(uid=uid)
+
+
+def test_prime_terms_resolves_terms_in_one_query():
+    repos = MagicMock()
+    repos.ct_term_name_repository.find_by_uids.return_value = [
+        term("CTTerm_1"),
+        term("CTTerm_2"),
+    ]
+    loader = StudySelectionLoader(repos)
+
+    loader.prime_terms(
+        ["CTTerm_1", None, "CTTerm_2", "CTTerm_1", "CTTerm_3"],
+        status=LibraryItemStatus.FINAL,
+        codelist_name="Objective Level",
+    )
+    loader.prime_terms(
+        ["CTTerm_1"], status=LibraryItemStatus.FINAL, codelist_name="Objective Level"
+    )
+
+    repos.ct_term_name_repository.find_by_uids.assert_called_once_with(
+        term_uids=["CTTerm_1", "CTTerm_2", "CTTerm_3"],
+        status=LibraryItemStatus.FINAL,
+        at_specific_date=None,
+        codelist_name="Objective Level",
+        include_retired_versions=False,
+    )
+    assert (
+        loader.find_term(
+            "CTTerm_2",
+            status=LibraryItemStatus.FINAL,
+            codelist_name="Objective Level",
+        ).uid
+        == "CTTerm_2"
+    )
+    repos.ct_term_name_repository.find_by_uid.assert_not_called()
+
+    # the terms not returned by the batch and other lookups are resolved one by one, once
+    for _ in range(2):
+        loader.find_term(
+            "CTTerm_3", status=LibraryItemStatus.FINAL, codelist_name="Objective Level"
+        )
+        loader.find_term("CTTerm_2")
+    assert repos.ct_term_name_repository.find_by_uid.call_count == 2
+
+
+def test_get_loads_each_key_once():
+    loader = StudySelectionLoader(MagicMock())
+    load = MagicMock(side_effect=["first", "second"])
+
+    assert loader.get(("objective", "Objective_000001"), load) == "first"
+    assert loader.get(("objective", "Objective_000001"), load) == "first"
+    assert loader.get(("objective", "Objective_000001", "1.0"), load) == "second"
+    assert load.call_count == 2
+
+
+def test_is_page_query_only_for_database_fields_and_operators():
+    page_fields = {"study_endpoint_uid": "uid", "endpoint.name": "endpoint_name"}
+
+    assert StudySelectionMixin._is_page_query(
+        page_fields,
+        {"endpoint.name": {"v": ["pain"], "op": "co"}},
+        {"study_endpoint_uid": True},
+        no_brackets=False,
+    )
+    assert not StudySelectionMixin._is_page_query(
+        page_fields, {"endpoint.name": {"v": ["pain"]}}, None, no_brackets=True
+    )
+    assert not StudySelectionMixin._is_page_query(
+        page_fields, {"study_endpoint_uid": {"v": ["a"], "op": "gt"}}, None, False
+    )
+    assert not StudySelectionMixin._is_page_query(
+        page_fields, None, {"endpoint_level.term_name": True}, False
+    )
+
+
+def test_ordered_selections_keep_aggregate_order():
+    selections = [MagicMock(study_selection_uid=uid) for uid in ("a", "b", "c")]
+
+    assert StudySelectionMixin._ordered_selections(selections) == [
+        (1, selections[0]),
+        (2, selections[1]),
+        (3, selections[2]),
+    ]
+    assert StudySelectionMixin._ordered_selections(selections, ["c", "x", "a"]) == [
+        (3, selections[2]),
+        (1, selections[0]),
+    ]
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from starlette.middleware import Middleware
+from starlette.testclient import TestClient
+
+from clinical_mdr_api.utils.lazy_routers import (
+    LazyRouter,
+    LazyRouterGroup,
+    LazyRouterMiddleware,
+    include_router_groups,
+)
+
+router = APIRouter()
+
+
+@router.get("/items")
+def get_items():
+    return ["item"]
+
+
+def lazy_app() -> tuple[FastAPI, LazyRouterGroup]:
+    app = FastAPI(middleware=[Middleware(LazyRouterMiddleware)])
+    group = LazyRouterGroup("Lazy", [LazyRouter(__name__, "/lazy", ["Lazy"])])
+    app.state.lazy_router_groups = (group,)
+    return app, group
+
+
+def test_group_is_included_on_first_request_to_its_prefix():
+    app, group = lazy_app()
+    client = TestClient(app)
+
+    assert client.get("/lazy-items").status_code == 404
+    assert not group.included
+
+    assert client.get("/lazy/items").json() == ["item"]
+    assert group.included
+    assert client.get("/lazy/items").json() == ["item"]
+    assert [route.path for route in app.routes].count("/lazy/items") == 1
+
+
+def test_group_is_included_outside_of_the_event_loop_thread():
+    app, group = lazy_app()
+    include = group.include
+    calls = []
+
+    def include_in_thread(application):
+        calls.append(application)
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        include(application)
+
+    group.include = include_in_thread
+    with TestClient(app) as client:
+        assert client.get("/lazy/items").json() == ["item"]
+        assert client.get("/lazy/items").json() == ["item"]
+
+    assert calls == [app]
+
+
+def test_include_router_groups():
+    app, group = lazy_app()
+
+    include_router_groups(app)
+    include_router_groups(app)
+
+    assert group.included
+    assert [route.path for route in app.routes].count("/lazy/items") == 1
+    assert "/lazy/items" in app.openapi()["paths"]
@@ -0,0 +1,104 @@
+"""Routers imported and included in the application on the first request to one of their paths"""
+
+import importlib
+import logging
+import re
+import threading
+import time
+from typing import Iterable, NamedTuple
+
+import anyio.to_thread
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+log = logging.getLogger(__name__)
+
+
+class LazyRouter(NamedTuple):
+    module: str
+    prefix: str
+    tags: list[str]
+    attribute: str = "router"
+
+
+class LazyRouterGroup:
+    """
+    Routers of rarely used endpoints, whose modules are only imported when the group is included in the application.
+
+    A group is included on the first request to one of its paths (see `LazyRouterMiddleware`),
+    or when all the routes are needed, e.g. to generate the OpenAPI schema.
+    Its paths must not be matched by the routes included in the application before the group.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        routers: Iterable[LazyRouter],
+        path_pattern: str | None = None,
+    ):
+        """`path_pattern` matches the paths of the group, by default the paths under the prefixes of its routers"""
+
+        self.name = name
+        self.routers = tuple(routers)
+        if path_pattern is None:
+            prefixes = sorted({re.escape(router.prefix) for router in self.routers})
+            path_pattern = f"(?:{'|'.join(prefixes)})(?:/|$)"
+        self._path_re = re.compile(path_pattern)
+        self.included = False
+        self._lock = threading.Lock()
+
+    def matches(self, path: str) -> bool:
+        return self._path_re.match(path) is not None
+
+    def include(self, app: FastAPI):
+        if self.included:
+            return
+        with self._lock:
+            if self.included:
+                return
+            started = time.perf_counter()
+            for router in self.routers:
+                app.include_router(
+                    getattr(importlib.import_module(router.module), router.attribute),
+                    prefix=router.prefix,
+                    tags=router.tags,
+                )
+            self.included = True
+        log.info(
+            "Router group %s included in %.2fs",
+            self.name,
+            time.perf_counter() - started,
+        )
+
+
+def include_router_groups(app: FastAPI):
+    """Includes all the lazy router groups of the application"""
+
+    for group in getattr(app.state, "lazy_router_groups", ()):
+        group.include(app)
+
+
+class LazyRouterMiddleware:
+    """
+    Includes the lazy router group matching the path of a request before it is routed.
+
+    The groups are read from the `lazy_router_groups` state of the application.
+    The routers are imported in a worker thread, not to block the event loop while a group is included.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket"):
+            application = scope["app"]
+            groups = getattr(application.state, "lazy_router_groups", ())
+            if groups:
+                path = scope["path"]
+                root_path = scope.get("root_path", "")
+                if root_path and path.startswith(root_path):
+                    path = path[len(root_path) :]
+                for group in groups:
+                    if not group.included and group.matches(path):
+                        await anyio.to_thread.run_sync(group.include, application)
+        await self.app(scope, receive, send)
@@ -0,0 +1,60 @@
+"""
+Warm-up of the application in the master process of a prefork server (see `gunicorn.conf.py`).
+
+Everything built here before the workers are forked is shared copy-on-write by the workers,
+instead of being built again by each worker on its first requests.
+"""
+
+import logging
+import time
+
+from fastapi import FastAPI
+from neo4j.exceptions import DriverError, Neo4jError
+from neomodel import db
+
+from clinical_mdr_api.domain_repositories.study_selections.study_epoch_repository import (
+    get_ct_terms_by_codelist,
+)
+from clinical_mdr_api.domain_repositories.user_repository import user_directory
+from clinical_mdr_api.models.utils import compile_mapping_plans
+from clinical_mdr_api.services.studies import study_epoch, study_visit
+from common import config
+
+log = logging.getLogger(__name__)
+
+
+def prime_caches():
+    """Loads the process-wide caches read by most requests: the user directory and the CT terms of the study epochs and visits"""
+
+    user_directory.get_users(())
+    for codelist_names in (
+        study_epoch.CT_CODELIST_NAMES,
+        study_visit.CT_CODELIST_NAMES,
+    ):
+        get_ct_terms_by_codelist(codelist_names)
+
+
+def warm_up(app: FastAPI):
+    """
+    Builds the OpenAPI schema and the mapping plans of the models and, if `WARMUP_PRIME_CACHES` is set, primes the caches.
+
+    The database connection opened for priming is closed, as a connection must not be shared by forked processes,
+    each worker opens its own on its first query.
+    """
+
+    started = time.perf_counter()
+    app.openapi()
+    mapping_plans = compile_mapping_plans()
+    if config.WARMUP_PRIME_CACHES:
+        try:
+            prime_caches()
+        except (DriverError, Neo4jError, OSError) as error:
+            # the workers load the caches on their first requests
+            log.warning("Priming the caches failed: %s", error)
+        finally:
+            db.close_connection()
+    log.info(
+        "Warmed up in %.2fs, %s mapping plans compiled",
+        time.perf_counter() - started,
+        mapping_plans,
+    )
@@ -2,6 +2,7 @@
 
 import os
 import string
+import tempfile
 import urllib.parse
 from os import environ
 
@@ -23,6 +24,21 @@ db_name = environ.get("NEO4J_DATABASE")
 if db_name:
     neomodel_config.DATABASE_URL = urllib.parse.urljoin(neo4j_dsn, f"/{db_name}")
 
+# Neo4j driver settings, shared by the neomodel driver and the async read driver (see `common.async_db`)
+NEO4J_MAX_CONNECTION_POOL_SIZE = int(environ.get("NEO4J_MAX_CONNECTION_POOL_SIZE", 100))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(
+    environ.get("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", 60.0)
+)
+neomodel_config.MAX_CONNECTION_POOL_SIZE = NEO4J_MAX_CONNECTION_POOL_SIZE
+neomodel_config.CONNECTION_ACQUISITION_TIMEOUT = NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+# Number of records fetched per batch by the async read driver
+NEO4J_FETCH_SIZE = int(environ.get("NEO4J_FETCH_SIZE", 1000))
+# Route the queries of the async read driver to the readers (followers) of a cluster, needs a neo4j:// DSN.
+# Off by default: the followers may not have applied a write yet, so a read right after a write can be stale.
+NEO4J_READ_FROM_FOLLOWERS = environ.get(
+    "NEO4J_READ_FROM_FOLLOWERS", "false"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+
 
 class Settings(BaseSettings):
     app_name: str = "Clinical MDR API"
@@ -36,6 +52,23 @@ NUMBER_OF_UID_DIGITS = 6
 
 CACHE_MAX_SIZE = int(environ.get("CACHE_MAX_SIZE", 1000))
 CACHE_TTL = int(environ.get("CACHE_TTL", 3600))
+# Seconds for which the distinct values returned by the header endpoints are cached
+HEADER_VALUES_CACHE_TTL = int(environ.get("HEADER_VALUES_CACHE_TTL", 60))
+# Seconds after which the in-memory user directory is refreshed with the users created or updated since
+USER_DIRECTORY_REFRESH_SECONDS = float(
+    environ.get("USER_DIRECTORY_REFRESH_SECONDS", "10")
+)
+# Seconds after which the in-memory snapshots of the feature flags and notifications are reloaded, 0 disables it,
+# for the changes made through the API instances of other hosts (the workers of a host signal their changes)
+SNAPSHOT_MAX_AGE_SECONDS = float(environ.get("SNAPSHOT_MAX_AGE_SECONDS", "60"))
+# Directory of the files through which the workers of a host signal the changes of the in-memory snapshots
+SNAPSHOT_CHANNEL_DIR = environ.get("SNAPSHOT_CHANNEL_DIR") or os.path.join(
+    tempfile.gettempdir(), "clinical-mdr-api-snapshots"
+)
+# Load the user directory and the CT terms of the study epochs and visits before the workers are forked
+WARMUP_PRIME_CACHES = environ.get(
+    "WARMUP_PRIME_CACHES", "true"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
 
 MAX_INT_NEO4J = 9223372036854775807
 DEFAULT_PAGE_NUMBER = 1
@@ -49,7 +82,22 @@ UNSCHEDULED_VISIT_NUMBER = 29500
 VISIT_0_NUMBER = 0
 FIXED_WEEK_PERIOD = 7
 
+# Number of studies whose SDTM trial design datasets are built concurrently for archives, shared by the requests
+SDTM_LISTINGS_BATCH_WORKERS = int(environ.get("SDTM_LISTINGS_BATCH_WORKERS", "4"))
+
+# Number of threads loading the sections of CTR XML documents concurrently, shared by the requests
+CTR_XML_PREFETCH_WORKERS = int(environ.get("CTR_XML_PREFETCH_WORKERS", "6"))
+
+# Size up to which CTR XML documents are serialized in memory before they are spooled to disk
+CTR_XML_SPOOL_MAX_SIZE = int(environ.get("CTR_XML_SPOOL_MAX_SIZE", 8 * 1024 * 1024))
+
 OPERATIONAL_SOA_DOCX_TEMPLATE = "operational-soa-template.docx"
+# Number of worker processes rendering DOCX documents of large tables, 0 renders them in the request thread
+DOCX_RENDERING_WORKERS = int(environ.get("DOCX_RENDERING_WORKERS", "0"))
+# Minimum number of table cells to render a DOCX document in a worker process
+DOCX_RENDERING_WORKER_MIN_CELLS = int(
+    environ.get("DOCX_RENDERING_WORKER_MIN_CELLS", "10000")
+)
 XML_STYLESHEET_DIR_PATH = "xml_stylesheets/"
 
 SDTM_CT_CATALOGUE_NAME = "SDTM CT"
@@ -126,6 +174,14 @@ SPONSOR_MODEL_VERSION_NUMBER_PREFIX = "NN"
 APPINSIGHTS_CONNECTION = environ.get("APPLICATIONINSIGHTS_CONNECTION_STRING", "")
 
 OPENAPI_SCHEMA_API_ROOT_PATH = environ.get("UVICORN_ROOT_PATH") or "/"
+# OpenAPI schema saved by `generate_openapi_json.py --prebuilt`, served instead of generating it if built for the running API version
+OPENAPI_PREBUILT_SCHEMA_FILE = environ.get(
+    "OPENAPI_PREBUILT_SCHEMA_FILE", "openapi.prebuilt.json"
+)
+# Include the rarely used router groups (ODM, listings, CTR XML, USDM) on their first request instead of on startup
+LAZY_ROUTER_GROUPS = environ.get("LAZY_ROUTER_GROUPS", "true").upper().strip() not in (
+    _UPPERCASE_FALSE_STRINGS
+)
 
 TRACING_DISABLED = environ.get("TRACING_DISABLED", "").upper().strip() not in (
     _UPPERCASE_FALSE_STRINGS
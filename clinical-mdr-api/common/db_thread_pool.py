@@ -0,0 +1,64 @@
+"""
+Thread pools running the database reads of a request concurrently.
+
+neomodel keeps its connection in the thread-local `db`, so a new thread opens its own neo4j driver,
+with its own connection pool, on its first query. The worker threads of a `DatabaseThreadPool` are long-lived,
+and run each task on the driver and the database of the thread that submitted it instead,
+in a copy of its context (e.g. the authenticated user and the request metrics).
+"""
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+import neo4j
+from neomodel import db
+
+T = TypeVar("T")
+
+
+def _run_on_driver(
+    driver: neo4j.Driver | None,
+    database_name: str | None,
+    func: Callable[..., T],
+    *args: Any,
+) -> T:
+    # without the driver of the submitting thread, the thread connects on its first query as usual
+    if driver is not None:
+        db._database_name = database_name  # pylint: disable=protected-access
+        if db.driver is not driver:
+            db.set_connection(driver=driver)
+    return func(*args)
+
+
+class DatabaseThreadPool:
+    """
+    Pool of `max_workers` threads, started on first use, running tasks on the neo4j driver of the submitting thread.
+
+    The pool is shared by the requests of the process, and also bounds their number of concurrent tasks.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.name
+                )
+            return self._executor
+
+    def submit(self, func: Callable[..., T], *args: Any) -> Future[T]:
+        return self._get_executor().submit(
+            contextvars.copy_context().run,
+            _run_on_driver,
+            db.driver,
+            db._database_name,  # pylint: disable=protected-access
+            func,
+            *args,
+        )
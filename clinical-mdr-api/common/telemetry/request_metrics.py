@@ -3,7 +3,7 @@ import json
 import logging
 import time
 from functools import wraps
-from typing import Mapping
+from typing import Callable, Mapping
 
 import neomodel
 import opencensus.trace
@@ -20,6 +20,10 @@ log = logging.getLogger(__name__)
 
 REQUEST_METRICS_HEADER_NAME = "X-Metrics"
 
+# Callbacks receiving (query, params, walltime) of every executed Cypher query, see capture_cypher_queries()
+CypherQueryListener = Callable[[str, Mapping, float], None]
+_cypher_query_listeners: list[CypherQueryListener] = []
+
 
 class RequestMetrics(BaseModel):
     """Per-request metrics"""
@@ -102,10 +106,11 @@ def add_request_metrics_header(
 # pylint: disable=unused-argument
 def cypher_tracing(query: str, params: Mapping):
     """cypher query tracing and metrics to Opencensus"""
+    start_time = time.time()
+
     # update request metrics
     if metrics := get_request_metrics():
         metrics.cypher_count += 1
-        start_time = time.time()
 
     with trace_block("neomodel.query") as span:
         span.add_attribute("cypher.query", query[: config.TRACE_QUERY_MAX_LEN])
@@ -114,10 +119,13 @@ def cypher_tracing(query: str, params: Mapping):
         # run the query (or any wrapped code) as a distinct operation (logical tracing block == Span)
         yield
 
+    delta_time = time.time() - start_time
+
+    for listener in _cypher_query_listeners:
+        listener(query, params, delta_time)
+
     # update cypher query metrics of the request
     if metrics:
-        # pylint: disable=possibly-used-before-assignment
-        delta_time = time.time() - start_time
         metrics.cypher_times += delta_time
 
         # find the slowest query of the request
@@ -130,9 +138,24 @@ def cypher_tracing(query: str, params: Mapping):
                 # metrics.cypher_slowest_query_params = params
 
 
+@contextlib.contextmanager
+def capture_cypher_queries(listener: CypherQueryListener):
+    """Calls `listener(query, params, walltime)` for every Cypher query executed within the block"""
+
+    patch_neomodel_database()
+    _cypher_query_listeners.append(listener)
+    try:
+        yield
+    finally:
+        _cypher_query_listeners.remove(listener)
+
+
 def patch_neomodel_database():
     """Monkey-patch neomodel.core.db singleton to trace Cypher queries"""
 
+    if getattr(neomodel.sync_.core.Database._run_cypher_query, "traces_cypher", False):
+        return
+
     def wrap(func):
         @wraps(func)
         def _run_cypher_query(
@@ -155,6 +178,7 @@ def patch_neomodel_database():
                     resolve_objects=resolve_objects,
                 )
 
+        _run_cypher_query.traces_cypher = True
         return _run_cypher_query
 
     log.info("Patching neomodel.util.Database")
@@ -0,0 +1,41 @@
+import contextvars
+import threading
+from unittest.mock import patch
+
+from neomodel import db
+
+from common.db_thread_pool import DatabaseThreadPool
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def connection() -> tuple:
+    return (
+        db.driver,
+        db._database_name,  # pylint: disable=protected-access
+        request_id.get(),
+        threading.current_thread().name,
+    )
+
+
+def set_connection(database, driver):
+    database.driver = driver
+
+
+@patch.object(type(db), "set_connection", autospec=True, side_effect=set_connection)
+def test_tasks_run_on_driver_of_submitting_thread(mock_set_connection):
+    pool = DatabaseThreadPool("test-pool", max_workers=1)
+    driver = object()
+    db.driver, db._database_name = driver, "mdrdb"
+    request_id.set("request-1")
+    try:
+        first = pool.submit(connection).result()
+        second = pool.submit(connection).result()
+    finally:
+        db.driver, db._database_name = None, None
+
+    assert first[:3] == (driver, "mdrdb", "request-1")
+    assert first[3].startswith("test-pool")
+    # the worker thread is reused with the same driver, no driver is opened per task
+    assert second == first
+    assert mock_set_connection.call_count == 1
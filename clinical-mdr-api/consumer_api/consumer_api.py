@@ -16,6 +16,7 @@ from pydantic import ValidationError
 from starlette_context.middleware import RawContextMiddleware
 
 from common import config, exceptions
+from common.async_db import adb
 from common.auth.config import OAUTH_ENABLED, SWAGGER_UI_INIT_OAUTH
 from common.auth.dependencies import dummy_user_auth, validate_token
 from common.auth.discovery import reconfigure_with_openid_discovery
@@ -115,6 +116,7 @@ async def lifespan(_app: FastAPI):
         # Reconfiguring Swagger UI settings with OpenID Connect discovery
         await reconfigure_with_openid_discovery()
     yield
+    await adb.close()
 
 
 app = FastAPI(
@@ -6,6 +6,8 @@ from typing import Any
 
 from neomodel.sync_.core import db
 
+from common.async_db import adb
+
 APP_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
 
 
@@ -46,6 +48,20 @@ def query(
     return rows, columns
 
 
+async def aquery(cypher_query, params: dict = None, to_dict_list: bool = True):
+    """
+    Runs a read query with `adb.cypher_query()`, without blocking the event loop
+
+    Returns the same as `query()`.
+    """
+    rows, columns = await adb.cypher_query(cypher_query, params)
+
+    if to_dict_list:
+        return [get_db_result_as_dict(row, columns) for row in rows]
+
+    return rows, columns
+
+
 def urlencode_link(link: str) -> str:
     """URL encodes a link"""
 
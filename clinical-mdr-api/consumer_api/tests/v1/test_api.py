@@ -397,6 +397,31 @@ def test_get_studies_filtering(api_client):
         assert f"id={filter_by_id}&" in res[key]
 
 
+def test_get_studies_after_lock_and_unlock(api_client):
+    study = studies[-1]
+    locked_version = TestUtils.lock_and_unlock_study(study.uid)
+
+    response = api_client.get(f"{BASE_URL}/studies?page_size=1000")
+    assert_response_status_code(response, 200)
+    res = response.json()
+    item = next(item for item in res["items"] if item["uid"] == study.uid)
+
+    # Versions are ordered by start date, latest first
+    assert item["versions"][0]["version_status"] == "DRAFT"
+    assert any(
+        version["version_status"] == "LOCKED"
+        and version["version_number"] == locked_version
+        for version in item["versions"]
+    )
+
+    for study_version_number in [None, locked_version]:
+        url = f"{BASE_URL}/studies/{study.uid}/study-visits"
+        if study_version_number:
+            url += f"?study_version_number={study_version_number}"
+        response = api_client.get(url)
+        assert_response_status_code(response, 200)
+
+
 def test_get_studies_invalid_pagination_params(api_client):
     response = api_client.get(f"{BASE_URL}/studies?page_size=0")
     assert_response_status_code(response, 422)
@@ -6,9 +6,9 @@ from common.exceptions import NotFoundException
 from common.utils import validate_page_number_and_page_size
 from consumer_api.shared.common import (
     SortByType,
+    aquery,
     db_pagination_clause,
     db_sort_clause,
-    query,
 )
 from consumer_api.v1 import models
 
@@ -20,14 +20,14 @@ def get_base_query_for_study_root_and_value(study_version_number: str | None) ->
         WITH study_root, study_value, hv ORDER BY hv.end_date DESC LIMIT 1
         """
 
+    # The current version of the study is resolved when the study is saved, see `StudyHeader`
     return """
-    MATCH (study_root:StudyRoot {uid: $study_uid})-[latest:LATEST]->(study_value:StudyValue)
-    MATCH (study_root)-[hv:HAS_VERSION]->(study_value)
-    WITH study_root, study_value, hv ORDER BY hv.end_date DESC LIMIT 1
+    MATCH (study_root:StudyRoot {uid: $study_uid})-[:HAS_HEADER]->(header:StudyHeader)
+    MATCH (study_root)-[:LATEST]->(study_value:StudyValue)
     """
 
 
-def get_studies(
+async def get_studies(
     sort_by: models.SortByStudies = models.SortByStudies.UID,
     sort_order: models.SortOrder = models.SortOrder.ASC,
     page_size: int = 10,
@@ -43,8 +43,23 @@ def get_studies(
         params["id"] = id.strip()
         filter_clause = "WHERE id CONTAINS toUpper($id)"
 
-    base_query = f"""
-        MATCH (study_root:StudyRoot)-[:LATEST]->(study_value:StudyValue)
+    sort_clause = db_sort_clause(sort_by.value, sort_order.value)
+
+    # Filtering, sorting and paging is done on the study headers,
+    # the versions are only collected for the studies of the requested page
+    full_query = f"""
+        MATCH (study_root:StudyRoot)-[:HAS_HEADER]->(header:StudyHeader)
+        WITH
+            study_root,
+            header.uid as uid,
+            header.acronym as acronym,
+            header.id_prefix as id_prefix,
+            header.number as number,
+            header.study_id as id
+
+        {filter_clause}
+
+        WITH * {sort_clause} {db_pagination_clause(page_size, page_number)}
         OPTIONAL MATCH (study_root)-[hv:HAS_VERSION]->(:StudyValue)
         OPTIONAL MATCH (author:User) WHERE author.user_id = hv.author_id
         WITH *,
@@ -54,14 +69,11 @@ def get_studies(
             }}) AS authors
         ORDER BY hv.start_date DESC
         WITH
-            study_root.uid as uid,
-            study_value.study_acronym as acronym,
-            study_value.study_id_prefix as id_prefix,
-            study_value.study_number as number,
-            CASE study_value.subpart_id
-                WHEN IS NULL THEN toUpper(COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, ''))
-                ELSE toUpper(COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, '')) + "-" + study_value.subpart_id
-            END AS id,
+            uid,
+            acronym,
+            id_prefix,
+            number,
+            id,
             COLLECT({{
                 version_status: hv.status,
                 version_number: hv.version,
@@ -72,29 +84,20 @@ def get_studies(
                 version_description: hv.change_description
             }}) as versions
 
-        {filter_clause}
-
         RETURN *
+        {sort_clause}
         """
 
-    full_query = " ".join(
-        [
-            base_query,
-            db_sort_clause(sort_by.value, sort_order.value),
-            db_pagination_clause(page_size, page_number),
-        ]
-    )
-    return query(full_query, params)
+    return await aquery(full_query, params)
 
 
-def get_study_version(
+async def get_study_version(
     study_uid: str, study_version_number: str | None
 ) -> dict[str, Any]:
     params = {"study_uid": study_uid, "study_version_number": study_version_number}
 
-    base_query = get_base_query_for_study_root_and_value(study_version_number)
-    full_query = f"""
-        {base_query}
+    if study_version_number:
+        return_clause = """
         RETURN  hv.version AS version_number,
                 hv.status AS version_status,
                 hv.start_date AS version_started_at,
@@ -102,8 +105,23 @@ def get_study_version(
                 hv.change_description AS version_description,
                 hv.author_id AS version_author_id
         """
+    else:
+        return_clause = """
+        RETURN  header.version_number AS version_number,
+                header.version_status AS version_status,
+                header.version_started_at AS version_started_at,
+                header.version_ended_at AS version_ended_at,
+                header.version_description AS version_description,
+                header.version_author_id AS version_author_id
+        """
+
+    base_query = get_base_query_for_study_root_and_value(study_version_number)
+    full_query = f"""
+        {base_query}
+        {return_clause}
+        """
 
-    res = query(full_query, params)
+    res = await aquery(full_query, params)
 
     NotFoundException.raise_if_not(
         res,
@@ -116,7 +134,7 @@ def get_study_version(
     return res[0]
 
 
-def get_study_visits(
+async def get_study_visits(
     study_uid: str,
     sort_by: models.SortByStudyVisits = models.SortByStudyVisits.UID,
     sort_order: models.SortOrder = models.SortOrder.ASC,
@@ -177,10 +195,10 @@ def get_study_visits(
             db_pagination_clause(page_size, page_number),
         ]
     )
-    return query(full_query, params)
+    return await aquery(full_query, params)
 
 
-def get_study_activities(
+async def get_study_activities(
     study_uid: str,
     sort_by: models.SortByStudyActivities = models.SortByStudyActivities.UID,
     sort_order: models.SortOrder = models.SortOrder.ASC,
@@ -194,7 +212,7 @@ def get_study_activities(
     base_query = get_base_query_for_study_root_and_value(study_version_number)
 
     base_query += """
-        WITH study_root, study_value, hv
+        WITH study_root, study_value
         MATCH (study_value)-[:HAS_STUDY_ACTIVITY]->(sa:StudyActivity)-[:HAS_SELECTED_ACTIVITY]->(av:ActivityValue)<-[:HAS_VERSION]-(ar:ActivityRoot)
         MATCH (sa)-[:STUDY_ACTIVITY_HAS_STUDY_SOA_GROUP]->(soa_group:StudySoAGroup)-[:HAS_FLOWCHART_GROUP]->(soa_group_term:CTTermRoot)-[:HAS_NAME_ROOT]->(:CTTermNameRoot)-[:LATEST]->(soa_group_term_value:CTTermNameValue)
         MATCH (ar)<-[:CONTAINS_CONCEPT]-(lib:Library)
@@ -251,10 +269,10 @@ def get_study_activities(
             db_pagination_clause(page_size, page_number),
         ]
     )
-    return query(full_query, params)
+    return await aquery(full_query, params)
 
 
-def get_study_detailed_soa(
+async def get_study_detailed_soa(
     study_uid: str,
     sort_by: models.SortByStudyActivities = models.SortByStudyActivities.UID,
     sort_order: models.SortOrder = models.SortOrder.ASC,
@@ -275,7 +293,6 @@ def get_study_detailed_soa(
         WHERE NOT (study_activity)<-[:BEFORE]-()
         
         WITH
-            hv,
             study_root,
             study_value,
             study_activity_schedule,
@@ -307,10 +324,10 @@ def get_study_detailed_soa(
             db_pagination_clause(page_size, page_number),
         ]
     )
-    return query(full_query, params)
+    return await aquery(full_query, params)
 
 
-def get_study_operational_soa(
+async def get_study_operational_soa(
     study_uid: str,
     sort_by: models.SortByStudyOperationalSoA = models.SortByStudyOperationalSoA.ACTIVITY_NAME,
     sort_order: models.SortOrder = models.SortOrder.ASC,
@@ -331,7 +348,6 @@ def get_study_operational_soa(
         WHERE NOT (study_activity)<-[:BEFORE]-() AND (study_activity_instance)-[:HAS_SELECTED_ACTIVITY_INSTANCE]-()
         
         WITH
-            hv,
             study_root,
             study_value,
             study_visit,
@@ -372,4 +388,4 @@ def get_study_operational_soa(
             db_pagination_clause(page_size, page_number),
         ]
     )
-    return query(full_query, params)
+    return await aquery(full_query, params)
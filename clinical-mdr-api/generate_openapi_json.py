@@ -6,8 +6,13 @@ import sys
 log = logging.getLogger(__name__)
 
 
-def main(filename: str = "openapi.json", stdout: bool = True, basepath: str = "./"):
-    from clinical_mdr_api.main import custom_openapi
+def main(
+    filename: str = "openapi.json",
+    stdout: bool = True,
+    basepath: str = "./",
+    prebuilt: bool = False,
+):
+    from clinical_mdr_api.main import build_openapi_schema, custom_openapi
     from clinical_mdr_api.utils.api_version import (
         increment_api_version_if_needed,
         increment_version_number,
@@ -18,7 +23,19 @@ def main(filename: str = "openapi.json", stdout: bool = True, basepath: str = ".
     schema_path = os.path.join(basepath, filename)
     version_path = os.path.join(basepath, "apiVersion")
 
-    api_spec_new = custom_openapi()
+    if prebuilt:
+        # Schema served by the API, stamped with the current version
+        # from the apiVersion file
+        api_spec = build_openapi_schema()
+        if stdout:
+            json.dump(api_spec, sys.stdout)
+        else:
+            with open(schema_path, "w", encoding="utf-8") as f:
+                json.dump(api_spec, f)
+            log.info("Successfully saved %s", filename)
+        return
+
+    api_spec_new = custom_openapi(prebuilt=False)
     try:
         with open(schema_path, "r", encoding="utf-8") as f:
             api_spec_old = json.load(f)
@@ -75,6 +92,13 @@ if __name__ == "__main__":
         help="dump OpenAPI specification to stdout, skipping update to apiVersion file",
     )
 
+    parser.add_argument(
+        "--prebuilt",
+        action="store_true",
+        help="save the schema served by the API (see OPENAPI_PREBUILT_SCHEMA_FILE) "
+        "for the current version, without incrementing it",
+    )
+
     args = parser.parse_args()
     basepath = os.path.normpath(os.path.dirname(sys.argv[0]))
 
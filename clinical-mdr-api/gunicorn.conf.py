@@ -0,0 +1,49 @@
+"""
+Gunicorn configuration of the prefork production server: `pipenv run prod-prefork`.
+
+The application is imported and warmed up once in the master process (see `clinical_mdr_api.warmup`),
+then forked into `WEB_CONCURRENCY` Uvicorn workers sharing its memory copy-on-write.
+The workers share nothing else: each opens its own database connections and keeps its own caches from then on.
+"""
+
+import gc
+from os import environ
+
+from uvicorn.workers import UvicornWorker as _UvicornWorker
+
+
+class UvicornWorker(_UvicornWorker):
+    CONFIG_KWARGS = {
+        **_UvicornWorker.CONFIG_KWARGS,
+        "loop": "asyncio",
+        "limit_concurrency": int(environ.get("UVICORN_LIMIT_CONCURRENCY", 120)),
+        "root_path": environ.get("UVICORN_ROOT_PATH", ""),
+    }
+
+
+wsgi_app = environ.get("UVICORN_APP", "clinical_mdr_api.main:app")
+bind = f"{environ.get('UVICORN_HOST', '0.0.0.0')}:{environ.get('UVICORN_PORT', '8000')}"
+workers = int(environ.get("WEB_CONCURRENCY", 4))
+worker_class = UvicornWorker
+preload_app = True
+timeout = int(environ.get("GUNICORN_TIMEOUT", 120))
+graceful_timeout = int(environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+# Restart the workers after a number of requests (with jitter) to bound the growth of their caches, 0 disables it
+max_requests = int(environ.get("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = int(environ.get("GUNICORN_MAX_REQUESTS_JITTER", 0))
+
+
+def when_ready(server):
+    # pylint: disable=import-outside-toplevel
+    from clinical_mdr_api.warmup import warm_up
+
+    warm_up(server.app.wsgi())
+    # the objects built so far are never collected, so that collections in the workers do not copy their pages
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    server.log.info(
+        "Worker %s forked with %s shared objects", worker.pid, gc.get_freeze_count()
+    )
@@ -1 +1,5 @@
-python3 -m uvicorn clinical_mdr_api.main:app --host 0.0.0.0
\ No newline at end of file
+if [ "$SERVER_MODE" = "prefork" ]; then
+    python3 -m gunicorn --config=gunicorn.conf.py
+else
+    python3 -m uvicorn clinical_mdr_api.main:app --host 0.0.0.0
+fi
@@ -3,6 +3,7 @@
 import os
 
 from migrations.common import migrate_ct_config_values, migrate_indexes_and_constraints
+from migrations.utils.runner import MigrationRunner, batched_step
 from migrations.utils.utils import get_db_connection, get_db_driver, get_logger
 
 logger = get_logger(os.path.basename(__file__))
@@ -10,6 +11,73 @@ DB_DRIVER = get_db_driver()
 DB_CONNECTION = get_db_connection()
 MIGRATION_DESC = "schema-migration-release-1.13.0"
 
+STEPS = [
+    batched_step(
+        "create_study_headers",
+        """
+        MATCH (study_root:StudyRoot)-[:LATEST]->(:StudyValue)
+        WHERE NOT (study_root)-[:HAS_HEADER]->(:StudyHeader)
+        RETURN study_root
+        """,
+        """
+        CALL {
+            WITH study_root
+            MATCH (study_root)-[:LATEST]->(study_value:StudyValue)
+            OPTIONAL MATCH (study_root)-[hv:HAS_VERSION]->(study_value)
+            WITH study_value, hv ORDER BY hv.end_date DESC LIMIT 1
+            RETURN study_value, hv
+        }
+        MERGE (study_root)-[:HAS_HEADER]->(header:StudyHeader)
+        SET header.uid = study_root.uid,
+            header.acronym = study_value.study_acronym,
+            header.id_prefix = study_value.study_id_prefix,
+            header.number = study_value.study_number,
+            header.study_id = CASE study_value.subpart_id
+                WHEN IS NULL THEN toUpper(COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, ''))
+                ELSE toUpper(COALESCE(study_value.study_id_prefix, '') + "-" + COALESCE(study_value.study_number, '')) + "-" + study_value.subpart_id
+            END,
+            header.version_status = hv.status,
+            header.version_number = hv.version,
+            header.version_started_at = hv.start_date,
+            header.version_ended_at = hv.end_date,
+            header.version_author_id = hv.author_id,
+            header.version_description = hv.change_description,
+            header.is_deleted = EXISTS((study_value)<-[:BEFORE]-(:Delete))
+        """,
+    ),
+    batched_step(
+        "create_study_summaries",
+        """
+        MATCH (sr:StudyRoot)-[:LATEST]->(:StudyValue)
+        WHERE NOT (sr)-[:HAS_SUMMARY]->(:StudySummary)
+        RETURN sr
+        """,
+        """
+        MATCH (sr)-[:LATEST]->(sv:StudyValue)
+        WITH sr, sv,
+            head([(sr)-[ll:LATEST_LOCKED]->() | ll]) AS llr,
+            head([(sr)-[ld:LATEST_DRAFT]->() | ld]) AS ldr
+        MERGE (sr)-[:HAS_SUMMARY]->(summary:StudySummary)
+        SET summary.uid = sr.uid,
+            summary.study_number = sv.study_number,
+            summary.subpart_id = sv.subpart_id,
+            summary.study_acronym = sv.study_acronym,
+            summary.study_subpart_acronym = sv.study_subpart_acronym,
+            summary.study_id_prefix = sv.study_id_prefix,
+            summary.description = sv.description,
+            summary.project_number = head([(sv)-[:HAS_PROJECT]->(:StudyProjectField)<-[:HAS_FIELD]-(p:Project) | p.project_number]),
+            summary.study_title = head([(sv)-[:HAS_TEXT_FIELD]->(t:StudyTextField) WHERE t.field_name = "study_title" | t.value]),
+            summary.study_short_title = head([(sv)-[:HAS_TEXT_FIELD]->(st:StudyTextField) WHERE st.field_name = "study_short_title" | st.value]),
+            summary.study_status = CASE WHEN ldr.end_date IS NULL THEN 'DRAFT' ELSE 'LOCKED' END,
+            summary.version_timestamp = CASE WHEN ldr.end_date IS NULL THEN ldr.start_date ELSE llr.start_date END,
+            summary.version_number = CASE WHEN ldr.end_date IS NULL THEN ldr.version ELSE llr.version END,
+            summary.version_author_id = CASE WHEN ldr.end_date IS NULL THEN ldr.author_id ELSE llr.author_id END,
+            summary.has_latest_locked = llr IS NOT NULL,
+            summary.is_deleted = EXISTS((sv)<-[:BEFORE]-(:Delete))
+        """,
+    ),
+]
+
 
 def main():
     logger.info("Running migration on DB '%s'", os.environ["DATABASE_NAME"])
@@ -19,7 +87,7 @@ def main():
     migrate_ct_config_values(DB_CONNECTION, logger)
 
     ### Release-specific migrations
-    # (none for this release)
+    MigrationRunner(MIGRATION_DESC, STEPS).run(DB_DRIVER)
 
 
 if __name__ == "__main__":
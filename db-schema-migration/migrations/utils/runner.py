@@ -0,0 +1,342 @@
+"""Resumable, batched runner for migration steps.
+
+A migration declares its release-specific changes as a list of steps
+and hands them to a `MigrationRunner`. Each step is either a plain Cypher
+statement (`cypher_step`) or a batched update (`batched_step`) that is
+applied with `apoc.periodic.iterate`, committing every `batch_size` rows
+so that large graphs are never updated in a single transaction.
+
+When a step completes, a `MigrationCheckpoint` node is written to the database.
+Re-running a migration skips completed steps, so a failed run can be
+restarted where it stopped. Batched steps should select only rows that are
+not yet migrated in their iterate query, so that a restart of a partially
+applied step continues with the remaining batches.
+
+Steps may declare `depends_on`. A migration that sets `parallel=True`
+runs steps whose dependencies are all completed concurrently.
+
+Example:
+```python
+STEPS = [
+    batched_step(
+        "copy_author_id",
+        "MATCH (n:StudyAction) WHERE n.author_id IS NULL RETURN n",
+        "SET n.author_id = n.user_initials",
+    ),
+    cypher_step(
+        "drop_user_initials",
+        "MATCH (n:StudyAction) REMOVE n.user_initials",
+        depends_on=["copy_author_id"],
+    ),
+]
+MigrationRunner(MIGRATION_DESC, STEPS, parallel=True).run(DB_DRIVER)
+```
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+import neo4j
+
+from migrations.utils.utils import get_logger, load_env, print_aligned, run_cypher_query
+
+logger = get_logger(os.path.basename(__file__))
+
+DEFAULT_BATCH_SIZE = int(load_env("MIGRATION_BATCH_SIZE", "10000"))
+DRY_RUN = load_env("MIGRATION_DRY_RUN", "false").lower() == "true"
+MAX_PARALLEL_STEPS = int(load_env("MIGRATION_MAX_PARALLEL_STEPS", "4"))
+
+CHECKPOINT_LABEL = "MigrationCheckpoint"
+
+
+@dataclass
+class MigrationStep:
+    """A single named unit of a migration.
+
+    `query` is the statement that performs the change. For batched steps
+    it is the action query, applied to each row returned by `iterate_query`.
+    `count_query` is used for dry-run estimates, it must return a single
+    row with a single numeric value. Without it, the estimate of the step
+    is reported as unknown.
+    """
+
+    name: str
+    query: str
+    iterate_query: Optional[str] = None
+    count_query: Optional[str] = None
+    params: dict[str, Any] = field(default_factory=dict)
+    batch_size: int = DEFAULT_BATCH_SIZE
+    depends_on: list[str] = field(default_factory=list)
+
+    @property
+    def is_batched(self) -> bool:
+        return self.iterate_query is not None
+
+
+@dataclass
+class StepResult:
+    name: str
+    rows: int = 0
+    updates: int = 0
+    duration: float = 0.0
+    skipped: bool = False
+    estimated: bool = False
+    estimated_rows: Optional[int] = None
+
+
+def cypher_step(
+    name: str,
+    query: str,
+    params: Optional[dict[str, Any]] = None,
+    count_query: Optional[str] = None,
+    depends_on: Optional[Iterable[str]] = None,
+) -> MigrationStep:
+    """A step that runs `query` in a single transaction.
+    Only suitable for changes that touch a limited number of nodes."""
+    return MigrationStep(
+        name=name,
+        query=query,
+        params=params or {},
+        count_query=count_query,
+        depends_on=list(depends_on or []),
+    )
+
+
+def batched_step(
+    name: str, iterate_query: str, action_query: str, **options: Any
+) -> MigrationStep:
+    """A step that runs `action_query` for every row of `iterate_query`,
+    committing a transaction for each batch of `batch_size` rows.
+
+    `options` are the other fields of `MigrationStep`: `params`, `batch_size`,
+    `count_query` and `depends_on`.
+    The variables returned by `iterate_query` are available in `action_query`,
+    and so are the entries of `params`, as `$name`.
+    Unless `count_query` is given, the dry-run estimate counts the rows of `iterate_query`.
+    """
+    options.setdefault("count_query", f"CALL {{ {iterate_query} }} RETURN count(*)")
+    return MigrationStep(
+        name=name, query=action_query, iterate_query=iterate_query, **options
+    )
+
+
+def plan_waves(steps: list[MigrationStep]) -> list[list[MigrationStep]]:
+    """Groups steps into waves where every step only depends on steps in earlier waves.
+    The declaration order of the steps is kept within each wave."""
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Migration step names must be unique: {names}")
+    for step in steps:
+        unknown = set(step.depends_on) - set(names)
+        if unknown:
+            raise ValueError(f"Step '{step.name}' depends on unknown steps {unknown}")
+
+    waves = []
+    planned: set[str] = set()
+    remaining = list(steps)
+    while remaining:
+        wave = [step for step in remaining if set(step.depends_on) <= planned]
+        if not wave:
+            raise ValueError(
+                f"Circular dependency between steps {[step.name for step in remaining]}"
+            )
+        waves.append(wave)
+        planned.update(step.name for step in wave)
+        remaining = [step for step in remaining if step.name not in planned]
+    return waves
+
+
+def count_updates(counters: neo4j.SummaryCounters) -> int:
+    return (
+        counters.nodes_created
+        + counters.nodes_deleted
+        + counters.relationships_created
+        + counters.relationships_deleted
+        + counters.properties_set
+        + counters.labels_added
+        + counters.labels_removed
+    )
+
+
+def get_completed_steps(driver: neo4j.Driver, migration: str) -> set[str]:
+    records, _ = run_cypher_query(
+        driver,
+        f"""
+        MATCH (c:{CHECKPOINT_LABEL} {{migration: $migration}})
+        WHERE c.completed_at IS NOT NULL
+        RETURN c.step
+        """,
+        {"migration": migration},
+    )
+    return {record[0] for record in records}
+
+
+def save_checkpoint(driver: neo4j.Driver, migration: str, result: StepResult):
+    run_cypher_query(
+        driver,
+        f"""
+        MERGE (c:{CHECKPOINT_LABEL} {{migration: $migration, step: $step}})
+        SET c.completed_at = datetime(),
+            c.rows = $rows,
+            c.updates = $updates,
+            c.duration_seconds = $duration
+        """,
+        {
+            "migration": migration,
+            "step": result.name,
+            "rows": result.rows,
+            "updates": result.updates,
+            "duration": result.duration,
+        },
+    )
+
+
+def reset_checkpoints(driver: neo4j.Driver, migration: str):
+    """Removes all checkpoints of a migration, so that all steps run again."""
+    run_cypher_query(
+        driver,
+        f"MATCH (c:{CHECKPOINT_LABEL} {{migration: $migration}}) DELETE c",
+        {"migration": migration},
+    )
+
+
+class MigrationRunner:
+    def __init__(
+        self,
+        migration: str,
+        steps: list[MigrationStep],
+        parallel: bool = False,
+        max_workers: int = MAX_PARALLEL_STEPS,
+        dry_run: bool = DRY_RUN,
+    ):
+        self.migration = migration
+        self.waves = plan_waves(steps)
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.dry_run = dry_run
+
+    def run(self, driver: neo4j.Driver) -> list[StepResult]:
+        """Runs all steps that have no checkpoint yet and returns the per-step results.
+        In dry-run mode nothing is written, only the row estimates are collected."""
+        completed = (
+            set() if self.dry_run else get_completed_steps(driver, self.migration)
+        )
+        if self.dry_run:
+            mode = "dry run"
+        else:
+            mode = "parallel" if self.parallel else "sequential"
+        logger.info(
+            "Running migration '%s' (%s), %i steps already completed",
+            self.migration,
+            mode,
+            len(completed),
+        )
+        results = []
+        for wave in self.waves:
+            pending = [step for step in wave if step.name not in completed]
+            results.extend(
+                StepResult(name=step.name, skipped=True)
+                for step in wave
+                if step.name in completed
+            )
+            if self.parallel and len(pending) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(pending))
+                ) as executor:
+                    results.extend(
+                        executor.map(lambda step: self._run_step(driver, step), pending)
+                    )
+            else:
+                results.extend(self._run_step(driver, step) for step in pending)
+        print_step_results(results)
+        return results
+
+    def _run_step(self, driver: neo4j.Driver, step: MigrationStep) -> StepResult:
+        if self.dry_run:
+            return self._estimate_step(driver, step)
+
+        logger.info("Migration '%s': running step '%s'", self.migration, step.name)
+        start = time.monotonic()
+        if step.is_batched:
+            result = self._run_batched(driver, step)
+        else:
+            records, summary = run_cypher_query(driver, step.query, step.params)
+            result = StepResult(
+                name=step.name,
+                rows=len(records),
+                updates=count_updates(summary.counters),
+            )
+        result.duration = time.monotonic() - start
+        save_checkpoint(driver, self.migration, result)
+        logger.info(
+            "Migration '%s': step '%s' completed, %i rows, %i updates in %.1f s",
+            self.migration,
+            step.name,
+            result.rows,
+            result.updates,
+            result.duration,
+        )
+        return result
+
+    @staticmethod
+    def _run_batched(driver: neo4j.Driver, step: MigrationStep) -> StepResult:
+        records, _ = run_cypher_query(
+            driver,
+            """
+            CALL apoc.periodic.iterate($iterate, $action, {
+                batchSize: $batch_size, parallel: false, params: $params
+            })
+            YIELD total, failedOperations, errorMessages, updateStatistics
+            RETURN total, failedOperations, errorMessages, updateStatistics
+            """,
+            {
+                "iterate": step.iterate_query,
+                "action": step.query,
+                "batch_size": step.batch_size,
+                "params": step.params,
+            },
+        )
+        total, failed, errors, stats = records[0]
+        if failed:
+            raise RuntimeError(
+                f"Step '{step.name}' failed for {failed} of {total} rows: {errors}"
+            )
+        return StepResult(
+            name=step.name,
+            rows=total,
+            updates=sum(value for value in stats.values() if isinstance(value, int)),
+        )
+
+    @staticmethod
+    def _estimate_step(driver: neo4j.Driver, step: MigrationStep) -> StepResult:
+        estimate = None
+        if step.count_query:
+            records, _ = run_cypher_query(driver, step.count_query, step.params)
+            estimate = records[0][0]
+        logger.info(
+            "Dry run of step '%s': estimated rows %s",
+            step.name,
+            "unknown" if estimate is None else estimate,
+        )
+        return StepResult(name=step.name, estimated=True, estimated_rows=estimate)
+
+
+def print_step_results(results: list[StepResult]):
+    print_aligned("Step", "Rows", "Updates", "Seconds")
+    for result in results:
+        if result.skipped:
+            print_aligned(result.name, "skipped", "", "")
+        elif result.estimated:
+            estimate = (
+                "unknown"
+                if result.estimated_rows is None
+                else f"~{result.estimated_rows}"
+            )
+            print_aligned(result.name, estimate, "", "")
+        else:
+            print_aligned(
+                result.name, result.rows, result.updates, f"{result.duration:.1f}"
+            )
@@ -8,6 +8,7 @@ from migrations.utils.utils import (
     get_db_connection,
     get_db_driver,
     get_logger,
+    run_cypher_query,
 )
 from tests import common
 from tests.data.db_before_migration_012 import TEST_DATA
@@ -46,3 +47,41 @@ def test_indexes_and_constraints(migration):
 
 def test_ct_config_values(migration):
     common.test_ct_config_values(db, logger)
+
+
+def test_create_study_headers(migration):
+    logger.info("Check that every study has a header matching its latest version")
+
+    records, _summary = run_cypher_query(
+        DB_DRIVER,
+        """
+        MATCH (study_root:StudyRoot)-[:LATEST]->(study_value:StudyValue)
+        OPTIONAL MATCH (study_root)-[:HAS_HEADER]->(header:StudyHeader)
+        WITH study_root, study_value, collect(header) AS headers
+        WHERE size(headers) <> 1
+            OR headers[0].uid <> study_root.uid
+            OR headers[0].number <> study_value.study_number
+            OR headers[0].is_deleted <> EXISTS((study_value)<-[:BEFORE]-(:Delete))
+        RETURN study_root.uid
+        """,
+    )
+    assert len(records) == 0, f"Studies without a correct header: {records}"
+
+
+def test_create_study_summaries(migration):
+    logger.info("Check that every study has a summary matching its latest version")
+
+    records, _summary = run_cypher_query(
+        DB_DRIVER,
+        """
+        MATCH (study_root:StudyRoot)-[:LATEST]->(study_value:StudyValue)
+        OPTIONAL MATCH (study_root)-[:HAS_SUMMARY]->(summary:StudySummary)
+        WITH study_root, study_value, collect(summary) AS summaries
+        WHERE size(summaries) <> 1
+            OR summaries[0].uid <> study_root.uid
+            OR summaries[0].study_number <> study_value.study_number
+            OR summaries[0].study_status IS NULL
+        RETURN study_root.uid
+        """,
+    )
+    assert len(records) == 0, f"Studies without a correct summary: {records}"
@@ -0,0 +1,72 @@
+import pytest
+
+from migrations.utils.runner import (
+    MigrationRunner,
+    batched_step,
+    cypher_step,
+    plan_waves,
+)
+
+
+def test_plan_waves_keeps_declaration_order():
+    steps = [
+        cypher_step("a", "RETURN 1"),
+        cypher_step("b", "RETURN 1", depends_on=["a"]),
+        cypher_step("c", "RETURN 1"),
+        cypher_step("d", "RETURN 1", depends_on=["b", "c"]),
+    ]
+    waves = plan_waves(steps)
+    assert [[step.name for step in wave] for wave in waves] == [
+        ["a", "c"],
+        ["b"],
+        ["d"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        pytest.param(
+            [cypher_step("a", "RETURN 1"), cypher_step("a", "RETURN 1")],
+            id="duplicate",
+        ),
+        pytest.param(
+            [cypher_step("a", "RETURN 1", depends_on=["x"])],
+            id="unknown",
+        ),
+        pytest.param(
+            [
+                cypher_step("a", "RETURN 1", depends_on=["b"]),
+                cypher_step("b", "RETURN 1", depends_on=["a"]),
+            ],
+            id="circular",
+        ),
+    ],
+)
+def test_plan_waves_rejects_invalid_dependencies(steps):
+    with pytest.raises(ValueError):
+        plan_waves(steps)
+
+
+def test_batched_step_derives_count_query():
+    step = batched_step(
+        "copy",
+        "MATCH (n:StudyAction) WHERE n.author_id IS NULL RETURN n",
+        "SET n.author_id = n.user_initials",
+        batch_size=500,
+    )
+    assert step.is_batched
+    assert step.batch_size == 500
+    assert step.count_query == (
+        "CALL { MATCH (n:StudyAction) WHERE n.author_id IS NULL RETURN n } RETURN count(*)"
+    )
+
+
+def test_dry_run_reports_unknown_estimate_without_count_query(capsys):
+    results = MigrationRunner(
+        "migration", [cypher_step("drop", "MATCH (n:Old) DELETE n")], dry_run=True
+    ).run(driver=None)
+
+    assert results[0].estimated
+    assert results[0].estimated_rows is None
+    assert "unknown" in capsys.readouterr().out.splitlines()[-1]
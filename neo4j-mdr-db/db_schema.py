@@ -171,6 +171,8 @@ CONSTRAINTS = [
     ("OdmItemRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("OdmAliasRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("StudyRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
+    ("StudyHeader", "uid", CONSTRAINT_TYPE_UNIQUE),
+    ("StudySummary", "uid", CONSTRAINT_TYPE_UNIQUE),
     ("ObjectiveTemplateRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("ObjectiveRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("EndpointTemplateRoot", "uid", CONSTRAINT_TYPE_NODE_KEY),
@@ -188,6 +190,7 @@ CONSTRAINTS = [
     ("CTPackage", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("CTPackageCodelist", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("CTPackageTerm", "uid", CONSTRAINT_TYPE_NODE_KEY),
+    ("CTPackageDiff", "key", CONSTRAINT_TYPE_UNIQUE),
     ("ClinicalProgramme", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("Project", "uid", CONSTRAINT_TYPE_NODE_KEY),
     ("CTTermNameRoot", "uid", CONSTRAINT_TYPE_UNIQUE),